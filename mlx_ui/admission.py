@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+
+from mlx_ui.engine_registry import (
+    COHERE_ENGINE,
+    PARAKEET_TDT_V3_ENGINE,
+    WHISPER_CPU_ENGINE,
+    WHISPER_MLX_ENGINE,
+)
+
+ADMISSION_ADMIT = "admit"
+ADMISSION_SPLIT = "split"
+ADMISSION_WAIT = "wait"
+ADMISSION_REJECT = "reject"
+
+ADMISSION_RESERVE_BYTES = 512 * 1024 * 1024
+ADMISSION_MAX_WAIT_SECONDS = 300.0
+SPLIT_WINDOW_SECONDS = 600.0
+# Short enough that a throttled job reaches a pause point every few seconds.
+LIVE_THROTTLE_WINDOW_SECONDS = 30.0
+
+_MIB = 1024 * 1024
+_GIB = 1024 * _MIB
+
+# Decoded float32 waveform at 16 kHz plus 80-bin mel features and the
+# intermediate ffmpeg PCM buffer: roughly what a whole-file load keeps alive.
+_WHOLE_FILE_BYTES_PER_SECOND = 64_000 + 32_000 + 32_000
+# Parakeet decodes the whole waveform but only featurizes one chunk at a time.
+_CHUNKED_BYTES_PER_SECOND = 64_000
+
+_WHISPER_MODEL_BYTES = {
+    "tiny": 200 * _MIB,
+    "base": 400 * _MIB,
+    "small": 1 * _GIB,
+    "medium": 3 * _GIB,
+    "large": 6 * _GIB,
+}
+_WHISPER_TURBO_MODEL_BYTES = 3 * _GIB
+_WHISPER_MLX_MODEL_BYTES = 2 * _GIB
+_PARAKEET_MODEL_BYTES = int(2.5 * _GIB)
+
+
+@dataclass(frozen=True)
+class AdmissionDecision:
+    action: str
+    estimated_bytes: int
+    available_bytes: int | None
+    reason: str | None = None
+    duration_seconds: float | None = None
+    window_seconds: float | None = None
+
+
+def estimate_job_memory_bytes(
+    engine_id: str | None,
+    *,
+    duration_seconds: float,
+    model_name: str | None = None,
+    model_loaded: bool = False,
+) -> int:
+    if engine_id == COHERE_ENGINE:
+        return 0
+    model_bytes = 0 if model_loaded else _model_bytes(engine_id, model_name)
+    if engine_id == PARAKEET_TDT_V3_ENGINE:
+        return model_bytes + int(duration_seconds * _CHUNKED_BYTES_PER_SECOND)
+    return model_bytes + int(duration_seconds * _WHOLE_FILE_BYTES_PER_SECOND)
+
+
+def available_memory_bytes() -> int | None:
+    meminfo = Path("/proc/meminfo")
+    try:
+        for line in meminfo.read_text(encoding="utf-8").splitlines():
+            if line.startswith("MemAvailable:"):
+                return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def evaluate_admission(
+    engine_id: str | None,
+    *,
+    duration_seconds: float | None,
+    model_name: str | None = None,
+    model_loaded: bool = False,
+    can_split: bool = False,
+    available_bytes: int | None = None,
+    budget_bytes: int | None = None,
+) -> AdmissionDecision:
+    if duration_seconds is None:
+        return AdmissionDecision(
+            action=ADMISSION_ADMIT,
+            estimated_bytes=0,
+            available_bytes=available_bytes,
+        )
+    estimated = estimate_job_memory_bytes(
+        engine_id,
+        duration_seconds=duration_seconds,
+        model_name=model_name,
+        model_loaded=model_loaded,
+    )
+    headroom = _headroom_bytes(available_bytes, budget_bytes)
+    if headroom is None or estimated <= headroom:
+        return AdmissionDecision(
+            action=ADMISSION_ADMIT,
+            estimated_bytes=estimated,
+            available_bytes=headroom,
+            duration_seconds=duration_seconds,
+        )
+    needed = estimated
+    if can_split and duration_seconds > SPLIT_WINDOW_SECONDS:
+        window_estimate = estimate_job_memory_bytes(
+            engine_id,
+            duration_seconds=SPLIT_WINDOW_SECONDS,
+            model_name=model_name,
+            model_loaded=model_loaded,
+        )
+        needed = window_estimate
+        if window_estimate <= headroom:
+            return AdmissionDecision(
+                action=ADMISSION_SPLIT,
+                estimated_bytes=window_estimate,
+                available_bytes=headroom,
+                reason=(
+                    f"Splitting into {int(SPLIT_WINDOW_SECONDS // 60)}-minute "
+                    f"windows: the full file needs about {_format_bytes(estimated)}."
+                ),
+                duration_seconds=duration_seconds,
+                window_seconds=SPLIT_WINDOW_SECONDS,
+            )
+    if budget_bytes is not None and needed > budget_bytes:
+        # Waiting cannot help: the job is larger than the configured budget.
+        return AdmissionDecision(
+            action=ADMISSION_REJECT,
+            estimated_bytes=needed,
+            available_bytes=headroom,
+            reason=(
+                f"Needs about {_format_bytes(needed)} of memory, more than the "
+                f"{_format_bytes(budget_bytes)} memory budget."
+            ),
+            duration_seconds=duration_seconds,
+        )
+    free = headroom if available_bytes is None else _free_bytes(available_bytes)
+    return AdmissionDecision(
+        action=ADMISSION_WAIT,
+        estimated_bytes=needed,
+        available_bytes=headroom,
+        reason=(
+            f"Waiting for memory: the next job needs about "
+            f"{_format_bytes(needed)}, {_format_bytes(free)} is free."
+        ),
+        duration_seconds=duration_seconds,
+    )
+
+
+def _headroom_bytes(
+    available_bytes: int | None,
+    budget_bytes: int | None,
+) -> int | None:
+    candidates = []
+    if available_bytes is not None:
+        candidates.append(_free_bytes(available_bytes))
+    if budget_bytes is not None:
+        candidates.append(budget_bytes)
+    if not candidates:
+        return None
+    return min(candidates)
+
+
+def _free_bytes(available_bytes: int) -> int:
+    return max(0, available_bytes - ADMISSION_RESERVE_BYTES)
+
+
+def _model_bytes(engine_id: str | None, model_name: str | None) -> int:
+    if engine_id == WHISPER_MLX_ENGINE:
+        return _WHISPER_MLX_MODEL_BYTES
+    if engine_id == PARAKEET_TDT_V3_ENGINE:
+        return _PARAKEET_MODEL_BYTES
+    if engine_id == WHISPER_CPU_ENGINE:
+        name = (model_name or "").strip().lower()
+        if "turbo" in name:
+            return _WHISPER_TURBO_MODEL_BYTES
+        for prefix, size in _WHISPER_MODEL_BYTES.items():
+            if name.startswith(prefix):
+                return size
+        return _WHISPER_MODEL_BYTES["large"]
+    return 0
+
+
+def _format_bytes(value: int) -> str:
+    if value >= _GIB:
+        return f"{value / _GIB:.1f} GB"
+    return f"{max(1, round(value / _MIB))} MB"
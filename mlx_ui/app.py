@@ -13,6 +13,7 @@ from mlx_ui.app_context import (
     bind_active_app,
     get_base_dir,
     get_db_path,
+    get_live_service,
     get_results_dir,
     get_uploads_dir,
     init_app_state,
@@ -21,20 +22,30 @@ from mlx_ui.app_context import (
     reset_live_service,
     set_default_app,
 )
-from mlx_ui.db import init_db, recover_running_jobs
+from mlx_ui.db import (
+    enable_db_writer,
+    init_db,
+    recover_running_jobs,
+    stop_db_writers,
+)
 from mlx_ui.hot_folder import HotFolderPaths, start_hot_folder, stop_hot_folder
+from mlx_ui.live_coordination import attach_live_coordinator, stop_live_coordinator
 from mlx_ui.logging_config import configure_logging
 from mlx_ui.routers.jobs_api import router as jobs_router
 from mlx_ui.routers.live_api import router as live_router
 from mlx_ui.routers.pages import router as pages_router
 from mlx_ui.routers.settings_api import router as settings_router
+from mlx_ui.result_manifest import backfill_result_manifests
 from mlx_ui.result_retention import ResultRetentionService
+from mlx_ui.resumable_uploads import purge_expired_partial_uploads
 from mlx_ui.settings import build_settings_snapshot
+from mlx_ui.transcript_search import backfill_transcript_index
 from mlx_ui.update_check import (
     DEFAULT_TIMEOUT,
     check_for_updates,
     is_update_check_disabled,
 )
+from mlx_ui.webhooks import WebhookDeliveryService
 from mlx_ui.worker import start_worker, stop_worker
 
 STATIC_DIR = Path(__file__).resolve().parent / "static"
@@ -52,6 +63,7 @@ async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     worker_enabled = is_worker_enabled(app)
     result_retention_service: ResultRetentionService | None = None
+    webhook_service: WebhookDeliveryService | None = None
     try:
         init_db(db_path)
         recovered = recover_running_jobs(db_path)
@@ -59,6 +71,19 @@ async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
             logger.warning(
                 "Recovered %s running job(s) after unclean shutdown.", recovered
             )
+        try:
+            backfill_transcript_index(db_path, results_dir)
+        except Exception:
+            logger.exception("Failed to backfill the transcript search index")
+        try:
+            backfill_result_manifests(db_path, results_dir)
+        except Exception:
+            logger.exception("Failed to backfill result manifests")
+        try:
+            purge_expired_partial_uploads(uploads_dir)
+        except Exception:
+            logger.exception("Failed to remove abandoned partial uploads")
+        enable_db_writer(db_path)
 
         result_retention_service = ResultRetentionService(
             db_path,
@@ -67,13 +92,20 @@ async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
         )
 
         if worker_enabled:
-            start_worker(
+            worker = start_worker(
                 db_path,
                 uploads_dir,
                 results_dir,
                 base_dir=base_dir,
             )
+            attach_live_coordinator(
+                get_live_service(app),
+                worker,
+                base_dir=base_dir,
+            )
         result_retention_service.start()
+        webhook_service = WebhookDeliveryService(db_path)
+        webhook_service.start()
 
         settings_snapshot = build_settings_snapshot(base_dir=base_dir)
         hot_folder_settings = (
@@ -128,8 +160,12 @@ async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
         stop_hot_folder()
         if result_retention_service is not None:
             result_retention_service.stop()
+        if webhook_service is not None:
+            webhook_service.stop()
+        stop_live_coordinator()
         if worker_enabled:
             stop_worker()
+        stop_db_writers()
         reset_live_service(app)
 
 
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from uuid import uuid4
+
+
+class ChangeBus:
+    """Version counter that wakes asyncio waiters when queue state changes.
+
+    Publishers may run on any thread (worker, hot folder, request handlers);
+    waiters live on an event loop and are woken with call_soon_threadsafe.
+    The version restarts with the process, so ``epoch`` tells restarts apart.
+    """
+
+    def __init__(self) -> None:
+        self.epoch = uuid4().hex[:12]
+        self._lock = threading.Lock()
+        self._version = 0
+        self._waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @property
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def publish(self) -> int:
+        with self._lock:
+            self._version += 1
+            version = self._version
+            waiters = list(self._waiters)
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiter's loop already closed; it is discarded on exit.
+                pass
+        return version
+
+    async def wait_for_change(self, version: int, timeout: float) -> int:
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            if self._version != version:
+                return self._version
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+        return self.version
+
+
+_CHANGE_BUS = ChangeBus()
+
+
+def get_change_bus() -> ChangeBus:
+    return _CHANGE_BUS
+
+
+def publish_change() -> None:
+    _CHANGE_BUS.publish()
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+import shutil
+import subprocess
+import wave
+
+from mlx_ui.transcript_result import (
+    TranscriptResult,
+    TranscriptSegment,
+    TranscriptWordTiming,
+)
+
+logger = logging.getLogger(__name__)
+
+CLIP_BATCH_SAMPLE_RATE = 16000
+CLIP_BATCH_GAP_SECONDS = 1.5
+CLIP_BATCH_MAX_CLIP_SECONDS = 15.0
+CLIP_BATCH_MAX_JOBS = 8
+PROBE_TIMEOUT_SECONDS = 30.0
+
+
+class ClipBatchError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class ClipSpan:
+    job_id: str
+    start: float
+    end: float
+
+
+@dataclass(frozen=True)
+class ClipBatch:
+    audio_path: Path
+    spans: tuple[ClipSpan, ...]
+    gap_seconds: float
+
+
+def probe_media_duration(path: Path) -> float | None:
+    ffprobe_path = shutil.which("ffprobe")
+    if ffprobe_path is None:
+        return None
+    try:
+        result = subprocess.run(
+            [
+                ffprobe_path,
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration",
+                "-of",
+                "default=noprint_wrappers=1:nokey=1",
+                str(path),
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=PROBE_TIMEOUT_SECONDS,
+        )
+    except subprocess.TimeoutExpired:
+        logger.warning("ffprobe timed out for %s", path)
+        return None
+    except OSError:
+        logger.warning("ffprobe failed to start for %s", path)
+        return None
+    if result.returncode != 0:
+        return None
+    try:
+        duration = float(result.stdout.strip())
+    except ValueError:
+        return None
+    if duration <= 0:
+        return None
+    return duration
+
+
+def decode_pcm(path: Path, *, sample_rate: int = CLIP_BATCH_SAMPLE_RATE) -> bytes:
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        raise ClipBatchError("ffmpeg is required to batch short clips.")
+    result = subprocess.run(
+        [
+            ffmpeg_path,
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-i",
+            str(path),
+            "-ac",
+            "1",
+            "-ar",
+            str(sample_rate),
+            "-f",
+            "s16le",
+            "-",
+        ],
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        detail = (result.stderr or b"").decode("utf-8", errors="replace").strip()
+        raise ClipBatchError(
+            f"Failed to decode {Path(path).name}. "
+            f"{detail or 'ffmpeg returned an unknown error.'}"
+        )
+    pcm_bytes = result.stdout
+    if len(pcm_bytes) % 2 == 1:
+        pcm_bytes = pcm_bytes[:-1]
+    return pcm_bytes
+
+
+def build_clip_batch(
+    clips: list[tuple[str, Path]],
+    output_path: Path,
+    *,
+    sample_rate: int = CLIP_BATCH_SAMPLE_RATE,
+    gap_seconds: float = CLIP_BATCH_GAP_SECONDS,
+) -> ClipBatch:
+    gap_frames = int(round(gap_seconds * sample_rate))
+    silence = b"\x00\x00" * gap_frames
+    spans: list[ClipSpan] = []
+    cursor = 0
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(output_path), "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(sample_rate)
+        for index, (job_id, path) in enumerate(clips):
+            if index:
+                writer.writeframes(silence)
+                cursor += gap_frames
+            pcm_bytes = decode_pcm(path, sample_rate=sample_rate)
+            frames = len(pcm_bytes) // 2
+            spans.append(
+                ClipSpan(
+                    job_id=job_id,
+                    start=cursor / sample_rate,
+                    end=(cursor + frames) / sample_rate,
+                )
+            )
+            writer.writeframes(pcm_bytes)
+            cursor += frames
+    return ClipBatch(
+        audio_path=output_path,
+        spans=tuple(spans),
+        gap_seconds=gap_frames / sample_rate,
+    )
+
+
+def split_batch_result(
+    result: TranscriptResult,
+    batch: ClipBatch,
+) -> dict[str, TranscriptResult]:
+    if not batch.spans:
+        return {}
+    if not result.segments and result.text.strip():
+        raise ClipBatchError("Batched transcript has no segment timings to split.")
+    half_gap = batch.gap_seconds / 2
+    window_starts = [span.start - half_gap for span in batch.spans]
+    segments_by_job: dict[str, list[TranscriptSegment]] = {
+        span.job_id: [] for span in batch.spans
+    }
+    words_by_job: dict[str, list[TranscriptWordTiming]] = {
+        span.job_id: [] for span in batch.spans
+    }
+
+    def span_for(start: float | None, end: float | None) -> ClipSpan:
+        if start is None or end is None:
+            raise ClipBatchError("Batched transcript is missing timestamps.")
+        midpoint = (start + end) / 2
+        index = max(0, bisect_right(window_starts, midpoint) - 1)
+        return batch.spans[index]
+
+    for segment in result.segments:
+        if segment.words:
+            grouped: dict[str, list[TranscriptWordTiming]] = {}
+            for word in segment.words:
+                span = span_for(word.start, word.end)
+                grouped.setdefault(span.job_id, []).append(_shift_word(word, span))
+            for job_id, words in grouped.items():
+                text = segment.text if len(grouped) == 1 else _join_words(words)
+                segments_by_job[job_id].append(
+                    TranscriptSegment(
+                        text=text.strip(),
+                        start=words[0].start,
+                        end=words[-1].end,
+                        words=tuple(words),
+                    )
+                )
+            continue
+        span = span_for(segment.start, segment.end)
+        segments_by_job[span.job_id].append(
+            TranscriptSegment(
+                text=segment.text.strip(),
+                start=_shift_time(segment.start, span),
+                end=_shift_time(segment.end, span),
+            )
+        )
+    for word in result.words:
+        span = span_for(word.start, word.end)
+        words_by_job[span.job_id].append(_shift_word(word, span))
+
+    split: dict[str, TranscriptResult] = {}
+    for span in batch.spans:
+        segments = tuple(
+            TranscriptSegment(
+                id=index,
+                text=segment.text,
+                start=segment.start,
+                end=segment.end,
+                words=segment.words,
+            )
+            for index, segment in enumerate(segments_by_job[span.job_id])
+        )
+        split[span.job_id] = TranscriptResult(
+            text=" ".join(segment.text for segment in segments if segment.text),
+            engine_id=result.engine_id,
+            model_id=result.model_id,
+            language=result.language,
+            segments=segments,
+            words=tuple(words_by_job[span.job_id]),
+        )
+    return split
+
+
+def _join_words(words: list[TranscriptWordTiming]) -> str:
+    # Whisper word tokens carry their leading space; Parakeet tokens are bare.
+    text = ""
+    for word in words:
+        if text and word.text and not word.text[0].isspace():
+            text += " "
+        text += word.text
+    return text
+
+
+def _shift_time(value: float | None, span: ClipSpan) -> float | None:
+    if value is None:
+        return None
+    return round(min(max(value - span.start, 0.0), span.end - span.start), 3)
+
+
+def _shift_word(word: TranscriptWordTiming, span: ClipSpan) -> TranscriptWordTiming:
+    return TranscriptWordTiming(
+        text=word.text,
+        start=_shift_time(word.start, span),
+        end=_shift_time(word.end, span),
+    )
+
+
+def _offset_time(value: float | None, offset: float) -> float | None:
+    if value is None:
+        return None
+    return round(value + offset, 3)
+
+
+def _offset_word(word: TranscriptWordTiming, offset: float) -> TranscriptWordTiming:
+    return TranscriptWordTiming(
+        text=word.text,
+        start=_offset_time(word.start, offset),
+        end=_offset_time(word.end, offset),
+    )
+
+
+def extract_audio_window(
+    path: Path,
+    output_path: Path,
+    *,
+    start: float,
+    duration: float,
+    sample_rate: int = CLIP_BATCH_SAMPLE_RATE,
+) -> Path:
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        raise ClipBatchError("ffmpeg is required to split long media.")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    result = subprocess.run(
+        [
+            ffmpeg_path,
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-y",
+            "-ss",
+            f"{start:.3f}",
+            "-t",
+            f"{duration:.3f}",
+            "-i",
+            str(path),
+            "-ac",
+            "1",
+            "-ar",
+            str(sample_rate),
+            str(output_path),
+        ],
+        capture_output=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        detail = (result.stderr or b"").decode("utf-8", errors="replace").strip()
+        raise ClipBatchError(
+            f"Failed to split {Path(path).name}. "
+            f"{detail or 'ffmpeg returned an unknown error.'}"
+        )
+    return output_path
+
+
+def join_window_results(
+    parts: list[tuple[float, TranscriptResult]],
+) -> TranscriptResult:
+    if not parts:
+        raise ClipBatchError("No transcript windows to join.")
+    segments: list[TranscriptSegment] = []
+    words: list[TranscriptWordTiming] = []
+    for offset, part in parts:
+        for segment in part.segments:
+            segments.append(
+                TranscriptSegment(
+                    id=len(segments),
+                    text=segment.text,
+                    start=_offset_time(segment.start, offset),
+                    end=_offset_time(segment.end, offset),
+                    words=tuple(_offset_word(word, offset) for word in segment.words),
+                )
+            )
+        words.extend(_offset_word(word, offset) for word in part.words)
+    first = parts[0][1]
+    return TranscriptResult(
+        text=" ".join(part.text.strip() for _offset, part in parts if part.text),
+        engine_id=first.engine_id,
+        model_id=first.model_id,
+        language=first.language,
+        segments=tuple(segments),
+        words=tuple(words),
+    )
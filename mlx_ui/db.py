@@ -1,11 +1,55 @@
+import base64
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+import json
+import os
 from pathlib import Path
+import re
 import sqlite3
+import threading
+from typing import TypeVar
 
+from mlx_ui.change_bus import publish_change
+from mlx_ui.db_writer import DbWriter, DbWriterClosed
 from mlx_ui.languages import AUTO_LANGUAGE, LEGACY_AUTO_LANGUAGE, normalize_language
 
 SQLITE_BUSY_TIMEOUT_SECONDS = 30.0
+SQLITE_WAL_AUTOCHECKPOINT_PAGES = 1000
+SQLITE_AUTO_VACUUM_INCREMENTAL = 2
+JOB_PRIORITY_NORMAL = 0
+JOB_PRIORITY_LOW = 1
+TRANSCRIPTION_MODE_STANDARD = "standard"
+TRANSCRIPTION_MODE_TWO_PASS = "two_pass"
+TRANSCRIPTION_MODES = (TRANSCRIPTION_MODE_STANDARD, TRANSCRIPTION_MODE_TWO_PASS)
+TRANSCRIPT_PASS_DRAFT = "draft"
+TRANSCRIPT_PASS_FINAL = "final"
+# The refinement was abandoned, so the draft is the job's final transcript.
+TRANSCRIPT_PASS_UNREFINED = "unrefined"
+TRANSCRIPT_SNIPPET_START = "\x02"
+TRANSCRIPT_SNIPPET_END = "\x03"
+TRANSCRIPT_SNIPPET_TOKENS = 16
+HISTORY_STATUSES = ("done", "failed", "cancelled")
+HISTORY_KEYSET_SORTS = ("newest", "oldest")
+RESULT_MANIFEST_STATUSES = ("done", "failed")
+RESULT_PREVIEW_CHARS = 2000
+# Queued jobs are spaced out so a move can take the midpoint between its new
+# neighbours; the queue is renumbered only when two neighbours touch.
+QUEUE_POSITION_GAP = 1024
+JOB_EVENT_RECOVERED = "recovered"
+JOB_EVENT_MOVED = "moved"
+JOB_EVENT_FINISHED = ("done", "failed", "cancelled", JOB_EVENT_RECOVERED)
+WEBHOOK_DELIVERY_PENDING = "pending"
+WEBHOOK_DELIVERY_DELIVERED = "delivered"
+WEBHOOK_DELIVERY_FAILED = "failed"
+UPLOAD_ORIGIN_UPLOAD = "upload"
+UPLOAD_ORIGIN_HARDLINK = "hardlink"
+UPLOAD_ORIGIN_REFLINK = "reflink"
+# The job reads a file it does not own; it must never be deleted.
+UPLOAD_ORIGIN_REFERENCE = "reference"
 
 
 @dataclass
@@ -27,6 +71,126 @@ class JobRecord:
     source_relpath: str | None = None
     client: str | None = None
     client_job_id: str | None = None
+    priority: int = JOB_PRIORITY_NORMAL
+    transcription_mode: str = TRANSCRIPTION_MODE_STANDARD
+    transcript_pass: str | None = None
+    refines_job_id: str | None = None
+    callback_url: str | None = None
+    upload_sha256: str | None = None
+    upload_origin: str = UPLOAD_ORIGIN_UPLOAD
+
+
+@dataclass
+class ResultFileRecord:
+    name: str
+    format: str
+    size_bytes: int
+    sha256: str
+    preview: str | None = None
+    preview_truncated: bool = False
+
+
+@dataclass(frozen=True)
+class JobEvent:
+    job_id: str
+    event: str
+    created_at: str
+
+
+@dataclass(frozen=True)
+class WebhookDelivery:
+    id: int
+    job_id: str
+    url: str
+    status: str
+    attempts: int
+    next_attempt_at: str
+    created_at: str
+    last_error: str | None = None
+    delivered_at: str | None = None
+
+
+@dataclass(frozen=True)
+class JobTimingStats:
+    engine: str
+    day: str | None
+    jobs: int
+    wait_p50_seconds: float | None
+    wait_p95_seconds: float | None
+    run_p50_seconds: float | None
+    run_p95_seconds: float | None
+
+
+_JOB_COLUMNS = (
+    "id",
+    "filename",
+    "status",
+    "created_at",
+    "upload_path",
+    "language",
+    "started_at",
+    "completed_at",
+    "error_message",
+    "queue_position",
+    "requested_engine",
+    "effective_engine",
+    "effective_implementation_id",
+    "source_path",
+    "source_relpath",
+    "client",
+    "client_job_id",
+    "priority",
+    "transcription_mode",
+    "transcript_pass",
+    "refines_job_id",
+    "callback_url",
+    "upload_sha256",
+    "upload_origin",
+)
+_JOB_SELECT_COLUMNS = ",\n                ".join(_JOB_COLUMNS)
+_JOB_SUMMARY_COLUMNS = tuple(
+    column for column in _JOB_COLUMNS if column not in {"upload_path", "source_path"}
+)
+_JOB_SUMMARY_SELECT_COLUMNS = ",\n                ".join(_JOB_SUMMARY_COLUMNS)
+
+
+class JobSummary:
+    """Job row without local file paths, used by the state polling endpoints."""
+
+    __slots__ = _JOB_SUMMARY_COLUMNS
+
+    id: str
+    filename: str
+    status: str
+    created_at: str
+    language: str
+    started_at: str | None
+    completed_at: str | None
+    error_message: str | None
+    queue_position: int | None
+    requested_engine: str | None
+    effective_engine: str | None
+    effective_implementation_id: str | None
+    source_relpath: str | None
+    client: str | None
+    client_job_id: str | None
+    priority: int
+    transcription_mode: str
+    transcript_pass: str | None
+    refines_job_id: str | None
+    callback_url: str | None
+    upload_sha256: str | None
+    upload_origin: str
+
+    def __init__(self, values: tuple[object, ...]) -> None:
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+        if self.status == "reserved":
+            self.status = "running"
+        self.language = _normalize_stored_language(self.language)
+
+    def to_dict(self) -> dict[str, object]:
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 SCHEMA = """
@@ -47,20 +211,359 @@ CREATE TABLE IF NOT EXISTS jobs (
     source_path TEXT,
     source_relpath TEXT,
     client TEXT,
-    client_job_id TEXT
+    client_job_id TEXT,
+    priority INTEGER NOT NULL DEFAULT 0,
+    transcription_mode TEXT NOT NULL DEFAULT 'standard',
+    transcript_pass TEXT,
+    refines_job_id TEXT,
+    callback_url TEXT,
+    upload_sha256 TEXT,
+    upload_origin TEXT NOT NULL DEFAULT 'upload',
+    results_recorded INTEGER NOT NULL DEFAULT 0,
+    finished_at TEXT GENERATED ALWAYS AS (COALESCE(completed_at, created_at)) VIRTUAL
 );
 """
 
+# Exact per-status row counts, kept in step with jobs by triggers so history
+# totals never need a COUNT(*) over the whole table.
+JOB_STATUS_COUNTS_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS job_status_counts (
+        status TEXT PRIMARY KEY,
+        job_count INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_status_count_insert
+    AFTER INSERT ON jobs BEGIN
+        INSERT INTO job_status_counts (status, job_count)
+        VALUES (new.status, 1)
+        ON CONFLICT(status) DO UPDATE SET job_count = job_count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_status_count_delete
+    AFTER DELETE ON jobs BEGIN
+        UPDATE job_status_counts
+        SET job_count = job_count - 1
+        WHERE status = old.status;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_status_count_update
+    AFTER UPDATE OF status ON jobs
+    WHEN old.status IS NOT new.status BEGIN
+        UPDATE job_status_counts
+        SET job_count = job_count - 1
+        WHERE status = old.status;
+        INSERT INTO job_status_counts (status, job_count)
+        VALUES (new.status, 1)
+        ON CONFLICT(status) DO UPDATE SET job_count = job_count + 1;
+    END
+    """,
+)
+
+# Every job gets a job_transcripts row holding its display name and, once done, its
+# transcript (NULL until indexed). The external-content FTS5 table indexes both
+# columns without storing the text twice, and snippet() reads it back from here.
+TRANSCRIPT_SEARCH_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS job_transcripts (
+        doc_id INTEGER PRIMARY KEY,
+        job_id TEXT NOT NULL UNIQUE,
+        title TEXT NOT NULL,
+        transcript TEXT
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_job_transcripts_pending
+    ON job_transcripts(job_id)
+    WHERE transcript IS NULL
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS job_transcripts_fts USING fts5(
+        title,
+        transcript,
+        content='job_transcripts',
+        content_rowid='doc_id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_transcripts_ai
+    AFTER INSERT ON job_transcripts BEGIN
+        INSERT INTO job_transcripts_fts(rowid, title, transcript)
+        VALUES (new.doc_id, new.title, new.transcript);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_transcripts_ad
+    AFTER DELETE ON job_transcripts BEGIN
+        INSERT INTO job_transcripts_fts(job_transcripts_fts, rowid, title, transcript)
+        VALUES ('delete', old.doc_id, old.title, old.transcript);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS job_transcripts_au
+    AFTER UPDATE ON job_transcripts BEGIN
+        INSERT INTO job_transcripts_fts(job_transcripts_fts, rowid, title, transcript)
+        VALUES ('delete', old.doc_id, old.title, old.transcript);
+        INSERT INTO job_transcripts_fts(rowid, title, transcript)
+        VALUES (new.doc_id, new.title, new.transcript);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_transcript_insert
+    AFTER INSERT ON jobs BEGIN
+        INSERT INTO job_transcripts (job_id, title)
+        VALUES (new.id, new.filename);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_transcript_cleanup
+    AFTER DELETE ON jobs BEGIN
+        DELETE FROM job_transcripts WHERE job_id = old.id;
+    END
+    """,
+    """
+    INSERT INTO job_transcripts (job_id, title)
+    SELECT id, filename
+    FROM jobs
+    WHERE NOT EXISTS (
+        SELECT 1 FROM job_transcripts WHERE job_transcripts.job_id = jobs.id
+    )
+    """,
+)
+
+# What the worker wrote for each job, so listing results never touches the
+# results directory. jobs.results_recorded tells an empty manifest apart from
+# one that was never taken (rows written by older builds).
+JOB_RESULTS_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS job_results (
+        job_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        format TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        sha256 TEXT NOT NULL,
+        preview TEXT,
+        preview_truncated INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (job_id, name)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_jobs_results_pending
+    ON jobs(id)
+    WHERE results_recorded = 0 AND status IN ('done', 'failed')
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_results_cleanup
+    AFTER DELETE ON jobs BEGIN
+        DELETE FROM job_results WHERE job_id = old.id;
+    END
+    """,
+)
+
+# Append-only log of status transitions (plus queue moves), written next to the
+# jobs update it describes. Events go away with their job row.
+JOB_EVENTS_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS job_events (
+        id INTEGER PRIMARY KEY,
+        job_id TEXT NOT NULL,
+        event TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_job_events_job
+    ON job_events(job_id, event)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_job_events_event_created
+    ON job_events(event, created_at)
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_events_cleanup
+    AFTER DELETE ON jobs BEGIN
+        DELETE FROM job_events WHERE job_id = old.id;
+    END
+    """,
+)
+
+# Durable outbox for job completion callbacks; rows are queued in the same
+# transaction that finishes the job.
+WEBHOOK_DELIVERIES_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS webhook_deliveries (
+        id INTEGER PRIMARY KEY,
+        job_id TEXT NOT NULL,
+        url TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        next_attempt_at TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        last_error TEXT,
+        delivered_at TEXT
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_webhook_deliveries_due
+    ON webhook_deliveries(status, next_attempt_at)
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS jobs_webhook_deliveries_cleanup
+    AFTER DELETE ON jobs BEGIN
+        DELETE FROM webhook_deliveries WHERE job_id = old.id;
+    END
+    """,
+)
+
+
+_thread_connections = threading.local()
+
 
 def _connect(db_path: Path) -> sqlite3.Connection:
+    connections: dict[str, tuple[sqlite3.Connection, tuple[int, int] | None]]
+    connections = getattr(_thread_connections, "connections", None)
+    if connections is None:
+        connections = {}
+        _thread_connections.connections = connections
+    key = str(db_path)
+    cached = connections.get(key)
+    if cached is not None:
+        connection, identity = cached
+        if identity is not None and identity == _db_file_identity(db_path):
+            return connection
+        # The file was removed or replaced underneath this thread's connection.
+        connection.close()
+        del connections[key]
+    connection = _open_connection(db_path)
+    connections[key] = (connection, _db_file_identity(db_path))
+    return connection
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
     connection = sqlite3.connect(db_path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS)
     connection.row_factory = sqlite3.Row
     connection.execute(
         f"PRAGMA busy_timeout = {int(SQLITE_BUSY_TIMEOUT_SECONDS * 1000)}"
     )
+    # Only takes effect on a new file; older databases switch to incremental
+    # mode on their first vacuum_db pass.
+    connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    connection.execute(f"PRAGMA wal_autocheckpoint = {SQLITE_WAL_AUTOCHECKPOINT_PAGES}")
     return connection
 
 
+def _db_file_identity(db_path: Path) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+@contextmanager
+def _immediate_transaction(db_path: Path) -> Iterator[sqlite3.Connection]:
+    connection = _connect(db_path)
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+    except BaseException:
+        connection.rollback()
+        raise
+    connection.commit()
+
+
+def checkpoint_db(db_path: Path) -> None:
+    _connect(db_path).execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+def vacuum_db(db_path: Path) -> int:
+    connection = _connect(db_path)
+    free_pages = int(connection.execute("PRAGMA freelist_count").fetchone()[0])
+    if free_pages <= 0:
+        return 0
+    mode = connection.execute("PRAGMA auto_vacuum").fetchone()[0]
+    if mode == SQLITE_AUTO_VACUUM_INCREMENTAL:
+        connection.execute("PRAGMA incremental_vacuum").fetchall()
+    else:
+        # Databases created before incremental mode need one full VACUUM to
+        # switch; after that each pass only releases the free pages.
+        connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        connection.execute("VACUUM")
+    return free_pages
+
+
+def archive_db_path(db_path: Path) -> Path:
+    return db_path.with_name(f"{db_path.stem}-archive{db_path.suffix}")
+
+
+_T = TypeVar("_T")
+_writers_lock = threading.Lock()
+_writers: dict[str, DbWriter] = {}
+
+
+def enable_db_writer(db_path: Path) -> DbWriter:
+    key = str(db_path)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = DbWriter(lambda: _connect(db_path))
+            _writers[key] = writer
+        return writer
+
+
+def stop_db_writers(timeout: float | None = None) -> None:
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.stop(timeout=timeout)
+
+
+def _submit_write(
+    db_path: Path,
+    operation: Callable[[sqlite3.Connection], _T],
+) -> Future:
+    with _writers_lock:
+        writer = _writers.get(str(db_path))
+    if writer is not None and not writer.owns_current_thread():
+        writer.start()
+        try:
+            future = writer.submit(operation)
+        except DbWriterClosed:
+            pass
+        else:
+            future.add_done_callback(_publish_committed_write)
+            return future
+    future = Future()
+    try:
+        with _immediate_transaction(db_path) as connection:
+            result = operation(connection)
+    except Exception as exc:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+        publish_change()
+    return future
+
+
+def _publish_committed_write(future: Future) -> None:
+    # Every committed write bumps the change sequence that state endpoints
+    # use for ETags and the browser event stream.
+    if not future.cancelled() and future.exception() is None:
+        publish_change()
+
+
+def _write(db_path: Path, operation: Callable[[sqlite3.Connection], _T]) -> _T:
+    return _submit_write(db_path, operation).result()
+
+
 def _job_record_from_data(job_data: dict[str, object]) -> JobRecord:
     if job_data.get("status") == "reserved":
         job_data["status"] = "running"
@@ -72,21 +575,129 @@ def _job_record_from_row(row: sqlite3.Row) -> JobRecord:
     return _job_record_from_data(dict(row))
 
 
+@lru_cache(maxsize=256)
+def _normalize_stored_language(value: str | None) -> str:
+    return normalize_language(value)
+
+
 def init_db(db_path: Path) -> None:
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    with _connect(db_path) as connection:
+    with _immediate_transaction(db_path) as connection:
         connection.execute(SCHEMA)
         _migrate_schema(connection)
-        connection.execute(
-            """
-            CREATE INDEX IF NOT EXISTS idx_jobs_status_completed_created
-            ON jobs(status, completed_at, created_at)
-            """
+    publish_change()
+
+
+def _ensure_job_status_counts(connection: sqlite3.Connection) -> None:
+    for statement in JOB_STATUS_COUNTS_SCHEMA:
+        connection.execute(statement)
+    connection.execute("DELETE FROM job_status_counts")
+    connection.execute(
+        """
+        INSERT INTO job_status_counts (status, job_count)
+        SELECT status, COUNT(*)
+        FROM jobs
+        GROUP BY status
+        """
+    )
+
+
+def _ensure_transcript_search(connection: sqlite3.Connection) -> None:
+    try:
+        for statement in TRANSCRIPT_SEARCH_SCHEMA:
+            connection.execute(statement)
+    except sqlite3.OperationalError as exc:
+        # SQLite builds without FTS5 fall back to the LIKE filename search.
+        if "fts5" not in str(exc):
+            raise
+
+
+def _has_transcript_search(connection: sqlite3.Connection) -> bool:
+    row = connection.execute(
+        """
+        SELECT 1
+        FROM sqlite_master
+        WHERE type = 'table' AND name = 'job_transcripts_fts'
+        """
+    ).fetchone()
+    return row is not None
+
+
+def _transcript_match_expression(query: str) -> str | None:
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return None
+    # Only the last term is a prefix so search-as-you-type stays cheap.
+    phrases = [f'"{term}"' for term in terms]
+    phrases[-1] += "*"
+    return " ".join(phrases)
+
+
+def _store_transcript(
+    connection: sqlite3.Connection,
+    job_id: str,
+    transcript: str,
+) -> None:
+    if not _has_transcript_search(connection):
+        return
+    connection.execute(
+        """
+        INSERT INTO job_transcripts (job_id, title, transcript)
+        SELECT id, filename, ?
+        FROM jobs
+        WHERE id = ?
+        ON CONFLICT(job_id) DO UPDATE SET transcript = excluded.transcript
+        """,
+        (transcript, job_id),
+    )
+
+
+def _store_job_results(
+    connection: sqlite3.Connection,
+    job_id: str,
+    results: list[ResultFileRecord],
+) -> None:
+    connection.execute("DELETE FROM job_results WHERE job_id = ?", (job_id,))
+    connection.executemany(
+        """
+        INSERT INTO job_results (
+            job_id,
+            name,
+            format,
+            size_bytes,
+            sha256,
+            preview,
+            preview_truncated
         )
-        connection.commit()
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                job_id,
+                result.name,
+                result.format,
+                result.size_bytes,
+                result.sha256,
+                result.preview,
+                int(result.preview_truncated),
+            )
+            for result in results
+        ],
+    )
+    connection.execute(
+        "UPDATE jobs SET results_recorded = 1 WHERE id = ?",
+        (job_id,),
+    )
 
 
 def _migrate_schema(connection: sqlite3.Connection) -> None:
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    for target, migration in enumerate(_MIGRATIONS[version:], start=version + 1):
+        migration(connection)
+        connection.execute(f"PRAGMA user_version = {target}")
+
+
+def _migrate_legacy_columns(connection: sqlite3.Connection) -> None:
     if not _table_has_column(connection, "jobs", "language"):
         connection.execute(
             f"ALTER TABLE jobs ADD COLUMN language TEXT NOT NULL DEFAULT '{AUTO_LANGUAGE}'"
@@ -115,6 +726,19 @@ def _migrate_schema(connection: sqlite3.Connection) -> None:
         connection.execute("ALTER TABLE jobs ADD COLUMN client TEXT")
     if not _table_has_column(connection, "jobs", "client_job_id"):
         connection.execute("ALTER TABLE jobs ADD COLUMN client_job_id TEXT")
+    if not _table_has_column(connection, "jobs", "priority"):
+        connection.execute(
+            "ALTER TABLE jobs ADD COLUMN priority INTEGER NOT NULL DEFAULT 0"
+        )
+    if not _table_has_column(connection, "jobs", "transcription_mode"):
+        connection.execute(
+            "ALTER TABLE jobs ADD COLUMN transcription_mode TEXT NOT NULL "
+            f"DEFAULT '{TRANSCRIPTION_MODE_STANDARD}'"
+        )
+    if not _table_has_column(connection, "jobs", "transcript_pass"):
+        connection.execute("ALTER TABLE jobs ADD COLUMN transcript_pass TEXT")
+    if not _table_has_column(connection, "jobs", "refines_job_id"):
+        connection.execute("ALTER TABLE jobs ADD COLUMN refines_job_id TEXT")
     connection.execute(
         """
         UPDATE jobs
@@ -129,6 +753,150 @@ def _migrate_schema(connection: sqlite3.Connection) -> None:
     _backfill_queue_positions(connection)
 
 
+def _migrate_finished_at(connection: sqlite3.Connection) -> None:
+    if not _table_has_column(connection, "jobs", "finished_at"):
+        connection.execute(
+            "ALTER TABLE jobs ADD COLUMN finished_at TEXT "
+            "GENERATED ALWAYS AS (COALESCE(completed_at, created_at)) VIRTUAL"
+        )
+    connection.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_jobs_status_finished
+        ON jobs(status, finished_at, id)
+        """
+    )
+    # History pages order on finished_at now, so nothing reads this one.
+    connection.execute("DROP INDEX IF EXISTS idx_jobs_status_completed_created")
+    _ensure_job_status_counts(connection)
+
+
+def _migrate_result_manifests(connection: sqlite3.Connection) -> None:
+    if not _table_has_column(connection, "jobs", "results_recorded"):
+        connection.execute(
+            "ALTER TABLE jobs ADD COLUMN results_recorded INTEGER NOT NULL DEFAULT 0"
+        )
+    for statement in JOB_RESULTS_SCHEMA:
+        connection.execute(statement)
+
+
+def _migrate_queue_position_index(connection: sqlite3.Connection) -> None:
+    connection.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_jobs_status_queue_position
+        ON jobs(status, queue_position)
+        """
+    )
+
+
+def _migrate_claim_order_index(connection: sqlite3.Connection) -> None:
+    # Mirrors the claim ORDER BY term for term, so picking the next job is one
+    # index seek instead of a sort over every queued row.
+    connection.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_jobs_status_priority_queue_position
+        ON jobs(status, priority, queue_position IS NULL, queue_position, created_at)
+        """
+    )
+
+
+def _migrate_client_job_index(connection: sqlite3.Connection) -> None:
+    # Older versions accepted retried submissions as new jobs. The newest one
+    # keeps the key, matching what the machine status endpoint returned.
+    connection.execute(
+        """
+        UPDATE jobs
+        SET client_job_id = NULL
+        WHERE client_job_id IS NOT NULL
+          AND EXISTS (
+              SELECT 1
+              FROM jobs AS newer
+              WHERE newer.client IS jobs.client
+                AND newer.client_job_id = jobs.client_job_id
+                AND (
+                    newer.created_at > jobs.created_at
+                    OR (newer.created_at = jobs.created_at AND newer.id > jobs.id)
+                )
+          )
+        """
+    )
+    connection.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_client_job
+        ON jobs(client, client_job_id)
+        WHERE client_job_id IS NOT NULL
+        """
+    )
+
+
+def _migrate_job_events(connection: sqlite3.Connection) -> None:
+    for statement in JOB_EVENTS_SCHEMA:
+        connection.execute(statement)
+    # Seed the log from the timestamps older rows already carry.
+    connection.execute(
+        """
+        INSERT INTO job_events (job_id, event, created_at)
+        SELECT id, 'queued', created_at FROM jobs
+        UNION ALL
+        SELECT id, 'running', started_at FROM jobs WHERE started_at IS NOT NULL
+        UNION ALL
+        SELECT id, status, completed_at
+        FROM jobs
+        WHERE completed_at IS NOT NULL
+          AND status IN ('done', 'failed', 'cancelled')
+        """
+    )
+
+
+def _migrate_webhook_deliveries(connection: sqlite3.Connection) -> None:
+    if not _table_has_column(connection, "jobs", "callback_url"):
+        connection.execute("ALTER TABLE jobs ADD COLUMN callback_url TEXT")
+    for statement in WEBHOOK_DELIVERIES_SCHEMA:
+        connection.execute(statement)
+
+
+def _migrate_upload_sha256(connection: sqlite3.Connection) -> None:
+    if not _table_has_column(connection, "jobs", "upload_sha256"):
+        connection.execute("ALTER TABLE jobs ADD COLUMN upload_sha256 TEXT")
+
+
+def _migrate_upload_origin(connection: sqlite3.Connection) -> None:
+    if not _table_has_column(connection, "jobs", "upload_origin"):
+        connection.execute(
+            "ALTER TABLE jobs ADD COLUMN upload_origin TEXT NOT NULL DEFAULT 'upload'"
+        )
+
+
+def _record_job_events(
+    connection: sqlite3.Connection,
+    event: str,
+    job_ids: list[str],
+    created_at: str | None = None,
+) -> None:
+    timestamp = created_at or _now_utc()
+    connection.executemany(
+        "INSERT INTO job_events (job_id, event, created_at) VALUES (?, ?, ?)",
+        [(job_id, event, timestamp) for job_id in job_ids],
+    )
+    if event in JOB_EVENT_FINISHED:
+        _enqueue_job_webhooks(connection, job_ids)
+
+
+def _enqueue_job_webhooks(connection: sqlite3.Connection, job_ids: list[str]) -> None:
+    if not job_ids:
+        return
+    now = _now_utc()
+    placeholders = ", ".join("?" for _ in job_ids)
+    connection.execute(
+        f"""
+        INSERT INTO webhook_deliveries (job_id, url, next_attempt_at, created_at)
+        SELECT id, callback_url, ?, ?
+        FROM jobs
+        WHERE id IN ({placeholders}) AND callback_url IS NOT NULL
+        """,
+        (now, now, *job_ids),
+    )
+
+
 def _backfill_effective_implementation_ids(connection: sqlite3.Connection) -> None:
     if not _table_has_column(connection, "jobs", "effective_implementation_id"):
         return
@@ -183,7 +951,7 @@ def _table_has_column(
     table_name: str,
     column_name: str,
 ) -> bool:
-    rows = connection.execute(f"PRAGMA table_info({table_name})").fetchall()
+    rows = connection.execute(f"PRAGMA table_xinfo({table_name})").fetchall()
     for row in rows:
         name = row["name"] if isinstance(row, sqlite3.Row) else row[1]
         if name == column_name:
@@ -217,50 +985,65 @@ def _backfill_queue_positions(connection: sqlite3.Connection) -> None:
         )
 
 
+# Ordered schema steps; PRAGMA user_version records how many have run, so each
+# step runs once per database. Append new steps, never reorder or edit old ones.
+_MIGRATIONS: tuple[Callable[[sqlite3.Connection], None], ...] = (
+    _migrate_legacy_columns,
+    _migrate_finished_at,
+    _ensure_transcript_search,
+    _migrate_result_manifests,
+    _migrate_queue_position_index,
+    _migrate_client_job_index,
+    _migrate_job_events,
+    _migrate_webhook_deliveries,
+    _migrate_upload_sha256,
+    _migrate_upload_origin,
+    _migrate_claim_order_index,
+)
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+
 def insert_job(db_path: Path, job: JobRecord) -> None:
-    with _connect(db_path) as connection:
+    submit_insert_job(db_path, job).result()
+
+
+def submit_insert_job(db_path: Path, job: JobRecord) -> Future:
+    return _submit_write(db_path, lambda connection: _insert_jobs(connection, [job]))
+
+
+def insert_jobs(db_path: Path, jobs: list[JobRecord]) -> None:
+    if not jobs:
+        return
+    _write(db_path, lambda connection: _insert_jobs(connection, jobs))
+
+
+def _insert_jobs(connection: sqlite3.Connection, jobs: list[JobRecord]) -> None:
+    next_position: int | None = None
+    values: list[tuple[object, ...]] = []
+    for job in jobs:
         queue_position = job.queue_position
-        language = normalize_language(job.language)
         if job.status == "queued" and queue_position is None:
-            row = connection.execute(
-                """
-                SELECT MAX(queue_position)
-                FROM jobs
-                WHERE status = 'queued'
-                """
-            ).fetchone()
-            max_position = row[0] if row and row[0] is not None else 0
-            queue_position = max_position + 1
-        connection.execute(
-            """
-            INSERT INTO jobs (
-                id,
-                filename,
-                status,
-                created_at,
-                upload_path,
-                language,
-                started_at,
-                completed_at,
-                error_message,
-                queue_position,
-                requested_engine,
-                effective_engine,
-                effective_implementation_id,
-                source_path,
-                source_relpath,
-                client,
-                client_job_id
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            if next_position is None:
+                row = connection.execute(
+                    """
+                    SELECT MAX(queue_position)
+                    FROM jobs
+                    WHERE status = 'queued'
+                    """
+                ).fetchone()
+                next_position = (row[0] if row and row[0] is not None else 0) + (
+                    QUEUE_POSITION_GAP
+                )
+            queue_position = next_position
+            next_position += QUEUE_POSITION_GAP
+        values.append(
             (
                 job.id,
                 job.filename,
                 job.status,
                 job.created_at,
                 job.upload_path,
-                language,
+                normalize_language(job.language),
                 job.started_at,
                 job.completed_at,
                 job.error_message,
@@ -272,33 +1055,35 @@ def insert_job(db_path: Path, job: JobRecord) -> None:
                 job.source_relpath,
                 job.client,
                 job.client_job_id,
-            ),
+                job.priority,
+                job.transcription_mode,
+                job.transcript_pass,
+                job.refines_job_id,
+                job.callback_url,
+                job.upload_sha256,
+                job.upload_origin,
+            )
         )
-        connection.commit()
+    placeholders = ", ".join("?" for _ in _JOB_COLUMNS)
+    connection.executemany(
+        f"""
+        INSERT INTO jobs ({", ".join(_JOB_COLUMNS)})
+        VALUES ({placeholders})
+        """,
+        values,
+    )
+    connection.executemany(
+        "INSERT INTO job_events (job_id, event, created_at) VALUES (?, ?, ?)",
+        [(job.id, job.status, job.created_at) for job in jobs],
+    )
 
 
 def list_jobs(db_path: Path) -> list[JobRecord]:
     with _connect(db_path) as connection:
         rows = connection.execute(
-            """
+            f"""
             SELECT
-                id,
-                filename,
-                status,
-                created_at,
-                upload_path,
-                language,
-                started_at,
-                completed_at,
-                error_message,
-                queue_position,
-                requested_engine,
-                effective_engine,
-                effective_implementation_id,
-                source_path,
-                source_relpath,
-                client,
-                client_job_id
+                {_JOB_SELECT_COLUMNS}
             FROM jobs
             ORDER BY
                 CASE
@@ -306,6 +1091,10 @@ def list_jobs(db_path: Path) -> list[JobRecord]:
                     WHEN status = 'queued' THEN 1
                     ELSE 2
                 END,
+                CASE
+                    WHEN status = 'queued' THEN priority
+                    ELSE 0
+                END,
                 CASE
                     WHEN status = 'queued' THEN queue_position IS NULL
                     ELSE 0
@@ -324,29 +1113,14 @@ def list_jobs(db_path: Path) -> list[JobRecord]:
 def list_active_jobs(db_path: Path) -> list[JobRecord]:
     with _connect(db_path) as connection:
         rows = connection.execute(
-            """
+            f"""
             SELECT
-                id,
-                filename,
-                status,
-                created_at,
-                upload_path,
-                language,
-                started_at,
-                completed_at,
-                error_message,
-                queue_position,
-                requested_engine,
-                effective_engine,
-                effective_implementation_id,
-                source_path,
-                source_relpath,
-                client,
-                client_job_id
+                {_JOB_SELECT_COLUMNS}
             FROM jobs
             WHERE status IN ('queued', 'running', 'reserved')
             ORDER BY
                 CASE WHEN status IN ('running', 'reserved') THEN 0 ELSE 1 END,
+                CASE WHEN status = 'queued' THEN priority ELSE 0 END,
                 CASE WHEN status = 'queued' THEN queue_position IS NULL ELSE 0 END,
                 CASE WHEN status = 'queued' THEN queue_position ELSE NULL END,
                 created_at ASC
@@ -360,28 +1134,12 @@ def list_recent_history_jobs(db_path: Path, *, limit: int) -> list[JobRecord]:
         return []
     with _connect(db_path) as connection:
         rows = connection.execute(
-            """
+            f"""
             SELECT
-                id,
-                filename,
-                status,
-                created_at,
-                upload_path,
-                language,
-                started_at,
-                completed_at,
-                error_message,
-                queue_position,
-                requested_engine,
-                effective_engine,
-                effective_implementation_id,
-                source_path,
-                source_relpath,
-                client,
-                client_job_id
+                {_JOB_SELECT_COLUMNS}
             FROM jobs
             WHERE status IN ('done', 'failed', 'cancelled')
-            ORDER BY COALESCE(completed_at, created_at) DESC, id DESC
+            ORDER BY finished_at DESC, id DESC
             LIMIT ?
             """,
             (limit,),
@@ -389,35 +1147,145 @@ def list_recent_history_jobs(db_path: Path, *, limit: int) -> list[JobRecord]:
     return [_job_record_from_row(row) for row in rows]
 
 
-def count_history_jobs(db_path: Path, *, status: str | None = None) -> int:
-    conditions = "status IN ('done', 'failed', 'cancelled')"
-    parameters: tuple[object, ...] = ()
-    if status is not None:
-        conditions += " AND status = ?"
-        parameters = (status,)
+def list_active_job_summaries(db_path: Path) -> list[JobSummary]:
     with _connect(db_path) as connection:
-        row = connection.execute(
-            f"SELECT COUNT(*) FROM jobs WHERE {conditions}",
-            parameters,
-        ).fetchone()
-    return int(row[0]) if row else 0
+        rows = connection.execute(
+            f"""
+            SELECT
+                {_JOB_SUMMARY_SELECT_COLUMNS}
+            FROM jobs
+            WHERE status IN ('queued', 'running', 'reserved')
+            ORDER BY
+                CASE WHEN status IN ('running', 'reserved') THEN 0 ELSE 1 END,
+                CASE WHEN status = 'queued' THEN priority ELSE 0 END,
+                CASE WHEN status = 'queued' THEN queue_position IS NULL ELSE 0 END,
+                CASE WHEN status = 'queued' THEN queue_position ELSE NULL END,
+                created_at ASC
+            """
+        ).fetchall()
+    return [JobSummary(row) for row in rows]
 
 
-def list_history_page(
-    db_path: Path,
-    *,
-    limit: int,
-    offset: int,
-    query: str = "",
-    status: str | None = None,
-    sort: str = "newest",
-) -> tuple[list[JobRecord], int]:
+def list_recent_history_summaries(db_path: Path, *, limit: int) -> list[JobSummary]:
     if limit <= 0:
-        return [], 0
-    conditions = ["status IN ('done', 'failed', 'cancelled')"]
-    parameters: list[object] = []
+        return []
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            f"""
+            SELECT
+                {_JOB_SUMMARY_SELECT_COLUMNS}
+            FROM jobs
+            WHERE status IN ('done', 'failed', 'cancelled')
+            ORDER BY finished_at DESC, id DESC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+    return [JobSummary(row) for row in rows]
+
+
+def count_history_jobs(db_path: Path, *, status: str | None = None) -> int:
+    with _connect(db_path) as connection:
+        return _count_statuses(connection, [status] if status else None)
+
+
+def count_jobs_by_status(db_path: Path) -> dict[str, int]:
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            "SELECT status, job_count FROM job_status_counts WHERE job_count > 0"
+        ).fetchall()
+    return {str(row["status"]): int(row["job_count"]) for row in rows}
+
+
+def list_history_page(
+    db_path: Path,
+    *,
+    limit: int,
+    offset: int = 0,
+    query: str = "",
+    status: str | None = None,
+    sort: str = "newest",
+    after: str | None = None,
+    include_archived: bool = False,
+) -> tuple[list[JobRecord], int]:
+    archive_path = archive_db_path(db_path)
+    if not include_archived or not archive_path.exists():
+        return _list_history_page(
+            db_path,
+            limit=limit,
+            offset=offset,
+            query=query,
+            status=status,
+            sort=sort,
+            after=after,
+        )
+    # Page each database up to the end of the requested window, then merge.
+    start = 0 if after is not None else offset
+    jobs: dict[str, JobRecord] = {}
+    total = 0
+    for path in (db_path, archive_path):
+        page, page_total = _list_history_page(
+            path,
+            limit=start + limit,
+            query=query,
+            status=status,
+            sort=sort,
+            after=after,
+        )
+        for job in page:
+            # A job can sit in both files if archiving stopped between its
+            # copy and delete steps.
+            jobs.setdefault(job.id, job)
+        total += page_total
+    merged = _sort_history_jobs(list(jobs.values()), sort)
+    return merged[start : start + limit], total
+
+
+def _sort_history_jobs(jobs: list[JobRecord], sort: str) -> list[JobRecord]:
+    def finished_key(job: JobRecord) -> tuple[str, str]:
+        return job.completed_at or job.created_at, job.id
+
+    if sort == "oldest":
+        return sorted(jobs, key=finished_key)
+    ordered = sorted(jobs, key=finished_key, reverse=True)
+    if sort == "name":
+        ordered.sort(key=lambda job: (job.filename.lower(), job.filename))
+    return ordered
+
+
+def _list_history_page(
+    db_path: Path,
+    *,
+    limit: int,
+    offset: int = 0,
+    query: str = "",
+    status: str | None = None,
+    sort: str = "newest",
+    after: str | None = None,
+) -> tuple[list[JobRecord], int]:
+    if limit <= 0:
+        return [], 0
+    conditions = ["status IN ('done', 'failed', 'cancelled')"]
+    parameters: list[object] = []
     normalized_query = query.strip()
-    if normalized_query:
+    match_expression = (
+        _transcript_match_expression(normalized_query)
+        if normalized_query and _has_transcript_search(_connect(db_path))
+        else None
+    )
+    from_sql = "jobs"
+    if match_expression is not None:
+        # CROSS JOIN keeps the FTS match as the outer loop; without ANALYZE
+        # stats SQLite would otherwise walk every history row by status.
+        from_sql = """
+            job_transcripts_fts
+            JOIN job_transcripts
+              ON job_transcripts.doc_id = job_transcripts_fts.rowid
+            CROSS JOIN jobs ON jobs.id = job_transcripts.job_id
+        """
+        conditions.append("job_transcripts_fts MATCH ?")
+        parameters.append(match_expression)
+    elif normalized_query:
         conditions.append("LOWER(filename) LIKE ? ESCAPE '\\'")
         escaped_query = (
             normalized_query.lower()
@@ -429,53 +1297,491 @@ def list_history_page(
     if status is not None:
         conditions.append("status = ?")
         parameters.append(status)
-    where_sql = " AND ".join(conditions)
+    count_sql = " AND ".join(conditions)
+    count_parameters = list(parameters)
     order_sql = {
-        "newest": "COALESCE(completed_at, created_at) DESC, id DESC",
-        "oldest": "COALESCE(completed_at, created_at) ASC, id ASC",
-        "name": (
-            "LOWER(filename) ASC, filename ASC, "
-            "COALESCE(completed_at, created_at) DESC, id DESC"
-        ),
+        "newest": "finished_at DESC, id DESC",
+        "oldest": "finished_at ASC, id ASC",
+        "name": "LOWER(filename) ASC, filename ASC, finished_at DESC, id DESC",
     }.get(sort)
     if order_sql is None:
         raise ValueError(f"Unsupported history sort: {sort}")
+    if after is not None:
+        if sort not in HISTORY_KEYSET_SORTS:
+            raise ValueError(f"History sort {sort} does not support cursors")
+        comparison = "<" if sort == "newest" else ">"
+        conditions.append(f"(finished_at, id) {comparison} (?, ?)")
+        parameters.extend(_decode_history_cursor(after))
+        offset = 0
+    where_sql = " AND ".join(conditions)
     with _connect(db_path) as connection:
-        count_row = connection.execute(
-            f"SELECT COUNT(*) FROM jobs WHERE {where_sql}",
-            parameters,
-        ).fetchone()
+        if normalized_query:
+            count_row = connection.execute(
+                f"SELECT COUNT(*) FROM {from_sql} WHERE {count_sql}",
+                count_parameters,
+            ).fetchone()
+            total = int(count_row[0]) if count_row else 0
+        else:
+            total = _count_statuses(connection, [status] if status else None)
         rows = connection.execute(
             f"""
             SELECT
-                id,
-                filename,
-                status,
-                created_at,
-                upload_path,
-                language,
-                started_at,
-                completed_at,
-                error_message,
-                queue_position,
-                requested_engine,
-                effective_engine,
-                effective_implementation_id,
-                source_path,
-                source_relpath,
-                client,
-                client_job_id
-            FROM jobs
+                {_JOB_SELECT_COLUMNS}
+            FROM {from_sql}
             WHERE {where_sql}
             ORDER BY {order_sql}
             LIMIT ? OFFSET ?
             """,
             (*parameters, limit, offset),
         ).fetchall()
-    total = int(count_row[0]) if count_row else 0
     return [_job_record_from_row(row) for row in rows], total
 
 
+def encode_history_cursor(job: JobRecord) -> str:
+    payload = json.dumps([job.completed_at or job.created_at, job.id])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_history_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        finished_at, job_id = json.loads(base64.urlsafe_b64decode(cursor))
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid history cursor") from exc
+    if not isinstance(finished_at, str) or not isinstance(job_id, str):
+        raise ValueError("Invalid history cursor")
+    return finished_at, job_id
+
+
+def _count_statuses(
+    connection: sqlite3.Connection,
+    statuses: list[str] | None = None,
+) -> int:
+    selected = list(statuses or HISTORY_STATUSES)
+    placeholders = ", ".join("?" for _ in selected)
+    row = connection.execute(
+        f"""
+        SELECT COALESCE(SUM(job_count), 0)
+        FROM job_status_counts
+        WHERE status IN ({placeholders})
+        """,
+        selected,
+    ).fetchone()
+    return int(row[0]) if row else 0
+
+
+def find_transcript_snippets(
+    db_path: Path,
+    job_ids: list[str],
+    query: str,
+) -> dict[str, str]:
+    match_expression = _transcript_match_expression(query)
+    if not job_ids or match_expression is None:
+        return {}
+    placeholders = ", ".join("?" for _ in job_ids)
+    snippets: dict[str, str] = {}
+    with _connect(db_path) as connection:
+        if not _has_transcript_search(connection):
+            return {}
+        documents = connection.execute(
+            f"""
+            SELECT job_id, doc_id
+            FROM job_transcripts
+            WHERE job_id IN ({placeholders})
+            """,
+            job_ids,
+        ).fetchall()
+        # One lookup per page row: joining on the match would build a snippet
+        # for every matching transcript, not just the ones on screen.
+        for document in documents:
+            row = connection.execute(
+                """
+                SELECT snippet(job_transcripts_fts, 1, ?, ?, '…', ?)
+                FROM job_transcripts_fts
+                WHERE job_transcripts_fts MATCH ? AND rowid = ?
+                """,
+                (
+                    TRANSCRIPT_SNIPPET_START,
+                    TRANSCRIPT_SNIPPET_END,
+                    TRANSCRIPT_SNIPPET_TOKENS,
+                    match_expression,
+                    document["doc_id"],
+                ),
+            ).fetchone()
+            # Rows that matched on the filename alone come back unhighlighted.
+            if row and row[0] and TRANSCRIPT_SNIPPET_START in row[0]:
+                snippets[str(document["job_id"])] = str(row[0])
+    return snippets
+
+
+def index_job_transcripts(db_path: Path, transcripts: dict[str, str]) -> None:
+    if not transcripts:
+        return
+
+    def apply(connection: sqlite3.Connection) -> None:
+        for job_id, transcript in transcripts.items():
+            _store_transcript(connection, job_id, transcript)
+
+    _write(db_path, apply)
+
+
+def clear_transcript_index(db_path: Path, job_ids: list[str]) -> int:
+    if not job_ids:
+        return 0
+    placeholders = ", ".join("?" for _ in job_ids)
+
+    def apply(connection: sqlite3.Connection) -> int:
+        if not _has_transcript_search(connection):
+            return 0
+        cursor = connection.execute(
+            f"""
+            UPDATE job_transcripts
+            SET transcript = ''
+            WHERE job_id IN ({placeholders})
+            """,
+            job_ids,
+        )
+        return cursor.rowcount
+
+    return _write(db_path, apply)
+
+
+def list_unindexed_done_job_ids(db_path: Path, *, limit: int) -> list[str]:
+    with _connect(db_path) as connection:
+        if not _has_transcript_search(connection):
+            return []
+        rows = connection.execute(
+            """
+            SELECT jobs.id AS id
+            FROM job_transcripts
+            JOIN jobs ON jobs.id = job_transcripts.job_id
+            WHERE job_transcripts.transcript IS NULL
+              AND jobs.status = 'done'
+            ORDER BY jobs.id
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+    return [str(row["id"]) for row in rows]
+
+
+def record_job_results(
+    db_path: Path,
+    manifests: dict[str, list[ResultFileRecord]],
+) -> None:
+    if not manifests:
+        return
+
+    def apply(connection: sqlite3.Connection) -> None:
+        for job_id, results in manifests.items():
+            _store_job_results(connection, job_id, results)
+
+    _write(db_path, apply)
+
+
+def clear_job_results(db_path: Path, job_ids: list[str] | None = None) -> int:
+    if job_ids is not None and not job_ids:
+        return 0
+
+    def apply(connection: sqlite3.Connection) -> int:
+        if job_ids is None:
+            connection.execute("DELETE FROM job_results")
+            cursor = connection.execute("UPDATE jobs SET results_recorded = 1")
+            return cursor.rowcount
+        for job_id in job_ids:
+            _store_job_results(connection, job_id, [])
+        return len(job_ids)
+
+    return _write(db_path, apply)
+
+
+def list_job_results(
+    db_path: Path,
+    job_ids: list[str],
+) -> dict[str, list[ResultFileRecord]]:
+    if not job_ids:
+        return {}
+    placeholders = ", ".join("?" for _ in job_ids)
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            f"""
+            SELECT
+                jobs.id AS job_id,
+                job_results.name AS name,
+                job_results.format AS format,
+                job_results.size_bytes AS size_bytes,
+                job_results.sha256 AS sha256,
+                job_results.preview AS preview,
+                job_results.preview_truncated AS preview_truncated
+            FROM jobs
+            LEFT JOIN job_results ON job_results.job_id = jobs.id
+            WHERE jobs.id IN ({placeholders})
+              AND jobs.results_recorded = 1
+            ORDER BY jobs.id, job_results.name
+            """,
+            job_ids,
+        ).fetchall()
+    manifests: dict[str, list[ResultFileRecord]] = {}
+    for row in rows:
+        results = manifests.setdefault(str(row["job_id"]), [])
+        if row["name"] is None:
+            continue
+        results.append(
+            ResultFileRecord(
+                name=str(row["name"]),
+                format=str(row["format"]),
+                size_bytes=int(row["size_bytes"]),
+                sha256=str(row["sha256"]),
+                preview=row["preview"],
+                preview_truncated=bool(row["preview_truncated"]),
+            )
+        )
+    return manifests
+
+
+def list_unrecorded_result_job_ids(db_path: Path, *, limit: int) -> list[str]:
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            """
+            SELECT id
+            FROM jobs
+            WHERE results_recorded = 0 AND status IN ('done', 'failed')
+            ORDER BY id
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+    return [str(row["id"]) for row in rows]
+
+
+def list_job_events(db_path: Path, job_ids: list[str]) -> list[JobEvent]:
+    if not job_ids:
+        return []
+    placeholders = ", ".join("?" for _ in job_ids)
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            f"""
+            SELECT job_id, event, created_at
+            FROM job_events
+            WHERE job_id IN ({placeholders})
+            ORDER BY id ASC
+            """,
+            job_ids,
+        ).fetchall()
+    return [
+        JobEvent(
+            job_id=str(row["job_id"]),
+            event=str(row["event"]),
+            created_at=str(row["created_at"]),
+        )
+        for row in rows
+    ]
+
+
+def list_due_webhook_deliveries(
+    db_path: Path,
+    *,
+    now: str,
+    limit: int,
+    exclude_ids: list[int] | None = None,
+) -> list[WebhookDelivery]:
+    excluded = exclude_ids or []
+    exclude_sql = (
+        f"AND id NOT IN ({', '.join('?' for _ in excluded)})" if excluded else ""
+    )
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            f"""
+            SELECT *
+            FROM webhook_deliveries
+            WHERE status = ? AND next_attempt_at <= ? {exclude_sql}
+            ORDER BY next_attempt_at ASC, id ASC
+            LIMIT ?
+            """,
+            (WEBHOOK_DELIVERY_PENDING, now, *excluded, limit),
+        ).fetchall()
+    return [WebhookDelivery(**dict(row)) for row in rows]
+
+
+def list_webhook_deliveries(db_path: Path, job_id: str) -> list[WebhookDelivery]:
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            "SELECT * FROM webhook_deliveries WHERE job_id = ? ORDER BY id ASC",
+            (job_id,),
+        ).fetchall()
+    return [WebhookDelivery(**dict(row)) for row in rows]
+
+
+def mark_webhook_delivered(
+    db_path: Path,
+    delivery_id: int,
+    *,
+    delivered_at: str | None = None,
+) -> None:
+    def apply(connection: sqlite3.Connection) -> None:
+        connection.execute(
+            """
+            UPDATE webhook_deliveries
+            SET status = ?,
+                attempts = attempts + 1,
+                last_error = NULL,
+                delivered_at = ?
+            WHERE id = ?
+            """,
+            (WEBHOOK_DELIVERY_DELIVERED, delivered_at or _now_utc(), delivery_id),
+        )
+
+    _write(db_path, apply)
+
+
+def record_webhook_failure(
+    db_path: Path,
+    delivery_id: int,
+    *,
+    error: str,
+    retry_at: str | None,
+) -> None:
+    """Count a failed attempt; without ``retry_at`` the delivery is given up."""
+
+    def apply(connection: sqlite3.Connection) -> None:
+        connection.execute(
+            """
+            UPDATE webhook_deliveries
+            SET status = ?,
+                attempts = attempts + 1,
+                last_error = ?,
+                next_attempt_at = COALESCE(?, next_attempt_at)
+            WHERE id = ?
+            """,
+            (
+                WEBHOOK_DELIVERY_PENDING
+                if retry_at is not None
+                else WEBHOOK_DELIVERY_FAILED,
+                error,
+                retry_at,
+                delivery_id,
+            ),
+        )
+
+    _write(db_path, apply)
+
+
+def list_job_timing_stats(
+    db_path: Path,
+    *,
+    since: str,
+    by_day: bool = False,
+) -> list[JobTimingStats]:
+    """Nearest-rank p50/p95 of queue wait and run time for finished jobs.
+
+    Wait runs from the first ``queued`` event to the first ``running`` one and
+    run time from there to the finishing event. Jobs that never ran are left
+    out.
+    """
+    finished = ", ".join("?" for _ in JOB_EVENT_FINISHED)
+    day_sql = "substr(finished_at, 1, 10)" if by_day else "NULL"
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            f"""
+            WITH finished_jobs AS (
+                SELECT DISTINCT job_id
+                FROM job_events
+                WHERE event IN ({finished}) AND created_at >= ?
+            ),
+            spans AS (
+                SELECT
+                    COALESCE(jobs.effective_engine, jobs.requested_engine, 'unknown')
+                        AS engine,
+                    MIN(CASE WHEN event = 'queued' THEN job_events.created_at END)
+                        AS queued_at,
+                    MIN(CASE WHEN event = 'running' THEN job_events.created_at END)
+                        AS started_at,
+                    MAX(
+                        CASE
+                            WHEN event IN ({finished}) THEN job_events.created_at
+                        END
+                    ) AS finished_at
+                FROM finished_jobs
+                JOIN job_events ON job_events.job_id = finished_jobs.job_id
+                JOIN jobs ON jobs.id = finished_jobs.job_id
+                GROUP BY finished_jobs.job_id
+            ),
+            durations AS (
+                SELECT
+                    engine,
+                    {day_sql} AS day,
+                    (julianday(started_at) - julianday(queued_at)) * 86400.0
+                        AS wait_seconds,
+                    (julianday(finished_at) - julianday(started_at)) * 86400.0
+                        AS run_seconds
+                FROM spans
+                WHERE queued_at IS NOT NULL
+                  AND started_at IS NOT NULL
+                  AND finished_at IS NOT NULL
+            ),
+            ranked AS (
+                SELECT
+                    engine,
+                    day,
+                    wait_seconds,
+                    run_seconds,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY engine, day ORDER BY wait_seconds
+                    ) AS wait_rank,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY engine, day ORDER BY run_seconds
+                    ) AS run_rank,
+                    COUNT(*) OVER (PARTITION BY engine, day) AS job_count
+                FROM durations
+            )
+            SELECT
+                engine,
+                day,
+                job_count,
+                MAX(CASE WHEN wait_rank = (job_count * 50 + 99) / 100
+                    THEN wait_seconds END) AS wait_p50,
+                MAX(CASE WHEN wait_rank = (job_count * 95 + 99) / 100
+                    THEN wait_seconds END) AS wait_p95,
+                MAX(CASE WHEN run_rank = (job_count * 50 + 99) / 100
+                    THEN run_seconds END) AS run_p50,
+                MAX(CASE WHEN run_rank = (job_count * 95 + 99) / 100
+                    THEN run_seconds END) AS run_p95
+            FROM ranked
+            GROUP BY engine, day, job_count
+            ORDER BY day DESC, engine ASC
+            """,
+            (*JOB_EVENT_FINISHED, since, *JOB_EVENT_FINISHED),
+        ).fetchall()
+    return [
+        JobTimingStats(
+            engine=str(row["engine"]),
+            day=row["day"],
+            jobs=int(row["job_count"]),
+            wait_p50_seconds=_round_seconds(row["wait_p50"]),
+            wait_p95_seconds=_round_seconds(row["wait_p95"]),
+            run_p50_seconds=_round_seconds(row["run_p50"]),
+            run_p95_seconds=_round_seconds(row["run_p95"]),
+        )
+        for row in rows
+    ]
+
+
+def _round_seconds(value: float | None) -> float | None:
+    return None if value is None else round(float(value), 3)
+
+
+def count_queued_jobs_by_engine(db_path: Path) -> dict[str, int]:
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            """
+            SELECT COALESCE(requested_engine, 'unknown') AS engine, COUNT(*)
+            FROM jobs
+            WHERE status = 'queued'
+            GROUP BY engine
+            """
+        ).fetchall()
+    return {str(row[0]): int(row[1]) for row in rows}
+
+
 def find_job_by_client_job_id(
     db_path: Path,
     *,
@@ -484,29 +1790,11 @@ def find_job_by_client_job_id(
 ) -> JobRecord | None:
     with _connect(db_path) as connection:
         row = connection.execute(
-            """
+            f"""
             SELECT
-                id,
-                filename,
-                status,
-                created_at,
-                upload_path,
-                language,
-                started_at,
-                completed_at,
-                error_message,
-                queue_position,
-                requested_engine,
-                effective_engine,
-                effective_implementation_id,
-                source_path,
-                source_relpath,
-                client,
-                client_job_id
+                {_JOB_SELECT_COLUMNS}
             FROM jobs
             WHERE client = ? AND client_job_id = ?
-            ORDER BY created_at DESC, id DESC
-            LIMIT 1
             """,
             (client, client_job_id),
         ).fetchone()
@@ -515,28 +1803,35 @@ def find_job_by_client_job_id(
     return _job_record_from_row(row)
 
 
+def find_jobs_by_client_job_ids(
+    db_path: Path,
+    *,
+    client: str,
+    client_job_ids: list[str],
+) -> dict[str, JobRecord]:
+    if not client_job_ids:
+        return {}
+    placeholders = ", ".join("?" for _ in client_job_ids)
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            f"""
+            SELECT
+                {_JOB_SELECT_COLUMNS}
+            FROM jobs
+            WHERE client = ? AND client_job_id IN ({placeholders})
+            """,
+            (client, *client_job_ids),
+        ).fetchall()
+    jobs = [_job_record_from_row(row) for row in rows]
+    return {str(job.client_job_id): job for job in jobs}
+
+
 def get_job(db_path: Path, job_id: str) -> JobRecord | None:
     with _connect(db_path) as connection:
         row = connection.execute(
-            """
+            f"""
             SELECT
-                id,
-                filename,
-                status,
-                created_at,
-                upload_path,
-                language,
-                started_at,
-                completed_at,
-                error_message,
-                queue_position,
-                requested_engine,
-                effective_engine,
-                effective_implementation_id,
-                source_path,
-                source_relpath,
-                client,
-                client_job_id
+                {_JOB_SELECT_COLUMNS}
             FROM jobs
             WHERE id = ?
             """,
@@ -548,7 +1843,7 @@ def get_job(db_path: Path, job_id: str) -> JobRecord | None:
 
 
 def delete_queued_job(db_path: Path, job_id: str) -> bool:
-    with _connect(db_path) as connection:
+    def apply(connection: sqlite3.Connection) -> bool:
         cursor = connection.execute(
             """
             DELETE FROM jobs
@@ -556,12 +1851,13 @@ def delete_queued_job(db_path: Path, job_id: str) -> bool:
             """,
             (job_id,),
         )
-        connection.commit()
-    return cursor.rowcount > 0
+        return cursor.rowcount > 0
+
+    return _write(db_path, apply)
 
 
 def delete_history_job(db_path: Path, job_id: str) -> bool:
-    with _connect(db_path) as connection:
+    def apply(connection: sqlite3.Connection) -> bool:
         cursor = connection.execute(
             """
             DELETE FROM jobs
@@ -569,32 +1865,45 @@ def delete_history_job(db_path: Path, job_id: str) -> bool:
             """,
             (job_id,),
         )
-        connection.commit()
-    return cursor.rowcount > 0
+        if cursor.rowcount > 0:
+            # The worker discards a running refinement once its draft is gone.
+            connection.execute(
+                """
+                DELETE FROM jobs
+                WHERE refines_job_id = ?
+                  AND status IN ('queued', 'reserved', 'running')
+                """,
+                (job_id,),
+            )
+        return cursor.rowcount > 0
+
+    return _write(db_path, apply)
+
+
+def list_running_refinements(db_path: Path, job_ids: list[str]) -> list[JobRecord]:
+    if not job_ids:
+        return []
+    placeholders = ", ".join("?" for _ in job_ids)
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            f"""
+            SELECT
+                {_JOB_SELECT_COLUMNS}
+            FROM jobs
+            WHERE status IN ('running', 'reserved')
+              AND refines_job_id IN ({placeholders})
+            """,
+            job_ids,
+        ).fetchall()
+    return [_job_record_from_row(row) for row in rows]
 
 
 def list_history_jobs(db_path: Path) -> list[JobRecord]:
     with _connect(db_path) as connection:
         rows = connection.execute(
-            """
+            f"""
             SELECT
-                id,
-                filename,
-                status,
-                created_at,
-                upload_path,
-                language,
-                started_at,
-                completed_at,
-                error_message,
-                queue_position,
-                requested_engine,
-                effective_engine,
-                effective_implementation_id,
-                source_path,
-                source_relpath,
-                client,
-                client_job_id
+                {_JOB_SELECT_COLUMNS}
             FROM jobs
             WHERE status IN ('done', 'failed', 'cancelled')
             """
@@ -617,19 +1926,113 @@ def list_expired_terminal_job_ids(
             SELECT id
             FROM jobs
             WHERE status IN ('done', 'failed', 'cancelled')
-              AND julianday(COALESCE(completed_at, created_at)) < julianday(?)
+              AND julianday(COALESCE(completed_at, created_at)) < julianday(?)
+              AND id IN ({placeholders})
+            """,
+            (cutoff, *job_ids),
+        ).fetchall()
+    return {str(row["id"]) for row in rows}
+
+
+def list_archivable_job_ids(db_path: Path, *, cutoff: str, limit: int) -> list[str]:
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            """
+            SELECT id
+            FROM jobs
+            WHERE status IN ('done', 'failed', 'cancelled')
+              AND finished_at < ?
+            ORDER BY finished_at, id
+            LIMIT ?
+            """,
+            (cutoff, limit),
+        ).fetchall()
+    return [str(row["id"]) for row in rows]
+
+
+def archive_history_jobs(db_path: Path, archive_path: Path, job_ids: list[str]) -> int:
+    if not job_ids:
+        return 0
+    placeholders = ", ".join("?" for _ in job_ids)
+    with _connect(db_path) as connection:
+        rows = connection.execute(
+            f"""
+            SELECT
+                {_JOB_SELECT_COLUMNS},
+                results_recorded
+            FROM jobs
+            WHERE status IN ('done', 'failed', 'cancelled')
               AND id IN ({placeholders})
             """,
-            (cutoff, *job_ids),
+            job_ids,
         ).fetchall()
-    return {str(row["id"]) for row in rows}
+        transcripts: dict[str, str] = {}
+        if _has_transcript_search(connection):
+            transcripts = {
+                str(row["job_id"]): str(row["transcript"])
+                for row in connection.execute(
+                    f"""
+                    SELECT job_id, transcript
+                    FROM job_transcripts
+                    WHERE job_id IN ({placeholders}) AND transcript IS NOT NULL
+                    """,
+                    job_ids,
+                )
+            }
+    archived_ids = [str(row["id"]) for row in rows]
+    manifests = list_job_results(db_path, archived_ids)
+    events = list_job_events(db_path, archived_ids)
+    columns = (*_JOB_COLUMNS, "results_recorded")
+    column_sql = ", ".join(columns)
+    value_sql = ", ".join("?" for _ in columns)
+
+    def apply(connection: sqlite3.Connection) -> None:
+        # A key reused after its first job was archived moves to the newer job.
+        connection.executemany(
+            """
+            UPDATE jobs
+            SET client_job_id = NULL
+            WHERE client = ? AND client_job_id = ? AND id != ?
+            """,
+            [
+                (row["client"], row["client_job_id"], row["id"])
+                for row in rows
+                if row["client_job_id"] is not None
+            ],
+        )
+        connection.executemany(
+            f"""
+            INSERT INTO jobs ({column_sql})
+            VALUES ({value_sql})
+            ON CONFLICT(id) DO NOTHING
+            """,
+            [tuple(row[column] for column in columns) for row in rows],
+        )
+        for job_id, transcript in transcripts.items():
+            _store_transcript(connection, job_id, transcript)
+        for job_id, results in manifests.items():
+            _store_job_results(connection, job_id, results)
+        connection.executemany(
+            "DELETE FROM job_events WHERE job_id = ?",
+            [(job_id,) for job_id in archived_ids],
+        )
+        connection.executemany(
+            "INSERT INTO job_events (job_id, event, created_at) VALUES (?, ?, ?)",
+            [(event.job_id, event.event, event.created_at) for event in events],
+        )
+
+    # The copy commits before the delete, so a crash in between leaves the
+    # job in both files rather than in neither; the next pass finishes it.
+    _write(archive_path, apply)
+    return delete_history_jobs(db_path, archived_ids)
 
 
 def delete_history_jobs(db_path: Path, job_ids: list[str]) -> int:
     if not job_ids:
         return 0
     placeholders = ", ".join("?" for _ in job_ids)
-    with _connect(db_path) as connection:
+
+    def apply(connection: sqlite3.Connection) -> int:
         cursor = connection.execute(
             f"""
             DELETE FROM jobs
@@ -638,8 +2041,17 @@ def delete_history_jobs(db_path: Path, job_ids: list[str]) -> int:
             """,
             job_ids,
         )
-        connection.commit()
-    return cursor.rowcount
+        connection.execute(
+            f"""
+            DELETE FROM jobs
+            WHERE status IN ('queued', 'reserved', 'running')
+              AND refines_job_id IN ({placeholders})
+            """,
+            job_ids,
+        )
+        return cursor.rowcount
+
+    return _write(db_path, apply)
 
 
 def reorder_queue(db_path: Path, job_ids: list[str]) -> bool:
@@ -652,7 +2064,8 @@ def reorder_queue(db_path: Path, job_ids: list[str]) -> bool:
         return queued_count == 0
     if len(set(job_ids)) != len(job_ids):
         return False
-    with _connect(db_path) as connection:
+
+    def apply(connection: sqlite3.Connection) -> bool:
         queued_rows = connection.execute(
             """
             SELECT id
@@ -665,18 +2078,154 @@ def reorder_queue(db_path: Path, job_ids: list[str]) -> bool:
             return False
         if set(queued_ids) != set(job_ids):
             return False
-        for index, job_id in enumerate(job_ids, start=1):
-            connection.execute(
-                "UPDATE jobs SET queue_position = ? WHERE id = ?",
-                (index, job_id),
+        connection.executemany(
+            "UPDATE jobs SET queue_position = ? WHERE id = ?",
+            [
+                (index * QUEUE_POSITION_GAP, job_id)
+                for index, job_id in enumerate(job_ids, start=1)
+            ],
+        )
+        _record_job_events(connection, JOB_EVENT_MOVED, job_ids)
+        return True
+
+    return _write(db_path, apply)
+
+
+def move_queued_job(
+    db_path: Path,
+    job_id: str,
+    *,
+    before: str | None = None,
+    after: str | None = None,
+) -> int | None:
+    if before is not None and after is not None:
+        raise ValueError("move_queued_job accepts before or after, not both")
+    anchor_id = before if before is not None else after
+    if anchor_id == job_id:
+        raise ValueError("a job cannot be moved relative to itself")
+
+    def apply(connection: sqlite3.Connection) -> int | None:
+        positions = _queued_positions(connection, job_id, anchor_id)
+        if job_id not in positions or (
+            anchor_id is not None and anchor_id not in positions
+        ):
+            return None
+        position = None
+        if None not in positions.values():
+            position = _queue_move_target(
+                connection,
+                job_id,
+                anchor_id,
+                positions,
+                before=before is not None,
+            )
+        if position is None:
+            _rebalance_queue_positions(connection)
+            position = _queue_move_target(
+                connection,
+                job_id,
+                anchor_id,
+                _queued_positions(connection, job_id, anchor_id),
+                before=before is not None,
             )
-        connection.commit()
-    return True
+        connection.execute(
+            "UPDATE jobs SET queue_position = ? WHERE id = ?",
+            (position, job_id),
+        )
+        _record_job_events(connection, JOB_EVENT_MOVED, [job_id])
+        return position
+
+    return _write(db_path, apply)
+
+
+def _queued_positions(
+    connection: sqlite3.Connection,
+    job_id: str,
+    anchor_id: str | None,
+) -> dict[str, int | None]:
+    rows = connection.execute(
+        """
+        SELECT id, queue_position
+        FROM jobs
+        WHERE status = 'queued' AND id IN (?, ?)
+        """,
+        (job_id, anchor_id),
+    ).fetchall()
+    return {str(row["id"]): row["queue_position"] for row in rows}
+
+
+def _queue_move_target(
+    connection: sqlite3.Connection,
+    job_id: str,
+    anchor_id: str | None,
+    positions: dict[str, int | None],
+    *,
+    before: bool,
+) -> int | None:
+    if anchor_id is None:
+        row = connection.execute(
+            """
+            SELECT MIN(queue_position)
+            FROM jobs
+            WHERE status = 'queued' AND id != ?
+            """,
+            (job_id,),
+        ).fetchone()
+        if row[0] is None:
+            return positions[job_id]
+        return int(row[0]) - QUEUE_POSITION_GAP
+    anchor_position = int(positions[anchor_id] or 0)
+    if before:
+        row = connection.execute(
+            """
+            SELECT MAX(queue_position)
+            FROM jobs
+            WHERE status = 'queued' AND queue_position < ? AND id != ?
+            """,
+            (anchor_position, job_id),
+        ).fetchone()
+        if row[0] is None:
+            return anchor_position - QUEUE_POSITION_GAP
+        low, high = int(row[0]), anchor_position
+    else:
+        row = connection.execute(
+            """
+            SELECT MIN(queue_position)
+            FROM jobs
+            WHERE status = 'queued' AND queue_position > ? AND id != ?
+            """,
+            (anchor_position, job_id),
+        ).fetchone()
+        if row[0] is None:
+            return anchor_position + QUEUE_POSITION_GAP
+        low, high = anchor_position, int(row[0])
+    if high - low < 2:
+        return None
+    return (low + high) // 2
+
+
+def _rebalance_queue_positions(connection: sqlite3.Connection) -> None:
+    rows = connection.execute(
+        """
+        SELECT id
+        FROM jobs
+        WHERE status = 'queued'
+        ORDER BY queue_position IS NULL, queue_position ASC, created_at ASC
+        """
+    ).fetchall()
+    connection.executemany(
+        "UPDATE jobs SET queue_position = ? WHERE id = ?",
+        [
+            (index * QUEUE_POSITION_GAP, row["id"])
+            for index, row in enumerate(rows, start=1)
+        ],
+    )
 
 
 def cancel_running_job(db_path: Path, job_id: str) -> bool:
     completed_at = _now_utc()
-    with _connect(db_path) as connection:
+
+    def apply(connection: sqlite3.Connection) -> bool:
         cursor = connection.execute(
             """
             UPDATE jobs
@@ -686,8 +2235,11 @@ def cancel_running_job(db_path: Path, job_id: str) -> bool:
             """,
             (completed_at, job_id),
         )
-        connection.commit()
-    return cursor.rowcount > 0
+        if cursor.rowcount > 0:
+            _record_job_events(connection, "cancelled", [job_id], completed_at)
+        return cursor.rowcount > 0
+
+    return _write(db_path, apply)
 
 
 def update_job_status(
@@ -714,7 +2266,12 @@ def update_job_status(
         updates["effective_implementation_id"] = effective_implementation_id
     set_clause = ", ".join(f"{column} = ?" for column in updates)
     values = list(updates.values()) + [job_id]
-    with _connect(db_path) as connection:
+
+    def apply(connection: sqlite3.Connection) -> None:
+        previous = connection.execute(
+            "SELECT status FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
         connection.execute(
             f"""
             UPDATE jobs
@@ -723,7 +2280,15 @@ def update_job_status(
             """,
             values,
         )
-        connection.commit()
+        if previous is not None and previous["status"] != status:
+            _record_job_events(
+                connection,
+                status,
+                [job_id],
+                completed_at or started_at,
+            )
+
+    _write(db_path, apply)
 
 
 def recover_running_jobs(
@@ -733,7 +2298,37 @@ def recover_running_jobs(
 ) -> int:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     completed_at = _now_utc()
-    with _connect(db_path) as connection:
+
+    def apply(connection: sqlite3.Connection) -> int:
+        # A refinement only upgrades a published draft, so run it again
+        # rather than failing it as a job of its own.
+        refinement_ids = [
+            str(row["id"])
+            for row in connection.execute(
+                """
+                SELECT id FROM jobs
+                WHERE status IN ('running', 'reserved')
+                  AND refines_job_id IS NOT NULL
+                """
+            )
+        ]
+        connection.execute(
+            """
+            UPDATE jobs
+            SET status = 'queued',
+                started_at = NULL
+            WHERE status IN ('running', 'reserved')
+              AND refines_job_id IS NOT NULL
+            """
+        )
+        _record_job_events(connection, "queued", refinement_ids, completed_at)
+        job_ids = [
+            str(row["id"])
+            for row in connection.execute(
+                "SELECT id FROM jobs WHERE status IN ('running', 'reserved')"
+            )
+        ]
+        _record_job_events(connection, JOB_EVENT_RECOVERED, job_ids, completed_at)
         cursor = connection.execute(
             """
             UPDATE jobs
@@ -747,8 +2342,9 @@ def recover_running_jobs(
             """,
             (completed_at, error_message),
         )
-        connection.commit()
-    return cursor.rowcount
+        return cursor.rowcount + len(refinement_ids)
+
+    return _write(db_path, apply)
 
 
 def mark_job_running(
@@ -761,7 +2357,8 @@ def mark_job_running(
 ) -> bool:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     started_at_value = started_at or _now_utc()
-    with _connect(db_path) as connection:
+
+    def apply(connection: sqlite3.Connection) -> bool:
         cursor = connection.execute(
             """
             UPDATE jobs
@@ -778,8 +2375,11 @@ def mark_job_running(
                 job_id,
             ),
         )
-        connection.commit()
-    return cursor.rowcount > 0
+        if cursor.rowcount > 0:
+            _record_job_events(connection, "running", [job_id], started_at_value)
+        return cursor.rowcount > 0
+
+    return _write(db_path, apply)
 
 
 def mark_job_done(
@@ -787,21 +2387,102 @@ def mark_job_done(
     job_id: str,
     *,
     completed_at: str | None = None,
+    transcript_pass: str | None = None,
+    transcript: str | None = None,
+    results: list[ResultFileRecord] | None = None,
 ) -> bool:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     completed_at_value = completed_at or _now_utc()
-    with _connect(db_path) as connection:
+
+    def apply(connection: sqlite3.Connection) -> bool:
         cursor = connection.execute(
             """
             UPDATE jobs
             SET status = 'done',
-                completed_at = ?
+                completed_at = ?,
+                transcript_pass = ?
             WHERE id = ? AND status = 'running'
             """,
-            (completed_at_value, job_id),
+            (completed_at_value, transcript_pass, job_id),
+        )
+        if cursor.rowcount > 0:
+            _record_job_events(connection, "done", [job_id], completed_at_value)
+        if cursor.rowcount > 0 and transcript is not None:
+            _store_transcript(connection, job_id, transcript)
+        if cursor.rowcount > 0 and results is not None:
+            _store_job_results(connection, job_id, results)
+        return cursor.rowcount > 0
+
+    return _write(db_path, apply)
+
+
+def complete_refinement(
+    db_path: Path,
+    refinement_job_id: str,
+    *,
+    parent_job_id: str,
+    effective_engine: str | None = None,
+    effective_implementation_id: str | None = None,
+    transcript: str | None = None,
+    results: list[ResultFileRecord] | None = None,
+) -> bool:
+    def apply(connection: sqlite3.Connection) -> bool:
+        cursor = connection.execute(
+            """
+            UPDATE jobs
+            SET transcript_pass = ?,
+                error_message = NULL,
+                effective_engine = COALESCE(?, effective_engine),
+                effective_implementation_id = COALESCE(?, effective_implementation_id)
+            WHERE id = ? AND status = 'done' AND transcript_pass = ?
+            """,
+            (
+                TRANSCRIPT_PASS_FINAL,
+                effective_engine,
+                effective_implementation_id,
+                parent_job_id,
+                TRANSCRIPT_PASS_DRAFT,
+            ),
+        )
+        promoted = cursor.rowcount > 0
+        connection.execute("DELETE FROM jobs WHERE id = ?", (refinement_job_id,))
+        if promoted and transcript is not None:
+            _store_transcript(connection, parent_job_id, transcript)
+        if promoted and results is not None:
+            _store_job_results(connection, parent_job_id, results)
+        if promoted:
+            # Callers told about the draft also hear about the final pass.
+            _enqueue_job_webhooks(connection, [parent_job_id])
+        return promoted
+
+    return _write(db_path, apply)
+
+
+def abandon_refinement(
+    db_path: Path,
+    refinement_job_id: str,
+    *,
+    parent_job_id: str,
+    error_message: str | None = None,
+) -> None:
+    def apply(connection: sqlite3.Connection) -> None:
+        connection.execute(
+            """
+            UPDATE jobs
+            SET transcript_pass = ?,
+                error_message = COALESCE(?, error_message)
+            WHERE id = ? AND status = 'done' AND transcript_pass = ?
+            """,
+            (
+                TRANSCRIPT_PASS_UNREFINED,
+                error_message,
+                parent_job_id,
+                TRANSCRIPT_PASS_DRAFT,
+            ),
         )
-        connection.commit()
-    return cursor.rowcount > 0
+        connection.execute("DELETE FROM jobs WHERE id = ?", (refinement_job_id,))
+
+    _write(db_path, apply)
 
 
 def mark_job_failed(
@@ -810,10 +2491,12 @@ def mark_job_failed(
     *,
     completed_at: str | None = None,
     error_message: str | None = None,
+    results: list[ResultFileRecord] | None = None,
 ) -> bool:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     completed_at_value = completed_at or _now_utc()
-    with _connect(db_path) as connection:
+
+    def apply(connection: sqlite3.Connection) -> bool:
         cursor = connection.execute(
             """
             UPDATE jobs
@@ -824,88 +2507,228 @@ def mark_job_failed(
             """,
             (completed_at_value, error_message, job_id),
         )
-        connection.commit()
-    return cursor.rowcount > 0
+        if cursor.rowcount > 0:
+            _record_job_events(connection, "failed", [job_id], completed_at_value)
+        if cursor.rowcount > 0 and results is not None:
+            _store_job_results(connection, job_id, results)
+        return cursor.rowcount > 0
+
+    return _write(db_path, apply)
 
 
 def claim_next_job(
     db_path: Path,
     *,
     effective_engine: str | None = None,
+    engine_ids: tuple[str, ...] | None = None,
+    exclude_engine_ids: tuple[str, ...] = (),
+    max_running: int = 1,
 ) -> JobRecord | None:
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    connection = sqlite3.connect(
-        db_path,
-        isolation_level=None,
-        timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
-    )
-    connection.row_factory = sqlite3.Row
-    connection.execute(
-        f"PRAGMA busy_timeout = {int(SQLITE_BUSY_TIMEOUT_SECONDS * 1000)}"
-    )
-    try:
-        connection.execute("BEGIN IMMEDIATE")
+    lane_sql, lane_parameters = _lane_condition(engine_ids, exclude_engine_ids)
+
+    def apply(connection: sqlite3.Connection) -> JobRecord | None:
         running = connection.execute(
-            """
-            SELECT id
+            f"""
+            SELECT COUNT(*)
             FROM jobs
             WHERE status IN ('running', 'reserved')
-            LIMIT 1
-            """
+              AND {lane_sql}
+            """,
+            lane_parameters,
         ).fetchone()
-        if running is not None:
-            connection.execute("COMMIT")
+        if running is not None and running[0] >= max_running:
             return None
-        row = connection.execute(
-            """
-            SELECT
-                id,
-                filename,
-                status,
-                created_at,
-                upload_path,
-                language,
-                started_at,
-                completed_at,
-                error_message,
-                queue_position,
-                requested_engine,
-                effective_engine,
-                effective_implementation_id,
-                source_path,
-                source_relpath,
-                client,
-                client_job_id
-            FROM jobs
-            WHERE status = 'queued'
-            ORDER BY
-                queue_position IS NULL,
-                queue_position ASC,
-                created_at ASC
-            LIMIT 1
-            """
-        ).fetchone()
+        row = _next_queued_row(connection, lane_sql, lane_parameters)
         if row is None:
-            connection.execute("COMMIT")
             return None
-        job_id = row["id"]
         connection.execute(
             """
             UPDATE jobs
             SET status = 'reserved'
             WHERE id = ?
             """,
-            (job_id,),
+            (row["id"],),
         )
-        connection.execute("COMMIT")
+        _record_job_events(connection, "reserved", [row["id"]])
         job_data = dict(row)
         job_data["status"] = "reserved"
         return _job_record_from_data(job_data)
-    except Exception:
-        connection.execute("ROLLBACK")
-        raise
-    finally:
-        connection.close()
+
+    return _write(db_path, apply)
+
+
+def peek_next_job(
+    db_path: Path,
+    *,
+    engine_ids: tuple[str, ...] | None = None,
+    exclude_engine_ids: tuple[str, ...] = (),
+) -> JobRecord | None:
+    """Return the job claim_next_job would pick, without reserving it."""
+    lane_sql, lane_parameters = _lane_condition(engine_ids, exclude_engine_ids)
+    with _connect(db_path) as connection:
+        row = _next_queued_row(connection, lane_sql, lane_parameters)
+    return None if row is None else _job_record_from_row(row)
+
+
+def _next_queued_row(
+    connection: sqlite3.Connection,
+    lane_sql: str,
+    lane_parameters: tuple[str, ...],
+) -> sqlite3.Row | None:
+    return connection.execute(
+        f"""
+        SELECT
+            {_JOB_SELECT_COLUMNS}
+        FROM jobs
+        WHERE status = 'queued'
+          AND {lane_sql}
+        ORDER BY
+            priority ASC,
+            queue_position IS NULL,
+            queue_position ASC,
+            created_at ASC
+        LIMIT 1
+        """,
+        lane_parameters,
+    ).fetchone()
+
+
+def _lane_condition(
+    engine_ids: tuple[str, ...] | None,
+    exclude_engine_ids: tuple[str, ...],
+) -> tuple[str, tuple[str, ...]]:
+    if engine_ids is not None:
+        if not engine_ids:
+            return "0", ()
+        placeholders = ", ".join("?" for _ in engine_ids)
+        return f"requested_engine IN ({placeholders})", tuple(engine_ids)
+    if exclude_engine_ids:
+        placeholders = ", ".join("?" for _ in exclude_engine_ids)
+        return (
+            f"(requested_engine IS NULL OR requested_engine NOT IN ({placeholders}))",
+            tuple(exclude_engine_ids),
+        )
+    return "1", ()
+
+
+def reserve_batch_companions(
+    db_path: Path,
+    job: JobRecord,
+    *,
+    limit: int,
+) -> list[JobRecord]:
+    if limit <= 0:
+        return []
+
+    def apply(connection: sqlite3.Connection) -> list[JobRecord]:
+        rows = connection.execute(
+            f"""
+            SELECT
+                {_JOB_SELECT_COLUMNS}
+            FROM jobs
+            WHERE status = 'queued'
+            ORDER BY
+                priority ASC,
+                queue_position IS NULL,
+                queue_position ASC,
+                created_at ASC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+        companions: list[JobRecord] = []
+        for row in rows:
+            if (
+                row["requested_engine"] != job.requested_engine
+                or normalize_language(row["language"]) != job.language
+                or row["priority"] != job.priority
+                or row["transcription_mode"] != job.transcription_mode
+                or row["refines_job_id"] is not None
+            ):
+                break
+            job_data = dict(row)
+            job_data["status"] = "reserved"
+            companions.append(_job_record_from_data(job_data))
+        connection.executemany(
+            "UPDATE jobs SET status = 'reserved' WHERE id = ?",
+            [(companion.id,) for companion in companions],
+        )
+        _record_job_events(
+            connection,
+            "reserved",
+            [companion.id for companion in companions],
+        )
+        return companions
+
+    return _write(db_path, apply)
+
+
+def release_reserved_jobs(db_path: Path, job_ids: list[str]) -> int:
+    if not job_ids:
+        return 0
+    placeholders = ", ".join("?" for _ in job_ids)
+
+    def apply(connection: sqlite3.Connection) -> int:
+        released = [
+            str(row["id"])
+            for row in connection.execute(
+                f"""
+                SELECT id
+                FROM jobs
+                WHERE status = 'reserved'
+                  AND id IN ({placeholders})
+                """,
+                job_ids,
+            )
+        ]
+        cursor = connection.execute(
+            f"""
+            UPDATE jobs
+            SET status = 'queued'
+            WHERE status = 'reserved'
+              AND id IN ({placeholders})
+            """,
+            job_ids,
+        )
+        _record_job_events(connection, "queued", released)
+        return cursor.rowcount
+
+    return _write(db_path, apply)
+
+
+def requeue_running_jobs(db_path: Path, job_ids: list[str]) -> int:
+    if not job_ids:
+        return 0
+    placeholders = ", ".join("?" for _ in job_ids)
+
+    def apply(connection: sqlite3.Connection) -> int:
+        requeued = [
+            str(row["id"])
+            for row in connection.execute(
+                f"""
+                SELECT id
+                FROM jobs
+                WHERE status IN ('running', 'reserved')
+                  AND id IN ({placeholders})
+                """,
+                job_ids,
+            )
+        ]
+        cursor = connection.execute(
+            f"""
+            UPDATE jobs
+            SET status = 'queued',
+                started_at = NULL
+            WHERE status IN ('running', 'reserved')
+              AND id IN ({placeholders})
+            """,
+            job_ids,
+        )
+        _record_job_events(connection, "queued", requeued)
+        return cursor.rowcount
+
+    return _write(db_path, apply)
 
 
 def _now_utc() -> str:
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import Future
+import logging
+import queue
+import sqlite3
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DB_WRITER_MAX_BATCH = 512
+
+WriteOperation = Callable[[sqlite3.Connection], Any]
+
+_STOP = object()
+
+
+class DbWriterClosed(RuntimeError):
+    pass
+
+
+class DbWriter:
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        *,
+        max_batch: int = DB_WRITER_MAX_BATCH,
+        name: str = "mlx-ui-db-writer",
+    ) -> None:
+        self._connect = connect
+        self.max_batch = max(1, max_batch)
+        self.name = name
+        self._queue: queue.Queue[object] = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        with self._lock:
+            if self._closed or self.is_running():
+                return
+            self._thread = threading.Thread(
+                target=self._run_loop,
+                name=self.name,
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def owns_current_thread(self) -> bool:
+        return self._thread is threading.current_thread()
+
+    def submit(self, operation: WriteOperation) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise DbWriterClosed("The database writer has been stopped.")
+            self._queue.put((operation, future))
+        return future
+
+    def _run_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            command = self._queue.get()
+            if command is _STOP:
+                break
+            batch = [command]
+            while len(batch) < self.max_batch:
+                try:
+                    command = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if command is _STOP:
+                    stopping = True
+                    break
+                batch.append(command)
+            self._apply(batch)
+
+    def _apply(self, batch: list[Any]) -> None:
+        outcomes: list[tuple[Future, Any, BaseException | None]] = []
+        started = [
+            (operation, future)
+            for operation, future in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        if not started:
+            return
+        try:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for operation, future in started:
+                    connection.execute("SAVEPOINT db_writer_command")
+                    try:
+                        result = operation(connection)
+                    except Exception as exc:
+                        connection.execute("ROLLBACK TO db_writer_command")
+                        connection.execute("RELEASE db_writer_command")
+                        outcomes.append((future, None, exc))
+                    else:
+                        connection.execute("RELEASE db_writer_command")
+                        outcomes.append((future, result, None))
+                connection.commit()
+            except BaseException:
+                connection.rollback()
+                raise
+        except Exception as exc:
+            logger.exception(
+                "Database writer failed to commit %d command(s)", len(started)
+            )
+            for _operation, future in started:
+                future.set_exception(exc)
+            return
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
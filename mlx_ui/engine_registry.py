@@ -32,6 +32,9 @@ PARAKEET_NEMO_CUDA_BACKEND = "parakeet_nemo_cuda"
 PARAKEET_TDT_V3_NEMO_CUDA_BACKEND = "parakeet_tdt_v3_nemo_cuda"
 PARAKEET_NEMO_CUDA_EXPERIMENTAL_ENV = "PARAKEET_NEMO_CUDA_EXPERIMENTAL"
 
+EXECUTION_CLASS_LOCAL_COMPUTE = "local_compute"
+EXECUTION_CLASS_REMOTE_IO = "remote_io"
+
 DEFAULT_ENGINE_ID = WHISPER_MLX_ENGINE
 DEFAULT_BACKEND = WTM_BACKEND
 
@@ -89,6 +92,9 @@ class EngineProvider:
     fallback_engine_id: str | None = None
     selectable: bool = True
     visible_in_settings: bool = True
+    execution_class: Literal["local_compute", "remote_io"] = (
+        EXECUTION_CLASS_LOCAL_COMPUTE
+    )
 
     def is_available(self) -> bool:
         return any(
@@ -279,10 +285,7 @@ def parakeet_nemo_cuda_availability_reason() -> str | None:
     try:
         nemo_asr_spec = importlib.util.find_spec("nemo.collections.asr")
     except Exception as exc:
-        return (
-            "NVIDIA NeMo ASR could not be inspected: "
-            f"{type(exc).__name__}: {exc}"
-        )
+        return f"NVIDIA NeMo ASR could not be inspected: {type(exc).__name__}: {exc}"
     if nemo_asr_spec is None:
         return "NVIDIA NeMo ASR is not installed."
     return None
@@ -436,6 +439,7 @@ _ENGINE_PROVIDERS: tuple[EngineProvider, ...] = (
             ),
         ),
         selectable=True,
+        execution_class=EXECUTION_CLASS_REMOTE_IO,
     ),
     EngineProvider(
         id=PARAKEET_TDT_V3_ENGINE,
@@ -546,6 +550,14 @@ def get_selectable_engine_ids() -> tuple[str, ...]:
     return tuple(provider.id for provider in _ENGINE_PROVIDERS if provider.selectable)
 
 
+def get_remote_io_engine_ids() -> tuple[str, ...]:
+    return tuple(
+        provider.id
+        for provider in _ENGINE_PROVIDERS
+        if provider.execution_class == EXECUTION_CLASS_REMOTE_IO
+    )
+
+
 def build_engine_options() -> list[dict[str, object]]:
     options: list[dict[str, object]] = []
     for provider in list_engine_providers(visible_only=True):
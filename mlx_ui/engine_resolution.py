@@ -6,6 +6,7 @@ import os
 from pathlib import Path
 from typing import Mapping
 
+from mlx_ui.db import TRANSCRIPTION_MODE_STANDARD, TRANSCRIPTION_MODE_TWO_PASS
 from mlx_ui.engine_registry import (
     EngineFactoryOptions,
     PARAKEET_MLX_BACKEND,
@@ -79,11 +80,78 @@ def resolve_default_language_with_settings(
     )
 
 
+def resolve_transcription_mode_with_settings(
+    base_dir: Path | None = None,
+    env: Mapping[str, str] | None = None,
+) -> str:
+    effective, _sources, _file_settings = compute_effective_settings(
+        base_dir=base_dir,
+        env=env,
+    )
+    if effective.get("two_pass_enabled"):
+        return TRANSCRIPTION_MODE_TWO_PASS
+    return TRANSCRIPTION_MODE_STANDARD
+
+
+def resolve_clip_batching_with_settings(
+    base_dir: Path | None = None,
+    env: Mapping[str, str] | None = None,
+) -> bool:
+    effective, _sources, _file_settings = compute_effective_settings(
+        base_dir=base_dir,
+        env=env,
+    )
+    return bool(effective.get("clip_batching_enabled"))
+
+
+def resolve_remote_io_limits_with_settings(
+    base_dir: Path | None = None,
+    env: Mapping[str, str] | None = None,
+) -> tuple[int, int]:
+    effective, _sources, _file_settings = compute_effective_settings(
+        base_dir=base_dir,
+        env=env,
+    )
+    return (
+        int(effective["remote_io_concurrency"]),
+        int(effective["remote_io_requests_per_minute"]),
+    )
+
+
+def resolve_memory_budget_with_settings(
+    base_dir: Path | None = None,
+    env: Mapping[str, str] | None = None,
+) -> int | None:
+    effective, _sources, _file_settings = compute_effective_settings(
+        base_dir=base_dir,
+        env=env,
+    )
+    budget_mb = int(effective["memory_budget_mb"])
+    if budget_mb <= 0:
+        return None
+    return budget_mb * 1024 * 1024
+
+
+def resolve_live_batch_policy_with_settings(
+    base_dir: Path | None = None,
+    env: Mapping[str, str] | None = None,
+) -> tuple[str, float]:
+    effective, _sources, _file_settings = compute_effective_settings(
+        base_dir=base_dir,
+        env=env,
+    )
+    return (
+        str(effective["live_batch_policy"]),
+        float(effective["live_batch_duty_cycle"]),
+    )
+
+
 def resolve_job_transcriber_spec_with_settings(
     requested_engine: str | None = None,
     *,
     base_dir: Path | None = None,
     env: Mapping[str, str] | None = None,
+    draft: bool = False,
 ) -> ResolvedTranscriberSettings:
     if env is None:
         env = os.environ
@@ -110,6 +178,7 @@ def resolve_job_transcriber_spec_with_settings(
         env=env,
         backend_from_env=backend_from_env,
         explicit_request=requested_engine_id is not None,
+        draft=draft,
     )
     return ResolvedTranscriberSettings(
         engine_id=provider.id,
@@ -212,16 +281,22 @@ def _build_engine_factory_options(
     env: Mapping[str, str],
     backend_from_env: str,
     explicit_request: bool,
+    draft: bool = False,
 ) -> EngineFactoryOptions:
     device = None
     if engine_id == ENGINE_CPU and (explicit_request or not backend_from_env):
         device = "cpu"
+    whisper_model_key = "draft_whisper_model" if draft else "whisper_model"
     return EngineFactoryOptions(
-        quick=bool(effective["wtm_quick"]) if engine_id == ENGINE_MLX else None,
+        quick=(
+            draft or bool(effective["wtm_quick"]) if engine_id == ENGINE_MLX else None
+        ),
         model_name=(
             str(effective["cohere_model"])
             if engine_id == ENGINE_COHERE
-            else (str(effective["whisper_model"]) if engine_id == ENGINE_CPU else None)
+            else (
+                str(effective[whisper_model_key]) if engine_id == ENGINE_CPU else None
+            )
         ),
         api_key=(
             _resolve_cohere_api_key(file_settings=file_settings, env=env)
@@ -20,6 +20,7 @@ from mlx_ui.engines.parakeet_mlx_runtime import (
     parakeet_mlx_supports_beam_decoding,
 )
 from mlx_ui.engines.parakeet_mlx_adapter import normalize_parakeet_mlx_result
+from mlx_ui.transcript_result import TranscriptResult
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +76,20 @@ class ParakeetMlxTranscriber:
         self.output_formats = normalize_requested_output_formats(output_formats)
         self._model = None
 
+    @property
+    def model_loaded(self) -> bool:
+        return self._model is not None
+
     def transcribe(self, job: JobRecord, results_dir: Path) -> Path:
+        return write_transcript_result(
+            result=self.transcribe_result(job),
+            results_dir=results_dir,
+            job_id=job.id,
+            source_name=job.filename,
+            output_formats=self.output_formats,
+        )
+
+    def transcribe_result(self, job: JobRecord) -> TranscriptResult:
         source_path = Path(job.upload_path)
         model = self._ensure_model()
         logger.info(
@@ -94,19 +108,12 @@ class ParakeetMlxTranscriber:
             )
         except Exception as exc:  # pragma: no cover - backend passthrough
             raise RuntimeError(f"Parakeet MLX transcription failed: {exc}") from exc
-        transcript = normalize_parakeet_mlx_result(
+        return normalize_parakeet_mlx_result(
             raw,
             engine_id=self.engine_id,
             model_id=self.model_id,
             fallback_language=job.language,
         )
-        return write_transcript_result(
-            result=transcript,
-            results_dir=results_dir,
-            job_id=job.id,
-            source_name=job.filename,
-            output_formats=self.output_formats,
-        )
 
     def _ensure_model(self):
         if self._model is not None:
@@ -146,6 +146,10 @@ class ParakeetNemoCudaTranscriber:
         self.output_formats = normalize_requested_output_formats(output_formats)
         self._model = None
 
+    @property
+    def model_loaded(self) -> bool:
+        return self._model is not None
+
     def transcribe(self, job: JobRecord, results_dir: Path) -> Path:
         source_path = Path(job.upload_path)
         model = self._ensure_model()
@@ -48,8 +48,20 @@ class WhisperTranscriber:
         self._whisper = None
         self.output_formats = normalize_requested_output_formats(output_formats)
 
+    @property
+    def model_loaded(self) -> bool:
+        return self._model is not None
+
     def transcribe(self, job: JobRecord, results_dir: Path) -> Path:
-        results_dir = Path(results_dir)
+        return write_transcript_result(
+            result=self.transcribe_result(job),
+            results_dir=Path(results_dir),
+            job_id=job.id,
+            source_name=job.filename,
+            output_formats=self.output_formats,
+        )
+
+    def transcribe_result(self, job: JobRecord) -> TranscriptResult:
         source_path = Path(job.upload_path)
         model = self._ensure_model()
         fp16 = self.fp16 and not self.device.lower().startswith("cpu")
@@ -71,7 +83,7 @@ class WhisperTranscriber:
             )
         except Exception as exc:  # pragma: no cover - passthrough for backend errors
             raise RuntimeError(f"whisper failed: {exc}") from exc
-        transcript = TranscriptResult(
+        return TranscriptResult(
             text=(result.get("text") or "").strip(),
             engine_id=self.engine_id,
             model_id=self.model_name,
@@ -79,13 +91,6 @@ class WhisperTranscriber:
             segments=_normalize_whisper_segments(result.get("segments")),
             words=_normalize_whisper_words(result.get("words")),
         )
-        return write_transcript_result(
-            result=transcript,
-            results_dir=results_dir,
-            job_id=job.id,
-            source_name=job.filename,
-            output_formats=self.output_formats,
-        )
 
     def _ensure_model(self):
         if self._model is not None:
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import logging
+from pathlib import Path
+
+from mlx_ui.db import (
+    archive_db_path,
+    archive_history_jobs,
+    init_db,
+    list_archivable_job_ids,
+)
+from mlx_ui.settings_store import compute_effective_settings
+
+logger = logging.getLogger(__name__)
+
+HISTORY_ARCHIVE_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class HistoryArchiveSummary:
+    archive_days: int
+    archived: int
+    batches: int
+
+
+def archive_expired_history(
+    db_path: Path,
+    *,
+    archive_days: int,
+    now: datetime | None = None,
+    batch_size: int = HISTORY_ARCHIVE_BATCH_SIZE,
+) -> HistoryArchiveSummary:
+    if archive_days < 1:
+        raise ValueError("archive_days must be positive")
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=archive_days)
+    cutoff_text = cutoff.astimezone(timezone.utc).isoformat(timespec="seconds")
+    archive_path = archive_db_path(db_path)
+    init_db(archive_path)
+    archived = 0
+    batches = 0
+    while True:
+        job_ids = list_archivable_job_ids(db_path, cutoff=cutoff_text, limit=batch_size)
+        if not job_ids:
+            break
+        batches += 1
+        moved = archive_history_jobs(db_path, archive_path, job_ids)
+        archived += moved
+        if moved == 0:
+            break
+    if archived:
+        logger.info(
+            "History archiving finished: archive_days=%s archived=%s batches=%s",
+            archive_days,
+            archived,
+            batches,
+        )
+    return HistoryArchiveSummary(
+        archive_days=archive_days,
+        archived=archived,
+        batches=batches,
+    )
+
+
+def archive_expired_history_from_settings(
+    db_path: Path,
+    base_dir: Path,
+) -> HistoryArchiveSummary | None:
+    effective, _sources, _file_settings = compute_effective_settings(base_dir=base_dir)
+    archive_days = int(effective["history_archive_days"])
+    if archive_days < 1:
+        return None
+    # Archived jobs are not scanned for expired result files, so never move
+    # a job before result retention has had its turn.
+    retention_days = int(effective["results_retention_days"])
+    return archive_expired_history(
+        db_path,
+        archive_days=max(archive_days, retention_days),
+    )
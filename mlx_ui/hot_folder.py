@@ -12,12 +12,13 @@ from pathlib import Path
 from typing import Mapping
 from uuid import uuid4
 
-from mlx_ui.db import JobRecord, insert_job
+from mlx_ui.db import JobRecord, insert_jobs
 from mlx_ui.engine_registry import PARAKEET_TDT_V3_ENGINE
 from mlx_ui.languages import AUTO_LANGUAGE, normalize_language
 from mlx_ui.settings import (
     resolve_default_language_with_settings,
     resolve_requested_engine_with_settings,
+    resolve_transcription_mode_with_settings,
 )
 from mlx_ui.settings_store import compute_effective_settings
 from mlx_ui.storage import sanitize_display_path, sanitize_filename
@@ -70,6 +71,14 @@ class _CandidateState:
     stable_since: float
 
 
+@dataclass(frozen=True)
+class _PendingEnqueue:
+    job: JobRecord
+    destination: Path
+    source_path: str
+    source_relpath: str
+
+
 class HotFolderWatcher:
     def __init__(
         self,
@@ -103,6 +112,10 @@ class HotFolderWatcher:
         if self._requested_engine == PARAKEET_TDT_V3_ENGINE:
             default_language = AUTO_LANGUAGE
         self._language = normalize_language(default_language)
+        self._transcription_mode = resolve_transcription_mode_with_settings(
+            base_dir=base_dir,
+            env=effective_env,
+        )
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
         self._candidates: dict[Path, _CandidateState] = {}
@@ -144,7 +157,7 @@ class HotFolderWatcher:
         self.uploads_dir.mkdir(parents=True, exist_ok=True)
 
         seen: set[Path] = set()
-        enqueued = 0
+        pending: list[_PendingEnqueue] = []
 
         for path in self._iter_files(input_dir):
             if self._stop_event.is_set():
@@ -155,15 +168,17 @@ class HotFolderWatcher:
                 continue
             if not self._is_candidate_ready(path):
                 continue
-            if self._enqueue_path(path):
-                enqueued += 1
+            entry = self._enqueue_path(path)
+            if entry is not None:
+                pending.append(entry)
             self._candidates.pop(path, None)
 
         stale = [path for path in self._candidates if path not in seen]
         for path in stale:
             self._candidates.pop(path, None)
 
-        return enqueued
+        # A burst of dropped files is queued in one transaction.
+        return self._finish_enqueue(pending)
 
     def _iter_files(self, root: Path):
         if self.recursive:
@@ -242,12 +257,12 @@ class HotFolderWatcher:
 
         return True
 
-    def _enqueue_path(self, path: Path) -> bool:
+    def _enqueue_path(self, path: Path) -> _PendingEnqueue | None:
         try:
             relative = path.relative_to(self.paths.input_dir)
         except ValueError:
             logger.warning("Hot folder saw file outside input dir: %s", path)
-            return False
+            return None
 
         source_path = str(path.resolve())
         source_relpath = relative.as_posix()
@@ -263,7 +278,7 @@ class HotFolderWatcher:
             _move_file(path, destination)
         except Exception:
             logger.exception("Hot folder failed to move %s", path)
-            return False
+            return None
 
         job = JobRecord(
             id=job_id,
@@ -275,22 +290,38 @@ class HotFolderWatcher:
             requested_engine=self._requested_engine,
             source_path=source_path,
             source_relpath=source_relpath,
+            transcription_mode=self._transcription_mode,
+        )
+        return _PendingEnqueue(
+            job=job,
+            destination=destination,
+            source_path=source_path,
+            source_relpath=source_relpath,
         )
+
+    def _finish_enqueue(self, pending: list[_PendingEnqueue]) -> int:
+        if not pending:
+            return 0
         try:
-            insert_job(self.db_path, job)
+            insert_jobs(self.db_path, [entry.job for entry in pending])
         except Exception:
-            logger.exception("Hot folder failed to insert job for %s", source_path)
-            try:
-                destination.parent.mkdir(parents=True, exist_ok=True)
-                _move_file(destination, Path(source_path))
-            except Exception:
-                logger.exception(
-                    "Hot folder failed to restore %s after enqueue failure", source_path
-                )
-            return False
-
-        logger.info("Hot folder queued %s as job %s", source_relpath, job_id)
-        return True
+            logger.exception("Hot folder failed to insert %d job(s)", len(pending))
+            for entry in pending:
+                try:
+                    entry.destination.parent.mkdir(parents=True, exist_ok=True)
+                    _move_file(entry.destination, Path(entry.source_path))
+                except Exception:
+                    logger.exception(
+                        "Hot folder failed to restore %s after enqueue failure",
+                        entry.source_path,
+                    )
+            return 0
+
+        for entry in pending:
+            logger.info(
+                "Hot folder queued %s as job %s", entry.source_relpath, entry.job.id
+            )
+        return len(pending)
 
 
 def _move_file(src: Path, dest: Path) -> None:
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from mlx_ui.db import (
+    JobTimingStats,
+    count_queued_jobs_by_engine,
+    list_job_timing_stats,
+)
+
+JOB_ANALYTICS_DEFAULT_DAYS = 7
+JOB_ANALYTICS_MAX_DAYS = 90
+
+
+def build_job_analytics(
+    db_path: Path,
+    *,
+    days: int = JOB_ANALYTICS_DEFAULT_DAYS,
+    now: datetime | None = None,
+) -> dict[str, object]:
+    since = (now or datetime.now(timezone.utc)) - timedelta(days=days)
+    since_text = since.astimezone(timezone.utc).isoformat(timespec="seconds")
+    engines = list_job_timing_stats(db_path, since=since_text)
+    daily = list_job_timing_stats(db_path, since=since_text, by_day=True)
+    return {
+        "since": since_text,
+        "days": days,
+        "engines": [asdict(stats) for stats in engines],
+        "daily": [asdict(stats) for stats in daily],
+        "queue": estimate_queue_drain(count_queued_jobs_by_engine(db_path), engines),
+    }
+
+
+def estimate_queue_drain(
+    queued_by_engine: dict[str, int],
+    engine_stats: list[JobTimingStats],
+) -> dict[str, object]:
+    run_p50 = {
+        stats.engine: stats.run_p50_seconds
+        for stats in engine_stats
+        if stats.run_p50_seconds is not None
+    }
+    # Engines without history borrow the slowest known median.
+    fallback = max(run_p50.values(), default=None)
+    engines: list[dict[str, object]] = []
+    total: float | None = 0.0
+    for engine, queued in sorted(queued_by_engine.items()):
+        per_job = run_p50.get(engine, fallback)
+        estimate = None if per_job is None else round(per_job * queued, 3)
+        engines.append(
+            {
+                "engine": engine,
+                "queued": queued,
+                "run_p50_seconds": per_job,
+                "estimated_seconds": estimate,
+            }
+        )
+        total = None if total is None or estimate is None else total + estimate
+    return {
+        "queued": sum(queued_by_engine.values()),
+        "estimated_seconds": None if total is None else round(total, 3),
+        "engines": engines,
+    }
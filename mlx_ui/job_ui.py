@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+from functools import lru_cache
 
-from mlx_ui.db import JobRecord
+from mlx_ui.db import (
+    TRANSCRIPT_PASS_DRAFT,
+    TRANSCRIPT_PASS_FINAL,
+    TRANSCRIPT_PASS_UNREFINED,
+    JobRecord,
+    JobSummary,
+)
 from mlx_ui.engine_registry import (
     get_engine_provider,
     resolve_backend_implementation,
     resolve_backend_provider,
 )
 from mlx_ui.languages import language_label, normalize_language
-from mlx_ui.worker import get_worker_snapshot
+from mlx_ui.worker import get_worker_admission_note, get_worker_snapshot
 
 _ENGINE_SHORT_LABELS = {
     "whisper_mlx": "MLX",
@@ -18,9 +24,12 @@ _ENGINE_SHORT_LABELS = {
     "cohere": "Cohere",
     "fake": "Fake",
 }
+_JOB_UI_CACHE_SIZE = 512
+
+Job = JobRecord | JobSummary
 
 
-def split_jobs(jobs: list[JobRecord]) -> tuple[list[JobRecord], list[JobRecord]]:
+def split_jobs(jobs: list[Job]) -> tuple[list[Job], list[Job]]:
     queue_jobs = [job for job in jobs if job.status in {"queued", "running"}]
     history_jobs = [
         job for job in jobs if job.status in {"done", "failed", "cancelled"}
@@ -29,20 +38,43 @@ def split_jobs(jobs: list[JobRecord]) -> tuple[list[JobRecord], list[JobRecord]]
     return queue_jobs, history_jobs
 
 
-def serialize_job(job: JobRecord) -> dict[str, object]:
-    payload = asdict(job)
+def serialize_job(job: Job) -> dict[str, object]:
+    # JobRecord only holds flat values, so a shallow copy matches asdict().
+    payload = job.to_dict() if isinstance(job, JobSummary) else dict(vars(job))
     payload["ui"] = build_job_ui(job)
     return payload
 
 
-def build_job_ui(job: JobRecord) -> dict[str, object]:
-    requested_engine = _engine_ui(job.requested_engine)
-    effective_engine = _engine_ui(job.effective_engine)
+def build_job_ui(job: Job) -> dict[str, object]:
+    # The UI metadata only depends on a handful of strings, so jobs sharing
+    # them also share one cached (read-only) dict.
+    return _cached_job_ui(
+        job.requested_engine,
+        job.effective_engine,
+        job.effective_implementation_id,
+        job.language,
+        job.transcript_pass,
+        bool(job.refines_job_id),
+    )
+
+
+@lru_cache(maxsize=_JOB_UI_CACHE_SIZE)
+def _cached_job_ui(
+    requested_engine_id: str | None,
+    effective_engine_id: str | None,
+    effective_implementation_id: str | None,
+    language_id: str | None,
+    transcript_pass_id: str | None,
+    is_refinement: bool,
+) -> dict[str, object]:
+    requested_engine = _engine_ui(requested_engine_id)
+    effective_engine = _engine_ui(effective_engine_id)
     effective_implementation = _implementation_ui(
-        engine_id=job.effective_engine,
-        implementation_id=job.effective_implementation_id,
+        engine_id=effective_engine_id,
+        implementation_id=effective_implementation_id,
     )
-    language = _language_ui(job.language)
+    language = _language_ui(language_id)
+    transcript_pass = _transcript_pass_ui(transcript_pass_id, is_refinement)
     engine_badges, engine_summary = _job_engine_badges(
         requested_engine=requested_engine,
         effective_engine=effective_engine,
@@ -60,6 +92,8 @@ def build_job_ui(job: JobRecord) -> dict[str, object]:
     if engine_summary:
         preview_meta_parts.append(engine_summary)
     preview_meta_parts.append(f"Language: {language['label']}")
+    if transcript_pass is not None:
+        preview_meta_parts.append(str(transcript_pass["title"]))
     if effective_implementation is not None:
         note = str(effective_implementation.get("note") or "")
         if note:
@@ -71,18 +105,20 @@ def build_job_ui(job: JobRecord) -> dict[str, object]:
         "engine_badges": engine_badges,
         "engine_summary": engine_summary,
         "language": language,
+        "transcript_pass": transcript_pass,
         "preview_meta": " · ".join(preview_meta_parts),
     }
 
 
-def queue_groups(jobs: list[JobRecord]) -> tuple[JobRecord | None, list[JobRecord]]:
+def queue_groups(jobs: list[Job]) -> tuple[Job | None, list[Job]]:
     running_job = next((job for job in jobs if job.status == "running"), None)
     queued_jobs = [job for job in jobs if job.status == "queued"]
     return running_job, queued_jobs
 
 
-def worker_state(jobs: list[JobRecord]) -> dict[str, object]:
+def worker_state(jobs: list[Job]) -> dict[str, object]:
     queued_count = sum(1 for job in jobs if job.status == "queued")
+    admission_note = get_worker_admission_note()
     worker_snapshot = get_worker_snapshot()
     running_job = None
     if worker_snapshot is not None:
@@ -115,6 +151,7 @@ def worker_state(jobs: list[JobRecord]) -> dict[str, object]:
             "queue_length": queued_count,
             "current_job_ui": current_job_ui,
             "can_cancel": not cancel_requested,
+            "admission": admission_note,
         }
     running_job = next((job for job in jobs if job.status == "running"), None)
     if running_job:
@@ -127,19 +164,21 @@ def worker_state(jobs: list[JobRecord]) -> dict[str, object]:
             "queue_length": queued_count,
             "current_job_ui": current_job_ui,
             "can_cancel": True,
+            "admission": admission_note,
         }
     return {
-        "status": "Idle",
+        "status": "Waiting for memory" if admission_note and queued_count else "Idle",
         "job_id": None,
         "filename": None,
         "started_at": None,
         "queue_length": queued_count,
         "current_job_ui": None,
         "can_cancel": False,
+        "admission": admission_note,
     }
 
 
-def _history_sort_key(job: JobRecord) -> str:
+def _history_sort_key(job: Job) -> str:
     return job.completed_at or job.created_at
 
 
@@ -224,6 +263,37 @@ def _language_ui(language: str | None) -> dict[str, str]:
     }
 
 
+def _transcript_pass_ui(
+    transcript_pass: str | None,
+    is_refinement: bool,
+) -> dict[str, str] | None:
+    if is_refinement:
+        return {
+            "id": "refinement",
+            "label": "Refinement",
+            "title": "Refinement pass for an existing draft transcript",
+        }
+    if transcript_pass == TRANSCRIPT_PASS_DRAFT:
+        return {
+            "id": TRANSCRIPT_PASS_DRAFT,
+            "label": "Draft",
+            "title": "Draft transcript; refinement pending",
+        }
+    if transcript_pass == TRANSCRIPT_PASS_UNREFINED:
+        return {
+            "id": TRANSCRIPT_PASS_UNREFINED,
+            "label": "Draft",
+            "title": "Draft transcript; refinement did not complete",
+        }
+    if transcript_pass == TRANSCRIPT_PASS_FINAL:
+        return {
+            "id": TRANSCRIPT_PASS_FINAL,
+            "label": "Refined",
+            "title": "Refined transcript",
+        }
+    return None
+
+
 def _compact_language_label(language: str) -> str:
     if language == "auto":
         return "Auto"
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+import logging
+from pathlib import Path
+import threading
+import time
+from typing import Protocol
+
+from mlx_ui.live_transcription import LiveTranscriptionService
+from mlx_ui.settings import resolve_live_batch_policy_with_settings
+
+logger = logging.getLogger(__name__)
+
+LIVE_BATCH_POLICY_PAUSE = "pause"
+LIVE_BATCH_POLICY_THROTTLE = "throttle"
+LIVE_BATCH_POLICY_OFF = "off"
+LIVE_SESSION_IDLE_SECONDS = 30.0
+THROTTLE_PERIOD_SECONDS = 10.0
+
+
+class PausableWorker(Protocol):
+    def pause(self) -> None:
+        raise NotImplementedError
+
+    def resume(self) -> None:
+        raise NotImplementedError
+
+    def is_paused(self) -> bool:
+        raise NotImplementedError
+
+
+class LiveWorkCoordinator:
+    def __init__(
+        self,
+        live_service: LiveTranscriptionService,
+        worker: PausableWorker,
+        *,
+        base_dir: Path | None = None,
+        env: Mapping[str, str] | None = None,
+        poll_interval: float = 0.5,
+        idle_timeout: float = LIVE_SESSION_IDLE_SECONDS,
+        throttle_period: float = THROTTLE_PERIOD_SECONDS,
+    ) -> None:
+        self.live_service = live_service
+        self.worker = worker
+        self.base_dir = base_dir
+        self.env = env
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+        self.throttle_period = throttle_period
+        self._holding = False
+        self._live_since: float | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    def attach(self) -> None:
+        add_listener = getattr(self.live_service, "add_session_listener", None)
+        if callable(add_listener):
+            add_listener(self.start)
+
+    def start(self) -> None:
+        with self._thread_lock:
+            if self._stop_event.is_set() or self.is_running():
+                return
+            self._thread = threading.Thread(
+                target=self._run_loop,
+                name="mlx-ui-live-coordinator",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop_event.set()
+        with self._thread_lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        self._set_live_throttle(False)
+        self._release()
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                active = self.coordinate_once()
+            except Exception:
+                logger.exception("Live coordination check failed")
+                active = 1
+            if active <= 0:
+                with self._thread_lock:
+                    if self._active_sessions() <= 0:
+                        self._thread = None
+                        return
+            self._stop_event.wait(self.poll_interval)
+
+    def coordinate_once(self, now: float | None = None) -> int:
+        now = time.monotonic() if now is None else now
+        active = self._active_sessions()
+        if active <= 0:
+            self._live_since = None
+            self._set_live_throttle(False)
+            self._release()
+            return 0
+        policy, duty_cycle = resolve_live_batch_policy_with_settings(
+            base_dir=self.base_dir,
+            env=self.env,
+        )
+        self._set_live_throttle(policy == LIVE_BATCH_POLICY_THROTTLE)
+        if policy == LIVE_BATCH_POLICY_OFF:
+            self._release()
+            return active
+        if self._live_since is None:
+            self._live_since = now
+        hold = True
+        if policy == LIVE_BATCH_POLICY_THROTTLE:
+            phase = (now - self._live_since) % self.throttle_period
+            hold = phase >= duty_cycle * self.throttle_period
+        if hold:
+            self._hold(active)
+        else:
+            self._release()
+        return active
+
+    def _active_sessions(self) -> int:
+        count_sessions = getattr(self.live_service, "active_session_count", None)
+        if not callable(count_sessions):
+            return 0
+        return int(count_sessions(idle_timeout=self.idle_timeout))
+
+    def _set_live_throttle(self, active: bool) -> None:
+        set_live_throttle = getattr(self.worker, "set_live_throttle", None)
+        if callable(set_live_throttle):
+            set_live_throttle(active)
+
+    def _hold(self, active_sessions: int) -> None:
+        if self._holding:
+            return
+        if self.worker.is_paused():
+            # Someone else paused the worker; leave resuming to them.
+            return
+        logger.info(
+            "Holding batch transcription while %d live session(s) are active",
+            active_sessions,
+        )
+        self.worker.pause()
+        self._holding = True
+
+    def _release(self) -> None:
+        if not self._holding:
+            return
+        self._holding = False
+        self.worker.resume()
+        logger.info("Resuming batch transcription")
+
+
+_coordinator_lock = threading.Lock()
+_coordinator_instance: LiveWorkCoordinator | None = None
+
+
+def attach_live_coordinator(
+    live_service: LiveTranscriptionService,
+    worker: PausableWorker,
+    *,
+    base_dir: Path | None = None,
+    env: Mapping[str, str] | None = None,
+) -> LiveWorkCoordinator:
+    global _coordinator_instance
+    with _coordinator_lock:
+        if _coordinator_instance is not None:
+            _coordinator_instance.stop()
+        _coordinator_instance = LiveWorkCoordinator(
+            live_service,
+            worker,
+            base_dir=base_dir,
+            env=env,
+        )
+        _coordinator_instance.attach()
+        return _coordinator_instance
+
+
+def stop_live_coordinator(timeout: float | None = None) -> None:
+    global _coordinator_instance
+    with _coordinator_lock:
+        if not _coordinator_instance:
+            return
+        _coordinator_instance.stop(timeout=timeout)
+        _coordinator_instance = None
@@ -8,6 +8,7 @@ import shutil
 import subprocess
 import tempfile
 import threading
+import time
 from typing import TYPE_CHECKING, Callable, Protocol
 from uuid import uuid4
 
@@ -119,6 +120,8 @@ class LiveTranscriptionService:
         self._backend_factory = backend_factory or _default_backend_factory
         self._backends: dict[tuple[object, ...], LiveBackend] = {}
         self._sessions: dict[str, LiveSession] = {}
+        self._session_activity: dict[str, float] = {}
+        self._session_listeners: list[Callable[[], None]] = []
         self._lock = threading.Lock()
 
     def open_session(self, config: ParakeetLiveConfig) -> LiveTranscriptionUpdate:
@@ -127,6 +130,10 @@ class LiveTranscriptionService:
         session = backend.create_session(session_id)
         with self._lock:
             self._sessions[session_id] = session
+            self._session_activity[session_id] = time.monotonic()
+            listeners = list(self._session_listeners)
+        for listener in listeners:
+            listener()
         return session.snapshot()
 
     def append_chunk(
@@ -137,6 +144,8 @@ class LiveTranscriptionService:
         content_type: str | None,
     ) -> LiveTranscriptionUpdate:
         session = self._require_session(session_id)
+        with self._lock:
+            self._session_activity[session_id] = time.monotonic()
         try:
             return session.push_chunk(chunk_bytes, content_type=content_type)
         except Exception as exc:
@@ -146,6 +155,7 @@ class LiveTranscriptionService:
     def stop_session(self, session_id: str) -> LiveTranscriptionUpdate:
         with self._lock:
             session = self._sessions.pop(session_id, None)
+            self._session_activity.pop(session_id, None)
         if session is None:
             raise LiveSessionNotFound(session_id)
         try:
@@ -154,6 +164,21 @@ class LiveTranscriptionService:
             session.mark_error(str(exc))
             raise
 
+    def add_session_listener(self, listener: Callable[[], None]) -> None:
+        with self._lock:
+            self._session_listeners.append(listener)
+
+    def active_session_count(self, *, idle_timeout: float | None = None) -> int:
+        with self._lock:
+            if idle_timeout is None:
+                return len(self._sessions)
+            cutoff = time.monotonic() - idle_timeout
+            return sum(
+                1
+                for last_activity in self._session_activity.values()
+                if last_activity >= cutoff
+            )
+
     def _get_backend(self, config: ParakeetLiveConfig) -> LiveBackend:
         cache_key = config.cache_key()
         with self._lock:
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+import ctypes
+import logging
+import os
+from pathlib import Path
+import sys
+
+from mlx_ui.db import (
+    UPLOAD_ORIGIN_HARDLINK,
+    UPLOAD_ORIGIN_REFERENCE,
+    UPLOAD_ORIGIN_REFLINK,
+)
+from mlx_ui.storage import sanitize_filename
+
+logger = logging.getLogger(__name__)
+
+LOCAL_INGEST_ROOTS_ENV = "LOCAL_INGEST_ROOTS"
+_FICLONE = 0x40049409
+
+
+class LocalIngestError(ValueError):
+    pass
+
+
+class LocalIngestForbidden(PermissionError):
+    pass
+
+
+def read_local_ingest_roots(env: dict[str, str] | None = None) -> list[Path]:
+    source = os.environ if env is None else env
+    roots: list[Path] = []
+    for value in source.get(LOCAL_INGEST_ROOTS_ENV, "").split(os.pathsep):
+        root = Path(value.strip()).expanduser()
+        if value.strip() and root.is_absolute() and root.is_dir():
+            roots.append(root.resolve())
+    return roots
+
+
+def resolve_local_ingest_path(
+    value: str,
+    roots: Sequence[Path],
+    uploads_dir: Path,
+) -> Path:
+    candidate = Path(value)
+    if not value or "\x00" in value or not candidate.is_absolute():
+        raise LocalIngestError("path must be an absolute file path.")
+    # Resolve symlinks first so a link inside a root cannot point outside it.
+    resolved = candidate.resolve()
+    if not any(resolved.is_relative_to(root) for root in roots):
+        raise LocalIngestForbidden("path is not under an allowed root.")
+    if resolved.is_relative_to(Path(uploads_dir).resolve()):
+        raise LocalIngestForbidden("path must not be inside the uploads dir.")
+    if not resolved.is_file():
+        raise LocalIngestError("path is not a file.")
+    return resolved
+
+
+def ingest_local_file(source: Path, uploads_dir: Path, job_id: str) -> tuple[Path, str]:
+    """Expose ``source`` to a job without copying its bytes.
+
+    Tries a hard link, then a reflink, into ``uploads/<job_id>/``; when the
+    file lives on another filesystem the job references it in place.
+    """
+    job_dir = Path(uploads_dir) / job_id
+    destination = job_dir / sanitize_filename(source.name)
+    job_dir.mkdir(parents=True, exist_ok=True)
+    for origin, link in (
+        (UPLOAD_ORIGIN_HARDLINK, os.link),
+        (UPLOAD_ORIGIN_REFLINK, _reflink),
+    ):
+        try:
+            link(source, destination)
+        except OSError as exc:
+            logger.debug("Could not %s %s for job %s: %s", origin, source, job_id, exc)
+            continue
+        return destination, origin
+    try:
+        job_dir.rmdir()
+    except OSError:
+        pass
+    return source, UPLOAD_ORIGIN_REFERENCE
+
+
+def _reflink(source: Path, destination: Path) -> None:
+    if sys.platform == "darwin":
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(source), os.fsencode(destination), 0) != 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        return
+    try:
+        import fcntl
+    except ImportError as exc:
+        raise OSError("reflinks are not supported on this platform") from exc
+    with source.open("rb") as src, destination.open("xb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            destination.unlink(missing_ok=True)
+            raise
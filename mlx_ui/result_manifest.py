@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from pathlib import Path
+
+from mlx_ui.db import (
+    RESULT_PREVIEW_CHARS,
+    ResultFileRecord,
+    list_unrecorded_result_job_ids,
+    record_job_results,
+)
+from mlx_ui.storage import list_result_files, pick_preview_result
+
+logger = logging.getLogger(__name__)
+
+RESULT_MANIFEST_BACKFILL_BATCH_SIZE = 500
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def build_result_manifest(results_dir: Path, job_id: str) -> list[ResultFileRecord]:
+    names = list_result_files(results_dir, job_id)
+    preview_name = pick_preview_result(names)
+    manifest: list[ResultFileRecord] = []
+    for name in names:
+        path = results_dir / job_id / name
+        try:
+            size_bytes, sha256 = _hash_file(path)
+            preview, truncated = (
+                read_result_preview(path, RESULT_PREVIEW_CHARS)
+                if name == preview_name
+                else (None, False)
+            )
+        except OSError:
+            logger.warning("Failed to read result file for manifest: %s", path)
+            continue
+        manifest.append(
+            ResultFileRecord(
+                name=name,
+                format=Path(name).suffix.lstrip(".").lower(),
+                size_bytes=size_bytes,
+                sha256=sha256,
+                preview=preview,
+                preview_truncated=truncated,
+            )
+        )
+    return manifest
+
+
+def read_result_preview(path: Path, limit: int) -> tuple[str, bool]:
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        data = handle.read(limit + 1)
+    return data[:limit], len(data) > limit
+
+
+def backfill_result_manifests(
+    db_path: Path,
+    results_dir: Path,
+    *,
+    batch_size: int = RESULT_MANIFEST_BACKFILL_BATCH_SIZE,
+) -> int:
+    recorded = 0
+    while True:
+        job_ids = list_unrecorded_result_job_ids(db_path, limit=batch_size)
+        if not job_ids:
+            break
+        manifests = {
+            job_id: build_result_manifest(results_dir, job_id) for job_id in job_ids
+        }
+        record_job_results(db_path, manifests)
+        recorded += len(manifests)
+    if recorded:
+        logger.info("Recorded result manifests for %s job(s)", recorded)
+    return recorded
+
+
+def _hash_file(path: Path) -> tuple[int, str]:
+    digest = hashlib.sha256()
+    size_bytes = 0
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+            size_bytes += len(chunk)
+    return size_bytes, digest.hexdigest()
@@ -6,7 +6,14 @@ import logging
 from pathlib import Path
 import threading
 
-from mlx_ui.db import list_expired_terminal_job_ids
+from mlx_ui.db import (
+    checkpoint_db,
+    clear_job_results,
+    clear_transcript_index,
+    list_expired_terminal_job_ids,
+    vacuum_db,
+)
+from mlx_ui.history_archive import archive_expired_history_from_settings
 from mlx_ui.settings_store import compute_effective_settings
 from mlx_ui.storage import is_safe_path_component, remove_results_dir
 
@@ -58,14 +65,19 @@ def purge_expired_results(
             cutoff=cutoff_text,
         )
         expired += len(expired_ids)
+        removed_ids: list[str] = []
         for job_id in sorted(expired_ids):
             result = remove_results_dir(results_dir, job_id)
             if result == "deleted":
                 deleted += 1
+                removed_ids.append(job_id)
             elif result == "missing":
                 missing += 1
+                removed_ids.append(job_id)
             else:
                 failed += 1
+        clear_transcript_index(db_path, removed_ids)
+        clear_job_results(db_path, removed_ids)
 
     summary = ResultRetentionSummary(
         retention_days=retention_days,
@@ -148,7 +160,7 @@ class ResultRetentionService:
 
     def run_once(self) -> ResultRetentionSummary | None:
         try:
-            return purge_expired_results_from_settings(
+            summary = purge_expired_results_from_settings(
                 self.db_path,
                 self.results_dir,
                 self.base_dir,
@@ -156,6 +168,19 @@ class ResultRetentionService:
         except Exception:
             logger.exception("Result retention cleanup failed; it will be retried")
             return None
+        try:
+            archive_expired_history_from_settings(self.db_path, self.base_dir)
+        except Exception:
+            logger.exception("History archiving failed; it will be retried")
+        try:
+            checkpoint_db(self.db_path)
+        except Exception:
+            logger.exception("SQLite WAL checkpoint failed; it will be retried")
+        try:
+            vacuum_db(self.db_path)
+        except Exception:
+            logger.exception("SQLite incremental vacuum failed; it will be retried")
+        return summary
 
     def _run_loop(self) -> None:
         self.run_once()
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import shutil
+from uuid import uuid4
+
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+
+from mlx_ui.storage import sanitize_display_path, sanitize_filename
+from mlx_ui.upload_stream import StoredUpload
+
+logger = logging.getLogger(__name__)
+
+# Partial uploads live next to finished ones so finalising is a rename.
+PARTIAL_UPLOADS_DIRNAME = ".partial"
+RESUMABLE_CHUNK_SIZE = 8 * 1024 * 1024
+RESUMABLE_MIN_CHUNK_SIZE = 256 * 1024
+RESUMABLE_MAX_CHUNK_SIZE = 64 * 1024 * 1024
+RESUMABLE_MAX_SIZE = 64 * 1024 * 1024 * 1024
+PARTIAL_UPLOAD_TTL_SECONDS = 24 * 60 * 60
+_HASH_BLOCK_SIZE = 1024 * 1024
+_META_NAME = "upload.json"
+_DATA_NAME = "data"
+_RECEIVED_NAME = "received"
+
+
+class PartialUploadNotFound(LookupError):
+    pass
+
+
+class PartialUploadConflict(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class PartialUpload:
+    id: str
+    filename: str
+    size: int
+    chunk_size: int
+    created_at: str
+    updated_at: str
+    received: bytes
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self.received)
+
+    @property
+    def missing_chunks(self) -> list[int]:
+        return [index for index, flag in enumerate(self.received) if not flag]
+
+    @property
+    def offset(self) -> int:
+        """Bytes received without a gap from the start of the file."""
+        missing = self.received.find(0)
+        if missing < 0:
+            return self.size
+        return missing * self.chunk_size
+
+    @property
+    def complete(self) -> bool:
+        return 0 not in self.received
+
+    def chunk_length(self, index: int) -> int:
+        return min(self.chunk_size, self.size - index * self.chunk_size)
+
+
+def partial_uploads_dir(uploads_dir: Path) -> Path:
+    return Path(uploads_dir) / PARTIAL_UPLOADS_DIRNAME
+
+
+def create_partial_upload(
+    uploads_dir: Path,
+    *,
+    filename: str,
+    size: int,
+    chunk_size: int = RESUMABLE_CHUNK_SIZE,
+) -> PartialUpload:
+    if size < 1 or size > RESUMABLE_MAX_SIZE:
+        raise ValueError(f"size must be between 1 and {RESUMABLE_MAX_SIZE} bytes")
+    if not RESUMABLE_MIN_CHUNK_SIZE <= chunk_size <= RESUMABLE_MAX_CHUNK_SIZE:
+        raise ValueError(
+            f"chunk_size must be between {RESUMABLE_MIN_CHUNK_SIZE} and "
+            f"{RESUMABLE_MAX_CHUNK_SIZE} bytes"
+        )
+    upload_id = uuid4().hex
+    upload_dir = partial_uploads_dir(uploads_dir) / upload_id
+    upload_dir.mkdir(parents=True)
+    created_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    with (upload_dir / _DATA_NAME).open("wb") as handle:
+        handle.truncate(size)
+    (upload_dir / _RECEIVED_NAME).write_bytes(bytes(-(-size // chunk_size)))
+    (upload_dir / _META_NAME).write_text(
+        json.dumps(
+            {
+                "filename": filename,
+                "size": size,
+                "chunk_size": chunk_size,
+                "created_at": created_at,
+            }
+        ),
+        encoding="utf-8",
+    )
+    return get_partial_upload(uploads_dir, upload_id)
+
+
+def get_partial_upload(uploads_dir: Path, upload_id: str) -> PartialUpload:
+    upload_dir = _partial_upload_dir(uploads_dir, upload_id)
+    try:
+        meta = json.loads((upload_dir / _META_NAME).read_text(encoding="utf-8"))
+        received_path = upload_dir / _RECEIVED_NAME
+        received = received_path.read_bytes()
+        updated = datetime.fromtimestamp(received_path.stat().st_mtime, timezone.utc)
+    except (OSError, ValueError) as exc:
+        raise PartialUploadNotFound(upload_id) from exc
+    return PartialUpload(
+        id=upload_id,
+        filename=str(meta["filename"]),
+        size=int(meta["size"]),
+        chunk_size=int(meta["chunk_size"]),
+        created_at=str(meta["created_at"]),
+        updated_at=updated.isoformat(timespec="seconds"),
+        received=received,
+    )
+
+
+async def receive_partial_chunk(
+    request: Request,
+    uploads_dir: Path,
+    upload_id: str,
+    offset: int,
+) -> PartialUpload:
+    """Write one chunk of the request body at ``offset`` and mark it received.
+
+    Chunks are independent, so clients may send them in parallel and retry
+    any of them; a chunk only counts once its full length has been written.
+    """
+    upload = await run_in_threadpool(get_partial_upload, uploads_dir, upload_id)
+    if offset < 0 or offset >= upload.size or offset % upload.chunk_size:
+        raise PartialUploadConflict(
+            f"offset must be a multiple of {upload.chunk_size} below {upload.size}."
+        )
+    index = offset // upload.chunk_size
+    expected = upload.chunk_length(index)
+    upload_dir = _partial_upload_dir(uploads_dir, upload_id)
+    try:
+        handle = await run_in_threadpool((upload_dir / _DATA_NAME).open, "r+b")
+    except OSError as exc:
+        raise PartialUploadNotFound(upload_id) from exc
+    written = 0
+    try:
+        await run_in_threadpool(handle.seek, offset)
+        async for data in request.stream():
+            written += len(data)
+            if written > expected:
+                raise PartialUploadConflict(f"Chunk {index} must be {expected} bytes.")
+            if data:
+                await run_in_threadpool(handle.write, data)
+    finally:
+        await run_in_threadpool(handle.close)
+    if written != expected:
+        raise PartialUploadConflict(f"Chunk {index} must be {expected} bytes.")
+    await run_in_threadpool(_mark_chunk_received, upload_dir, index)
+    return await run_in_threadpool(get_partial_upload, uploads_dir, upload_id)
+
+
+def finalize_partial_upload(uploads_dir: Path, upload_id: str) -> StoredUpload:
+    upload = get_partial_upload(uploads_dir, upload_id)
+    if not upload.complete:
+        raise PartialUploadConflict(
+            f"{len(upload.missing_chunks)} chunk(s) are still missing."
+        )
+    upload_dir = _partial_upload_dir(uploads_dir, upload_id)
+    data_path = upload_dir / _DATA_NAME
+    hasher = hashlib.sha256()
+    try:
+        with data_path.open("rb") as handle:
+            while block := handle.read(_HASH_BLOCK_SIZE):
+                hasher.update(block)
+    except OSError as exc:
+        raise PartialUploadNotFound(upload_id) from exc
+    job_id = uuid4().hex
+    safe_name = sanitize_filename(upload.filename)
+    destination = Path(uploads_dir) / job_id / safe_name
+    destination.parent.mkdir(parents=True)
+    try:
+        os.replace(data_path, destination)
+    except FileNotFoundError as exc:
+        # A concurrent finalise already claimed the data file.
+        destination.parent.rmdir()
+        raise PartialUploadNotFound(upload_id) from exc
+    shutil.rmtree(upload_dir, ignore_errors=True)
+    return StoredUpload(
+        job_id=job_id,
+        field_name="file",
+        display_name=sanitize_display_path(upload.filename, safe_name),
+        path=destination,
+        size_bytes=upload.size,
+        sha256=hasher.hexdigest(),
+    )
+
+
+def delete_partial_upload(uploads_dir: Path, upload_id: str) -> bool:
+    upload_dir = _partial_upload_dir(uploads_dir, upload_id)
+    if not upload_dir.is_dir():
+        return False
+    shutil.rmtree(upload_dir, ignore_errors=True)
+    return True
+
+
+def purge_expired_partial_uploads(
+    uploads_dir: Path,
+    *,
+    max_age_seconds: float = PARTIAL_UPLOAD_TTL_SECONDS,
+    now: datetime | None = None,
+) -> int:
+    root = partial_uploads_dir(uploads_dir)
+    if not root.is_dir():
+        return 0
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(seconds=max_age_seconds)
+    removed = 0
+    for upload_dir in root.iterdir():
+        try:
+            last_activity = max(
+                path.stat().st_mtime for path in (upload_dir, *upload_dir.iterdir())
+            )
+        except (OSError, ValueError):
+            continue
+        if datetime.fromtimestamp(last_activity, timezone.utc) >= cutoff:
+            continue
+        shutil.rmtree(upload_dir, ignore_errors=True)
+        removed += 1
+    if removed:
+        logger.info("Removed %s abandoned partial upload(s)", removed)
+    return removed
+
+
+def _partial_upload_dir(uploads_dir: Path, upload_id: str) -> Path:
+    if len(upload_id) != 32 or not all(
+        char in "0123456789abcdef" for char in upload_id
+    ):
+        raise PartialUploadNotFound(upload_id)
+    return partial_uploads_dir(uploads_dir) / upload_id
+
+
+def _mark_chunk_received(upload_dir: Path, index: int) -> None:
+    # One byte per chunk, so parallel chunk writers never touch the same byte.
+    try:
+        with (upload_dir / _RECEIVED_NAME).open("r+b") as handle:
+            handle.seek(index)
+            handle.write(b"\x01")
+    except OSError as exc:
+        raise PartialUploadNotFound(upload_dir.name) from exc
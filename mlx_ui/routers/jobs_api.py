@@ -1,19 +1,31 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-import shutil
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import json
 from pathlib import Path
+import sqlite3
+import threading
+from urllib.parse import urlsplit
 from uuid import uuid4
 
 from fastapi import (
     APIRouter,
-    File,
-    Form,
     HTTPException,
     Query,
-    UploadFile,
+    Request,
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import (
+    FileResponse,
+    HTMLResponse,
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
 )
-from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
 
 from mlx_ui.app_context import (
     get_base_dir,
@@ -21,20 +33,44 @@ from mlx_ui.app_context import (
     get_results_dir,
     get_uploads_dir,
 )
+from mlx_ui.change_bus import ChangeBus, get_change_bus
 from mlx_ui.db import (
+    HISTORY_KEYSET_SORTS,
+    RESULT_MANIFEST_STATUSES,
+    TRANSCRIPTION_MODE_STANDARD,
+    TRANSCRIPTION_MODES,
+    UPLOAD_ORIGIN_UPLOAD,
     JobRecord,
+    JobSummary,
+    ResultFileRecord,
+    archive_db_path,
     cancel_running_job,
     count_history_jobs,
+    count_jobs_by_status,
     delete_history_job,
     delete_history_jobs,
     delete_queued_job,
+    encode_history_cursor,
     find_job_by_client_job_id,
+    find_jobs_by_client_job_ids,
+    find_transcript_snippets,
     get_job,
     insert_job,
+    insert_jobs,
+    list_active_job_summaries,
     list_active_jobs,
     list_history_jobs,
     list_history_page,
+    list_job_results,
     list_recent_history_jobs,
+    list_recent_history_summaries,
+    list_running_refinements,
+    move_queued_job,
+)
+from mlx_ui.job_analytics import (
+    JOB_ANALYTICS_DEFAULT_DAYS,
+    JOB_ANALYTICS_MAX_DAYS,
+    build_job_analytics,
 )
 from mlx_ui.job_ui import queue_groups, serialize_job, split_jobs, worker_state
 from mlx_ui.engine_registry import PARAKEET_TDT_V3_ENGINE
@@ -44,9 +80,32 @@ from mlx_ui.languages import (
     is_parakeet_tdt_v3_language_supported,
     normalize_language,
 )
+from mlx_ui.result_manifest import read_result_preview
 from mlx_ui.settings import (
     resolve_default_language_with_settings,
     resolve_requested_engine_with_settings,
+    resolve_transcription_mode_with_settings,
+)
+from mlx_ui.local_ingest import (
+    LOCAL_INGEST_ROOTS_ENV,
+    LocalIngestError,
+    LocalIngestForbidden,
+    ingest_local_file,
+    read_local_ingest_roots,
+    resolve_local_ingest_path,
+)
+from mlx_ui.resumable_uploads import (
+    PARTIAL_UPLOAD_TTL_SECONDS,
+    RESUMABLE_CHUNK_SIZE,
+    PartialUpload,
+    PartialUploadConflict,
+    PartialUploadNotFound,
+    create_partial_upload,
+    delete_partial_upload,
+    finalize_partial_upload,
+    get_partial_upload,
+    purge_expired_partial_uploads,
+    receive_partial_chunk,
 )
 from mlx_ui.storage import (
     ensure_directory,
@@ -55,8 +114,13 @@ from mlx_ui.storage import (
     pick_preview_result,
     remove_results_dir,
     safe_result_file_path,
-    sanitize_display_path,
-    sanitize_filename,
+)
+from mlx_ui.transcript_search import format_snippet_html
+from mlx_ui.upload_stream import (
+    StoredUpload,
+    UploadForm,
+    UploadFormError,
+    receive_upload_form,
 )
 from mlx_ui.uploads import cleanup_upload_path
 from mlx_ui.worker import cleanup_cancelled_job_artifacts, request_worker_cancel
@@ -64,9 +128,24 @@ from mlx_ui.worker import cleanup_cancelled_job_artifacts, request_worker_cancel
 router = APIRouter()
 
 MACHINE_STATE_HISTORY_LIMIT = 100
+MACHINE_STATUS_MAX_IDS = 1000
+CALLBACK_URL_MAX_LENGTH = 2048
 BROWSER_HISTORY_DEFAULT_LIMIT = 50
 BROWSER_HISTORY_MAX_LIMIT = 100
 BROWSER_STATE_RECENT_HISTORY_LIMIT = 10
+BROWSER_EVENTS_MIN_INTERVAL_SECONDS = 0.25
+BROWSER_EVENTS_KEEPALIVE_SECONDS = 15.0
+
+
+@dataclass(frozen=True)
+class _CachedState:
+    version: int
+    etag: str
+    body: bytes
+
+
+_state_cache_lock = threading.Lock()
+_state_cache: dict[tuple[str, str], _CachedState] = {}
 
 
 def _new_job_record(
@@ -77,6 +156,10 @@ def _new_job_record(
     language: str = DEFAULT_LANGUAGE,
     client: str | None = None,
     client_job_id: str | None = None,
+    transcription_mode: str = TRANSCRIPTION_MODE_STANDARD,
+    callback_url: str | None = None,
+    upload_sha256: str | None = None,
+    upload_origin: str = UPLOAD_ORIGIN_UPLOAD,
 ) -> JobRecord:
     return JobRecord(
         id=job_id,
@@ -88,15 +171,46 @@ def _new_job_record(
         requested_engine=requested_engine,
         client=client,
         client_job_id=client_job_id,
+        transcription_mode=transcription_mode,
+        callback_url=callback_url,
+        upload_sha256=upload_sha256,
+        upload_origin=upload_origin,
     )
 
 
-def _build_results_index(jobs: list[JobRecord]) -> dict[str, list[str]]:
+def _history_db_paths(include_archived: bool = False) -> list[Path]:
+    db_path = get_db_path()
+    archive_path = archive_db_path(db_path)
+    if include_archived and archive_path.exists():
+        return [db_path, archive_path]
+    return [db_path]
+
+
+def _build_results_index(
+    jobs: list[JobRecord],
+    db_paths: list[Path] | None = None,
+) -> dict[str, list[str]]:
+    manifests: dict[str, list[ResultFileRecord]] = {}
+    for db_path in db_paths or [get_db_path()]:
+        for job_id, manifest in list_job_results(
+            db_path, [job.id for job in jobs]
+        ).items():
+            manifests.setdefault(job_id, manifest)
     results_dir = get_results_dir()
-    return {job.id: list_result_files(results_dir, job.id) for job in jobs}
+    results_index: dict[str, list[str]] = {}
+    for job in jobs:
+        manifest = manifests.get(job.id)
+        if manifest is not None:
+            results_index[job.id] = [result.name for result in manifest]
+        elif job.status in RESULT_MANIFEST_STATUSES:
+            # Finished before manifests existed and not backfilled yet.
+            results_index[job.id] = list_result_files(results_dir, job.id)
+        else:
+            results_index[job.id] = []
+    return results_index
 
 
-def _serialize_active_job(job: JobRecord) -> dict[str, object]:
+def _serialize_active_job(job: JobSummary) -> dict[str, object]:
     return {
         "id": job.id,
         "filename": job.filename,
@@ -109,12 +223,21 @@ def _serialize_active_job(job: JobRecord) -> dict[str, object]:
     }
 
 
-def _serialize_history_job(job: JobRecord) -> dict[str, object]:
+def _serialize_history_job(job: JobRecord, results: list[str]) -> dict[str, object]:
     payload = serialize_job(job)
-    payload["results"] = list_result_files(get_results_dir(), job.id)
+    payload["results"] = results
     return payload
 
 
+def _queue_counts(db_path: Path) -> dict[str, int]:
+    counts = count_jobs_by_status(db_path)
+    # Reserved clip-batch companions are in flight with the job that claimed them.
+    return {
+        "running": counts.get("running", 0) + counts.get("reserved", 0),
+        "queued": counts.get("queued", 0),
+    }
+
+
 def _resolve_job_defaults(language: str | None) -> tuple[str | None, str]:
     requested_engine = resolve_requested_engine_with_settings(base_dir=get_base_dir())
     default_language = resolve_default_language_with_settings(base_dir=get_base_dir())
@@ -124,6 +247,25 @@ def _resolve_job_defaults(language: str | None) -> tuple[str | None, str]:
     return requested_engine, batch_language
 
 
+def _resolve_transcription_mode(mode: str | None) -> str | None:
+    normalized = (mode or "").strip().lower()
+    if not normalized:
+        return resolve_transcription_mode_with_settings(base_dir=get_base_dir())
+    if normalized in TRANSCRIPTION_MODES:
+        return normalized
+    return None
+
+
+def _require_transcription_mode(mode: str | None) -> str:
+    transcription_mode = _resolve_transcription_mode(mode)
+    if transcription_mode is None:
+        raise HTTPException(
+            status_code=422,
+            detail=f"mode must be one of: {', '.join(TRANSCRIPTION_MODES)}.",
+        )
+    return transcription_mode
+
+
 def _validate_parakeet_language(
     requested_engine: str | None,
     language: str,
@@ -151,65 +293,342 @@ def _normalize_machine_metadata(value: str | None, *, field_name: str) -> str:
     return normalized
 
 
+def _normalize_callback_url(value: str | None) -> str | None:
+    normalized = (value or "").strip()
+    if not normalized:
+        return None
+    parts = urlsplit(normalized)
+    if (
+        len(normalized) > CALLBACK_URL_MAX_LENGTH
+        or parts.scheme not in {"http", "https"}
+        or not parts.netloc
+    ):
+        raise HTTPException(
+            status_code=422,
+            detail="callback_url must be an absolute http(s) URL.",
+        )
+    return normalized
+
+
 @router.post("/upload", response_class=HTMLResponse)
-async def upload_files(
-    files: list[UploadFile] = File(...),
-    language: str | None = Form(None),
-):
+async def upload_files(request: Request):
     uploads_dir = ensure_directory(get_uploads_dir())
+    form = await _receive_upload_form(request, uploads_dir)
+    try:
+        return await _queue_uploaded_files(form, uploads_dir)
+    except BaseException:
+        await _discard_uploads(form, uploads_dir)
+        raise
+
+
+async def _queue_uploaded_files(form: UploadForm, uploads_dir: Path) -> Response:
     db_path = get_db_path()
-    requested_engine, batch_language = _resolve_job_defaults(language)
+    requested_engine, batch_language = _resolve_job_defaults(form.get("language"))
+    transcription_mode = _require_transcription_mode(form.get("mode"))
+    uploads = form.files_for("files")
+    await _discard_uploads(
+        form, uploads_dir, [item for item in form.files if item not in uploads]
+    )
 
     if not _validate_parakeet_language(requested_engine, batch_language):
+        await _discard_uploads(form, uploads_dir)
         return RedirectResponse(
             url=f"/?tab=queue&queue_error=parakeet_language&queue_error_language={batch_language}",
             status_code=303,
         )
 
-    for upload in files:
-        if not upload.filename:
-            continue
-        safe_name = sanitize_filename(upload.filename)
-        display_name = sanitize_display_path(upload.filename, safe_name)
-        job_id = uuid4().hex
-        job_dir = uploads_dir / job_id
-        job_dir.mkdir(parents=True, exist_ok=True)
-        destination = job_dir / safe_name
-        try:
-            with destination.open("wb") as outfile:
-                shutil.copyfileobj(upload.file, outfile)
-        finally:
-            await upload.close()
-        insert_job(
-            db_path,
-            _new_job_record(
-                job_id,
-                display_name,
-                destination,
-                requested_engine=requested_engine,
-                language=batch_language,
-            ),
+    jobs = [
+        _new_job_record(
+            upload.job_id,
+            upload.display_name,
+            upload.path,
+            requested_engine=requested_engine,
+            language=batch_language,
+            transcription_mode=transcription_mode,
+            upload_sha256=upload.sha256,
         )
+        for upload in uploads
+    ]
+    insert_jobs(db_path, jobs)
 
     return RedirectResponse(url="/?tab=queue", status_code=303)
 
 
+async def _receive_upload_form(
+    request: Request,
+    uploads_dir: Path,
+    *,
+    skip_files: Callable[[UploadForm], bool] | None = None,
+) -> UploadForm:
+    try:
+        return await receive_upload_form(request, uploads_dir, skip_files=skip_files)
+    except UploadFormError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+async def _discard_uploads(
+    form: UploadForm,
+    uploads_dir: Path,
+    uploads: list[StoredUpload] | None = None,
+) -> None:
+    if uploads is None or uploads:
+        await run_in_threadpool(form.discard, uploads_dir, uploads)
+
+
 @router.post("/api/jobs")
-async def create_machine_job(
-    file: UploadFile = File(...),
-    language: str | None = Form(None),
-    client: str = Form(...),
-    client_job_id: str = Form(...),
+async def create_machine_job(request: Request) -> dict[str, object]:
+    uploads_dir = ensure_directory(get_uploads_dir())
+    form = await _receive_upload_form(
+        request, uploads_dir, skip_files=_find_existing_machine_job
+    )
+    try:
+        return await _create_machine_job(form, uploads_dir)
+    except BaseException:
+        await _discard_uploads(form, uploads_dir)
+        raise
+
+
+def _find_existing_machine_job(form: UploadForm) -> bool:
+    # Runs before the file part is read, so a retried submission whose
+    # metadata fields come first never re-sends the media.
+    client = form.get("client")
+    client_job_id = form.get("client_job_id")
+    if client is None or client_job_id is None:
+        return False
+    existing = find_job_by_client_job_id(
+        get_db_path(),
+        client=client.strip(),
+        client_job_id=client_job_id.strip(),
+    )
+    return existing is not None
+
+
+async def _create_machine_job(
+    form: UploadForm,
+    uploads_dir: Path,
 ) -> dict[str, object]:
-    machine_client = _normalize_machine_metadata(client, field_name="client")
+    machine_client = _normalize_machine_metadata(
+        form.get("client"), field_name="client"
+    )
     machine_client_job_id = _normalize_machine_metadata(
-        client_job_id,
+        form.get("client_job_id"),
         field_name="client_job_id",
     )
-    if not file.filename:
-        raise HTTPException(status_code=422, detail="file filename is required.")
+    machine_callback_url = _normalize_callback_url(form.get("callback_url"))
+    db_path = get_db_path()
+    existing = find_job_by_client_job_id(
+        db_path,
+        client=machine_client,
+        client_job_id=machine_client_job_id,
+    )
+    if existing is not None:
+        await _discard_uploads(form, uploads_dir)
+        return _serialize_created_machine_job(existing, created=False)
+    uploads = form.files_for("file")
+    if not uploads:
+        raise HTTPException(status_code=422, detail="file is required.")
+    upload = uploads[0]
+    await _discard_uploads(
+        form, uploads_dir, [item for item in form.files if item is not upload]
+    )
+    requested_engine, batch_language, transcription_mode = _resolve_machine_job_options(
+        form.get("language"), form.get("mode")
+    )
+
+    job = _new_job_record(
+        upload.job_id,
+        upload.display_name,
+        upload.path,
+        requested_engine=requested_engine,
+        language=batch_language,
+        client=machine_client,
+        client_job_id=machine_client_job_id,
+        transcription_mode=transcription_mode,
+        callback_url=machine_callback_url,
+        upload_sha256=upload.sha256,
+    )
+    try:
+        insert_job(db_path, job)
+    except sqlite3.IntegrityError:
+        # A concurrent retry with the same key won the insert.
+        await _discard_uploads(form, uploads_dir)
+        existing = find_job_by_client_job_id(
+            db_path,
+            client=machine_client,
+            client_job_id=machine_client_job_id,
+        )
+        if existing is None:
+            raise
+        return _serialize_created_machine_job(existing, created=False)
+    return _serialize_created_machine_job(job)
+
+
+@router.post("/api/jobs/batch")
+async def create_machine_jobs(request: Request) -> dict[str, object]:
+    uploads_dir = ensure_directory(get_uploads_dir())
+    form = await _receive_upload_form(request, uploads_dir)
+    try:
+        return await _create_machine_jobs(form, uploads_dir)
+    except BaseException:
+        await _discard_uploads(form, uploads_dir)
+        raise
+
+
+async def _create_machine_jobs(
+    form: UploadForm,
+    uploads_dir: Path,
+) -> dict[str, object]:
+    machine_client = _normalize_machine_metadata(
+        form.get("client"), field_name="client"
+    )
+    machine_callback_url = _normalize_callback_url(form.get("callback_url"))
+    machine_client_job_ids = [
+        _normalize_machine_metadata(value, field_name="client_job_id")
+        for value in form.getlist("client_job_id")
+    ]
+    uploads = form.files_for("files")
+    if not uploads:
+        raise HTTPException(status_code=422, detail="files is required.")
+    if len(machine_client_job_ids) != len(uploads):
+        raise HTTPException(
+            status_code=422,
+            detail="Provide one client_job_id per file.",
+        )
+    if len(set(machine_client_job_ids)) != len(machine_client_job_ids):
+        raise HTTPException(
+            status_code=422,
+            detail="client_job_id values must be unique within a batch.",
+        )
+    requested_engine, batch_language, transcription_mode = _resolve_machine_job_options(
+        form.get("language"), form.get("mode")
+    )
+
+    db_path = get_db_path()
+    existing = find_jobs_by_client_job_ids(
+        db_path,
+        client=machine_client,
+        client_job_ids=machine_client_job_ids,
+    )
+    jobs = [
+        _new_job_record(
+            upload.job_id,
+            upload.display_name,
+            upload.path,
+            requested_engine=requested_engine,
+            language=batch_language,
+            client=machine_client,
+            client_job_id=machine_client_job_id,
+            transcription_mode=transcription_mode,
+            callback_url=machine_callback_url,
+            upload_sha256=upload.sha256,
+        )
+        for upload, machine_client_job_id in zip(uploads, machine_client_job_ids)
+        if machine_client_job_id not in existing
+    ]
+    kept = {job.id for job in jobs}
+    await _discard_uploads(
+        form, uploads_dir, [item for item in form.files if item.job_id not in kept]
+    )
+    try:
+        insert_jobs(db_path, jobs)
+    except sqlite3.IntegrityError:
+        await _discard_uploads(form, uploads_dir)
+        raise HTTPException(
+            status_code=409,
+            detail="A concurrent request submitted the same client_job_id; retry.",
+        )
+    created = {str(job.client_job_id): job for job in jobs}
+    return {
+        "jobs": [
+            _serialize_created_machine_job(created[value])
+            if value in created
+            else _serialize_created_machine_job(existing[value], created=False)
+            for value in machine_client_job_ids
+        ]
+    }
+
 
+@router.post("/api/jobs/local")
+async def create_local_machine_job(request: Request) -> dict[str, object]:
+    payload = await _read_json_object(request)
+    fields = ("path", "client", "client_job_id", "language", "mode", "callback_url")
+    values = {name: payload.get(name) for name in fields}
+    if any(
+        value is not None and not isinstance(value, str) for value in values.values()
+    ):
+        raise HTTPException(
+            status_code=422,
+            detail=f"{', '.join(fields)} must be strings.",
+        )
+    roots = read_local_ingest_roots()
+    if not roots:
+        raise HTTPException(
+            status_code=403,
+            detail=f"Local ingestion is disabled; set {LOCAL_INGEST_ROOTS_ENV}.",
+        )
+    machine_client = _normalize_machine_metadata(values["client"], field_name="client")
+    machine_client_job_id = _normalize_machine_metadata(
+        values["client_job_id"],
+        field_name="client_job_id",
+    )
+    machine_callback_url = _normalize_callback_url(values["callback_url"])
     uploads_dir = ensure_directory(get_uploads_dir())
+    try:
+        source = await run_in_threadpool(
+            resolve_local_ingest_path, values["path"] or "", roots, uploads_dir
+        )
+    except LocalIngestForbidden as exc:
+        raise HTTPException(status_code=403, detail=str(exc)) from exc
+    except LocalIngestError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    db_path = get_db_path()
+    existing = find_job_by_client_job_id(
+        db_path,
+        client=machine_client,
+        client_job_id=machine_client_job_id,
+    )
+    if existing is not None:
+        return _serialize_created_machine_job(existing, created=False)
+    requested_engine, batch_language, transcription_mode = _resolve_machine_job_options(
+        values["language"], values["mode"]
+    )
+
+    job_id = uuid4().hex
+    upload_path, upload_origin = await run_in_threadpool(
+        ingest_local_file, source, uploads_dir, job_id
+    )
+    job = _new_job_record(
+        job_id,
+        source.name,
+        upload_path,
+        requested_engine=requested_engine,
+        language=batch_language,
+        client=machine_client,
+        client_job_id=machine_client_job_id,
+        transcription_mode=transcription_mode,
+        callback_url=machine_callback_url,
+        upload_origin=upload_origin,
+    )
+    try:
+        insert_job(db_path, job)
+    except sqlite3.IntegrityError:
+        cleanup_upload_path(upload_path, uploads_dir, job_id, origin=upload_origin)
+        existing = find_job_by_client_job_id(
+            db_path,
+            client=machine_client,
+            client_job_id=machine_client_job_id,
+        )
+        if existing is None:
+            raise
+        return _serialize_created_machine_job(existing, created=False)
+    return {**_serialize_created_machine_job(job), "upload_origin": upload_origin}
+
+
+def _resolve_machine_job_options(
+    language: str | None,
+    mode: str | None,
+) -> tuple[str | None, str, str]:
+    transcription_mode = _require_transcription_mode(mode)
     requested_engine, batch_language = _resolve_job_defaults(language)
     if not _validate_parakeet_language(requested_engine, batch_language):
         raise HTTPException(
@@ -219,45 +638,175 @@ async def create_machine_job(
                 f"got '{batch_language}'."
             ),
         )
+    return requested_engine, batch_language, transcription_mode
 
-    safe_name = sanitize_filename(file.filename)
-    display_name = sanitize_display_path(file.filename, safe_name)
-    job_id = uuid4().hex
-    job_dir = uploads_dir / job_id
-    job_dir.mkdir(parents=True, exist_ok=True)
-    destination = job_dir / safe_name
+
+def _serialize_created_machine_job(
+    job: JobRecord,
+    *,
+    created: bool = True,
+) -> dict[str, object]:
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "filename": job.filename,
+        "client": job.client,
+        "client_job_id": job.client_job_id,
+        "mode": job.transcription_mode,
+        "created": created,
+    }
+
+
+@router.post("/api/uploads")
+async def create_resumable_upload(request: Request) -> dict[str, object]:
+    payload = await _read_json_object(request)
+    filename = payload.get("filename")
+    size = payload.get("size")
+    chunk_size = payload.get("chunk_size", RESUMABLE_CHUNK_SIZE)
+    if not isinstance(filename, str) or not filename.strip():
+        raise HTTPException(status_code=422, detail="filename is required.")
+    if not isinstance(size, int) or not isinstance(chunk_size, int):
+        raise HTTPException(
+            status_code=422,
+            detail="size and chunk_size must be integers.",
+        )
+    uploads_dir = ensure_directory(get_uploads_dir())
+    await run_in_threadpool(purge_expired_partial_uploads, uploads_dir)
     try:
-        with destination.open("wb") as outfile:
-            shutil.copyfileobj(file.file, outfile)
-    finally:
-        await file.close()
+        upload = await run_in_threadpool(
+            create_partial_upload,
+            uploads_dir,
+            filename=filename.strip(),
+            size=size,
+            chunk_size=chunk_size,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return _serialize_partial_upload(upload)
 
-    insert_job(
-        get_db_path(),
-        _new_job_record(
-            job_id,
-            display_name,
-            destination,
-            requested_engine=requested_engine,
-            language=batch_language,
-            client=machine_client,
-            client_job_id=machine_client_job_id,
-        ),
+
+@router.get("/api/uploads/{upload_id}")
+def get_resumable_upload(upload_id: str) -> dict[str, object]:
+    try:
+        upload = get_partial_upload(get_uploads_dir(), upload_id)
+    except PartialUploadNotFound:
+        raise HTTPException(status_code=404)
+    return _serialize_partial_upload(upload)
+
+
+@router.put("/api/uploads/{upload_id}")
+async def put_resumable_upload_chunk(
+    request: Request,
+    upload_id: str,
+    offset: int = Query(..., ge=0),
+) -> dict[str, object]:
+    try:
+        upload = await receive_partial_chunk(
+            request, get_uploads_dir(), upload_id, offset
+        )
+    except PartialUploadNotFound:
+        raise HTTPException(status_code=404)
+    except PartialUploadConflict as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return _serialize_partial_upload(upload)
+
+
+@router.post("/api/uploads/{upload_id}/complete")
+async def complete_resumable_upload(
+    request: Request,
+    upload_id: str,
+) -> dict[str, object]:
+    payload = await _read_json_object(request) if await request.body() else {}
+    language = payload.get("language")
+    mode = payload.get("mode")
+    if not isinstance(language, (str, type(None))) or not isinstance(
+        mode, (str, type(None))
+    ):
+        raise HTTPException(
+            status_code=422,
+            detail="language and mode must be strings.",
+        )
+    requested_engine, batch_language, transcription_mode = _resolve_machine_job_options(
+        language, mode
     )
+    uploads_dir = get_uploads_dir()
+    try:
+        upload = await run_in_threadpool(
+            finalize_partial_upload, uploads_dir, upload_id
+        )
+    except PartialUploadNotFound:
+        raise HTTPException(status_code=404)
+    except PartialUploadConflict as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    job = _new_job_record(
+        upload.job_id,
+        upload.display_name,
+        upload.path,
+        requested_engine=requested_engine,
+        language=batch_language,
+        transcription_mode=transcription_mode,
+        upload_sha256=upload.sha256,
+    )
+    try:
+        insert_job(get_db_path(), job)
+    except BaseException:
+        cleanup_upload_path(upload.path, uploads_dir, upload.job_id)
+        raise
     return {
-        "job_id": job_id,
-        "status": "queued",
-        "filename": display_name,
-        "client": machine_client,
-        "client_job_id": machine_client_job_id,
+        "job_id": job.id,
+        "status": job.status,
+        "filename": job.filename,
+        "size_bytes": upload.size_bytes,
+        "upload_sha256": upload.sha256,
+    }
+
+
+@router.delete("/api/uploads/{upload_id}")
+def delete_resumable_upload(upload_id: str) -> dict[str, bool]:
+    try:
+        deleted = delete_partial_upload(get_uploads_dir(), upload_id)
+    except PartialUploadNotFound:
+        deleted = False
+    if not deleted:
+        raise HTTPException(status_code=404)
+    return {"ok": True}
+
+
+async def _read_json_object(request: Request) -> dict[str, object]:
+    try:
+        payload = await request.json()
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=422, detail="Expected a JSON object.")
+    return payload
+
+
+def _serialize_partial_upload(upload: PartialUpload) -> dict[str, object]:
+    expires_at = datetime.fromisoformat(upload.updated_at) + timedelta(
+        seconds=PARTIAL_UPLOAD_TTL_SECONDS
+    )
+    return {
+        "upload_id": upload.id,
+        "filename": upload.filename,
+        "size": upload.size,
+        "chunk_size": upload.chunk_size,
+        "offset": upload.offset,
+        "missing_chunks": upload.missing_chunks,
+        "complete": upload.complete,
+        "expires_at": expires_at.isoformat(timespec="seconds"),
     }
 
 
 @router.get("/api/state")
-def api_state() -> dict[str, object]:
-    queue_jobs = list_active_jobs(get_db_path())
+def api_state(request: Request) -> Response:
+    return _cached_state_response(request, "state", _legacy_state)
+
+
+def _legacy_state(db_path: Path) -> dict[str, object]:
+    queue_jobs = list_active_job_summaries(db_path)
     history_jobs = list_recent_history_jobs(
-        get_db_path(),
+        db_path,
         limit=MACHINE_STATE_HISTORY_LIMIT,
     )
     running_job, queued_jobs = queue_groups(queue_jobs)
@@ -265,10 +814,7 @@ def api_state() -> dict[str, object]:
         "queue": [_serialize_active_job(job) for job in queue_jobs],
         "queue_running": _serialize_active_job(running_job) if running_job else None,
         "queue_pending": [_serialize_active_job(job) for job in queued_jobs],
-        "queue_counts": {
-            "running": 1 if running_job else 0,
-            "queued": len(queued_jobs),
-        },
+        "queue_counts": _queue_counts(db_path),
         "history": [serialize_job(job) for job in history_jobs],
         "results_by_job": _build_results_index(history_jobs),
         "worker": worker_state(queue_jobs),
@@ -276,10 +822,27 @@ def api_state() -> dict[str, object]:
 
 
 @router.get("/api/browser/state")
-def api_browser_state() -> dict[str, object]:
-    queue_jobs = list_active_jobs(get_db_path())
-    recent_history_jobs = list_recent_history_jobs(
-        get_db_path(),
+def api_browser_state(request: Request) -> Response:
+    return _cached_state_response(request, "browser", _browser_state)
+
+
+@router.get("/api/browser/events")
+async def api_browser_events(request: Request) -> StreamingResponse:
+    return StreamingResponse(
+        _browser_state_events(
+            get_db_path(),
+            get_change_bus(),
+            is_disconnected=request.is_disconnected,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+    )
+
+
+def _browser_state(db_path: Path) -> dict[str, object]:
+    queue_jobs = list_active_job_summaries(db_path)
+    recent_history_jobs = list_recent_history_summaries(
+        db_path,
         limit=BROWSER_STATE_RECENT_HISTORY_LIMIT,
     )
     running_job, queued_jobs = queue_groups(queue_jobs)
@@ -287,23 +850,54 @@ def api_browser_state() -> dict[str, object]:
         "queue": [serialize_job(job) for job in queue_jobs],
         "queue_running": serialize_job(running_job) if running_job else None,
         "queue_pending": [serialize_job(job) for job in queued_jobs],
-        "queue_counts": {
-            "running": 1 if running_job else 0,
-            "queued": len(queued_jobs),
-        },
-        "history_count": count_history_jobs(get_db_path()),
+        "queue_counts": _queue_counts(db_path),
+        "history_count": count_history_jobs(db_path),
         "recent_history": [serialize_job(job) for job in recent_history_jobs],
         "worker": worker_state(queue_jobs),
     }
 
 
+async def _browser_state_events(
+    db_path: Path,
+    bus: ChangeBus,
+    *,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    keepalive_seconds: float = BROWSER_EVENTS_KEEPALIVE_SECONDS,
+    min_interval_seconds: float = BROWSER_EVENTS_MIN_INTERVAL_SECONDS,
+) -> AsyncIterator[str]:
+    version = bus.version
+    payload = await run_in_threadpool(_browser_state, db_path)
+    yield _format_state_event(payload)
+    while not await is_disconnected():
+        next_version = await bus.wait_for_change(version, keepalive_seconds)
+        if next_version == version:
+            yield ": keepalive\n\n"
+            continue
+        # Coalesce bursts (a batch upload, a finishing job) into one push.
+        await asyncio.sleep(min_interval_seconds)
+        version = bus.version
+        next_payload = await run_in_threadpool(_browser_state, db_path)
+        if next_payload != payload:
+            payload = next_payload
+            yield _format_state_event(payload)
+
+
+def _format_state_event(payload: dict[str, object]) -> str:
+    data = json.dumps(payload, separators=(",", ":"))
+    return f"event: state\ndata: {data}\n\n"
+
+
 @router.get("/api/browser/history")
 def api_browser_history(
-    limit: int = Query(BROWSER_HISTORY_DEFAULT_LIMIT, ge=1, le=BROWSER_HISTORY_MAX_LIMIT),
+    limit: int = Query(
+        BROWSER_HISTORY_DEFAULT_LIMIT, ge=1, le=BROWSER_HISTORY_MAX_LIMIT
+    ),
     offset: int = Query(0, ge=0),
+    after: str | None = Query(None, max_length=512),
     query: str = Query("", max_length=256),
     status: str = Query("all"),
     sort: str = Query("newest"),
+    include_archived: bool = Query(False),
 ) -> dict[str, object]:
     normalized_status = status.strip().lower()
     if normalized_status not in {"all", "done", "failed", "cancelled"}:
@@ -311,24 +905,58 @@ def api_browser_history(
     normalized_sort = sort.strip().lower()
     if normalized_sort not in {"newest", "oldest", "name"}:
         raise HTTPException(status_code=422, detail="unsupported history sort")
-    history_jobs, total = list_history_page(
-        get_db_path(),
-        limit=limit,
-        offset=offset,
-        query=query,
-        status=None if normalized_status == "all" else normalized_status,
-        sort=normalized_sort,
-    )
-    next_offset = offset + len(history_jobs)
+    after = after or None
+    if after is not None and normalized_sort not in HISTORY_KEYSET_SORTS:
+        raise HTTPException(status_code=422, detail="history cursor requires date sort")
+    try:
+        history_jobs, total = list_history_page(
+            get_db_path(),
+            limit=limit + 1,
+            offset=offset,
+            query=query,
+            status=None if normalized_status == "all" else normalized_status,
+            sort=normalized_sort,
+            after=after,
+            include_archived=include_archived,
+        )
+    except ValueError:
+        raise HTTPException(status_code=422, detail="invalid history cursor")
+    has_more = len(history_jobs) > limit
+    history_jobs = history_jobs[:limit]
+    next_offset = None
+    if has_more and after is None:
+        next_offset = offset + len(history_jobs)
+    next_cursor = None
+    if has_more and normalized_sort in HISTORY_KEYSET_SORTS:
+        next_cursor = encode_history_cursor(history_jobs[-1])
+    db_paths = _history_db_paths(include_archived)
+    results_index = _build_results_index(history_jobs, db_paths)
+    items = [_serialize_history_job(job, results_index[job.id]) for job in history_jobs]
+    if query.strip():
+        snippets: dict[str, str] = {}
+        for db_path in db_paths:
+            snippets.update(
+                find_transcript_snippets(
+                    db_path,
+                    [job.id for job in history_jobs if job.id not in snippets],
+                    query.strip(),
+                )
+            )
+        for item in items:
+            snippet = snippets.get(str(item["id"]))
+            if snippet:
+                item["transcript_snippet_html"] = format_snippet_html(snippet)
     return {
-        "items": [_serialize_history_job(job) for job in history_jobs],
+        "items": items,
         "page": {
             "limit": limit,
-            "offset": offset,
+            "offset": offset if after is None else None,
+            "after": after,
             "returned": len(history_jobs),
             "total": total,
-            "has_more": next_offset < total,
-            "next_offset": next_offset if next_offset < total else None,
+            "has_more": has_more,
+            "next_offset": next_offset,
+            "next_cursor": next_cursor,
         },
         "query": query.strip(),
         "status": normalized_status,
@@ -336,25 +964,139 @@ def api_browser_history(
     }
 
 
+@router.get("/api/analytics/jobs")
+def api_job_analytics(
+    days: int = Query(JOB_ANALYTICS_DEFAULT_DAYS, ge=1, le=JOB_ANALYTICS_MAX_DAYS),
+) -> dict[str, object]:
+    return build_job_analytics(get_db_path(), days=days)
+
+
 @router.get("/api/machine/state")
-def api_machine_state() -> dict[str, object]:
-    jobs = list_active_jobs(get_db_path())
+def api_machine_state(request: Request) -> Response:
+    return _cached_state_response(request, "machine", _machine_state)
+
+
+def _machine_state(db_path: Path) -> dict[str, object]:
+    jobs = list_active_jobs(db_path)
     queue_jobs, _ = split_jobs(jobs)
     running_job, queued_jobs = queue_groups(queue_jobs)
     return {
         "queue": [serialize_job(job) for job in queue_jobs],
         "queue_running": serialize_job(running_job) if running_job else None,
         "queue_pending": [serialize_job(job) for job in queued_jobs],
-        "queue_counts": {
-            "running": 1 if running_job else 0,
-            "queued": len(queued_jobs),
-        },
+        "queue_counts": _queue_counts(db_path),
         "worker": worker_state(jobs),
     }
 
 
+def _cached_state_response(
+    request: Request,
+    kind: str,
+    build: Callable[[Path], dict[str, object]],
+) -> Response:
+    bus = get_change_bus()
+    db_path = get_db_path()
+    key = (kind, str(db_path))
+    # Read the sequence before building so a concurrent change can only make
+    # the cached body newer than its tag, never older.
+    version = bus.version
+    with _state_cache_lock:
+        cached = _state_cache.get(key)
+    if cached is None or cached.version != version:
+        cached = _CachedState(
+            version=version,
+            etag=f'"{bus.epoch}-{version}"',
+            body=JSONResponse(build(db_path)).body,
+        )
+        with _state_cache_lock:
+            _state_cache[key] = cached
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {
+        value.strip().removeprefix("W/") for value in if_none_match.split(",")
+    }
+    return "*" in candidates or etag in candidates
+
+
 @router.get("/api/machine/jobs/{client}/{client_job_id}")
 def api_machine_job(client: str, client_job_id: str) -> dict[str, object]:
+    job = _find_machine_job(client, client_job_id)
+    payload = serialize_job(job)
+    payload["results"] = _build_results_index([job])[job.id]
+    return payload
+
+
+@router.head("/api/machine/jobs/{client}/{client_job_id}")
+def api_machine_job_exists(client: str, client_job_id: str) -> Response:
+    job = _find_machine_job(client, client_job_id)
+    return Response(headers={"X-Job-Id": job.id, "X-Job-Status": job.status})
+
+
+@router.post("/api/machine/jobs/status")
+async def api_machine_jobs_status(request: Request) -> dict[str, object]:
+    payload = await _read_json_object(request)
+    client = payload.get("client")
+    client_job_ids = payload.get("client_job_ids")
+    if not isinstance(client, str):
+        raise HTTPException(status_code=422, detail="client must be a string.")
+    if not isinstance(client_job_ids, list) or not all(
+        isinstance(value, str) for value in client_job_ids
+    ):
+        raise HTTPException(
+            status_code=422,
+            detail="client_job_ids must be a list of strings.",
+        )
+    if len(client_job_ids) > MACHINE_STATUS_MAX_IDS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"At most {MACHINE_STATUS_MAX_IDS} client_job_ids per request.",
+        )
+    machine_client = _normalize_machine_metadata(client, field_name="client")
+    machine_client_job_ids = list(
+        dict.fromkeys(
+            _normalize_machine_metadata(value, field_name="client_job_id")
+            for value in client_job_ids
+        )
+    )
+    jobs = await run_in_threadpool(
+        find_jobs_by_client_job_ids,
+        get_db_path(),
+        client=machine_client,
+        client_job_ids=machine_client_job_ids,
+    )
+    return {
+        "jobs": {
+            client_job_id: _serialize_machine_job_status(job)
+            for client_job_id, job in jobs.items()
+        },
+        "missing": [value for value in machine_client_job_ids if value not in jobs],
+    }
+
+
+def _serialize_machine_job_status(job: JobRecord) -> dict[str, object]:
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at,
+        "error_message": job.error_message,
+        "transcript_pass": job.transcript_pass,
+    }
+
+
+def _find_machine_job(client: str, client_job_id: str) -> JobRecord:
     machine_client = _normalize_machine_metadata(client, field_name="client")
     machine_client_job_id = _normalize_machine_metadata(
         client_job_id,
@@ -367,9 +1109,7 @@ def api_machine_job(client: str, client_job_id: str) -> dict[str, object]:
     )
     if job is None:
         raise HTTPException(status_code=404)
-    payload = serialize_job(job)
-    payload["results"] = list_result_files(get_results_dir(), job.id)
-    return payload
+    return job
 
 
 @router.get("/results/{job_id}/{filename}")
@@ -393,16 +1133,27 @@ def job_preview(
         raise HTTPException(status_code=404)
 
     results_dir = get_results_dir()
-    results = list_result_files(results_dir, job_id)
+    manifest = list_job_results(get_db_path(), [job_id]).get(job_id)
+    if manifest is None:
+        results = list_result_files(results_dir, job_id)
+    else:
+        results = [result.name for result in manifest]
     filename = pick_preview_result(results)
     if not filename:
         return {"job_id": job_id, "filename": None, "snippet": "", "truncated": False}
 
-    file_path = safe_result_file_path(results_dir, job_id, filename)
-    if file_path is None:
-        raise HTTPException(status_code=404)
-
-    snippet, truncated = _read_preview(file_path, chars)
+    recorded = next(
+        (result for result in manifest or [] if result.name == filename),
+        None,
+    )
+    if recorded is not None and recorded.preview is not None:
+        snippet = recorded.preview[:chars]
+        truncated = recorded.preview_truncated or len(recorded.preview) > chars
+    else:
+        file_path = safe_result_file_path(results_dir, job_id, filename)
+        if file_path is None:
+            raise HTTPException(status_code=404)
+        snippet, truncated = read_result_preview(file_path, chars)
     return {
         "job_id": job_id,
         "filename": filename,
@@ -411,13 +1162,6 @@ def job_preview(
     }
 
 
-def _read_preview(file_path: Path, limit: int) -> tuple[str, bool]:
-    with file_path.open("r", encoding="utf-8", errors="replace") as handle:
-        data = handle.read(limit + 1)
-    truncated = len(data) > limit
-    return data[:limit], truncated
-
-
 @router.delete("/api/jobs/{job_id}")
 def delete_job_from_queue(job_id: str) -> dict[str, bool]:
     if not is_safe_path_component(job_id):
@@ -436,10 +1180,53 @@ def delete_job_from_queue(job_id: str) -> dict[str, bool]:
             status_code=409,
             detail="Job is no longer queued.",
         )
-    cleanup_upload_path(job.upload_path, get_uploads_dir(), job.id)
+    cleanup_upload_path(
+        job.upload_path, get_uploads_dir(), job.id, origin=job.upload_origin
+    )
     return {"ok": True}
 
 
+@router.post("/api/jobs/{job_id}/move")
+async def move_job_in_queue(request: Request, job_id: str) -> dict[str, object]:
+    if not is_safe_path_component(job_id):
+        raise HTTPException(status_code=404)
+    if request.headers.get("content-type", "").startswith("application/json"):
+        payload: Mapping[str, object] = await _read_json_object(request)
+    else:
+        payload = await request.form()
+    before = payload.get("before")
+    after = payload.get("after")
+    if not isinstance(before, (str, type(None))) or not isinstance(
+        after, (str, type(None))
+    ):
+        raise HTTPException(
+            status_code=422,
+            detail="before and after must be strings.",
+        )
+    before = (before or "").strip() or None
+    after = (after or "").strip() or None
+    if before is not None and after is not None:
+        raise HTTPException(
+            status_code=422,
+            detail="Pass either before or after, not both.",
+        )
+    if job_id in {before, after}:
+        raise HTTPException(
+            status_code=422,
+            detail="A job cannot be moved relative to itself.",
+        )
+    db_path = get_db_path()
+    position = move_queued_job(db_path, job_id, before=before, after=after)
+    if position is None:
+        if get_job(db_path, job_id) is None:
+            raise HTTPException(status_code=404)
+        raise HTTPException(
+            status_code=409,
+            detail="Only queued jobs can be moved.",
+        )
+    return {"ok": True, "queue_position": position}
+
+
 @router.post("/api/jobs/{job_id}/cancel")
 def cancel_job(job_id: str) -> dict[str, object]:
     if not is_safe_path_component(job_id):
@@ -485,6 +1272,9 @@ def delete_history_item(job_id: str) -> dict[str, object]:
         raise HTTPException(status_code=404)
     db_path = get_db_path()
     job = get_job(db_path, job_id)
+    if job is None and archive_db_path(db_path).exists():
+        db_path = archive_db_path(db_path)
+        job = get_job(db_path, job_id)
     if job is None:
         raise HTTPException(status_code=404)
     if job.status not in {"done", "failed", "cancelled"}:
@@ -498,7 +1288,10 @@ def delete_history_item(job_id: str) -> dict[str, object]:
             status_code=500,
             detail="Failed to remove stored outputs.",
         )
-    cleanup_upload_path(job.upload_path, get_uploads_dir(), job.id)
+    if not _stop_running_refinements(db_path, [job.id]):
+        cleanup_upload_path(
+            job.upload_path, get_uploads_dir(), job.id, origin=job.upload_origin
+        )
     deleted = delete_history_job(db_path, job_id)
     if not deleted:
         return {
@@ -508,11 +1301,21 @@ def delete_history_item(job_id: str) -> dict[str, object]:
     return {"ok": True}
 
 
+def _stop_running_refinements(db_path: Path, job_ids: list[str]) -> set[str]:
+    # A running refinement still reads the shared upload; the worker removes it
+    # once the cancelled refinement is discarded.
+    refinements = list_running_refinements(db_path, job_ids)
+    for refinement in refinements:
+        request_worker_cancel(refinement.id)
+    return {refinement.refines_job_id for refinement in refinements}
+
+
 @router.post("/api/history/clear")
 def clear_history() -> dict[str, object]:
     db_path = get_db_path()
     results_dir = get_results_dir()
     jobs = list_history_jobs(db_path)
+    refined_ids = _stop_running_refinements(db_path, [job.id for job in jobs])
     deletable_ids: list[str] = []
     deleted_results = 0
     failed_results = 0
@@ -523,7 +1326,10 @@ def clear_history() -> dict[str, object]:
         elif result_state == "failed":
             failed_results += 1
             continue
-        cleanup_upload_path(job.upload_path, get_uploads_dir(), job.id)
+        if job.id not in refined_ids:
+            cleanup_upload_path(
+                job.upload_path, get_uploads_dir(), job.id, origin=job.upload_origin
+            )
         deletable_ids.append(job.id)
     deleted_jobs = delete_history_jobs(db_path, deletable_ids)
     response: dict[str, object] = {
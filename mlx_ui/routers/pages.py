@@ -14,7 +14,7 @@ from mlx_ui.app_context import (
     get_results_dir,
     get_uploads_dir,
 )
-from mlx_ui.db import count_history_jobs, list_active_jobs
+from mlx_ui.db import count_history_jobs, list_active_job_summaries
 from mlx_ui.job_ui import build_job_ui, worker_state
 from mlx_ui.settings import (
     CONFIGURABLE_ENGINE_CHOICES,
@@ -47,7 +47,7 @@ def favicon() -> FileResponse:
 
 @router.get("/", response_class=HTMLResponse)
 def read_root(request: Request):
-    queue_jobs = list_active_jobs(get_db_path())
+    queue_jobs = list_active_job_summaries(get_db_path())
     history_count = count_history_jobs(get_db_path())
     queued_count = sum(1 for job in queue_jobs if job.status == "queued")
     upload_is_busy = any(job.status in {"queued", "running"} for job in queue_jobs)
@@ -157,6 +157,12 @@ async def update_settings(request: Request) -> RedirectResponse:
         if 1 <= retention_value <= 365:
             updates["results_retention_days"] = retention_value
 
+    history_archive_days = str(form.get("history_archive_days", "")).strip()
+    if history_archive_days.isdigit():
+        archive_value = int(history_archive_days)
+        if 0 <= archive_value <= 3650:
+            updates["history_archive_days"] = archive_value
+
     if "cohere_model" in form:
         updates["cohere_model"] = str(form.get("cohere_model", "")).strip()
 
@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException, Request
 
-from mlx_ui.app_context import get_base_dir, get_results_dir, get_uploads_dir
+from mlx_ui.app_context import (
+    get_base_dir,
+    get_db_path,
+    get_results_dir,
+    get_uploads_dir,
+)
+from mlx_ui.db import clear_job_results
 from mlx_ui.settings import (
     build_cohere_snapshot,
     build_settings_snapshot,
@@ -48,4 +54,5 @@ def api_clear_uploads() -> dict[str, str]:
 @router.post("/api/settings/clear-results")
 def api_clear_results() -> dict[str, str]:
     clear_directory(get_results_dir())
+    clear_job_results(get_db_path())
     return {"status": "ok"}
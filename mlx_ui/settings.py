@@ -43,6 +43,21 @@ resolve_requested_engine_with_settings = (
 resolve_default_language_with_settings = (
     _engine_resolution.resolve_default_language_with_settings
 )
+resolve_transcription_mode_with_settings = (
+    _engine_resolution.resolve_transcription_mode_with_settings
+)
+resolve_clip_batching_with_settings = (
+    _engine_resolution.resolve_clip_batching_with_settings
+)
+resolve_remote_io_limits_with_settings = (
+    _engine_resolution.resolve_remote_io_limits_with_settings
+)
+resolve_memory_budget_with_settings = (
+    _engine_resolution.resolve_memory_budget_with_settings
+)
+resolve_live_batch_policy_with_settings = (
+    _engine_resolution.resolve_live_batch_policy_with_settings
+)
 resolve_job_transcriber_spec_with_settings = (
     _engine_resolution.resolve_job_transcriber_spec_with_settings
 )
@@ -29,9 +29,22 @@ DEFAULT_PARAKEET_CHUNK_DURATION = 30
 DEFAULT_PARAKEET_OVERLAP_DURATION = 5
 DEFAULT_PARAKEET_DECODING_MODE = "greedy"
 DEFAULT_PARAKEET_BATCH_SIZE = 1
+DEFAULT_DRAFT_WHISPER_MODEL = "base"
 DEFAULT_RESULTS_RETENTION_DAYS = 3
 MIN_RESULTS_RETENTION_DAYS = 1
 MAX_RESULTS_RETENTION_DAYS = 365
+DEFAULT_HISTORY_ARCHIVE_DAYS = 0
+MAX_HISTORY_ARCHIVE_DAYS = 3650
+DEFAULT_REMOTE_IO_CONCURRENCY = 2
+MAX_REMOTE_IO_CONCURRENCY = 16
+DEFAULT_REMOTE_IO_REQUESTS_PER_MINUTE = 60
+MAX_REMOTE_IO_REQUESTS_PER_MINUTE = 600
+MAX_MEMORY_BUDGET_MB = 1024 * 1024
+LIVE_BATCH_POLICY_CHOICES = ("pause", "throttle", "off")
+DEFAULT_LIVE_BATCH_POLICY = "pause"
+DEFAULT_LIVE_BATCH_DUTY_CYCLE = 0.25
+MIN_LIVE_BATCH_DUTY_CYCLE = 0.05
+MAX_LIVE_BATCH_DUTY_CYCLE = 0.95
 
 
 def supported_parakeet_decoding_modes() -> tuple[str, ...]:
@@ -45,12 +58,21 @@ DEFAULT_SETTINGS: dict[str, object] = {
     "update_check_enabled": True,
     "log_level": "INFO",
     "wtm_quick": False,
+    "two_pass_enabled": False,
+    "draft_whisper_model": DEFAULT_DRAFT_WHISPER_MODEL,
+    "clip_batching_enabled": False,
+    "remote_io_concurrency": DEFAULT_REMOTE_IO_CONCURRENCY,
+    "remote_io_requests_per_minute": DEFAULT_REMOTE_IO_REQUESTS_PER_MINUTE,
+    "memory_budget_mb": 0,
+    "live_batch_policy": DEFAULT_LIVE_BATCH_POLICY,
+    "live_batch_duty_cycle": DEFAULT_LIVE_BATCH_DUTY_CYCLE,
     "output_formats": ["txt"],
     "default_language": DEFAULT_JOB_LANGUAGE,
     "hot_folder_enabled": False,
     "hot_folder_input_dir": "",
     "hot_folder_output_dir": "",
     "results_retention_days": DEFAULT_RESULTS_RETENTION_DAYS,
+    "history_archive_days": DEFAULT_HISTORY_ARCHIVE_DAYS,
     "cohere_model": DEFAULT_COHERE_MODEL,
     "whisper_model": DEFAULT_WHISPER_MODEL,
     "parakeet_model": DEFAULT_PARAKEET_MODEL,
@@ -134,6 +156,46 @@ def normalize_results_retention_days(value: object) -> int | None:
     return normalized
 
 
+def normalize_history_archive_days(value: object) -> int | None:
+    if isinstance(value, bool) or not isinstance(value, int):
+        return None
+    if value < 0 or value > MAX_HISTORY_ARCHIVE_DAYS:
+        return None
+    return value
+
+
+def normalize_bounded_int(value: object, maximum: int) -> int | None:
+    normalized = normalize_positive_int(value)
+    if normalized is None or normalized > maximum:
+        return None
+    return normalized
+
+
+def normalize_memory_budget_mb(value: object) -> int | None:
+    if isinstance(value, bool) or not isinstance(value, int):
+        return None
+    if value < 0 or value > MAX_MEMORY_BUDGET_MB:
+        return None
+    return value
+
+
+def normalize_live_batch_policy(value: object) -> str | None:
+    if not isinstance(value, str):
+        return None
+    candidate = value.strip().lower()
+    if candidate in LIVE_BATCH_POLICY_CHOICES:
+        return candidate
+    return None
+
+
+def normalize_live_batch_duty_cycle(value: object) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    if not MIN_LIVE_BATCH_DUTY_CYCLE <= value <= MAX_LIVE_BATCH_DUTY_CYCLE:
+        return None
+    return float(value)
+
+
 def parse_bool(value: str | None) -> bool | None:
     if value is None:
         return None
@@ -187,6 +249,82 @@ def validate_settings_payload(payload: object) -> tuple[dict[str, object], list[
         else:
             errors.append("wtm_quick must be a boolean")
 
+    if "two_pass_enabled" in payload:
+        value = payload["two_pass_enabled"]
+        if isinstance(value, bool):
+            updates["two_pass_enabled"] = value
+        else:
+            errors.append("two_pass_enabled must be a boolean")
+
+    if "draft_whisper_model" in payload:
+        value = payload["draft_whisper_model"]
+        if isinstance(value, str) and value.strip():
+            updates["draft_whisper_model"] = value.strip()
+        else:
+            errors.append("draft_whisper_model must be a non-empty string")
+
+    if "clip_batching_enabled" in payload:
+        value = payload["clip_batching_enabled"]
+        if isinstance(value, bool):
+            updates["clip_batching_enabled"] = value
+        else:
+            errors.append("clip_batching_enabled must be a boolean")
+
+    if "remote_io_concurrency" in payload:
+        value = normalize_bounded_int(
+            payload["remote_io_concurrency"], MAX_REMOTE_IO_CONCURRENCY
+        )
+        if value is None:
+            errors.append(
+                "remote_io_concurrency must be an integer between 1 and "
+                f"{MAX_REMOTE_IO_CONCURRENCY}"
+            )
+        else:
+            updates["remote_io_concurrency"] = value
+
+    if "remote_io_requests_per_minute" in payload:
+        value = normalize_bounded_int(
+            payload["remote_io_requests_per_minute"],
+            MAX_REMOTE_IO_REQUESTS_PER_MINUTE,
+        )
+        if value is None:
+            errors.append(
+                "remote_io_requests_per_minute must be an integer between 1 and "
+                f"{MAX_REMOTE_IO_REQUESTS_PER_MINUTE}"
+            )
+        else:
+            updates["remote_io_requests_per_minute"] = value
+
+    if "memory_budget_mb" in payload:
+        value = normalize_memory_budget_mb(payload["memory_budget_mb"])
+        if value is None:
+            errors.append(
+                "memory_budget_mb must be an integer between 0 and "
+                f"{MAX_MEMORY_BUDGET_MB} (0 uses available memory)"
+            )
+        else:
+            updates["memory_budget_mb"] = value
+
+    if "live_batch_policy" in payload:
+        value = normalize_live_batch_policy(payload["live_batch_policy"])
+        if value is None:
+            errors.append(
+                "live_batch_policy must be one of: "
+                f"{', '.join(LIVE_BATCH_POLICY_CHOICES)}"
+            )
+        else:
+            updates["live_batch_policy"] = value
+
+    if "live_batch_duty_cycle" in payload:
+        value = normalize_live_batch_duty_cycle(payload["live_batch_duty_cycle"])
+        if value is None:
+            errors.append(
+                "live_batch_duty_cycle must be a number between "
+                f"{MIN_LIVE_BATCH_DUTY_CYCLE} and {MAX_LIVE_BATCH_DUTY_CYCLE}"
+            )
+        else:
+            updates["live_batch_duty_cycle"] = value
+
     if "output_formats" in payload:
         normalized_formats = normalize_output_formats(payload["output_formats"])
         if normalized_formats is None:
@@ -232,6 +370,16 @@ def validate_settings_payload(payload: object) -> tuple[dict[str, object], list[
         else:
             updates["results_retention_days"] = value
 
+    if "history_archive_days" in payload:
+        value = normalize_history_archive_days(payload["history_archive_days"])
+        if value is None:
+            errors.append(
+                "history_archive_days must be an integer between "
+                f"0 and {MAX_HISTORY_ARCHIVE_DAYS}"
+            )
+        else:
+            updates["history_archive_days"] = value
+
     if "cohere_model" in payload:
         value = payload["cohere_model"]
         if isinstance(value, str):
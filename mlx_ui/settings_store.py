@@ -11,8 +11,15 @@ from mlx_ui.languages import parse_language
 from mlx_ui.settings_schema import (
     ENGINE_CHOICES,
     DEFAULT_SETTINGS,
+    MAX_REMOTE_IO_CONCURRENCY,
+    MAX_REMOTE_IO_REQUESTS_PER_MINUTE,
+    normalize_bounded_int,
+    normalize_live_batch_duty_cycle,
+    normalize_live_batch_policy,
+    normalize_memory_budget_mb,
     parse_bool,
     normalize_duration,
+    normalize_history_archive_days,
     normalize_log_level,
     normalize_non_negative_duration,
     normalize_output_formats,
@@ -74,6 +81,39 @@ def read_settings_file(path: Path) -> dict[str, object]:
     wtm_quick = payload.get("wtm_quick")
     if isinstance(wtm_quick, bool):
         parsed["wtm_quick"] = wtm_quick
+    two_pass_enabled = payload.get("two_pass_enabled")
+    if isinstance(two_pass_enabled, bool):
+        parsed["two_pass_enabled"] = two_pass_enabled
+    draft_whisper_model = payload.get("draft_whisper_model")
+    if isinstance(draft_whisper_model, str):
+        cleaned = draft_whisper_model.strip()
+        if cleaned:
+            parsed["draft_whisper_model"] = cleaned
+    clip_batching_enabled = payload.get("clip_batching_enabled")
+    if isinstance(clip_batching_enabled, bool):
+        parsed["clip_batching_enabled"] = clip_batching_enabled
+    remote_io_concurrency = normalize_bounded_int(
+        payload.get("remote_io_concurrency"), MAX_REMOTE_IO_CONCURRENCY
+    )
+    if remote_io_concurrency is not None:
+        parsed["remote_io_concurrency"] = remote_io_concurrency
+    remote_io_requests_per_minute = normalize_bounded_int(
+        payload.get("remote_io_requests_per_minute"),
+        MAX_REMOTE_IO_REQUESTS_PER_MINUTE,
+    )
+    if remote_io_requests_per_minute is not None:
+        parsed["remote_io_requests_per_minute"] = remote_io_requests_per_minute
+    memory_budget_mb = normalize_memory_budget_mb(payload.get("memory_budget_mb"))
+    if memory_budget_mb is not None:
+        parsed["memory_budget_mb"] = memory_budget_mb
+    live_batch_policy = normalize_live_batch_policy(payload.get("live_batch_policy"))
+    if live_batch_policy is not None:
+        parsed["live_batch_policy"] = live_batch_policy
+    live_batch_duty_cycle = normalize_live_batch_duty_cycle(
+        payload.get("live_batch_duty_cycle")
+    )
+    if live_batch_duty_cycle is not None:
+        parsed["live_batch_duty_cycle"] = live_batch_duty_cycle
     output_formats = payload.get("output_formats")
     if output_formats is not None:
         normalized_formats = normalize_output_formats(output_formats)
@@ -96,6 +136,11 @@ def read_settings_file(path: Path) -> dict[str, object]:
     )
     if results_retention_days is not None:
         parsed["results_retention_days"] = results_retention_days
+    history_archive_days = normalize_history_archive_days(
+        payload.get("history_archive_days")
+    )
+    if history_archive_days is not None:
+        parsed["history_archive_days"] = history_archive_days
     cohere_model = payload.get("cohere_model")
     if isinstance(cohere_model, str):
         parsed["cohere_model"] = cohere_model.strip()
@@ -225,6 +270,68 @@ def compute_effective_settings(
         effective["wtm_quick"] = DEFAULT_SETTINGS["wtm_quick"]
         sources["wtm_quick"] = "default"
 
+    if "two_pass_enabled" in file_settings:
+        effective["two_pass_enabled"] = bool(file_settings["two_pass_enabled"])
+        sources["two_pass_enabled"] = "file"
+    else:
+        effective["two_pass_enabled"] = DEFAULT_SETTINGS["two_pass_enabled"]
+        sources["two_pass_enabled"] = "default"
+
+    if "draft_whisper_model" in file_settings:
+        effective["draft_whisper_model"] = str(file_settings["draft_whisper_model"])
+        sources["draft_whisper_model"] = "file"
+    else:
+        effective["draft_whisper_model"] = DEFAULT_SETTINGS["draft_whisper_model"]
+        sources["draft_whisper_model"] = "default"
+
+    if "clip_batching_enabled" in file_settings:
+        effective["clip_batching_enabled"] = bool(
+            file_settings["clip_batching_enabled"]
+        )
+        sources["clip_batching_enabled"] = "file"
+    else:
+        effective["clip_batching_enabled"] = DEFAULT_SETTINGS["clip_batching_enabled"]
+        sources["clip_batching_enabled"] = "default"
+
+    if "remote_io_concurrency" in file_settings:
+        effective["remote_io_concurrency"] = file_settings["remote_io_concurrency"]
+        sources["remote_io_concurrency"] = "file"
+    else:
+        effective["remote_io_concurrency"] = DEFAULT_SETTINGS["remote_io_concurrency"]
+        sources["remote_io_concurrency"] = "default"
+
+    if "remote_io_requests_per_minute" in file_settings:
+        effective["remote_io_requests_per_minute"] = file_settings[
+            "remote_io_requests_per_minute"
+        ]
+        sources["remote_io_requests_per_minute"] = "file"
+    else:
+        effective["remote_io_requests_per_minute"] = DEFAULT_SETTINGS[
+            "remote_io_requests_per_minute"
+        ]
+        sources["remote_io_requests_per_minute"] = "default"
+
+    if "memory_budget_mb" in file_settings:
+        effective["memory_budget_mb"] = file_settings["memory_budget_mb"]
+        sources["memory_budget_mb"] = "file"
+    else:
+        effective["memory_budget_mb"] = DEFAULT_SETTINGS["memory_budget_mb"]
+        sources["memory_budget_mb"] = "default"
+
+    if "live_batch_policy" in file_settings:
+        effective["live_batch_policy"] = file_settings["live_batch_policy"]
+        sources["live_batch_policy"] = "file"
+    else:
+        effective["live_batch_policy"] = DEFAULT_SETTINGS["live_batch_policy"]
+        sources["live_batch_policy"] = "default"
+
+    if "live_batch_duty_cycle" in file_settings:
+        effective["live_batch_duty_cycle"] = file_settings["live_batch_duty_cycle"]
+        sources["live_batch_duty_cycle"] = "file"
+    else:
+        effective["live_batch_duty_cycle"] = DEFAULT_SETTINGS["live_batch_duty_cycle"]
+        sources["live_batch_duty_cycle"] = "default"
+
     if "output_formats" in file_settings:
         effective["output_formats"] = list(file_settings["output_formats"])
         sources["output_formats"] = "file"
@@ -297,6 +404,13 @@ def compute_effective_settings(
         effective["results_retention_days"] = DEFAULT_SETTINGS["results_retention_days"]
         sources["results_retention_days"] = "default"
 
+    if "history_archive_days" in file_settings:
+        effective["history_archive_days"] = file_settings["history_archive_days"]
+        sources["history_archive_days"] = "file"
+    else:
+        effective["history_archive_days"] = DEFAULT_SETTINGS["history_archive_days"]
+        sources["history_archive_days"] = "default"
+
     cohere_model_env = env.get(COHERE_MODEL_ENV)
     if cohere_model_env is not None and cohere_model_env.strip() != "":
         effective["cohere_model"] = cohere_model_env.strip()
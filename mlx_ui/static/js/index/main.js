@@ -91,8 +91,7 @@
   }, 1000);
 
   if (app.state) {
-    setInterval(app.state.refreshState, 2500);
-    app.state.refreshState();
+    app.state.subscribeState();
   }
 })();
 
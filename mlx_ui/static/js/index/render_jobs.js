@@ -213,6 +213,18 @@
         </span>
       `);
     }
+    const transcriptPass =
+      ui.transcript_pass && typeof ui.transcript_pass === "object" ? ui.transcript_pass : null;
+    if (transcriptPass && transcriptPass.label) {
+      chips.push(`
+        <span
+          class="meta-chip is-pass is-${escapeHtml(transcriptPass.id || "draft")}"
+          title="${escapeHtml(transcriptPass.title || transcriptPass.label)}"
+        >
+          ${escapeHtml(transcriptPass.label)}
+        </span>
+      `);
+    }
     return chips.join("");
   }
 
@@ -580,6 +592,10 @@
         </div>
       `
       : "";
+    // The API escapes snippet text and only adds <mark> around matched terms.
+    const transcriptSnippet = job.transcript_snippet_html
+      ? `<div class="history-snippet">${job.transcript_snippet_html}</div>`
+      : "";
     const previewMeta = escapeHtml(buildPreviewMetaText(job));
     const defaultHref =
       status === "done" && defaultResult
@@ -618,6 +634,7 @@
             ${timeMeta}
             ${errorSummary}
           </div>
+          ${transcriptSnippet}
         </div>
         <div class="history-actions">
           <div class="history-actions-main">
@@ -430,6 +430,12 @@
         ) {
           updates.results_retention_days = Number.parseInt(current.results_retention_days, 10);
         }
+        if (
+          "history_archive_days" in current &&
+          current.history_archive_days !== baselineState.history_archive_days
+        ) {
+          updates.history_archive_days = Number.parseInt(current.history_archive_days, 10);
+        }
         if ("cohere_model" in current && current.cohere_model !== baselineState.cohere_model) {
           updates.cohere_model = current.cohere_model;
         }
@@ -18,6 +18,7 @@
   } = app.dom || {};
 
   const HISTORY_PAGE_SIZE = 50;
+  const STATE_POLL_INTERVAL_MS = 2500;
   let historyItems = [];
   let historyPage = null;
   let historyLoaded = false;
@@ -221,11 +222,16 @@
     const filters = currentHistoryFilters();
     const params = new URLSearchParams({
       limit: String(HISTORY_PAGE_SIZE),
-      offset: String(reset ? 0 : historyItems.length),
       query: filters.query,
       status: filters.status,
       sort: filters.sort,
     });
+    const cursor = !reset && historyPage ? historyPage.next_cursor : null;
+    if (cursor) {
+      params.set("after", cursor);
+    } else {
+      params.set("offset", String(reset ? 0 : historyItems.length));
+    }
     try {
       const response = await fetch(`/api/browser/history?${params}`, { cache: "no-store" });
       if (!response.ok) {
@@ -262,32 +268,66 @@
       if (!response.ok) {
         return;
       }
-      const payload = await response.json();
-      const queue = payload.queue || [];
-      const workerState = payload.worker && payload.worker.status ? payload.worker.status : "Idle";
-      renderQueue(queueList, queuePlaceholder, queue, payload.worker || null);
-      if (app.toasts) {
-        app.toasts.handleNotifications(payload.recent_history || [], {});
+      applyState(await response.json());
+    } catch (error) {
+      console.warn("Failed to refresh state", error);
+    }
+  }
+
+  function applyState(payload) {
+    const queue = payload.queue || [];
+    const workerState = payload.worker && payload.worker.status ? payload.worker.status : "Idle";
+    renderQueue(queueList, queuePlaceholder, queue, payload.worker || null);
+    if (app.toasts) {
+      app.toasts.handleNotifications(payload.recent_history || [], {});
+    }
+    updateSettingsStorageState(queue, { count: payload.history_count || 0 });
+    updateHistoryClearState(payload.history_count || 0);
+    if (historyLoaded && historyPage) {
+      const previousTotal = Number(historyPage.total || 0);
+      const nextTotal = Number(payload.history_count || 0);
+      if (previousTotal !== nextTotal) {
+        loadHistory({ reset: true });
       }
-      updateSettingsStorageState(queue, { count: payload.history_count || 0 });
-      updateHistoryClearState(payload.history_count || 0);
-      if (historyLoaded && historyPage) {
-        const previousTotal = Number(historyPage.total || 0);
-        const nextTotal = Number(payload.history_count || 0);
-        if (previousTotal !== nextTotal) {
-          loadHistory({ reset: true });
-        }
+    }
+    updateQueueCount(queue.filter((job) => job.status === "queued").length);
+    updateUploadDensity(queue, payload.worker || null);
+    if (payload.worker && workerStatus && app.workerCard) {
+      app.workerCard.setState(payload.worker);
+    } else if (workerStatus) {
+      workerStatus.textContent = workerState || "Idle";
+    }
+  }
+
+  function subscribeState() {
+    let pollTimer = null;
+    const startPolling = () => {
+      if (pollTimer === null) {
+        pollTimer = window.setInterval(refreshState, STATE_POLL_INTERVAL_MS);
       }
-      updateQueueCount(queue.filter((job) => job.status === "queued").length);
-      updateUploadDensity(queue, payload.worker || null);
-      if (payload.worker && workerStatus && app.workerCard) {
-        app.workerCard.setState(payload.worker);
-      } else if (workerStatus) {
-        workerStatus.textContent = workerState || "Idle";
+    };
+    const stopPolling = () => {
+      if (pollTimer !== null) {
+        window.clearInterval(pollTimer);
+        pollTimer = null;
       }
-    } catch (error) {
-      console.warn("Failed to refresh state", error);
+    };
+    refreshState();
+    if (typeof window.EventSource !== "function") {
+      startPolling();
+      return;
     }
+    const source = new window.EventSource("/api/browser/events");
+    source.addEventListener("state", (event) => {
+      stopPolling();
+      try {
+        applyState(JSON.parse(event.data));
+      } catch (error) {
+        console.warn("Failed to apply pushed state", error);
+      }
+    });
+    // EventSource reconnects on its own; poll until the stream is back.
+    source.addEventListener("error", startPolling);
   }
 
   function historyCount(history) {
@@ -305,6 +345,7 @@
     app.state = {
       __initialized: true,
       refreshState,
+      subscribeState,
       loadHistory,
       renderQueue,
       renderHistory,
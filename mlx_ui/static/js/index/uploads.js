@@ -54,6 +54,11 @@
     "3gp",
   ]);
   const SKIP_PATH_PARTS = new Set(["__MACOSX"]);
+  // Files at least this large go through the resumable chunked upload API.
+  const RESUMABLE_THRESHOLD_BYTES = 32 * 1024 * 1024;
+  const RESUMABLE_PARALLEL_CHUNKS = 4;
+  const RESUMABLE_MAX_ATTEMPTS = 6;
+  const RESUMABLE_STORAGE_KEY = "mlxUi.resumableUploads";
   let queueBusy = Boolean(
     uploadForm &&
       dropzone &&
@@ -416,6 +421,164 @@
     return false;
   }
 
+  function readResumableIds() {
+    try {
+      const raw = localStorage.getItem(RESUMABLE_STORAGE_KEY);
+      const parsed = raw ? JSON.parse(raw) : {};
+      return parsed && typeof parsed === "object" ? parsed : {};
+    } catch (error) {
+      return {};
+    }
+  }
+
+  function writeResumableId(key, uploadId) {
+    const ids = readResumableIds();
+    if (uploadId) {
+      ids[key] = uploadId;
+    } else {
+      delete ids[key];
+    }
+    try {
+      localStorage.setItem(RESUMABLE_STORAGE_KEY, JSON.stringify(ids));
+    } catch (error) {
+      // localStorage may be disabled; uploads then restart after a reload.
+    }
+  }
+
+  function sleep(ms) {
+    return new Promise((resolve) => window.setTimeout(resolve, ms));
+  }
+
+  async function requestJson(url, options) {
+    const response = await fetch(url, options);
+    let payload = null;
+    try {
+      payload = await response.json();
+    } catch (error) {
+      payload = null;
+    }
+    if (!response.ok) {
+      const detail = payload && typeof payload.detail === "string" ? payload.detail : "";
+      const error = new Error(detail || `Request failed (${response.status})`);
+      error.status = response.status;
+      throw error;
+    }
+    return payload;
+  }
+
+  async function withRetry(task) {
+    for (let attempt = 1; ; attempt += 1) {
+      try {
+        return await task();
+      } catch (error) {
+        const retryable = !error.status || error.status >= 500 || error.status === 429;
+        if (!retryable || attempt >= RESUMABLE_MAX_ATTEMPTS) {
+          throw error;
+        }
+        await sleep(Math.min(1000 * 2 ** (attempt - 1), 15000));
+      }
+    }
+  }
+
+  async function openResumableUpload(item, key) {
+    const previousId = readResumableIds()[key];
+    if (previousId) {
+      try {
+        const existing = await requestJson(`/api/uploads/${encodeURIComponent(previousId)}`);
+        if (existing && existing.size === item.file.size) {
+          return existing;
+        }
+      } catch (error) {
+        // Expired or unknown; start a new upload below.
+      }
+    }
+    const created = await withRetry(() =>
+      requestJson("/api/uploads", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({
+          filename: item.displayPath || item.file.name,
+          size: item.file.size,
+        }),
+      })
+    );
+    writeResumableId(key, created.upload_id);
+    return created;
+  }
+
+  async function uploadResumable(item, onProgress) {
+    const key = buildItemKey(item);
+    const upload = await openResumableUpload(item, key);
+    const chunkSize = upload.chunk_size;
+    const pending = upload.missing_chunks.slice();
+    const chunkLength = (index) => Math.min(chunkSize, item.file.size - index * chunkSize);
+    onProgress(item.file.size - pending.reduce((total, index) => total + chunkLength(index), 0));
+
+    const worker = async () => {
+      while (pending.length > 0) {
+        const index = pending.shift();
+        const offset = index * chunkSize;
+        const blob = item.file.slice(offset, offset + chunkLength(index));
+        await withRetry(() =>
+          requestJson(`/api/uploads/${upload.upload_id}?offset=${offset}`, {
+            method: "PUT",
+            headers: { "Content-Type": "application/octet-stream" },
+            body: blob,
+          })
+        );
+        onProgress(blob.size);
+      }
+    };
+    const workers = Math.min(RESUMABLE_PARALLEL_CHUNKS, pending.length);
+    await Promise.all(Array.from({ length: workers }, worker));
+
+    const job = await withRetry(() =>
+      requestJson(`/api/uploads/${upload.upload_id}/complete`, { method: "POST" })
+    );
+    writeResumableId(key, null);
+    return job;
+  }
+
+  function dropSubmittedItems(items) {
+    // Keep only unsent files selected, so a retry after a failure does not
+    // queue the same file twice.
+    items.forEach((item) => {
+      const index = pendingItems.indexOf(item);
+      if (index >= 0) {
+        pendingItems.splice(index, 1);
+      }
+    });
+  }
+
+  async function submitItems(items) {
+    const small = items.filter((item) => item.file.size < RESUMABLE_THRESHOLD_BYTES);
+    const large = items.filter((item) => item.file.size >= RESUMABLE_THRESHOLD_BYTES);
+    if (small.length > 0) {
+      const formData = new FormData();
+      small.forEach((item) => {
+        formData.append("files", item.file, item.displayPath || item.file.name);
+      });
+      const response = await fetch("/upload", {
+        method: "POST",
+        body: formData,
+      });
+      if (!response.ok) {
+        throw new Error(`Upload failed (${response.status}): ${await response.text()}`);
+      }
+      dropSubmittedItems(small);
+    }
+    const totalBytes = large.reduce((total, item) => total + item.file.size, 0);
+    let sentBytes = 0;
+    for (const item of large) {
+      await uploadResumable(item, (bytes) => {
+        sentBytes += bytes;
+        const percent = totalBytes ? Math.floor((sentBytes / totalBytes) * 100) : 100;
+        uploadSubmit.textContent = `Uploading… ${Math.min(percent, 100)}%`;
+      });
+      dropSubmittedItems([item]);
+    }
+  }
+
   function initUploads() {
     if (app.uploads && app.uploads.__initialized) {
       return;
@@ -584,39 +747,22 @@
         uploadInFlight = true;
         uploadSubmit.disabled = true;
         uploadSubmit.textContent = "Queuing…";
+        const count = pendingItems.length;
         try {
-          const formData = new FormData();
-          pendingItems.forEach((item) => {
-            formData.append("files", item.file, item.displayPath || item.file.name);
-          });
-          const response = await fetch("/upload", {
-            method: "POST",
-            body: formData,
-          });
-          if (response.ok) {
-            const count = pendingItems.length;
-            const label = count === 1 ? "file" : "files";
-            if (app.toasts) {
-              app.toasts.storePendingToast({
-                title: "Queue",
-                message: `Added ${count} ${label} to queue.`,
-                kind: "success",
-                key: "queue:queued",
-                cooldown: 0,
-                duration: 5200,
-              });
-            }
-            window.location = "/?tab=queue";
-            return;
-          }
-          const message = await response.text();
-          console.error("Upload failed", response.status, message);
+          await submitItems(pendingItems.slice());
+          const label = count === 1 ? "file" : "files";
           if (app.toasts) {
-            app.toasts.notifySystem("Queue", "Can’t add files to queue. Try again.", "error", {
-              key: "queue:queued:error",
-              cooldown: 1500,
+            app.toasts.storePendingToast({
+              title: "Queue",
+              message: `Added ${count} ${label} to queue.`,
+              kind: "success",
+              key: "queue:queued",
+              cooldown: 0,
+              duration: 5200,
             });
           }
+          window.location = "/?tab=queue";
+          return;
         } catch (error) {
           console.error("Upload failed", error);
           if (app.toasts) {
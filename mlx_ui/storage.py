@@ -125,3 +125,36 @@ def pick_preview_result(results: list[str]) -> str | None:
         if lower.endswith((".srt", ".vtt", ".json")):
             return result
     return results[0]
+
+
+def replace_results_dir(
+    results_dir: Path,
+    source_job_id: str,
+    target_job_id: str,
+) -> Path | None:
+    if not is_safe_path_component(source_job_id) or not is_safe_path_component(
+        target_job_id
+    ):
+        return None
+    source_dir = results_dir / source_job_id
+    target_dir = results_dir / target_job_id
+    if not source_dir.is_dir():
+        return None
+    stale_dir = results_dir / f".{target_job_id}.replaced"
+    try:
+        if stale_dir.exists():
+            shutil.rmtree(stale_dir)
+        if target_dir.exists():
+            target_dir.replace(stale_dir)
+        source_dir.replace(target_dir)
+    except OSError:
+        logger.exception(
+            "Failed to replace results for job %s with %s",
+            target_job_id,
+            source_job_id,
+        )
+        if stale_dir.exists() and not target_dir.exists():
+            stale_dir.replace(target_dir)
+        return None
+    shutil.rmtree(stale_dir, ignore_errors=True)
+    return target_dir
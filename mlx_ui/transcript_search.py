@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import html
+import logging
+from pathlib import Path
+
+from mlx_ui.db import (
+    TRANSCRIPT_SNIPPET_END,
+    TRANSCRIPT_SNIPPET_START,
+    index_job_transcripts,
+    list_unindexed_done_job_ids,
+)
+from mlx_ui.storage import list_result_files
+
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_BACKFILL_BATCH_SIZE = 500
+
+
+def read_transcript_text(path: Path | None) -> str | None:
+    if path is None:
+        return None
+    try:
+        return Path(path).read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        logger.warning("Failed to read transcript for search index: %s", path)
+        return None
+
+
+def find_transcript_file(results_dir: Path, job_id: str) -> Path | None:
+    for name in list_result_files(results_dir, job_id):
+        if name.lower().endswith(".txt"):
+            return results_dir / job_id / name
+    return None
+
+
+def backfill_transcript_index(
+    db_path: Path,
+    results_dir: Path,
+    *,
+    batch_size: int = TRANSCRIPT_BACKFILL_BATCH_SIZE,
+) -> int:
+    indexed = 0
+    while True:
+        job_ids = list_unindexed_done_job_ids(db_path, limit=batch_size)
+        if not job_ids:
+            break
+        # Jobs whose results are gone still get an empty row so the next
+        # startup does not read their directories again.
+        transcripts = {
+            job_id: _read_job_transcript(results_dir, job_id) for job_id in job_ids
+        }
+        index_job_transcripts(db_path, transcripts)
+        indexed += len(transcripts)
+    if indexed:
+        logger.info("Indexed %s transcript(s) for history search", indexed)
+    return indexed
+
+
+def _read_job_transcript(results_dir: Path, job_id: str) -> str:
+    return read_transcript_text(find_transcript_file(results_dir, job_id)) or ""
+
+
+def format_snippet_html(snippet: str) -> str:
+    escaped = html.escape(snippet)
+    return escaped.replace(TRANSCRIPT_SNIPPET_START, "<mark>").replace(
+        TRANSCRIPT_SNIPPET_END, "</mark>"
+    )
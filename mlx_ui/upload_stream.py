@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import hashlib
+from pathlib import Path
+from typing import BinaryIO
+from uuid import uuid4
+
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+
+from mlx_ui.storage import sanitize_display_path, sanitize_filename
+from mlx_ui.uploads import cleanup_upload_path
+
+UPLOAD_FORM_MAX_FIELD_BYTES = 1024 * 1024
+UPLOAD_FORM_MAX_FIELDS = 1000
+UPLOAD_FORM_MAX_FILES = 1000
+
+
+class UploadFormError(ValueError):
+    pass
+
+
+@dataclass
+class StoredUpload:
+    job_id: str
+    field_name: str
+    display_name: str
+    path: Path
+    size_bytes: int = 0
+    sha256: str = ""
+
+
+@dataclass
+class UploadForm:
+    fields: list[tuple[str, str]] = field(default_factory=list)
+    files: list[StoredUpload] = field(default_factory=list)
+    files_skipped: bool = False
+
+    def get(self, name: str) -> str | None:
+        return next((value for key, value in self.fields if key == name), None)
+
+    def getlist(self, name: str) -> list[str]:
+        return [value for key, value in self.fields if key == name]
+
+    def files_for(self, name: str) -> list[StoredUpload]:
+        return [upload for upload in self.files if upload.field_name == name]
+
+    def discard(
+        self, uploads_dir: Path, uploads: list[StoredUpload] | None = None
+    ) -> None:
+        for upload in self.files if uploads is None else uploads:
+            cleanup_upload_path(upload.path, uploads_dir, upload.job_id)
+
+
+async def receive_upload_form(
+    request: Request,
+    uploads_dir: Path,
+    *,
+    skip_files: Callable[[UploadForm], bool] | None = None,
+) -> UploadForm:
+    """Parse a multipart body, streaming each file into ``uploads/<job_id>/``.
+
+    File parts are written (and hashed) in the threadpool while the next chunk
+    is received, so large uploads are written to disk once and never block the
+    event loop.
+
+    ``skip_files`` is called with the fields that precede the first file part.
+    When it returns true the rest of the body is left unread and the form comes
+    back without files and with ``files_skipped`` set.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type"))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise UploadFormError("Expected a multipart/form-data body.")
+    charset = params.get(b"charset", b"utf-8").decode("latin-1")
+    receiver = _MultipartReceiver(uploads_dir, charset)
+    parser = MultipartParser(boundary, receiver.callbacks())
+    writing: asyncio.Future[None] | None = None
+    try:
+        try:
+            async for chunk in request.stream():
+                parser.write(chunk)
+                if writing is not None:
+                    await writing
+                if skip_files is not None and receiver.form.files:
+                    check, skip_files = skip_files, None
+                    if await run_in_threadpool(check, receiver.form):
+                        await run_in_threadpool(receiver.discard)
+                        receiver.form.files.clear()
+                        receiver.form.files_skipped = True
+                        return receiver.form
+                writing = asyncio.ensure_future(receiver.flush())
+            parser.finalize()
+        except UploadFormError:
+            raise
+        except ValueError as exc:
+            raise UploadFormError(f"Malformed multipart body: {exc}") from exc
+        if writing is not None:
+            await writing
+        await receiver.flush()
+    except BaseException:
+        if writing is not None and not writing.done():
+            writing.cancel()
+            await asyncio.gather(writing, return_exceptions=True)
+        await run_in_threadpool(receiver.discard)
+        raise
+    return receiver.form
+
+
+class _FilePart:
+    def __init__(self, upload: StoredUpload) -> None:
+        self.upload = upload
+        self.pending: list[bytes] = []
+        self.finished = False
+        self._handle: BinaryIO | None = None
+        self._hasher = hashlib.sha256()
+
+    def write(self, data: bytes, finish: bool) -> None:
+        if self._handle is None:
+            self.upload.path.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = self.upload.path.open("wb")
+        if data:
+            self._handle.write(data)
+            self._hasher.update(data)
+            self.upload.size_bytes += len(data)
+        if finish:
+            self.close()
+            self.upload.sha256 = self._hasher.hexdigest()
+
+    def close(self) -> None:
+        if self._handle is not None and not self._handle.closed:
+            self._handle.close()
+
+
+class _MultipartReceiver:
+    def __init__(self, uploads_dir: Path, charset: str) -> None:
+        self.uploads_dir = uploads_dir
+        self.charset = charset
+        self.form = UploadForm()
+        self._parts: list[_FilePart] = []
+        self._dirty: list[_FilePart] = []
+        self._headers: dict[bytes, bytes] = {}
+        self._header_name = b""
+        self._header_value = b""
+        self._field_name = ""
+        self._field_data = bytearray()
+        self._file: _FilePart | None = None
+        self._skip_file = False
+
+    def callbacks(self) -> dict[str, object]:
+        return {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+        }
+
+    async def flush(self) -> None:
+        dirty, self._dirty = self._dirty, []
+        writes = []
+        for part in dirty:
+            data = b"".join(part.pending)
+            part.pending.clear()
+            writes.append(run_in_threadpool(part.write, data, part.finished))
+        await asyncio.gather(*writes)
+
+    def discard(self) -> None:
+        for part in self._parts:
+            part.close()
+        self.form.discard(self.uploads_dir)
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._field_data = bytearray()
+        self._file = None
+        self._skip_file = False
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition"))
+        if b"name" not in options:
+            raise UploadFormError("Every form part needs a name.")
+        self._field_name = self._decode(options[b"name"])
+        if b"filename" not in options:
+            if len(self.form.fields) >= UPLOAD_FORM_MAX_FIELDS:
+                raise UploadFormError("Too many form fields.")
+            return
+        filename = self._decode(options[b"filename"])
+        if not filename:
+            # Browsers send an empty, unnamed part for an empty file input.
+            self._skip_file = True
+            return
+        if len(self.form.files) >= UPLOAD_FORM_MAX_FILES:
+            raise UploadFormError("Too many files.")
+        job_id = uuid4().hex
+        safe_name = sanitize_filename(filename)
+        upload = StoredUpload(
+            job_id=job_id,
+            field_name=self._field_name,
+            display_name=sanitize_display_path(filename, safe_name),
+            path=self.uploads_dir / job_id / safe_name,
+        )
+        self.form.files.append(upload)
+        self._file = _FilePart(upload)
+        self._parts.append(self._file)
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._file is not None:
+            self._file.pending.append(data[start:end])
+            self._mark_dirty(self._file)
+        elif not self._skip_file:
+            self._field_data += data[start:end]
+            if len(self._field_data) > UPLOAD_FORM_MAX_FIELD_BYTES:
+                raise UploadFormError(f"Form field {self._field_name} is too large.")
+
+    def _on_part_end(self) -> None:
+        if self._file is not None:
+            self._file.finished = True
+            self._mark_dirty(self._file)
+        elif not self._skip_file:
+            self.form.fields.append((self._field_name, self._decode(self._field_data)))
+
+    def _mark_dirty(self, part: _FilePart) -> None:
+        if part not in self._dirty:
+            self._dirty.append(part)
+
+    def _decode(self, value: bytes | bytearray) -> str:
+        try:
+            return value.decode(self.charset)
+        except (UnicodeDecodeError, LookupError):
+            return value.decode("latin-1")
@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
+from mlx_ui.db import UPLOAD_ORIGIN_REFERENCE
+
 logger = logging.getLogger(__name__)
 
 
@@ -10,7 +12,12 @@ def cleanup_upload_path(
     upload_path: Path | str,
     uploads_root: Path | str,
     job_id: str | None = None,
+    *,
+    origin: str | None = None,
 ) -> None:
+    if origin == UPLOAD_ORIGIN_REFERENCE:
+        # Referenced files belong to whoever enqueued them, not to the app.
+        return
     resolved_upload = Path(upload_path).resolve()
     resolved_root = Path(uploads_root).resolve()
     if not resolved_upload.is_relative_to(resolved_root):
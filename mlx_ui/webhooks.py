@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import hashlib
+import hmac
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import urllib.error
+import urllib.request
+
+from mlx_ui.db import (
+    WebhookDelivery,
+    get_job,
+    list_due_webhook_deliveries,
+    list_job_results,
+    mark_webhook_delivered,
+    record_webhook_failure,
+)
+from mlx_ui.job_ui import serialize_job
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_SECRET_ENV = "WEBHOOK_SECRET"
+WEBHOOK_EVENT = "job.finished"
+WEBHOOK_TIMEOUT_SECONDS = 10.0
+WEBHOOK_MAX_ATTEMPTS = 8
+WEBHOOK_MAX_CONCURRENCY = 4
+WEBHOOK_POLL_INTERVAL_SECONDS = 2.0
+WEBHOOK_RETRY_BASE_SECONDS = 5.0
+WEBHOOK_RETRY_MAX_SECONDS = 3600.0
+WEBHOOK_ERROR_MAX_CHARS = 500
+
+
+def read_webhook_secret(env: dict[str, str] | None = None) -> str | None:
+    source = os.environ if env is None else env
+    return source.get(WEBHOOK_SECRET_ENV, "").strip() or None
+
+
+def sign_webhook(secret: str, timestamp: str, body: bytes) -> str:
+    digest = hmac.new(
+        secret.encode("utf-8"),
+        timestamp.encode("ascii") + b"." + body,
+        hashlib.sha256,
+    ).hexdigest()
+    return f"sha256={digest}"
+
+
+def webhook_retry_delay(attempt: int) -> float:
+    return min(
+        WEBHOOK_RETRY_BASE_SECONDS * 2 ** max(attempt - 1, 0),
+        WEBHOOK_RETRY_MAX_SECONDS,
+    )
+
+
+class WebhookDeliveryService:
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        secret: str | None = None,
+        max_concurrency: int = WEBHOOK_MAX_CONCURRENCY,
+        max_attempts: int = WEBHOOK_MAX_ATTEMPTS,
+        timeout: float = WEBHOOK_TIMEOUT_SECONDS,
+        poll_interval_seconds: float = WEBHOOK_POLL_INTERVAL_SECONDS,
+    ) -> None:
+        if poll_interval_seconds <= 0:
+            raise ValueError("poll_interval_seconds must be positive")
+        self.db_path = Path(db_path)
+        self.secret = secret if secret is not None else read_webhook_secret()
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self.timeout = timeout
+        self.poll_interval_seconds = poll_interval_seconds
+        self._warned_unsigned = False
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name="mlx-ui-webhooks",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=timeout)
+        if thread is None or not thread.is_alive():
+            self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def run_once(self, now: datetime | None = None) -> int:
+        current = now or datetime.now(timezone.utc)
+        deliveries = list_due_webhook_deliveries(
+            self.db_path,
+            now=current.isoformat(timespec="seconds"),
+            limit=self.max_concurrency,
+        )
+        if not deliveries:
+            return 0
+        with ThreadPoolExecutor(
+            max_workers=len(deliveries),
+            thread_name_prefix="mlx-ui-webhook",
+        ) as executor:
+            list(executor.map(lambda item: self.deliver(item, current), deliveries))
+        return len(deliveries)
+
+    def deliver(self, delivery: WebhookDelivery, now: datetime) -> bool:
+        job = get_job(self.db_path, delivery.job_id)
+        if job is None:
+            record_webhook_failure(
+                self.db_path,
+                delivery.id,
+                error="Job no longer exists.",
+                retry_at=None,
+            )
+            return False
+        payload = {
+            "event": WEBHOOK_EVENT,
+            "delivery_id": delivery.id,
+            "job": serialize_job(job),
+            "results": [
+                {
+                    "name": result.name,
+                    "format": result.format,
+                    "size_bytes": result.size_bytes,
+                    "sha256": result.sha256,
+                }
+                for result in list_job_results(self.db_path, [job.id]).get(job.id, [])
+            ],
+        }
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        error = self._post(delivery, body, now)
+        if error is None:
+            mark_webhook_delivered(self.db_path, delivery.id)
+            logger.info("Delivered webhook %s for job %s", delivery.id, job.id)
+            return True
+        attempt = delivery.attempts + 1
+        retry_at = None
+        if attempt < self.max_attempts:
+            retry_at = (
+                now + timedelta(seconds=webhook_retry_delay(attempt))
+            ).isoformat(timespec="seconds")
+        record_webhook_failure(
+            self.db_path,
+            delivery.id,
+            error=error[:WEBHOOK_ERROR_MAX_CHARS],
+            retry_at=retry_at,
+        )
+        logger.warning(
+            "Webhook %s for job %s failed (attempt %d/%d): %s",
+            delivery.id,
+            job.id,
+            attempt,
+            self.max_attempts,
+            error,
+        )
+        return False
+
+    def _post(
+        self, delivery: WebhookDelivery, body: bytes, now: datetime
+    ) -> str | None:
+        timestamp = str(int(now.timestamp()))
+        headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "whisper-webui-mlx",
+            "X-Webhook-Id": str(delivery.id),
+            "X-Webhook-Attempt": str(delivery.attempts + 1),
+            "X-Webhook-Timestamp": timestamp,
+        }
+        if self.secret:
+            headers["X-Webhook-Signature"] = sign_webhook(self.secret, timestamp, body)
+        elif not self._warned_unsigned:
+            self._warned_unsigned = True
+            logger.warning(
+                "%s is not set; job webhooks are sent unsigned", WEBHOOK_SECRET_ENV
+            )
+        request = urllib.request.Request(
+            delivery.url,
+            data=body,
+            headers=headers,
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                response.read()
+        except urllib.error.HTTPError as exc:
+            return f"HTTP {exc.code}"
+        except (urllib.error.URLError, OSError) as exc:
+            return str(getattr(exc, "reason", None) or exc)
+        return None
+
+    def _run_loop(self) -> None:
+        while not self._stop_event.wait(self.poll_interval_seconds):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Webhook delivery pass failed; it will be retried")
@@ -3,20 +3,60 @@ from __future__ import annotations
 import logging
 import os
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
 import sqlite3
+import tempfile
 import threading
 import time
+import uuid
 
+from mlx_ui.admission import (
+    ADMISSION_ADMIT,
+    ADMISSION_MAX_WAIT_SECONDS,
+    ADMISSION_REJECT,
+    ADMISSION_SPLIT,
+    ADMISSION_WAIT,
+    LIVE_THROTTLE_WINDOW_SECONDS,
+    SPLIT_WINDOW_SECONDS,
+    AdmissionDecision,
+    available_memory_bytes,
+    evaluate_admission,
+)
+from mlx_ui.clip_batching import (
+    CLIP_BATCH_MAX_CLIP_SECONDS,
+    CLIP_BATCH_MAX_JOBS,
+    build_clip_batch,
+    extract_audio_window,
+    join_window_results,
+    probe_media_duration,
+    split_batch_result,
+)
+from mlx_ui.change_bus import publish_change
 from mlx_ui.db import (
+    JOB_PRIORITY_LOW,
+    TRANSCRIPT_PASS_DRAFT,
+    TRANSCRIPTION_MODE_STANDARD,
+    TRANSCRIPTION_MODE_TWO_PASS,
+    JobRecord,
+    abandon_refinement,
     claim_next_job,
+    complete_refinement,
+    get_job,
+    insert_job,
     mark_job_done,
     mark_job_failed,
     mark_job_running,
+    peek_next_job,
+    release_reserved_jobs,
+    requeue_running_jobs,
+    reserve_batch_companions,
     update_job_status,
 )
-from mlx_ui.engine_registry import create_transcriber
+from mlx_ui.engine_registry import create_transcriber, get_remote_io_engine_ids
+from mlx_ui.engines.common import write_transcript_result
 from mlx_ui.hot_folder import (
     export_hot_folder_transcript,
     quarantine_failed_hot_folder_upload,
@@ -24,11 +64,22 @@ from mlx_ui.hot_folder import (
 )
 from mlx_ui.settings import (
     ResolvedTranscriberSettings,
+    resolve_clip_batching_with_settings,
     resolve_job_transcriber_spec_with_settings,
+    resolve_memory_budget_with_settings,
+    resolve_remote_io_limits_with_settings,
 )
 from mlx_ui.telegram import maybe_send_telegram
-from mlx_ui.storage import remove_results_dir
+from mlx_ui.storage import (
+    list_result_files,
+    pick_preview_result,
+    remove_results_dir,
+    replace_results_dir,
+)
 from mlx_ui.transcriber import Transcriber
+from mlx_ui.result_manifest import build_result_manifest
+from mlx_ui.transcript_result import TranscriptResult
+from mlx_ui.transcript_search import find_transcript_file, read_transcript_text
 from mlx_ui.uploads import cleanup_upload_path
 
 logger = logging.getLogger(__name__)
@@ -37,6 +88,34 @@ _worker_lock = threading.Lock()
 _worker_instance: Worker | None = None
 _SQLITE_BUSY_RETRY_LIMIT = 5
 _SQLITE_BUSY_RETRY_BASE_SECONDS = 0.1
+LANE_LOCAL = "local"
+LANE_REMOTE = "remote"
+
+
+@dataclass
+class _ActiveJob:
+    job_id: str
+    filename: str
+    started_at: str | None
+    transcriber: Transcriber | None
+    lane: str
+    cancel_requested: bool = False
+
+
+class _RateLimiter:
+    def __init__(self, per_minute: int) -> None:
+        self.interval = 60.0 / max(1, per_minute)
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def ready(self) -> bool:
+        with self._lock:
+            return time.monotonic() >= self._next_at
+
+    def consume(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._next_at = max(now, self._next_at) + self.interval
 
 
 class Worker:
@@ -51,6 +130,9 @@ class Worker:
         effective_implementation_id: str | None = None,
         base_dir: Path | None = None,
         env: Mapping[str, str] | None = None,
+        draft_transcriber: Transcriber | None = None,
+        remote_concurrency: int | None = None,
+        remote_requests_per_minute: int | None = None,
     ) -> None:
         self.db_path = Path(db_path)
         self.uploads_dir = Path(uploads_dir)
@@ -61,6 +143,7 @@ class Worker:
         )
         self.env = env if env is not None else os.environ
         self.transcriber = transcriber
+        self.draft_transcriber = draft_transcriber
         self.effective_engine = _normalize_engine_id(
             effective_engine
         ) or _transcriber_engine_id(transcriber)
@@ -68,32 +151,64 @@ class Worker:
             effective_implementation_id
         )
         self._transcriber_cache: dict[tuple[object, ...], Transcriber] = {}
+        self._cache_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._paused_event = threading.Event()
+        self._live_throttle_event = threading.Event()
         self._thread: threading.Thread | None = None
+        self._remote_thread: threading.Thread | None = None
+        self._remote_executor: ThreadPoolExecutor | None = None
         self._state_lock = threading.Lock()
-        self._current_job_id: str | None = None
-        self._current_job_filename: str | None = None
-        self._current_job_started_at: str | None = None
-        self._current_transcriber: Transcriber | None = None
-        self._cancel_requested = False
+        self._active_jobs: dict[str, _ActiveJob] = {}
+        self._admission_reason: str | None = None
+        self._admission_waits: dict[str, tuple[float, float | None]] = {}
+        self.remote_engine_ids = get_remote_io_engine_ids()
+        if remote_concurrency is None or remote_requests_per_minute is None:
+            configured_concurrency, configured_rate = (
+                resolve_remote_io_limits_with_settings(
+                    base_dir=self.base_dir,
+                    env=self.env,
+                )
+            )
+            if remote_concurrency is None:
+                remote_concurrency = configured_concurrency
+            if remote_requests_per_minute is None:
+                remote_requests_per_minute = configured_rate
+        self.remote_concurrency = max(1, int(remote_concurrency))
+        self._remote_rate_limiter = _RateLimiter(remote_requests_per_minute)
 
     def start(self) -> None:
         if self.is_running():
             return
         self._stop_event.clear()
+        if self.remote_engine_ids:
+            self._remote_executor = ThreadPoolExecutor(
+                max_workers=self.remote_concurrency,
+                thread_name_prefix="mlx-ui-remote-job",
+            )
         self._thread = threading.Thread(
             target=self._run_loop,
             name="mlx-ui-worker",
             daemon=True,
         )
         self._thread.start()
+        if self._remote_executor is not None:
+            self._remote_thread = threading.Thread(
+                target=self._run_remote_loop,
+                name="mlx-ui-remote-worker",
+                daemon=True,
+            )
+            self._remote_thread.start()
 
     def stop(self, timeout: float | None = None) -> None:
         self._stop_event.set()
-        thread = self._thread
-        if thread is not None:
-            thread.join(timeout=timeout)
+        for thread in (self._thread, self._remote_thread):
+            if thread is not None:
+                thread.join(timeout=timeout)
+        executor = self._remote_executor
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._remote_executor = None
 
     def is_running(self) -> bool:
         return self._thread is not None and self._thread.is_alive()
@@ -107,34 +222,58 @@ class Worker:
     def is_paused(self) -> bool:
         return self._paused_event.is_set()
 
+    def set_live_throttle(self, active: bool) -> None:
+        if active:
+            self._live_throttle_event.set()
+        else:
+            self._live_throttle_event.clear()
+
     def snapshot(self) -> dict[str, object] | None:
         with self._state_lock:
-            if not self._current_job_id:
+            if not self._active_jobs:
                 return None
+            active = next(
+                (
+                    candidate
+                    for candidate in self._active_jobs.values()
+                    if candidate.lane == LANE_LOCAL
+                ),
+                next(iter(self._active_jobs.values())),
+            )
             return {
-                "job_id": self._current_job_id,
-                "filename": self._current_job_filename,
-                "started_at": self._current_job_started_at,
-                "cancel_requested": self._cancel_requested,
+                "job_id": active.job_id,
+                "filename": active.filename,
+                "started_at": active.started_at,
+                "cancel_requested": active.cancel_requested,
+                "active_job_ids": list(self._active_jobs),
             }
 
     def request_cancel(self, job_id: str) -> dict[str, object] | None:
         with self._state_lock:
-            if self._current_job_id != job_id:
+            active = self._active_jobs.get(job_id)
+            if active is None:
                 return None
-            transcriber = self._current_transcriber
-            already_requested = self._cancel_requested
-            self._cancel_requested = True
+            transcriber = active.transcriber
+            already_requested = active.cancel_requested
+            active.cancel_requested = True
+            snapshot = {
+                "job_id": active.job_id,
+                "filename": active.filename,
+                "started_at": active.started_at,
+                "cancel_requested": True,
+            }
         interrupted = False
         if not already_requested:
+            publish_change()
             interrupted = _request_transcriber_cancel(transcriber, job_id)
-        snapshot = self.snapshot()
-        if snapshot is None:
-            return None
         snapshot["interrupted"] = interrupted
         snapshot["already_requested"] = already_requested
         return snapshot
 
+    def admission_note(self) -> str | None:
+        with self._state_lock:
+            return self._admission_reason
+
     def _resolve_transcriber_for_job(
         self,
         job,
@@ -150,9 +289,43 @@ class Worker:
             base_dir=self.base_dir,
             env=self.env,
         )
-        transcriber = _cached_transcriber(self._transcriber_cache, resolved)
+        with self._cache_lock:
+            transcriber = _cached_transcriber(self._transcriber_cache, resolved)
         return transcriber, resolved.engine_id, resolved.implementation_id
 
+    def _resolve_draft_transcriber_for_job(
+        self,
+        job,
+    ) -> tuple[Transcriber, str | None, str | None] | None:
+        if job.transcription_mode != TRANSCRIPTION_MODE_TWO_PASS:
+            return None
+        if job.refines_job_id:
+            return None
+        if self.transcriber is not None:
+            if self.draft_transcriber is None:
+                return None
+            return (
+                self.draft_transcriber,
+                self.effective_engine,
+                self.effective_implementation_id,
+            )
+        resolved = resolve_job_transcriber_spec_with_settings(
+            job.requested_engine,
+            base_dir=self.base_dir,
+            env=self.env,
+        )
+        draft = resolve_job_transcriber_spec_with_settings(
+            job.requested_engine,
+            base_dir=self.base_dir,
+            env=self.env,
+            draft=True,
+        )
+        if draft.cache_key == resolved.cache_key:
+            return None
+        with self._cache_lock:
+            transcriber = _cached_transcriber(self._transcriber_cache, draft)
+        return transcriber, draft.engine_id, draft.implementation_id
+
     def _run_loop(self) -> None:
         while not self._stop_event.is_set():
             try:
@@ -165,34 +338,85 @@ class Worker:
             if not processed:
                 self._stop_event.wait(self.poll_interval)
 
+    def _run_remote_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                processed = self.run_remote_once()
+            except Exception:
+                logger.exception(
+                    "Remote worker iteration failed; keeping the remote lane alive"
+                )
+                processed = False
+            if not processed:
+                self._stop_event.wait(self.poll_interval)
+
     def run_once(self) -> bool:
         if self._paused_event.is_set():
             return False
-        job = claim_next_job(self.db_path)
+        remote_lane_running = self._remote_executor is not None
+        exclude_engine_ids = self.remote_engine_ids if remote_lane_running else ()
+        if self._next_job_waiting_for_memory(exclude_engine_ids):
+            return False
+        job = claim_next_job(self.db_path, exclude_engine_ids=exclude_engine_ids)
         if job is None:
             return False
+        return self._process_job(job, lane=LANE_LOCAL)
+
+    def run_remote_once(self) -> bool:
+        executor = self._remote_executor
+        if executor is None or self._paused_event.is_set():
+            return False
+        if not self._remote_rate_limiter.ready():
+            return False
+        job = claim_next_job(
+            self.db_path,
+            engine_ids=self.remote_engine_ids,
+            max_running=self.remote_concurrency,
+        )
+        if job is None:
+            return False
+        self._remote_rate_limiter.consume()
+        executor.submit(self._process_remote_job, job)
+        return True
+
+    def _process_remote_job(self, job) -> None:
+        try:
+            self._process_job(job, lane=LANE_REMOTE)
+        except Exception:
+            logger.exception("Remote worker failed while processing job %s", job.id)
+
+    def _process_job(self, job, *, lane: str) -> bool:
         try:
             (
                 transcriber,
                 effective_engine,
                 effective_implementation_id,
             ) = self._resolve_transcriber_for_job(job)
+            draft_pass = self._resolve_draft_transcriber_for_job(job)
         except Exception as exc:
             _log_transcriber_resolution_error(job.id, exc)
-            mark_job_failed(
-                self.db_path,
-                job.id,
-                completed_at=_now_utc(),
-                error_message=_truncate_error(str(exc) or exc.__class__.__name__),
-            )
-            self._quarantine_failed_hot_folder_upload(job)
-            cleanup_upload_path(job.upload_path, self.uploads_dir, job.id)
+            self._fail_job(job, str(exc) or exc.__class__.__name__)
+            return True
+        if draft_pass is not None:
+            (
+                transcriber,
+                effective_engine,
+                effective_implementation_id,
+            ) = draft_pass
+        admission = self._admit_job(job, transcriber, effective_engine, lane=lane)
+        if admission.action == ADMISSION_WAIT:
+            release_reserved_jobs(self.db_path, [job.id])
+            return False
+        if admission.action == ADMISSION_REJECT:
+            logger.warning("Worker rejecting job %s: %s", job.id, admission.reason)
+            self._fail_job(job, admission.reason or "Not enough memory.")
             return True
+        admission = self._split_for_live_throttle(transcriber, admission)
         started_at = _now_utc()
         job.started_at = started_at
         job.effective_engine = effective_engine
         job.effective_implementation_id = effective_implementation_id
-        self._set_current_job(job, transcriber)
+        self._set_current_job(job, transcriber, lane=lane)
         if not mark_job_running(
             self.db_path,
             job.id,
@@ -205,42 +429,51 @@ class Worker:
                 job.id,
             )
             self._clear_current_job(job.id)
+            if job.refines_job_id:
+                self._abandon_refinement(job)
+                return True
             self._quarantine_failed_hot_folder_upload(job)
-            cleanup_upload_path(job.upload_path, self.uploads_dir, job.id)
+            cleanup_upload_path(
+                job.upload_path, self.uploads_dir, job.id, origin=job.upload_origin
+            )
             return True
         try:
+            if (
+                draft_pass is None
+                and admission.action == ADMISSION_ADMIT
+                and self._run_clip_batch(
+                    job,
+                    transcriber,
+                    duration=admission.duration_seconds,
+                    effective_engine=effective_engine,
+                    effective_implementation_id=effective_implementation_id,
+                )
+            ):
+                return True
             try:
-                result_path = transcriber.transcribe(job, self.results_dir)
+                if admission.action == ADMISSION_SPLIT:
+                    result_path = self._transcribe_in_windows(
+                        job, transcriber, admission
+                    )
+                else:
+                    result_path = transcriber.transcribe(job, self.results_dir)
             except Exception as exc:
                 if self._is_cancel_requested(job.id):
                     logger.info("Worker cancelled job %s during transcription", job.id)
-                    self._mark_job_cancelled(job.id)
-                    cleanup_cancelled_job_artifacts(
-                        job,
-                        uploads_dir=self.uploads_dir,
-                        results_dir=self.results_dir,
-                        hot_folder_output_dir=self._hot_folder_output_dir(),
-                    )
+                    self._cancel_job(job)
                     return True
                 logger.exception("Worker failed to transcribe job %s", job.id)
-                mark_job_failed(
-                    self.db_path,
-                    job.id,
-                    completed_at=_now_utc(),
-                    error_message=_truncate_error(str(exc) or exc.__class__.__name__),
-                )
-                self._quarantine_failed_hot_folder_upload(job)
-                cleanup_upload_path(job.upload_path, self.uploads_dir, job.id)
+                self._fail_job(job, str(exc) or exc.__class__.__name__)
                 return True
             if self._is_cancel_requested(job.id):
                 logger.info("Worker cancelled job %s after transcription", job.id)
-                self._mark_job_cancelled(job.id)
-                cleanup_cancelled_job_artifacts(
-                    job,
-                    uploads_dir=self.uploads_dir,
-                    results_dir=self.results_dir,
-                    hot_folder_output_dir=self._hot_folder_output_dir(),
-                )
+                self._cancel_job(job)
+                return True
+            if draft_pass is not None:
+                self._publish_draft(job, result_path)
+                return True
+            if job.refines_job_id:
+                self._promote_refinement(job)
                 return True
             try:
                 maybe_send_telegram(job, result_path)
@@ -250,13 +483,7 @@ class Worker:
                 )
             if self._is_cancel_requested(job.id):
                 logger.info("Worker cancelled job %s before export", job.id)
-                self._mark_job_cancelled(job.id)
-                cleanup_cancelled_job_artifacts(
-                    job,
-                    uploads_dir=self.uploads_dir,
-                    results_dir=self.results_dir,
-                    hot_folder_output_dir=self._hot_folder_output_dir(),
-                )
+                self._cancel_job(job)
                 return True
             if job.source_path:
                 output_dir = resolve_hot_folder_output_dir(
@@ -271,42 +498,44 @@ class Worker:
                     )
             if self._is_cancel_requested(job.id):
                 logger.info("Worker cancelled job %s before completion", job.id)
-                self._mark_job_cancelled(job.id)
-                cleanup_cancelled_job_artifacts(
-                    job,
-                    uploads_dir=self.uploads_dir,
-                    results_dir=self.results_dir,
-                    hot_folder_output_dir=self._hot_folder_output_dir(),
-                )
+                self._cancel_job(job)
                 return True
             _retry_sqlite_busy(
                 mark_job_done,
                 self.db_path,
                 job.id,
                 completed_at=_now_utc(),
+                transcript=read_transcript_text(result_path),
+                results=build_result_manifest(self.results_dir, job.id),
+            )
+            cleanup_upload_path(
+                job.upload_path, self.uploads_dir, job.id, origin=job.upload_origin
             )
-            cleanup_upload_path(job.upload_path, self.uploads_dir, job.id)
             return True
         finally:
             self._clear_current_job(job.id)
 
-    def _set_current_job(self, job, transcriber: Transcriber) -> None:
+    def _set_current_job(
+        self,
+        job,
+        transcriber: Transcriber,
+        *,
+        lane: str = LANE_LOCAL,
+    ) -> None:
         with self._state_lock:
-            self._current_job_id = job.id
-            self._current_job_filename = job.filename
-            self._current_job_started_at = job.started_at
-            self._current_transcriber = transcriber
-            self._cancel_requested = False
+            self._active_jobs[job.id] = _ActiveJob(
+                job_id=job.id,
+                filename=job.filename,
+                started_at=job.started_at,
+                transcriber=transcriber,
+                lane=lane,
+            )
+        publish_change()
 
     def _clear_current_job(self, job_id: str) -> None:
         with self._state_lock:
-            if self._current_job_id != job_id:
-                return
-            self._current_job_id = None
-            self._current_job_filename = None
-            self._current_job_started_at = None
-            self._current_transcriber = None
-            self._cancel_requested = False
+            self._active_jobs.pop(job_id, None)
+        publish_change()
 
     def _hot_folder_output_dir(self) -> Path | None:
         return resolve_hot_folder_output_dir(
@@ -322,7 +551,462 @@ class Worker:
 
     def _is_cancel_requested(self, job_id: str) -> bool:
         with self._state_lock:
-            return self._current_job_id == job_id and self._cancel_requested
+            active = self._active_jobs.get(job_id)
+            return active is not None and active.cancel_requested
+
+    def _admit_job(
+        self,
+        job,
+        transcriber: Transcriber,
+        effective_engine: str | None,
+        *,
+        lane: str,
+    ) -> AdmissionDecision:
+        if lane == LANE_REMOTE:
+            return AdmissionDecision(
+                action=ADMISSION_ADMIT,
+                estimated_bytes=0,
+                available_bytes=None,
+            )
+        self._forget_stale_admission_waits(job.id)
+        decision = self._decide_admission(job, transcriber, effective_engine)
+        if decision.action == ADMISSION_WAIT:
+            waiting_since, _ = self._admission_waits.get(
+                job.id, (time.monotonic(), None)
+            )
+            self._admission_waits[job.id] = (waiting_since, decision.duration_seconds)
+        else:
+            self._admission_waits.pop(job.id, None)
+        if decision.action == ADMISSION_SPLIT:
+            logger.info("Worker splitting job %s: %s", job.id, decision.reason)
+        admission_reason = (
+            decision.reason if decision.action == ADMISSION_WAIT else None
+        )
+        with self._state_lock:
+            changed = admission_reason != self._admission_reason
+            self._admission_reason = admission_reason
+        if changed:
+            publish_change()
+        return decision
+
+    def _next_job_waiting_for_memory(self, exclude_engine_ids: tuple[str, ...]) -> bool:
+        # A job held for memory is re-checked without claiming it again, so
+        # waiting does not write reserved/queued events on every poll.
+        if not self._admission_waits:
+            return False
+        job = peek_next_job(self.db_path, exclude_engine_ids=exclude_engine_ids)
+        if job is None or job.id not in self._admission_waits:
+            return False
+        self._forget_stale_admission_waits(job.id)
+        try:
+            draft_pass = self._resolve_draft_transcriber_for_job(job)
+            transcriber, effective_engine, _ = (
+                draft_pass or self._resolve_transcriber_for_job(job)
+            )
+        except Exception:
+            # Claim it so the normal path reports the resolution error.
+            return False
+        decision = self._decide_admission(job, transcriber, effective_engine)
+        return decision.action == ADMISSION_WAIT
+
+    def _decide_admission(
+        self,
+        job,
+        transcriber: Transcriber,
+        effective_engine: str | None,
+    ) -> AdmissionDecision:
+        now = time.monotonic()
+        waiting_since, duration = self._admission_waits.get(job.id, (now, None))
+        if job.id not in self._admission_waits:
+            duration = probe_media_duration(Path(job.upload_path))
+        can_split = callable(getattr(transcriber, "transcribe_result", None))
+        decision = evaluate_admission(
+            effective_engine,
+            duration_seconds=duration,
+            model_name=getattr(transcriber, "model_name", None),
+            model_loaded=bool(getattr(transcriber, "model_loaded", False)),
+            can_split=can_split,
+            available_bytes=available_memory_bytes(),
+            budget_bytes=resolve_memory_budget_with_settings(
+                base_dir=self.base_dir,
+                env=self.env,
+            ),
+        )
+        if (
+            decision.action == ADMISSION_WAIT
+            and can_split
+            and (duration or 0) > SPLIT_WINDOW_SECONDS
+            and now - waiting_since >= ADMISSION_MAX_WAIT_SECONDS
+        ):
+            # Windows keep the smallest footprint this engine can manage; a job
+            # that cannot be split keeps waiting rather than risking an OOM.
+            logger.warning(
+                "Worker splitting job %s after waiting %.0fs for memory: %s",
+                job.id,
+                now - waiting_since,
+                decision.reason,
+            )
+            decision = replace(
+                decision,
+                action=ADMISSION_SPLIT,
+                window_seconds=SPLIT_WINDOW_SECONDS,
+            )
+        return decision
+
+    def _split_for_live_throttle(
+        self,
+        transcriber: Transcriber,
+        admission: AdmissionDecision,
+    ) -> AdmissionDecision:
+        # A single transcribe call cannot yield to the throttle's hold phase;
+        # short windows give it a pause point between each one.
+        if not self._live_throttle_event.is_set():
+            return admission
+        if admission.action != ADMISSION_ADMIT:
+            return admission
+        if not callable(getattr(transcriber, "transcribe_result", None)):
+            return admission
+        if (admission.duration_seconds or 0) <= LIVE_THROTTLE_WINDOW_SECONDS:
+            return admission
+        return replace(
+            admission,
+            action=ADMISSION_SPLIT,
+            window_seconds=LIVE_THROTTLE_WINDOW_SECONDS,
+        )
+
+    def _forget_stale_admission_waits(self, job_id: str) -> None:
+        for waiting_id in [key for key in self._admission_waits if key != job_id]:
+            waiting_job = get_job(self.db_path, waiting_id)
+            if waiting_job is None or waiting_job.status != "queued":
+                self._admission_waits.pop(waiting_id, None)
+
+    def _transcribe_in_windows(
+        self,
+        job,
+        transcriber: Transcriber,
+        admission: AdmissionDecision,
+    ) -> Path:
+        window_seconds = float(admission.window_seconds or 0)
+        duration = float(admission.duration_seconds or 0)
+        transcribe_result = getattr(transcriber, "transcribe_result")
+        parts = []
+        with tempfile.TemporaryDirectory(prefix="mlx-ui-split-") as tmp_dir:
+            offset = 0.0
+            while offset < duration:
+                self._wait_while_paused(job.id)
+                if self._is_cancel_requested(job.id):
+                    raise RuntimeError("Split transcription cancelled.")
+                window_path = extract_audio_window(
+                    Path(job.upload_path),
+                    Path(tmp_dir) / f"window-{len(parts):04d}.wav",
+                    start=offset,
+                    duration=window_seconds,
+                )
+                window_job = replace(
+                    job,
+                    filename=window_path.name,
+                    upload_path=str(window_path),
+                )
+                parts.append((offset, transcribe_result(window_job)))
+                offset += window_seconds
+        return write_transcript_result(
+            result=join_window_results(parts),
+            results_dir=self.results_dir,
+            job_id=job.id,
+            source_name=job.filename,
+            output_formats=getattr(transcriber, "output_formats", None),
+        )
+
+    def _wait_while_paused(self, job_id: str) -> None:
+        while (
+            self._paused_event.is_set()
+            and not self._stop_event.is_set()
+            and not self._is_cancel_requested(job_id)
+        ):
+            self._stop_event.wait(self.poll_interval)
+
+    def _run_clip_batch(
+        self,
+        job,
+        transcriber: Transcriber,
+        *,
+        duration: float | None,
+        effective_engine: str | None,
+        effective_implementation_id: str | None,
+    ) -> bool:
+        """Transcribe ``job`` (already running) together with short queued clips.
+
+        Returns False, with every companion back in the queue, when ``job``
+        should be transcribed on its own instead.
+        """
+        transcribe_result = getattr(transcriber, "transcribe_result", None)
+        if not callable(transcribe_result):
+            return False
+        if job.transcription_mode != TRANSCRIPTION_MODE_STANDARD or job.refines_job_id:
+            return False
+        if not resolve_clip_batching_with_settings(
+            base_dir=self.base_dir,
+            env=self.env,
+        ):
+            return False
+        if duration is None or duration > CLIP_BATCH_MAX_CLIP_SECONDS:
+            return False
+        candidates = reserve_batch_companions(
+            self.db_path,
+            job,
+            limit=CLIP_BATCH_MAX_JOBS - 1,
+        )
+        companions = []
+        for candidate in candidates:
+            if not _is_short_clip(candidate):
+                break
+            companions.append(candidate)
+        release_reserved_jobs(
+            self.db_path,
+            [candidate.id for candidate in candidates[len(companions) :]],
+        )
+        companions = [
+            companion
+            for companion in companions
+            if self._mark_batch_companion_running(
+                companion,
+                started_at=job.started_at,
+                effective_engine=effective_engine,
+                effective_implementation_id=effective_implementation_id,
+            )
+        ]
+        if not companions:
+            return False
+        companion_ids = [companion.id for companion in companions]
+        batch_jobs = [job, *companions]
+        try:
+            with tempfile.TemporaryDirectory(prefix="mlx-ui-batch-") as tmp_dir:
+                batch = build_clip_batch(
+                    [
+                        (batch_job.id, Path(batch_job.upload_path))
+                        for batch_job in batch_jobs
+                    ],
+                    Path(tmp_dir) / "batch.wav",
+                )
+                combined = transcribe_result(
+                    replace(
+                        job,
+                        filename="batch.wav",
+                        upload_path=str(batch.audio_path),
+                    )
+                )
+            split = split_batch_result(combined, batch)
+        except Exception:
+            logger.exception(
+                "Worker failed to transcribe clip batch for job %s; "
+                "falling back to single-job transcription",
+                job.id,
+            )
+            requeue_running_jobs(self.db_path, companion_ids)
+            return False
+        if self._is_cancel_requested(job.id):
+            logger.info("Worker cancelled job %s during clip batch", job.id)
+            requeue_running_jobs(self.db_path, companion_ids)
+            self._cancel_job(job)
+            return True
+        logger.info(
+            "Worker transcribed %d clips in one batch starting with job %s",
+            len(batch_jobs),
+            job.id,
+        )
+        output_formats = getattr(transcriber, "output_formats", None)
+        for batch_job in batch_jobs:
+            try:
+                self._complete_batched_job(
+                    batch_job, split[batch_job.id], output_formats
+                )
+            except Exception as exc:
+                logger.exception("Worker failed to finish batched job %s", batch_job.id)
+                self._fail_job(batch_job, str(exc) or exc.__class__.__name__)
+        return True
+
+    def _mark_batch_companion_running(
+        self,
+        companion,
+        *,
+        started_at: str | None,
+        effective_engine: str | None,
+        effective_implementation_id: str | None,
+    ) -> bool:
+        companion.started_at = started_at
+        companion.effective_engine = effective_engine
+        companion.effective_implementation_id = effective_implementation_id
+        if mark_job_running(
+            self.db_path,
+            companion.id,
+            started_at=started_at,
+            effective_engine=effective_engine,
+            effective_implementation_id=effective_implementation_id,
+        ):
+            return True
+        logger.warning("Worker lost reservation for batched job %s", companion.id)
+        return False
+
+    def _complete_batched_job(
+        self,
+        job,
+        result: TranscriptResult,
+        output_formats,
+    ) -> None:
+        result_path = write_transcript_result(
+            result=result,
+            results_dir=self.results_dir,
+            job_id=job.id,
+            source_name=job.filename,
+            output_formats=output_formats,
+        )
+        self._deliver_result(job, result_path)
+        _retry_sqlite_busy(
+            mark_job_done,
+            self.db_path,
+            job.id,
+            completed_at=_now_utc(),
+            transcript=read_transcript_text(result_path),
+            results=build_result_manifest(self.results_dir, job.id),
+        )
+        cleanup_upload_path(
+            job.upload_path,
+            self.uploads_dir,
+            job.id,
+            origin=job.upload_origin,
+        )
+
+    def _fail_job(self, job, message: str) -> None:
+        error_message = _truncate_error(message)
+        if job.refines_job_id:
+            self._abandon_refinement(
+                job,
+                error_message=_truncate_error(f"Refinement failed: {message}"),
+            )
+            return
+        mark_job_failed(
+            self.db_path,
+            job.id,
+            completed_at=_now_utc(),
+            error_message=error_message,
+            results=build_result_manifest(self.results_dir, job.id),
+        )
+        self._quarantine_failed_hot_folder_upload(job)
+        cleanup_upload_path(
+            job.upload_path, self.uploads_dir, job.id, origin=job.upload_origin
+        )
+
+    def _cancel_job(self, job) -> None:
+        if job.refines_job_id:
+            self._abandon_refinement(job)
+            return
+        self._mark_job_cancelled(job.id)
+        cleanup_cancelled_job_artifacts(
+            job,
+            uploads_dir=self.uploads_dir,
+            results_dir=self.results_dir,
+            hot_folder_output_dir=self._hot_folder_output_dir(),
+        )
+
+    def _publish_draft(self, job, result_path: Path) -> None:
+        _retry_sqlite_busy(
+            mark_job_done,
+            self.db_path,
+            job.id,
+            completed_at=_now_utc(),
+            transcript_pass=TRANSCRIPT_PASS_DRAFT,
+            transcript=read_transcript_text(result_path),
+            results=build_result_manifest(self.results_dir, job.id),
+        )
+        refinement = JobRecord(
+            id=uuid.uuid4().hex,
+            filename=job.filename,
+            status="queued",
+            created_at=_now_utc(),
+            upload_path=job.upload_path,
+            language=job.language,
+            requested_engine=job.requested_engine,
+            priority=JOB_PRIORITY_LOW,
+            upload_origin=job.upload_origin,
+            transcription_mode=TRANSCRIPTION_MODE_TWO_PASS,
+            refines_job_id=job.id,
+        )
+        _retry_sqlite_busy(insert_job, self.db_path, refinement)
+        logger.info(
+            "Published draft for job %s; queued refinement %s",
+            job.id,
+            refinement.id,
+        )
+
+    def _promote_refinement(self, job) -> None:
+        parent = get_job(self.db_path, job.refines_job_id)
+        if parent is None or parent.status != "done":
+            logger.info(
+                "Discarding refinement %s; job %s is no longer available",
+                job.id,
+                job.refines_job_id,
+            )
+            self._abandon_refinement(job)
+            return
+        if replace_results_dir(self.results_dir, job.id, parent.id) is None:
+            self._abandon_refinement(
+                job,
+                error_message="Refinement failed: could not replace draft results",
+            )
+            return
+        _retry_sqlite_busy(
+            complete_refinement,
+            self.db_path,
+            job.id,
+            parent_job_id=parent.id,
+            effective_engine=job.effective_engine,
+            effective_implementation_id=job.effective_implementation_id,
+            transcript=read_transcript_text(
+                find_transcript_file(self.results_dir, parent.id)
+            ),
+            results=build_result_manifest(self.results_dir, parent.id),
+        )
+        self._deliver_final_result(parent)
+        cleanup_upload_path(
+            job.upload_path, self.uploads_dir, job.id, origin=job.upload_origin
+        )
+
+    def _abandon_refinement(self, job, *, error_message: str | None = None) -> None:
+        abandon_refinement(
+            self.db_path,
+            job.id,
+            parent_job_id=job.refines_job_id,
+            error_message=error_message,
+        )
+        remove_results_dir(self.results_dir, job.id)
+        parent = get_job(self.db_path, job.refines_job_id)
+        if parent is not None and parent.status == "done":
+            self._deliver_final_result(parent)
+        cleanup_upload_path(
+            job.upload_path, self.uploads_dir, job.id, origin=job.upload_origin
+        )
+
+    def _deliver_final_result(self, job) -> None:
+        result_name = pick_preview_result(list_result_files(self.results_dir, job.id))
+        if result_name is None:
+            return
+        self._deliver_result(job, self.results_dir / job.id / result_name)
+
+    def _deliver_result(self, job, result_path: Path) -> None:
+        try:
+            maybe_send_telegram(job, result_path)
+        except Exception:
+            logger.exception(
+                "Worker failed to deliver Telegram message for job %s", job.id
+            )
+        if job.source_path:
+            output_dir = self._hot_folder_output_dir()
+            if output_dir is not None:
+                export_hot_folder_transcript(
+                    job=job,
+                    result_path=result_path,
+                    output_dir=output_dir,
+                )
 
     def _mark_job_cancelled(self, job_id: str) -> None:
         update_job_status(
@@ -344,6 +1028,9 @@ def start_worker(
     effective_implementation_id: str | None = None,
     base_dir: Path | None = None,
     env: Mapping[str, str] | None = None,
+    draft_transcriber: Transcriber | None = None,
+    remote_concurrency: int | None = None,
+    remote_requests_per_minute: int | None = None,
 ) -> Worker:
     global _worker_instance
     with _worker_lock:
@@ -359,6 +1046,9 @@ def start_worker(
             effective_implementation_id=effective_implementation_id,
             base_dir=base_dir,
             env=env,
+            draft_transcriber=draft_transcriber,
+            remote_concurrency=remote_concurrency,
+            remote_requests_per_minute=remote_requests_per_minute,
         )
         _worker_instance.start()
         return _worker_instance
@@ -381,6 +1071,14 @@ def get_worker_snapshot() -> dict[str, object] | None:
     return worker.snapshot()
 
 
+def get_worker_admission_note() -> str | None:
+    with _worker_lock:
+        worker = _worker_instance
+    if worker is None or not worker.is_running():
+        return None
+    return worker.admission_note()
+
+
 def request_worker_cancel(job_id: str) -> dict[str, object] | None:
     with _worker_lock:
         worker = _worker_instance
@@ -400,7 +1098,7 @@ def cleanup_cancelled_job_artifacts(
     if result_state == "failed":
         logger.warning("Failed to remove results for cancelled job %s", job.id)
     quarantine_failed_hot_folder_upload(job, output_dir=hot_folder_output_dir)
-    cleanup_upload_path(job.upload_path, uploads_dir, job.id)
+    cleanup_upload_path(job.upload_path, uploads_dir, job.id, origin=job.upload_origin)
 
 
 def _now_utc() -> str:
@@ -424,6 +1122,11 @@ def _retry_sqlite_busy(operation, *args, **kwargs):
             time.sleep(delay)
 
 
+def _is_short_clip(job) -> bool:
+    duration = probe_media_duration(Path(job.upload_path))
+    return duration is not None and duration <= CLIP_BATCH_MAX_CLIP_SECONDS
+
+
 def _truncate_error(message: str, limit: int = 4000) -> str:
     if len(message) <= limit:
         return message
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+SCRIPT_REPO_DIR = Path(__file__).resolve().parents[1]
+if str(SCRIPT_REPO_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_REPO_DIR))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from mlx_ui.app import app  # noqa: E402
+from mlx_ui.db import JobRecord, init_db, insert_jobs  # noqa: E402
+from mlx_ui.routers.jobs_api import (  # noqa: E402
+    _browser_state,
+    _legacy_state,
+    _machine_state,
+)
+
+_ENGINES = (
+    ("whisper_mlx", "whisper_mlx", None),
+    ("parakeet_tdt_v3", "parakeet_tdt_v3", "parakeet_mlx"),
+    ("whisper_mlx", "whisper_cpu", None),
+)
+_LANGUAGES = ("auto", "en", "fr", "de")
+
+
+def seed_jobs(db_path: Path, *, queued: int, history: int) -> None:
+    init_db(db_path)
+    start = datetime(2026, 7, 21, tzinfo=timezone.utc)
+    jobs: list[JobRecord] = []
+    for index in range(queued + history):
+        requested, effective, implementation = _ENGINES[index % len(_ENGINES)]
+        timestamp = (start + timedelta(seconds=index)).isoformat(timespec="seconds")
+        finished = index >= queued
+        jobs.append(
+            JobRecord(
+                id=f"job-{index:06d}",
+                filename=f"recording-{index:06d}.wav",
+                status="done" if finished else "queued",
+                created_at=timestamp,
+                completed_at=timestamp if finished else None,
+                upload_path=f"/tmp/uploads/job-{index:06d}/recording.wav",
+                language=_LANGUAGES[index % len(_LANGUAGES)],
+                requested_engine=requested,
+                effective_engine=effective if finished else None,
+                effective_implementation_id=implementation if finished else None,
+                client="benchmark",
+                client_job_id=f"command-{index:06d}",
+            )
+        )
+    insert_jobs(db_path, jobs)
+
+
+def measure(label: str, poll, iterations: int) -> None:  # type: ignore[no-untyped-def]
+    poll()
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    for _ in range(iterations):
+        poll()
+    cpu_ms = (time.process_time() - cpu_started) * 1000 / iterations
+    wall_ms = (time.perf_counter() - wall_started) * 1000 / iterations
+    print(f"{label:<22} cpu {cpu_ms:8.2f} ms/poll   wall {wall_ms:8.2f} ms/poll")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure per-poll CPU time of the queue state endpoints against a "
+            "throwaway database."
+        )
+    )
+    parser.add_argument("--queued", type=int, default=1000)
+    parser.add_argument("--history", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_dir = Path(temp_dir)
+        app.state.base_dir = base_dir
+        app.state.uploads_dir = base_dir / "uploads"
+        app.state.results_dir = base_dir / "results"
+        app.state.db_path = base_dir / "jobs.db"
+        app.state.worker_enabled = False
+        app.state.update_check_enabled = False
+        db_path = app.state.db_path
+        seed_jobs(db_path, queued=args.queued, history=args.history)
+
+        print(
+            f"{args.queued} queued + {args.history} finished jobs, "
+            f"{args.iterations} polls each"
+        )
+        measure("/api/browser/state", lambda: _browser_state(db_path), args.iterations)
+        measure("/api/state", lambda: _legacy_state(db_path), args.iterations)
+        measure("/api/machine/state", lambda: _machine_state(db_path), args.iterations)
+        with TestClient(app) as client:
+            logging.getLogger("httpx").setLevel(logging.WARNING)
+            etag = client.get("/api/machine/state").headers["ETag"]
+            measure(
+                "304 revalidation",
+                lambda: client.get(
+                    "/api/machine/state", headers={"If-None-Match": etag}
+                ),
+                args.iterations,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
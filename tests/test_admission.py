@@ -0,0 +1,378 @@
+from pathlib import Path
+import sqlite3
+import subprocess
+import time
+
+import mlx_ui.worker as worker_module
+import mlx_ui.clip_batching as clip_batching
+from mlx_ui.admission import (
+    ADMISSION_ADMIT,
+    ADMISSION_MAX_WAIT_SECONDS,
+    ADMISSION_REJECT,
+    ADMISSION_SPLIT,
+    ADMISSION_WAIT,
+    estimate_job_memory_bytes,
+    evaluate_admission,
+)
+from mlx_ui.db import JobRecord, init_db, insert_job, list_jobs
+from mlx_ui.engine_registry import FAKE_ENGINE, WHISPER_CPU_ENGINE
+from mlx_ui.transcript_result import TranscriptResult, TranscriptSegment
+from mlx_ui.worker import Worker
+
+_GIB = 1024 * 1024 * 1024
+
+
+def _make_job(job_id: str, filename: str, uploads_dir: Path) -> JobRecord:
+    job_dir = uploads_dir / job_id
+    job_dir.mkdir(parents=True, exist_ok=True)
+    upload_path = job_dir / filename
+    upload_path.write_text("data", encoding="utf-8")
+    return JobRecord(
+        id=job_id,
+        filename=filename,
+        status="queued",
+        created_at="2024-01-01T00:00:00+00:00",
+        upload_path=str(upload_path),
+        language="en",
+    )
+
+
+def _job_event_count(db_path: Path) -> int:
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute("SELECT COUNT(*) FROM job_events").fetchone()[0]
+
+
+def test_whisper_cpu_estimate_grows_with_duration_and_model() -> None:
+    short = estimate_job_memory_bytes(
+        WHISPER_CPU_ENGINE, duration_seconds=60, model_name="base"
+    )
+    long = estimate_job_memory_bytes(
+        WHISPER_CPU_ENGINE, duration_seconds=4 * 3600, model_name="base"
+    )
+    large = estimate_job_memory_bytes(
+        WHISPER_CPU_ENGINE, duration_seconds=60, model_name="large-v3"
+    )
+    loaded = estimate_job_memory_bytes(
+        WHISPER_CPU_ENGINE,
+        duration_seconds=60,
+        model_name="large-v3",
+        model_loaded=True,
+    )
+
+    assert short < long
+    assert short < large
+    assert loaded < short
+
+
+def test_evaluate_admission_splits_or_waits_when_over_budget() -> None:
+    fits = evaluate_admission(
+        WHISPER_CPU_ENGINE,
+        duration_seconds=600,
+        model_name="base",
+        budget_bytes=2 * _GIB,
+    )
+    split = evaluate_admission(
+        WHISPER_CPU_ENGINE,
+        duration_seconds=4 * 3600,
+        model_name="base",
+        can_split=True,
+        budget_bytes=1 * _GIB,
+    )
+    wait = evaluate_admission(
+        WHISPER_CPU_ENGINE,
+        duration_seconds=4 * 3600,
+        model_name="base",
+        available_bytes=2 * _GIB,
+        budget_bytes=4 * _GIB,
+    )
+    over_budget = evaluate_admission(
+        WHISPER_CPU_ENGINE,
+        duration_seconds=4 * 3600,
+        model_name="base",
+        available_bytes=8 * _GIB,
+        budget_bytes=1 * _GIB,
+    )
+    unknown = evaluate_admission(
+        WHISPER_CPU_ENGINE,
+        duration_seconds=None,
+        budget_bytes=1,
+    )
+
+    assert fits.action == ADMISSION_ADMIT
+    assert split.action == ADMISSION_SPLIT
+    assert split.window_seconds is not None
+    assert wait.action == ADMISSION_WAIT
+    assert wait.reason is not None and "Waiting for memory" in wait.reason
+    assert wait.reason.endswith("1.5 GB is free.")
+    assert over_budget.action == ADMISSION_REJECT
+    assert (
+        over_budget.reason is not None and "1.0 GB memory budget" in over_budget.reason
+    )
+    assert unknown.action == ADMISSION_ADMIT
+
+
+class WindowTranscriber:
+    engine_id = FAKE_ENGINE
+    output_formats = ("txt",)
+
+    def __init__(self) -> None:
+        self.windows: list[str] = []
+
+    def transcribe_result(self, job: JobRecord) -> TranscriptResult:
+        self.windows.append(job.filename)
+        return TranscriptResult(
+            text=f"part{len(self.windows)}",
+            engine_id=self.engine_id,
+            segments=(
+                TranscriptSegment(text=f"part{len(self.windows)}", start=1, end=2),
+            ),
+        )
+
+    def transcribe(self, job: JobRecord, results_dir: Path) -> Path:
+        raise AssertionError("oversized job should not be transcribed whole")
+
+
+def test_worker_holds_oversized_job_and_reports_reason(
+    tmp_path: Path, monkeypatch
+) -> None:
+    db_path = tmp_path / "data" / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    init_db(db_path)
+    insert_job(db_path, _make_job("job1", "long.wav", uploads_dir))
+    monkeypatch.setattr(worker_module, "probe_media_duration", lambda path: 14400.0)
+    monkeypatch.setattr(worker_module, "available_memory_bytes", lambda: _GIB)
+
+    class WholeFileTranscriber:
+        engine_id = FAKE_ENGINE
+
+        def transcribe(self, job: JobRecord, results_dir: Path) -> Path:
+            raise AssertionError("job should wait for memory")
+
+    worker = Worker(
+        db_path=db_path,
+        uploads_dir=uploads_dir,
+        results_dir=tmp_path / "results",
+        transcriber=WholeFileTranscriber(),
+        base_dir=tmp_path,
+        env={},
+    )
+
+    assert worker.run_once() is False
+    assert list_jobs(db_path)[0].status == "queued"
+    note = worker.admission_note()
+    assert note is not None and "Waiting for memory" in note
+
+
+def test_worker_splits_oversized_job_into_windows(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "data" / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    results_dir = tmp_path / "results"
+    init_db(db_path)
+    insert_job(db_path, _make_job("job1", "long.wav", uploads_dir))
+    monkeypatch.setattr(worker_module, "probe_media_duration", lambda path: 1500.0)
+    monkeypatch.setattr(worker_module, "available_memory_bytes", lambda: None)
+    monkeypatch.setattr(
+        worker_module,
+        "extract_audio_window",
+        lambda path, output_path, *, start, duration: output_path,
+    )
+    (tmp_path / "data" / "settings.json").write_text(
+        '{"memory_budget_mb": 150}', encoding="utf-8"
+    )
+    transcriber = WindowTranscriber()
+    worker = Worker(
+        db_path=db_path,
+        uploads_dir=uploads_dir,
+        results_dir=results_dir,
+        transcriber=transcriber,
+        base_dir=tmp_path,
+        env={},
+    )
+
+    assert worker.run_once() is True
+
+    assert list_jobs(db_path)[0].status == "done"
+    assert transcriber.windows == [
+        "window-0000.wav",
+        "window-0001.wav",
+        "window-0002.wav",
+    ]
+    assert (results_dir / "job1" / "long.txt").read_text(encoding="utf-8") == (
+        "part1 part2 part3\n"
+    )
+    assert worker.admission_note() is None
+
+
+def test_worker_splits_jobs_into_short_windows_while_live_throttled(
+    tmp_path: Path, monkeypatch
+) -> None:
+    db_path = tmp_path / "data" / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    init_db(db_path)
+    insert_job(db_path, _make_job("job1", "talk.wav", uploads_dir))
+    monkeypatch.setattr(worker_module, "probe_media_duration", lambda path: 75.0)
+    monkeypatch.setattr(worker_module, "available_memory_bytes", lambda: None)
+    starts: list[float] = []
+
+    def extract(path: Path, output_path: Path, *, start: float, duration: float):
+        starts.append(start)
+        assert duration == 30.0
+        return output_path
+
+    monkeypatch.setattr(worker_module, "extract_audio_window", extract)
+    transcriber = WindowTranscriber()
+    worker = Worker(
+        db_path=db_path,
+        uploads_dir=uploads_dir,
+        results_dir=tmp_path / "results",
+        transcriber=transcriber,
+        base_dir=tmp_path,
+        env={},
+    )
+    worker.set_live_throttle(True)
+
+    assert worker.run_once() is True
+
+    assert list_jobs(db_path)[0].status == "done"
+    assert starts == [0.0, 30.0, 60.0]
+
+
+def test_worker_keeps_waiting_past_max_wait_and_forgets_stale_waits(
+    tmp_path: Path, monkeypatch
+) -> None:
+    db_path = tmp_path / "data" / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    init_db(db_path)
+    insert_job(db_path, _make_job("job1", "long.wav", uploads_dir))
+    monkeypatch.setattr(worker_module, "probe_media_duration", lambda path: 14400.0)
+    monkeypatch.setattr(worker_module, "available_memory_bytes", lambda: _GIB)
+
+    class WholeFileTranscriber:
+        engine_id = FAKE_ENGINE
+
+        def transcribe(self, job: JobRecord, results_dir: Path) -> Path:
+            raise AssertionError("job should keep waiting for memory")
+
+    worker = Worker(
+        db_path=db_path,
+        uploads_dir=uploads_dir,
+        results_dir=tmp_path / "results",
+        transcriber=WholeFileTranscriber(),
+        base_dir=tmp_path,
+        env={},
+    )
+    assert worker.run_once() is False
+    long_ago = time.monotonic() - ADMISSION_MAX_WAIT_SECONDS - 1
+    worker._admission_waits["job1"] = (long_ago, 14400.0)
+    worker._admission_waits["deleted"] = (long_ago, 60.0)
+    events_before = _job_event_count(db_path)
+    published: list[None] = []
+    monkeypatch.setattr(worker_module, "publish_change", lambda: published.append(None))
+
+    for _ in range(5):
+        assert worker.run_once() is False
+
+    assert list_jobs(db_path)[0].status == "queued"
+    assert _job_event_count(db_path) == events_before
+    assert published == []
+    assert list(worker._admission_waits) == ["job1"]
+    note = worker.admission_note()
+    assert note is not None and "Waiting for memory" in note
+
+
+def test_worker_splits_job_that_waited_past_max_wait(
+    tmp_path: Path, monkeypatch
+) -> None:
+    db_path = tmp_path / "data" / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    init_db(db_path)
+    insert_job(db_path, _make_job("job1", "long.wav", uploads_dir))
+    monkeypatch.setattr(worker_module, "probe_media_duration", lambda path: 1500.0)
+    monkeypatch.setattr(worker_module, "available_memory_bytes", lambda: 1)
+    monkeypatch.setattr(
+        worker_module,
+        "extract_audio_window",
+        lambda path, output_path, *, start, duration: output_path,
+    )
+    transcriber = WindowTranscriber()
+    worker = Worker(
+        db_path=db_path,
+        uploads_dir=uploads_dir,
+        results_dir=tmp_path / "results",
+        transcriber=transcriber,
+        base_dir=tmp_path,
+        env={},
+    )
+
+    assert worker.run_once() is False
+    worker._admission_waits["job1"] = (
+        time.monotonic() - ADMISSION_MAX_WAIT_SECONDS - 1,
+        1500.0,
+    )
+
+    assert worker.run_once() is True
+    assert list_jobs(db_path)[0].status == "done"
+    assert len(transcriber.windows) == 3
+    assert worker.admission_note() is None
+
+
+def test_probe_media_duration_treats_timeout_as_unknown(
+    tmp_path: Path, monkeypatch
+) -> None:
+    def hang(*args, **kwargs):
+        raise subprocess.TimeoutExpired(args[0], kwargs["timeout"])
+
+    monkeypatch.setattr(clip_batching.subprocess, "run", hang)
+
+    assert clip_batching.probe_media_duration(tmp_path / "broken.wav") is None
+
+
+def test_worker_fails_job_over_memory_budget_and_moves_on(
+    tmp_path: Path, monkeypatch
+) -> None:
+    db_path = tmp_path / "data" / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    init_db(db_path)
+    insert_job(db_path, _make_job("job1", "long.wav", uploads_dir))
+    insert_job(db_path, _make_job("job2", "short.wav", uploads_dir))
+    durations = {"long.wav": 14400.0, "short.wav": 60.0}
+    monkeypatch.setattr(
+        worker_module, "probe_media_duration", lambda path: durations[path.name]
+    )
+    monkeypatch.setattr(worker_module, "available_memory_bytes", lambda: 64 * _GIB)
+    (tmp_path / "data" / "settings.json").write_text(
+        '{"memory_budget_mb": 1024}', encoding="utf-8"
+    )
+
+    class RecordingTranscriber:
+        engine_id = FAKE_ENGINE
+
+        def __init__(self) -> None:
+            self.seen: list[str] = []
+
+        def transcribe(self, job: JobRecord, results_dir: Path) -> Path:
+            self.seen.append(job.id)
+            result_path = results_dir / job.id / "short.txt"
+            result_path.parent.mkdir(parents=True, exist_ok=True)
+            result_path.write_text("short\n", encoding="utf-8")
+            return result_path
+
+    transcriber = RecordingTranscriber()
+    worker = Worker(
+        db_path=db_path,
+        uploads_dir=uploads_dir,
+        results_dir=tmp_path / "results",
+        transcriber=transcriber,
+        base_dir=tmp_path,
+        env={},
+    )
+
+    assert worker.run_once() is True
+    assert worker.run_once() is True
+
+    jobs = {job.id: job for job in list_jobs(db_path)}
+    assert jobs["job1"].status == "failed"
+    assert "memory budget" in (jobs["job1"].error_message or "")
+    assert jobs["job2"].status == "done"
+    assert transcriber.seen == ["job2"]
+    assert worker.admission_note() is None
@@ -773,9 +773,12 @@ def test_api_state_and_browser_history_have_independent_bounded_contracts(
     assert browser_state["recent_history"][0]["id"] == "history-104"
     assert len(browser_history["items"]) == 50
     assert browser_history["items"][0]["id"] == "history-104"
+    next_cursor = browser_history["page"].pop("next_cursor")
+    assert isinstance(next_cursor, str) and next_cursor
     assert browser_history["page"] == {
         "limit": 50,
         "offset": 0,
+        "after": None,
         "returned": 50,
         "total": 105,
         "has_more": True,
@@ -829,6 +832,63 @@ def test_browser_history_filters_sorts_and_validates_bounds(tmp_path: Path) -> N
     assert too_large.status_code == 422
 
 
+def test_browser_history_cursor_pages_match_offset_pages(tmp_path: Path) -> None:
+    _configure_app(tmp_path)
+    db_path = Path(app.state.db_path)
+    init_db(db_path)
+    for index in range(7):
+        # Pairs share a timestamp so the id tiebreaker is exercised.
+        timestamp = f"2026-07-21T10:00:{index // 2:02d}+00:00"
+        insert_job(
+            db_path,
+            JobRecord(
+                id=f"job-{index}",
+                filename=f"clip-{index}.wav",
+                status="failed" if index == 3 else "done",
+                created_at=timestamp,
+                completed_at=timestamp,
+                upload_path=str(tmp_path / f"clip-{index}.wav"),
+                language="auto",
+            ),
+        )
+
+    with TestClient(app) as client:
+        offset_ids = [
+            item["id"]
+            for item in client.get("/api/browser/history?limit=7").json()["items"]
+        ]
+        cursor_ids: list[str] = []
+        cursor = None
+        totals = []
+        while True:
+            url = "/api/browser/history?limit=3"
+            if cursor:
+                url += f"&after={cursor}"
+            page = client.get(url).json()
+            cursor_ids.extend(item["id"] for item in page["items"])
+            totals.append(page["page"]["total"])
+            cursor = page["page"]["next_cursor"]
+            if not cursor:
+                assert page["page"]["has_more"] is False
+                break
+        oldest = client.get("/api/browser/history?sort=oldest&limit=2").json()
+        oldest_next = client.get(
+            "/api/browser/history?sort=oldest&limit=2"
+            f"&after={oldest['page']['next_cursor']}"
+        ).json()
+        name_cursor = client.get(
+            f"/api/browser/history?sort=name&after={oldest['page']['next_cursor']}"
+        )
+        bad_cursor = client.get("/api/browser/history?after=not-a-cursor")
+
+    assert offset_ids == [f"job-{index}" for index in (6, 5, 4, 3, 2, 1, 0)]
+    assert cursor_ids == offset_ids
+    assert totals == [7, 7, 7]
+    assert [item["id"] for item in oldest_next["items"]] == ["job-2", "job-3"]
+    assert name_cursor.status_code == 422
+    assert bad_cursor.status_code == 422
+
+
 def test_root_history_html_does_not_embed_retained_rows(tmp_path: Path) -> None:
     _configure_app(tmp_path)
     db_path = Path(app.state.db_path)
@@ -1209,6 +1269,34 @@ def test_machine_state_omits_history_and_result_index(tmp_path: Path) -> None:
     assert payload["queue_counts"] == {"running": 0, "queued": 1}
 
 
+def test_machine_state_counts_reserved_jobs_as_running(tmp_path: Path) -> None:
+    _configure_app(tmp_path)
+    db_path = Path(app.state.db_path)
+    now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    with TestClient(app) as client:
+        for job_id, status in (
+            ("running-job", "running"),
+            ("reserved-job", "reserved"),
+            ("queued-job", "queued"),
+        ):
+            insert_job(
+                db_path,
+                JobRecord(
+                    id=job_id,
+                    filename="audio.wav",
+                    status=status,
+                    created_at=now,
+                    upload_path=str(tmp_path / "uploads" / job_id / "audio.wav"),
+                    language="auto",
+                ),
+            )
+        response = client.get("/api/machine/state")
+
+    assert response.status_code == 200
+    assert response.json()["queue_counts"] == {"running": 2, "queued": 1}
+
+
 def test_machine_job_lookup_returns_owned_terminal_result(tmp_path: Path) -> None:
     _configure_app(tmp_path)
     db_path = Path(app.state.db_path)
@@ -1316,6 +1404,22 @@ def test_upload_persists_selected_language(tmp_path: Path) -> None:
     assert jobs[0].language == "ru"
 
 
+def test_upload_rejects_unknown_mode(tmp_path: Path) -> None:
+    _configure_app(tmp_path)
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/upload",
+            data={"mode": "turbo"},
+            files=[("files", ("alpha.txt", b"one", "text/plain"))],
+        )
+
+    assert response.status_code == 422
+    assert "mode must be one of" in response.json()["detail"]
+    assert list_jobs(Path(app.state.db_path)) == []
+    assert list((tmp_path / "uploads").glob("*/*")) == []
+
+
 def test_upload_uses_saved_default_language_when_form_omits_it(tmp_path: Path) -> None:
     _configure_app(tmp_path)
     settings_path = tmp_path / "data" / "settings.json"
@@ -1521,6 +1625,43 @@ def test_delete_history_job_removes_results(tmp_path: Path) -> None:
     assert not uploads_dir.exists()
 
 
+def test_delete_history_job_keeps_upload_for_running_refinement(
+    tmp_path: Path,
+) -> None:
+    _configure_app(tmp_path)
+    db_path = Path(app.state.db_path)
+    init_db(db_path)
+
+    upload_path = Path(app.state.uploads_dir) / "draft-job" / "alpha.txt"
+    upload_path.parent.mkdir(parents=True, exist_ok=True)
+    upload_path.write_text("data", encoding="utf-8")
+    created_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    with TestClient(app) as client:
+        for job_id, status, refines_job_id in (
+            ("draft-job", "done", None),
+            ("refinement-job", "running", "draft-job"),
+        ):
+            insert_job(
+                db_path,
+                JobRecord(
+                    id=job_id,
+                    filename="alpha.txt",
+                    status=status,
+                    created_at=created_at,
+                    upload_path=str(upload_path),
+                    language="any",
+                    transcription_mode="two_pass",
+                    refines_job_id=refines_job_id,
+                ),
+            )
+        response = client.delete("/api/history/draft-job")
+
+    assert response.status_code == 200
+    assert list_jobs(db_path) == []
+    assert upload_path.exists()
+
+
 def test_delete_history_job_only_removes_target_job(tmp_path: Path) -> None:
     _configure_app(tmp_path)
     db_path = Path(app.state.db_path)
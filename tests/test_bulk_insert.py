@@ -0,0 +1,99 @@
+from datetime import datetime, timezone
+from pathlib import Path
+import sqlite3
+
+from fastapi.testclient import TestClient
+import pytest
+
+from mlx_ui.app import app
+from mlx_ui.db import (
+    QUEUE_POSITION_GAP,
+    JobRecord,
+    init_db,
+    insert_job,
+    insert_jobs,
+    list_jobs,
+)
+
+
+def _configure_app(tmp_path: Path) -> None:
+    app.state.base_dir = tmp_path
+    app.state.uploads_dir = tmp_path / "uploads"
+    app.state.results_dir = tmp_path / "results"
+    app.state.db_path = tmp_path / "jobs.db"
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+
+
+def _job(job_id: str) -> JobRecord:
+    return JobRecord(
+        id=job_id,
+        filename=f"{job_id}.wav",
+        status="queued",
+        created_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        upload_path=f"/tmp/{job_id}.wav",
+        language="auto",
+    )
+
+
+def test_insert_jobs_assigns_contiguous_queue_positions(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    insert_job(db_path, _job("first"))
+
+    insert_jobs(db_path, [_job("batch-1"), _job("batch-2"), _job("batch-3")])
+    insert_jobs(db_path, [])
+
+    positions = {job.id: job.queue_position for job in list_jobs(db_path)}
+    assert positions == {
+        "first": QUEUE_POSITION_GAP,
+        "batch-1": 2 * QUEUE_POSITION_GAP,
+        "batch-2": 3 * QUEUE_POSITION_GAP,
+        "batch-3": 4 * QUEUE_POSITION_GAP,
+    }
+
+
+def test_insert_jobs_is_all_or_nothing(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    insert_job(db_path, _job("taken"))
+
+    with pytest.raises(sqlite3.IntegrityError):
+        insert_jobs(db_path, [_job("new"), _job("taken")])
+
+    assert [job.id for job in list_jobs(db_path)] == ["taken"]
+
+
+def test_machine_batch_endpoint_enqueues_every_file(tmp_path: Path) -> None:
+    _configure_app(tmp_path)
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/jobs/batch",
+            data={"client": "agent", "client_job_id": ["a", "b"]},
+            files=[
+                ("files", ("a.wav", b"a", "audio/wav")),
+                ("files", ("b.wav", b"b", "audio/wav")),
+            ],
+        )
+        mismatch = client.post(
+            "/api/jobs/batch",
+            data={"client": "agent", "client_job_id": ["only-one"]},
+            files=[
+                ("files", ("a.wav", b"a", "audio/wav")),
+                ("files", ("b.wav", b"b", "audio/wav")),
+            ],
+        )
+
+    assert response.status_code == 200
+    created = response.json()["jobs"]
+    assert [job["client_job_id"] for job in created] == ["a", "b"]
+    assert [job["filename"] for job in created] == ["a.wav", "b.wav"]
+    assert {job["status"] for job in created} == {"queued"}
+    jobs = {job.id: job for job in list_jobs(Path(app.state.db_path))}
+    assert [jobs[job["job_id"]].queue_position for job in created] == [
+        QUEUE_POSITION_GAP,
+        2 * QUEUE_POSITION_GAP,
+    ]
+    assert mismatch.status_code == 422
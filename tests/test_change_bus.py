@@ -0,0 +1,69 @@
+import asyncio
+from pathlib import Path
+import threading
+
+from mlx_ui.change_bus import ChangeBus
+from mlx_ui.db import JobRecord, init_db, insert_job
+from mlx_ui.routers.jobs_api import _browser_state_events
+
+
+def _insert_queued(db_path: Path, job_id: str) -> None:
+    insert_job(
+        db_path,
+        JobRecord(
+            id=job_id,
+            filename=f"{job_id}.wav",
+            status="queued",
+            created_at="2026-07-21T12:00:00+00:00",
+            upload_path=f"/tmp/{job_id}.wav",
+            language="auto",
+        ),
+    )
+
+
+def test_change_bus_wakes_waiters_from_other_threads() -> None:
+    bus = ChangeBus()
+
+    async def scenario() -> tuple[int, int]:
+        idle = await bus.wait_for_change(bus.version, 0.01)
+        threading.Timer(0.01, bus.publish).start()
+        woken = await bus.wait_for_change(idle, 5)
+        return idle, woken
+
+    assert asyncio.run(scenario()) == (0, 1)
+    assert asyncio.run(bus.wait_for_change(0, 5)) == 1
+
+
+def test_browser_events_push_state_only_after_changes(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    bus = ChangeBus()
+    disconnected = False
+
+    async def is_disconnected() -> bool:
+        return disconnected
+
+    async def scenario() -> list[str]:
+        nonlocal disconnected
+        stream = _browser_state_events(
+            db_path,
+            bus,
+            is_disconnected=is_disconnected,
+            keepalive_seconds=0.05,
+            min_interval_seconds=0,
+        )
+        chunks = [await anext(stream), await anext(stream)]
+        _insert_queued(db_path, "job-1")
+        bus.publish()
+        chunks.append(await anext(stream))
+        disconnected = True
+        chunks.extend([chunk async for chunk in stream])
+        return chunks
+
+    initial, keepalive, pushed = asyncio.run(scenario())
+
+    assert initial.startswith("event: state\ndata: ")
+    assert '"queue":[]' in initial
+    assert keepalive == ": keepalive\n\n"
+    assert pushed.startswith("event: state\n")
+    assert '"id":"job-1"' in pushed
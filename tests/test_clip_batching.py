@@ -0,0 +1,301 @@
+from pathlib import Path
+import wave
+
+import mlx_ui.clip_batching as clip_batching
+import mlx_ui.worker as worker_module
+from mlx_ui.clip_batching import (
+    ClipBatch,
+    ClipSpan,
+    build_clip_batch,
+    split_batch_result,
+)
+from mlx_ui.db import JobRecord, init_db, insert_job, list_jobs
+from mlx_ui.engine_registry import FAKE_ENGINE
+from mlx_ui.transcript_result import (
+    TranscriptResult,
+    TranscriptSegment,
+    TranscriptWordTiming,
+)
+from mlx_ui.worker import Worker
+
+
+def _make_job(
+    job_id: str,
+    filename: str,
+    created_at: str,
+    uploads_dir: Path,
+    *,
+    language: str = "en",
+) -> JobRecord:
+    job_dir = uploads_dir / job_id
+    job_dir.mkdir(parents=True, exist_ok=True)
+    upload_path = job_dir / filename
+    upload_path.write_text("data", encoding="utf-8")
+    return JobRecord(
+        id=job_id,
+        filename=filename,
+        status="queued",
+        created_at=created_at,
+        upload_path=str(upload_path),
+        language=language,
+    )
+
+
+def test_build_clip_batch_joins_clips_with_silence_gaps(
+    tmp_path: Path, monkeypatch
+) -> None:
+    frames = {"a.wav": 16000, "b.wav": 8000}
+    monkeypatch.setattr(
+        clip_batching,
+        "decode_pcm",
+        lambda path, sample_rate: b"\x01\x00" * frames[Path(path).name],
+    )
+
+    batch = build_clip_batch(
+        [("job-a", tmp_path / "a.wav"), ("job-b", tmp_path / "b.wav")],
+        tmp_path / "batch.wav",
+        gap_seconds=1.0,
+    )
+
+    assert batch.spans == (
+        ClipSpan(job_id="job-a", start=0.0, end=1.0),
+        ClipSpan(job_id="job-b", start=2.0, end=2.5),
+    )
+    with wave.open(str(batch.audio_path), "rb") as reader:
+        assert reader.getframerate() == 16000
+        assert reader.getnframes() == 16000 + 16000 + 8000
+
+
+def test_split_batch_result_assigns_words_and_segments_by_span() -> None:
+    batch = ClipBatch(
+        audio_path=Path("batch.wav"),
+        spans=(
+            ClipSpan(job_id="job-a", start=0.0, end=2.0),
+            ClipSpan(job_id="job-b", start=3.5, end=6.0),
+        ),
+        gap_seconds=1.5,
+    )
+    result = TranscriptResult(
+        text="hello there general kenobi",
+        engine_id="whisper_cpu",
+        model_id="base",
+        language="en",
+        segments=(
+            TranscriptSegment(
+                text=" hello there general",
+                start=0.2,
+                end=4.2,
+                words=(
+                    TranscriptWordTiming(text=" hello", start=0.2, end=0.8),
+                    TranscriptWordTiming(text=" there", start=1.0, end=1.6),
+                    TranscriptWordTiming(text=" general", start=3.7, end=4.2),
+                ),
+            ),
+            TranscriptSegment(text=" kenobi", start=4.4, end=5.1),
+        ),
+    )
+
+    split = split_batch_result(result, batch)
+
+    assert split["job-a"].text == "hello there"
+    assert split["job-a"].segments[0].start == 0.2
+    assert split["job-a"].segments[0].end == 1.6
+    assert [word.text for word in split["job-a"].segments[0].words] == [
+        " hello",
+        " there",
+    ]
+    assert split["job-b"].text == "general kenobi"
+    assert [segment.id for segment in split["job-b"].segments] == [0, 1]
+    assert split["job-b"].segments[0].words[0].start == 0.2
+    assert split["job-b"].segments[1].start == 0.9
+    assert split["job-b"].model_id == "base"
+
+
+def test_split_batch_result_spaces_stripped_parakeet_tokens() -> None:
+    batch = ClipBatch(
+        audio_path=Path("batch.wav"),
+        spans=(
+            ClipSpan(job_id="job-a", start=0.0, end=2.0),
+            ClipSpan(job_id="job-b", start=3.5, end=6.0),
+        ),
+        gap_seconds=1.5,
+    )
+    result = TranscriptResult(
+        text="hello world. good morning",
+        engine_id="parakeet_tdt_v3",
+        segments=(
+            TranscriptSegment(
+                text="hello world.",
+                start=0.2,
+                end=1.6,
+                words=(
+                    TranscriptWordTiming(text="hello", start=0.2, end=0.8),
+                    TranscriptWordTiming(text="world.", start=1.0, end=1.6),
+                ),
+            ),
+            TranscriptSegment(
+                text="good morning",
+                start=3.7,
+                end=4.8,
+                words=(
+                    TranscriptWordTiming(text="good", start=3.7, end=4.2),
+                    TranscriptWordTiming(text="morning", start=4.3, end=4.8),
+                ),
+            ),
+            TranscriptSegment(
+                text="see you",
+                start=1.7,
+                end=3.9,
+                words=(
+                    TranscriptWordTiming(text="see", start=1.7, end=1.9),
+                    TranscriptWordTiming(text="you", start=3.6, end=3.9),
+                ),
+            ),
+        ),
+    )
+
+    split = split_batch_result(result, batch)
+
+    assert split["job-a"].text == "hello world. see"
+    assert split["job-b"].text == "good morning you"
+
+
+class TimedBatchTranscriber:
+    engine_id = FAKE_ENGINE
+    output_formats = ("txt",)
+
+    def __init__(self) -> None:
+        self.batch_calls = 0
+        self.single_calls: list[str] = []
+
+    def transcribe_result(self, job: JobRecord) -> TranscriptResult:
+        self.batch_calls += 1
+        return TranscriptResult(
+            text="first second",
+            engine_id=self.engine_id,
+            segments=(
+                TranscriptSegment(text=" first", start=0.1, end=0.9),
+                TranscriptSegment(text=" second", start=2.6, end=3.2),
+            ),
+        )
+
+    def transcribe(self, job: JobRecord, results_dir: Path) -> Path:
+        self.single_calls.append(job.id)
+        job_dir = Path(results_dir) / job.id
+        job_dir.mkdir(parents=True, exist_ok=True)
+        result_path = job_dir / f"{Path(job.filename).stem}.txt"
+        result_path.write_text("single\n", encoding="utf-8")
+        return result_path
+
+
+def test_worker_batches_short_clips_into_one_call(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "data" / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    results_dir = tmp_path / "results"
+    init_db(db_path)
+    (tmp_path / "data" / "settings.json").write_text(
+        '{"clip_batching_enabled": true}', encoding="utf-8"
+    )
+    durations = {"one.wav": 1.0, "two.wav": 1.0, "long.wav": 120.0}
+    probed: list[str] = []
+
+    def probe(path: Path) -> float:
+        probed.append(Path(path).name)
+        return durations[Path(path).name]
+
+    monkeypatch.setattr(worker_module, "probe_media_duration", probe)
+    monkeypatch.setattr(
+        clip_batching,
+        "decode_pcm",
+        lambda path, sample_rate: b"\x00\x00" * sample_rate,
+    )
+    for index, (job_id, filename) in enumerate(
+        [("job1", "one.wav"), ("job2", "two.wav"), ("job3", "long.wav")]
+    ):
+        insert_job(
+            db_path,
+            _make_job(
+                job_id, filename, f"2024-01-01T00:00:0{index}+00:00", uploads_dir
+            ),
+        )
+
+    transcriber = TimedBatchTranscriber()
+    worker = Worker(
+        db_path=db_path,
+        uploads_dir=uploads_dir,
+        results_dir=results_dir,
+        transcriber=transcriber,
+        base_dir=tmp_path,
+        env={},
+    )
+
+    assert worker.run_once() is True
+    jobs = {job.id: job for job in list_jobs(db_path)}
+    assert transcriber.batch_calls == 1
+    assert transcriber.single_calls == []
+    assert jobs["job1"].status == "done"
+    assert jobs["job2"].status == "done"
+    assert jobs["job3"].status == "queued"
+    assert (results_dir / "job1" / "one.txt").read_text(encoding="utf-8") == "first\n"
+    assert (results_dir / "job2" / "two.txt").read_text(encoding="utf-8") == "second\n"
+    assert not (uploads_dir / "job1").exists()
+    assert probed == ["one.wav", "two.wav", "long.wav"]
+
+    assert worker.run_once() is True
+    assert transcriber.single_calls == ["job3"]
+
+
+def test_batched_jobs_run_during_inference_and_finish_independently(
+    tmp_path: Path, monkeypatch
+) -> None:
+    db_path = tmp_path / "data" / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    init_db(db_path)
+    (tmp_path / "data" / "settings.json").write_text(
+        '{"clip_batching_enabled": true}', encoding="utf-8"
+    )
+    monkeypatch.setattr(worker_module, "probe_media_duration", lambda path: 1.0)
+    monkeypatch.setattr(
+        clip_batching,
+        "decode_pcm",
+        lambda path, sample_rate: b"\x00\x00" * sample_rate,
+    )
+    write_result = worker_module.write_transcript_result
+
+    def flaky_write(**kwargs) -> Path:
+        if kwargs["job_id"] == "job1":
+            raise OSError("disk full")
+        return write_result(**kwargs)
+
+    monkeypatch.setattr(worker_module, "write_transcript_result", flaky_write)
+    for index, job_id in enumerate(["job1", "job2"]):
+        insert_job(
+            db_path,
+            _make_job(
+                job_id, f"{job_id}.wav", f"2024-01-01T00:00:0{index}+00:00", uploads_dir
+            ),
+        )
+
+    class StatusRecordingTranscriber(TimedBatchTranscriber):
+        def transcribe_result(self, job: JobRecord) -> TranscriptResult:
+            self.seen = {job.id: job for job in list_jobs(db_path)}
+            return super().transcribe_result(job)
+
+    transcriber = StatusRecordingTranscriber()
+    worker = Worker(
+        db_path=db_path,
+        uploads_dir=uploads_dir,
+        results_dir=tmp_path / "results",
+        transcriber=transcriber,
+        base_dir=tmp_path,
+        env={},
+    )
+
+    assert worker.run_once() is True
+
+    assert {job.status for job in transcriber.seen.values()} == {"running"}
+    assert transcriber.seen["job2"].started_at == transcriber.seen["job1"].started_at
+    jobs = {job.id: job for job in list_jobs(db_path)}
+    assert jobs["job1"].status == "failed"
+    assert jobs["job1"].error_message == "disk full"
+    assert jobs["job2"].status == "done"
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 import sqlite3
 
+import mlx_ui.db as db_module
 from mlx_ui.db import JobRecord, init_db, insert_job, list_jobs, recover_running_jobs
 
 
@@ -247,3 +248,128 @@ def test_recover_running_jobs_marks_reserved_failed(tmp_path: Path) -> None:
     assert recovered_job.status == "failed"
     assert recovered_job.completed_at is not None
     assert recovered_job.error_message == "Recovered after crash"
+
+
+def test_init_db_enables_wal_and_reuses_thread_connection(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+
+    with sqlite3.connect(db_path) as connection:
+        journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+    assert journal_mode == "wal"
+    assert db_module._connect(db_path) is db_module._connect(db_path)
+
+
+def test_thread_connection_reopens_after_db_file_is_replaced(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    insert_job(
+        db_path,
+        JobRecord(
+            id="job-1",
+            filename="alpha.wav",
+            status="queued",
+            created_at="2024-01-01T00:00:00+00:00",
+            upload_path="x",
+            language="en",
+        ),
+    )
+    assert len(list_jobs(db_path)) == 1
+
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    init_db(db_path)
+
+    assert list_jobs(db_path) == []
+
+
+def test_init_db_adds_finished_at_and_status_counters(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            """
+            CREATE TABLE jobs (
+                id TEXT PRIMARY KEY,
+                filename TEXT NOT NULL,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                upload_path TEXT NOT NULL,
+                completed_at TEXT
+            )
+            """
+        )
+        connection.execute(
+            """
+            INSERT INTO jobs (id, filename, status, created_at, upload_path,
+                              completed_at)
+            VALUES
+                ('job-1', 'a.wav', 'done', '2024-01-01', 'x', '2024-01-02'),
+                ('job-2', 'b.wav', 'failed', '2024-01-03', 'x', NULL),
+                ('job-3', 'c.wav', 'queued', '2024-01-04', 'x', NULL)
+            """
+        )
+        connection.execute(
+            """
+            CREATE INDEX idx_jobs_status_completed_created
+            ON jobs(status, completed_at, created_at)
+            """
+        )
+        connection.commit()
+
+    init_db(db_path)
+    init_db(db_path)
+
+    def counts() -> dict[str, int]:
+        rows = db_module._connect(db_path).execute(
+            "SELECT status, job_count FROM job_status_counts WHERE job_count > 0"
+        )
+        return {row["status"]: row["job_count"] for row in rows}
+
+    connection = db_module._connect(db_path)
+    finished = dict(connection.execute("SELECT id, finished_at FROM jobs").fetchall())
+    assert finished == {
+        "job-1": "2024-01-02",
+        "job-2": "2024-01-03",
+        "job-3": "2024-01-04",
+    }
+    assert counts() == {"done": 1, "failed": 1, "queued": 1}
+    indexes = {row[1] for row in connection.execute("PRAGMA index_list(jobs)")}
+    assert "idx_jobs_status_finished" in indexes
+    assert "idx_jobs_status_completed_created" not in indexes
+
+    db_module.update_job_status(db_path, "job-3", "cancelled")
+    db_module.delete_history_job(db_path, "job-1")
+    assert counts() == {"failed": 1, "cancelled": 1}
+    assert db_module.list_history_page(db_path, limit=10)[1] == 2
+
+
+def test_init_db_runs_each_migration_once(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    connection = db_module._connect(db_path)
+    assert (
+        connection.execute("PRAGMA user_version").fetchone()[0]
+        == db_module.SCHEMA_VERSION
+    )
+    connection.execute(
+        """
+        INSERT INTO jobs (id, filename, status, created_at, upload_path, language)
+        VALUES ('job-1', 'a.wav', 'queued', '2024-01-01', 'x', 'any')
+        """
+    )
+    connection.commit()
+
+    init_db(db_path)
+
+    row = connection.execute(
+        "SELECT language, queue_position FROM jobs WHERE id = 'job-1'"
+    ).fetchone()
+    assert tuple(row) == ("any", None)
+
+    connection.execute("PRAGMA user_version = 0")
+    init_db(db_path)
+
+    row = connection.execute(
+        "SELECT language, queue_position FROM jobs WHERE id = 'job-1'"
+    ).fetchone()
+    assert tuple(row) == ("auto", 1)
@@ -0,0 +1,115 @@
+from pathlib import Path
+import sqlite3
+import threading
+
+import pytest
+
+import mlx_ui.db as db_module
+from mlx_ui.db import JobRecord, init_db, insert_job, list_jobs, submit_insert_job
+from mlx_ui.db_writer import DbWriter, DbWriterClosed
+
+
+def _make_job(job_id: str) -> JobRecord:
+    return JobRecord(
+        id=job_id,
+        filename=f"{job_id}.wav",
+        status="queued",
+        created_at="2024-01-01T00:00:00+00:00",
+        upload_path=f"/tmp/{job_id}.wav",
+        language="en",
+    )
+
+
+def _items_db(tmp_path: Path) -> Path:
+    db_path = tmp_path / "items.db"
+    db_module._connect(db_path).execute("CREATE TABLE items (name TEXT NOT NULL)")
+    return db_path
+
+
+def _item_names(db_path: Path) -> list[str]:
+    rows = db_module._connect(db_path).execute("SELECT name FROM items").fetchall()
+    return [row["name"] for row in rows]
+
+
+def test_writer_commits_queued_commands_in_one_transaction(tmp_path: Path) -> None:
+    db_path = _items_db(tmp_path)
+    transactions = 0
+
+    def connect() -> sqlite3.Connection:
+        nonlocal transactions
+        transactions += 1
+        return db_module._connect(db_path)
+
+    writer = DbWriter(connect)
+    writer.start()
+    started = threading.Event()
+    gate = threading.Event()
+    blocker = writer.submit(lambda connection: started.set() or gate.wait(5))
+    assert started.wait(5)
+    futures = [
+        writer.submit(
+            lambda connection, index=index: connection.execute(
+                "INSERT INTO items (name) VALUES (?)", (f"item{index}",)
+            ).rowcount
+        )
+        for index in range(5)
+    ]
+    gate.set()
+
+    assert blocker.result(timeout=5) is True
+    assert [future.result(timeout=5) for future in futures] == [1] * 5
+    assert transactions == 2
+    assert len(_item_names(db_path)) == 5
+    writer.stop(timeout=5)
+    with pytest.raises(DbWriterClosed):
+        writer.submit(lambda connection: None)
+
+
+def test_writer_isolates_failing_command(tmp_path: Path) -> None:
+    db_path = _items_db(tmp_path)
+    writer = DbWriter(lambda: db_module._connect(db_path))
+    gate = threading.Event()
+    writer.start()
+    writer.submit(lambda connection: gate.wait(5))
+
+    def fail(connection: sqlite3.Connection) -> None:
+        connection.execute("DELETE FROM items")
+        raise RuntimeError("boom")
+
+    first = writer.submit(
+        lambda connection: connection.execute(
+            "INSERT INTO items (name) VALUES ('keep')"
+        )
+    )
+    failed = writer.submit(fail)
+    gate.set()
+
+    first.result(timeout=5)
+    with pytest.raises(RuntimeError, match="boom"):
+        failed.result(timeout=5)
+    assert _item_names(db_path) == ["keep"]
+    writer.stop(timeout=5)
+
+
+def test_db_writes_route_through_enabled_writer(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    writer = db_module.enable_db_writer(db_path)
+    try:
+        futures = [submit_insert_job(db_path, _make_job(f"job{i}")) for i in range(3)]
+        for future in futures:
+            future.result(timeout=5)
+        assert writer.is_running()
+        insert_job(db_path, _make_job("job3"))
+    finally:
+        db_module.stop_db_writers(timeout=5)
+
+    assert not writer.is_running()
+    insert_job(db_path, _make_job("job4"))
+    assert sorted(job.id for job in list_jobs(db_path)) == [
+        "job0",
+        "job1",
+        "job2",
+        "job3",
+        "job4",
+    ]
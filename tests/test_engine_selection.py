@@ -6,7 +6,10 @@ from types import SimpleNamespace
 import pytest
 
 import mlx_ui.engine_registry as engine_registry
-from mlx_ui.settings import resolve_transcriber_with_settings
+from mlx_ui.settings import (
+    resolve_job_transcriber_spec_with_settings,
+    resolve_transcriber_with_settings,
+)
 from mlx_ui.transcriber import (
     CohereTranscriber,
     FakeTranscriber,
@@ -38,6 +41,29 @@ def test_engine_setting_selects_cpu_backend(tmp_path: Path, monkeypatch) -> None
     assert transcriber.device == "cpu"
 
 
+def test_draft_transcriber_spec_uses_fast_variant(tmp_path: Path, monkeypatch) -> None:
+    _write_settings(tmp_path, {"draft_whisper_model": "tiny"})
+    monkeypatch.setattr(engine_registry, "is_whisper_available", lambda: True)
+
+    final_cpu = resolve_job_transcriber_spec_with_settings(
+        "whisper_cpu", base_dir=tmp_path, env={}
+    )
+    draft_cpu = resolve_job_transcriber_spec_with_settings(
+        "whisper_cpu", base_dir=tmp_path, env={}, draft=True
+    )
+    assert final_cpu.options.model_name == "large-v3-turbo"
+    assert draft_cpu.options.model_name == "tiny"
+    assert draft_cpu.cache_key != final_cpu.cache_key
+
+    final_mlx = resolve_job_transcriber_spec_with_settings(
+        "fake", base_dir=tmp_path, env={}
+    )
+    draft_mlx = resolve_job_transcriber_spec_with_settings(
+        "fake", base_dir=tmp_path, env={}, draft=True
+    )
+    assert draft_mlx.cache_key == final_mlx.cache_key
+
+
 def test_engine_env_override_takes_precedence(tmp_path: Path) -> None:
     _write_settings(tmp_path, {"engine": "whisper_cpu"})
     transcriber = resolve_transcriber_with_settings(
@@ -82,8 +108,7 @@ def test_parakeet_nemo_cuda_availability_handles_nemo_probe_errors(
     reason = engine_registry.parakeet_nemo_cuda_availability_reason()
 
     assert reason == (
-        "NVIDIA NeMo ASR could not be inspected: "
-        "ValueError: duplicate registration"
+        "NVIDIA NeMo ASR could not be inspected: ValueError: duplicate registration"
     )
 
 
@@ -0,0 +1,150 @@
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from mlx_ui.app import app
+from mlx_ui.db import (
+    JobRecord,
+    ResultFileRecord,
+    archive_db_path,
+    count_jobs_by_status,
+    init_db,
+    insert_job,
+    list_history_page,
+    list_job_results,
+    mark_job_done,
+    mark_job_running,
+    vacuum_db,
+)
+from mlx_ui.history_archive import (
+    archive_expired_history,
+    archive_expired_history_from_settings,
+)
+
+NOW = datetime(2026, 7, 21, 12, 0, tzinfo=timezone.utc)
+
+
+def _configure_app(tmp_path: Path) -> None:
+    app.state.base_dir = tmp_path
+    app.state.uploads_dir = tmp_path / "uploads"
+    app.state.results_dir = tmp_path / "results"
+    app.state.db_path = tmp_path / "jobs.db"
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+
+
+def _insert(db_path: Path, job_id: str, *, days_ago: int, status: str) -> None:
+    timestamp = (NOW - timedelta(days=days_ago)).isoformat(timespec="seconds")
+    insert_job(
+        db_path,
+        JobRecord(
+            id=job_id,
+            filename=f"{job_id}.wav",
+            status=status,
+            created_at=timestamp,
+            completed_at=timestamp if status != "reserved" else None,
+            upload_path=f"/tmp/{job_id}.wav",
+            language="auto",
+        ),
+    )
+
+
+def _seed(db_path: Path) -> None:
+    init_db(db_path)
+    _insert(db_path, "old-done", days_ago=40, status="reserved")
+    mark_job_running(db_path, "old-done")
+    mark_job_done(
+        db_path,
+        "old-done",
+        completed_at=(NOW - timedelta(days=40)).isoformat(timespec="seconds"),
+        transcript="Budget review for the warehouse lease.",
+        results=[ResultFileRecord("old-done.txt", "txt", 38, "abc")],
+    )
+    _insert(db_path, "old-failed", days_ago=35, status="failed")
+    _insert(db_path, "recent", days_ago=2, status="done")
+    _insert(db_path, "queued", days_ago=50, status="queued")
+
+
+def test_archive_moves_old_terminal_jobs_with_their_index(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    _seed(db_path)
+
+    summary = archive_expired_history(db_path, archive_days=30, now=NOW, batch_size=1)
+
+    assert (summary.archived, summary.batches) == (2, 2)
+    archive_path = archive_db_path(db_path)
+    assert archive_path == tmp_path / "jobs-archive.db"
+    assert count_jobs_by_status(db_path) == {"done": 1, "queued": 1}
+    assert count_jobs_by_status(archive_path) == {"done": 1, "failed": 1}
+    assert list_job_results(archive_path, ["old-done"])["old-done"][0].sha256 == "abc"
+    assert list_job_results(db_path, ["old-done"]) == {}
+
+    hot, hot_total = list_history_page(db_path, limit=10)
+    assert ([job.id for job in hot], hot_total) == (["recent"], 1)
+    merged, total = list_history_page(db_path, limit=2, include_archived=True)
+    assert ([job.id for job in merged], total) == (["recent", "old-failed"], 3)
+    oldest, _ = list_history_page(
+        db_path,
+        limit=2,
+        offset=1,
+        sort="oldest",
+        include_archived=True,
+    )
+    assert [job.id for job in oldest] == ["old-failed", "recent"]
+    found, _ = list_history_page(
+        db_path,
+        limit=10,
+        query="warehouse",
+        include_archived=True,
+    )
+    assert [job.id for job in found] == ["old-done"]
+
+    assert archive_expired_history(db_path, archive_days=30, now=NOW).archived == 0
+    assert vacuum_db(db_path) >= 0
+
+
+def test_archiving_is_off_by_default_and_waits_for_retention(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    _seed(db_path)
+    settings_path = tmp_path / "data" / "settings.json"
+    settings_path.parent.mkdir()
+
+    assert archive_expired_history_from_settings(db_path, tmp_path) is None
+
+    settings_path.write_text(
+        json.dumps({"history_archive_days": 1, "results_retention_days": 7}),
+        encoding="utf-8",
+    )
+    summary = archive_expired_history_from_settings(db_path, tmp_path)
+
+    assert summary is not None
+    assert summary.archive_days == 7
+
+
+def test_browser_history_includes_archived_jobs_on_request(tmp_path: Path) -> None:
+    _configure_app(tmp_path)
+    db_path = Path(app.state.db_path)
+    _seed(db_path)
+    archive_expired_history(db_path, archive_days=30, now=NOW)
+
+    with TestClient(app) as client:
+        hot = client.get("/api/browser/history")
+        archived = client.get(
+            "/api/browser/history?include_archived=true&query=warehouse"
+        )
+        deleted = client.delete("/api/history/old-done")
+        after_delete = client.get("/api/browser/history?include_archived=true")
+
+    assert [item["id"] for item in hot.json()["items"]] == ["recent"]
+    items = archived.json()["items"]
+    assert [item["id"] for item in items] == ["old-done"]
+    assert items[0]["results"] == ["old-done.txt"]
+    assert "<mark>warehouse</mark>" in items[0]["transcript_snippet_html"]
+    assert deleted.json() == {"ok": True}
+    assert [item["id"] for item in after_delete.json()["items"]] == [
+        "recent",
+        "old-failed",
+    ]
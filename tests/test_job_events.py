@@ -0,0 +1,146 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sqlite3
+
+from fastapi.testclient import TestClient
+
+from mlx_ui.app import app
+import mlx_ui.db as db_module
+from mlx_ui.db import (
+    JobRecord,
+    cancel_running_job,
+    claim_next_job,
+    init_db,
+    insert_job,
+    list_job_events,
+    list_job_timing_stats,
+    mark_job_done,
+    mark_job_running,
+    recover_running_jobs,
+    release_reserved_jobs,
+)
+from mlx_ui.job_analytics import build_job_analytics
+
+NOW = datetime(2026, 7, 21, 12, 0, tzinfo=timezone.utc)
+
+
+def _at(seconds: int) -> str:
+    return (NOW - timedelta(hours=1) + timedelta(seconds=seconds)).isoformat(
+        timespec="seconds"
+    )
+
+
+def _insert(db_path: Path, job_id: str, *, created_at: str, engine: str) -> None:
+    insert_job(
+        db_path,
+        JobRecord(
+            id=job_id,
+            filename=f"{job_id}.wav",
+            status="queued",
+            created_at=created_at,
+            upload_path=f"/tmp/{job_id}.wav",
+            language="auto",
+            requested_engine=engine,
+        ),
+    )
+
+
+def _run(db_path: Path, job_id: str, *, started: int, finished: int) -> None:
+    claimed = claim_next_job(db_path)
+    assert claimed is not None and claimed.id == job_id
+    mark_job_running(db_path, job_id, started_at=_at(started))
+    mark_job_done(db_path, job_id, completed_at=_at(finished))
+
+
+def test_transitions_append_events(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    _insert(db_path, "job-1", created_at=_at(0), engine="whisper_mlx")
+    _insert(db_path, "job-2", created_at=_at(1), engine="whisper_mlx")
+    _insert(db_path, "job-3", created_at=_at(2), engine="whisper_mlx")
+
+    _run(db_path, "job-1", started=5, finished=20)
+    claim_next_job(db_path)
+    release_reserved_jobs(db_path, ["job-2"])
+    claim_next_job(db_path)
+    cancel_running_job(db_path, "job-2")
+    claim_next_job(db_path)
+    recover_running_jobs(db_path)
+
+    events: dict[str, list[str]] = {}
+    for event in list_job_events(db_path, ["job-1", "job-2", "job-3"]):
+        events.setdefault(event.job_id, []).append(event.event)
+    assert events == {
+        "job-1": ["queued", "reserved", "running", "done"],
+        "job-2": ["queued", "reserved", "queued", "reserved", "cancelled"],
+        "job-3": ["queued", "reserved", "recovered"],
+    }
+
+
+def test_timing_stats_report_nearest_rank_percentiles(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    for index in range(4):
+        _insert(db_path, f"job-{index}", created_at=_at(0), engine="whisper_mlx")
+    for index in range(4):
+        wait = (index + 1) * 10
+        _run(db_path, f"job-{index}", started=wait, finished=wait + 60 * (index + 1))
+    _insert(db_path, "waiting", created_at=_at(500), engine="whisper_mlx")
+    _insert(db_path, "other", created_at=_at(501), engine="cohere")
+
+    (stats,) = list_job_timing_stats(db_path, since=_at(0))
+    assert (stats.engine, stats.day, stats.jobs) == ("whisper_mlx", None, 4)
+    assert (stats.wait_p50_seconds, stats.wait_p95_seconds) == (20.0, 40.0)
+    assert (stats.run_p50_seconds, stats.run_p95_seconds) == (120.0, 240.0)
+    (daily,) = list_job_timing_stats(db_path, since=_at(0), by_day=True)
+    assert daily.day == "2026-07-21"
+
+    analytics = build_job_analytics(db_path, days=1, now=NOW)
+    assert analytics["queue"] == {
+        "queued": 2,
+        "estimated_seconds": 240.0,
+        "engines": [
+            {
+                "engine": "cohere",
+                "queued": 1,
+                "run_p50_seconds": 120.0,
+                "estimated_seconds": 120.0,
+            },
+            {
+                "engine": "whisper_mlx",
+                "queued": 1,
+                "run_p50_seconds": 120.0,
+                "estimated_seconds": 120.0,
+            },
+        ],
+    }
+
+    app.state.base_dir = tmp_path
+    app.state.db_path = db_path
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+    with TestClient(app) as client:
+        response = client.get("/api/analytics/jobs?days=3650")
+        default = client.get("/api/analytics/jobs")
+    assert response.status_code == 422
+    assert default.json()["days"] == 7
+
+
+def test_migration_seeds_events_from_job_timestamps(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    _insert(db_path, "job-1", created_at=_at(0), engine="whisper_mlx")
+    _run(db_path, "job-1", started=5, finished=20)
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("DROP TABLE job_events")
+        connection.execute(
+            "PRAGMA user_version = "
+            f"{db_module._MIGRATIONS.index(db_module._migrate_job_events)}"
+        )
+
+    init_db(db_path)
+
+    assert [
+        (event.event, event.created_at) for event in list_job_events(db_path, ["job-1"])
+    ] == [("queued", _at(0)), ("running", _at(5)), ("done", _at(20))]
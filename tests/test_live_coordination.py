@@ -0,0 +1,141 @@
+from pathlib import Path
+
+from mlx_ui.live_coordination import LiveWorkCoordinator
+from mlx_ui.live_transcription import (
+    LiveTranscriptionService,
+    LiveTranscriptionUpdate,
+    ParakeetLiveConfig,
+)
+
+
+class FakeLiveSession:
+    def __init__(self, session_id: str) -> None:
+        self.session_id = session_id
+
+    def snapshot(self) -> LiveTranscriptionUpdate:
+        return LiveTranscriptionUpdate(
+            session_id=self.session_id,
+            status="running",
+            transcript="",
+            received_chunks=0,
+            processed_windows=0,
+            engine_id="parakeet_tdt_v3",
+            engine_label="Parakeet TDT v3",
+            model_id="fake",
+        )
+
+    def finish(self) -> LiveTranscriptionUpdate:
+        return self.snapshot()
+
+
+class FakeLiveBackend:
+    def create_session(self, session_id: str) -> FakeLiveSession:
+        return FakeLiveSession(session_id)
+
+
+class FakeWorker:
+    def __init__(self) -> None:
+        self.paused = False
+        self.pause_calls = 0
+        self.resume_calls = 0
+        self.live_throttle = False
+
+    def pause(self) -> None:
+        self.paused = True
+        self.pause_calls += 1
+
+    def resume(self) -> None:
+        self.paused = False
+        self.resume_calls += 1
+
+    def is_paused(self) -> bool:
+        return self.paused
+
+    def set_live_throttle(self, active: bool) -> None:
+        self.live_throttle = active
+
+
+def _service() -> LiveTranscriptionService:
+    return LiveTranscriptionService(backend_factory=lambda config: FakeLiveBackend())
+
+
+def _open(service: LiveTranscriptionService) -> str:
+    return service.open_session(ParakeetLiveConfig(repo_id="fake")).session_id
+
+
+def test_coordinator_pauses_worker_during_live_session(tmp_path: Path) -> None:
+    service = _service()
+    worker = FakeWorker()
+    coordinator = LiveWorkCoordinator(service, worker, base_dir=tmp_path, env={})
+
+    assert coordinator.coordinate_once() == 0
+    assert worker.pause_calls == 0
+
+    session_id = _open(service)
+    assert coordinator.coordinate_once() == 1
+    assert worker.paused is True
+    assert worker.live_throttle is False
+
+    service.stop_session(session_id)
+    assert coordinator.coordinate_once() == 0
+    assert worker.paused is False
+    assert worker.resume_calls == 1
+
+
+def test_coordinator_throttles_to_duty_cycle(tmp_path: Path) -> None:
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "settings.json").write_text(
+        '{"live_batch_policy": "throttle", "live_batch_duty_cycle": 0.25}',
+        encoding="utf-8",
+    )
+    service = _service()
+    worker = FakeWorker()
+    coordinator = LiveWorkCoordinator(
+        service,
+        worker,
+        base_dir=tmp_path,
+        env={},
+        throttle_period=10.0,
+    )
+    session_id = _open(service)
+
+    coordinator.coordinate_once(now=100.0)
+    assert worker.paused is False
+    assert worker.live_throttle is True
+    coordinator.coordinate_once(now=102.0)
+    assert worker.paused is False
+    coordinator.coordinate_once(now=103.0)
+    assert worker.paused is True
+    coordinator.coordinate_once(now=110.5)
+    assert worker.paused is False
+
+    service.stop_session(session_id)
+    coordinator.coordinate_once(now=111.0)
+    assert worker.live_throttle is False
+
+
+def test_coordinator_leaves_manual_pause_and_idle_sessions_alone(
+    tmp_path: Path,
+) -> None:
+    service = _service()
+    worker = FakeWorker()
+    worker.pause()
+    coordinator = LiveWorkCoordinator(
+        service,
+        worker,
+        base_dir=tmp_path,
+        env={},
+        idle_timeout=0.0,
+    )
+    _open(service)
+
+    assert coordinator.coordinate_once() == 0
+    assert worker.paused is True
+    assert worker.resume_calls == 0
+
+    coordinator.idle_timeout = 30.0
+    assert coordinator.coordinate_once() == 1
+    pause_calls = worker.pause_calls
+    assert coordinator.coordinate_once() == 1
+    assert worker.pause_calls == pause_calls
+    assert worker.resume_calls == 0
@@ -0,0 +1,100 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from mlx_ui.app import app
+from mlx_ui.db import UPLOAD_ORIGIN_REFERENCE, get_job
+import mlx_ui.local_ingest as local_ingest
+from mlx_ui.local_ingest import LOCAL_INGEST_ROOTS_ENV
+from mlx_ui.uploads import cleanup_upload_path
+
+
+def _configure_app(tmp_path: Path) -> None:
+    app.state.base_dir = tmp_path
+    app.state.uploads_dir = tmp_path / "uploads"
+    app.state.results_dir = tmp_path / "results"
+    app.state.db_path = tmp_path / "jobs.db"
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+
+
+def _media(tmp_path: Path) -> Path:
+    media = tmp_path / "media"
+    media.mkdir()
+    (media / "lecture.wav").write_bytes(b"audio")
+    (tmp_path / "secret.wav").write_bytes(b"secret")
+    (media / "escape.wav").symlink_to(tmp_path / "secret.wav")
+    return media
+
+
+def _request(path: Path | str, client_job_id: str) -> dict[str, object]:
+    return {"path": str(path), "client": "batch", "client_job_id": client_job_id}
+
+
+def test_local_files_are_hard_linked_within_allowed_roots(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    _configure_app(tmp_path)
+    media = _media(tmp_path)
+    source = media / "lecture.wav"
+
+    with TestClient(app) as client:
+        disabled = client.post("/api/jobs/local", json=_request(source, "x"))
+        monkeypatch.setenv(LOCAL_INGEST_ROOTS_ENV, str(media))
+        created = client.post("/api/jobs/local", json=_request(source, "lecture"))
+        retried = client.post("/api/jobs/local", json=_request(source, "lecture"))
+        outside = client.post(
+            "/api/jobs/local", json=_request(tmp_path / "secret.wav", "a")
+        )
+        escaped = client.post(
+            "/api/jobs/local", json=_request(media / "escape.wav", "b")
+        )
+        relative = client.post("/api/jobs/local", json=_request("lecture.wav", "c"))
+        job = get_job(Path(app.state.db_path), created.json()["job_id"])
+        linked_inode = Path(job.upload_path).stat().st_ino
+        removed = client.delete(f"/api/jobs/{job.id}")
+
+    assert disabled.status_code == 403
+    assert created.json()["upload_origin"] == "hardlink"
+    assert retried.json()["created"] is False
+    assert (outside.status_code, escaped.status_code) == (403, 403)
+    assert relative.status_code == 422
+    upload = Path(job.upload_path)
+    assert upload.parent == tmp_path / "uploads" / job.id
+    assert linked_inode == source.stat().st_ino
+    assert removed.status_code == 200
+    assert not upload.exists()
+    assert source.read_bytes() == b"audio"
+
+
+def test_referenced_files_are_never_cleaned_up(tmp_path: Path, monkeypatch) -> None:
+    _configure_app(tmp_path)
+    media = _media(tmp_path)
+    source = media / "lecture.wav"
+
+    def unsupported(source: Path, destination: Path) -> None:
+        raise OSError("cross-device link")
+
+    monkeypatch.setattr(local_ingest.os, "link", unsupported)
+    monkeypatch.setattr(local_ingest, "_reflink", unsupported)
+    monkeypatch.setenv(LOCAL_INGEST_ROOTS_ENV, str(media))
+
+    with TestClient(app) as client:
+        created = client.post("/api/jobs/local", json=_request(source, "lecture"))
+        job = get_job(Path(app.state.db_path), created.json()["job_id"])
+        removed = client.delete(f"/api/jobs/{job.id}")
+
+    assert created.json()["upload_origin"] == UPLOAD_ORIGIN_REFERENCE
+    assert job.upload_origin == UPLOAD_ORIGIN_REFERENCE
+    assert Path(job.upload_path) == source
+    assert not (tmp_path / "uploads" / job.id).exists()
+    assert removed.status_code == 200
+    assert source.read_bytes() == b"audio"
+
+    inside = tmp_path / "uploads" / "job-1" / "kept.wav"
+    inside.parent.mkdir(parents=True)
+    inside.write_bytes(b"kept")
+    cleanup_upload_path(inside, tmp_path / "uploads", "job-1", origin="reference")
+    assert inside.exists()
@@ -0,0 +1,84 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from mlx_ui.app import app
+from mlx_ui.db import _connect, claim_next_job, mark_job_failed, mark_job_running
+import mlx_ui.routers.jobs_api as jobs_api
+
+
+def _configure_app(tmp_path: Path) -> None:
+    app.state.base_dir = tmp_path
+    app.state.uploads_dir = tmp_path / "uploads"
+    app.state.results_dir = tmp_path / "results"
+    app.state.db_path = tmp_path / "jobs.db"
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+
+
+def test_bulk_status_returns_states_for_submitted_batch(tmp_path: Path) -> None:
+    _configure_app(tmp_path)
+    db_path = Path(app.state.db_path)
+
+    with TestClient(app) as client:
+        batch = client.post(
+            "/api/jobs/batch",
+            data={"client": "agent", "client_job_id": ["a-1", "a-2", "a-3"]},
+            files=[
+                ("files", (f"call-{index}.wav", b"audio", "audio/wav"))
+                for index in range(3)
+            ],
+        )
+        first = claim_next_job(db_path)
+        mark_job_running(db_path, first.id)
+        mark_job_failed(db_path, first.id, error_message="decoder crashed")
+        status = client.post(
+            "/api/machine/jobs/status",
+            json={
+                "client": "agent",
+                "client_job_ids": ["a-1", "a-2", "missing", "a-2", "a-3"],
+            },
+        )
+        other_client = client.post(
+            "/api/machine/jobs/status",
+            json={"client": "other", "client_job_ids": ["a-1"]},
+        )
+
+    assert batch.status_code == 200
+    payload = status.json()
+    assert list(payload["jobs"]) == ["a-1", "a-2", "a-3"]
+    assert payload["jobs"]["a-1"]["job_id"] == first.id
+    assert payload["jobs"]["a-1"]["status"] == "failed"
+    assert payload["jobs"]["a-1"]["error_message"] == "decoder crashed"
+    assert payload["jobs"]["a-2"]["status"] == "queued"
+    assert payload["missing"] == ["missing"]
+    assert other_client.json() == {"jobs": {}, "missing": ["a-1"]}
+
+    plan = _connect(db_path).execute(
+        "EXPLAIN QUERY PLAN "
+        "SELECT id FROM jobs WHERE client = ? AND client_job_id IN (?, ?)",
+        ("agent", "a-1", "a-2"),
+    )
+    assert "idx_jobs_client_job" in " ".join(str(row[3]) for row in plan)
+
+
+def test_bulk_status_validates_payload(tmp_path: Path, monkeypatch) -> None:
+    _configure_app(tmp_path)
+    monkeypatch.setattr(jobs_api, "MACHINE_STATUS_MAX_IDS", 2)
+
+    with TestClient(app) as client:
+        not_json = client.post("/api/machine/jobs/status", content=b"nope")
+        wrong_type = client.post(
+            "/api/machine/jobs/status",
+            json={"client": "agent", "client_job_ids": "a-1"},
+        )
+        too_many = client.post(
+            "/api/machine/jobs/status",
+            json={"client": "agent", "client_job_ids": ["a", "b", "c"]},
+        )
+
+    assert not_json.status_code == 422
+    assert wrong_type.status_code == 422
+    assert too_many.status_code == 422
+    assert "At most 2" in too_many.json()["detail"]
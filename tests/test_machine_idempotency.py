@@ -0,0 +1,112 @@
+from pathlib import Path
+import sqlite3
+
+from fastapi.testclient import TestClient
+
+from mlx_ui.app import app
+import mlx_ui.db as db_module
+from mlx_ui.db import (
+    JobRecord,
+    find_job_by_client_job_id,
+    init_db,
+    insert_job,
+    list_jobs,
+)
+
+CLIENT_INDEX_VERSION = db_module._MIGRATIONS.index(db_module._migrate_client_job_index)
+
+
+def _configure_app(tmp_path: Path) -> None:
+    app.state.base_dir = tmp_path
+    app.state.uploads_dir = tmp_path / "uploads"
+    app.state.results_dir = tmp_path / "results"
+    app.state.db_path = tmp_path / "jobs.db"
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+
+
+def _submit(client: TestClient, client_job_id: str):  # type: ignore[no-untyped-def]
+    return client.post(
+        "/api/jobs",
+        data={"client": "agent", "client_job_id": client_job_id},
+        files={"file": ("call.wav", b"audio", "audio/wav")},
+    )
+
+
+def test_machine_submission_is_idempotent_per_client_job_id(tmp_path: Path) -> None:
+    _configure_app(tmp_path)
+
+    with TestClient(app) as client:
+        missing = client.head("/api/machine/jobs/agent/call-1")
+        first = _submit(client, "call-1")
+        retry = _submit(client, "call-1")
+        present = client.head("/api/machine/jobs/agent/call-1")
+        batch = client.post(
+            "/api/jobs/batch",
+            data={"client": "agent", "client_job_id": ["call-1", "call-2"]},
+            files=[
+                ("files", ("call.wav", b"audio", "audio/wav")),
+                ("files", ("other.wav", b"audio", "audio/wav")),
+            ],
+        )
+
+    assert missing.status_code == 404
+    assert first.json()["created"] is True
+    job_id = first.json()["job_id"]
+    assert retry.status_code == 200
+    assert (retry.json()["job_id"], retry.json()["created"]) == (job_id, False)
+    assert present.status_code == 200
+    assert present.headers["x-job-id"] == job_id
+    assert present.headers["x-job-status"] == "queued"
+    batch_jobs = batch.json()["jobs"]
+    assert [job["created"] for job in batch_jobs] == [False, True]
+    assert batch_jobs[0]["job_id"] == job_id
+    assert len(list_jobs(Path(app.state.db_path))) == 2
+    assert len(list((tmp_path / "uploads").iterdir())) == 2
+
+
+def test_client_job_lookup_uses_the_unique_index(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    with sqlite3.connect(db_path) as connection:
+        plan = connection.execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT id FROM jobs WHERE client = ? AND client_job_id = ?
+            """,
+            ("agent", "call-1"),
+        ).fetchall()
+    assert any("idx_jobs_client_job" in str(row[-1]) for row in plan)
+
+
+def test_migration_keeps_the_newest_duplicate_submission(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("DROP INDEX idx_jobs_client_job")
+        connection.execute(f"PRAGMA user_version = {CLIENT_INDEX_VERSION}")
+    for job_id, created_at in (
+        ("older", "2026-07-21T10:00:00+00:00"),
+        ("newer", "2026-07-21T11:00:00+00:00"),
+    ):
+        insert_job(
+            db_path,
+            JobRecord(
+                id=job_id,
+                filename="call.wav",
+                status="done",
+                created_at=created_at,
+                upload_path=f"/tmp/{job_id}.wav",
+                language="auto",
+                client="agent",
+                client_job_id="call-1",
+            ),
+        )
+
+    init_db(db_path)
+
+    job = find_job_by_client_job_id(db_path, client="agent", client_job_id="call-1")
+    assert job is not None and job.id == "newer"
+    jobs = {job.id: job for job in list_jobs(db_path)}
+    assert jobs["older"].client_job_id is None
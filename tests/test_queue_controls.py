@@ -1,14 +1,29 @@
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+import sqlite3
 import threading
 import time
 
+from fastapi.testclient import TestClient
+
+from mlx_ui.app import app
+import mlx_ui.db as db_module
 from mlx_ui.db import (
+    QUEUE_POSITION_GAP,
     JobRecord,
     cancel_running_job,
+    claim_next_job,
+    count_history_jobs,
+    count_jobs_by_status,
+    delete_history_jobs,
+    delete_queued_job,
     init_db,
     insert_job,
     list_jobs,
+    mark_job_done,
+    mark_job_running,
+    move_queued_job,
+    recover_running_jobs,
     reorder_queue,
 )
 from mlx_ui.engine_registry import FAKE_ENGINE
@@ -57,9 +72,9 @@ def test_reorder_queue_updates_positions(tmp_path: Path) -> None:
     ordered_ids = [job.id for job in jobs if job.status == "queued"]
     assert ordered_ids == reordered
     positions = {job.id: job.queue_position for job in jobs}
-    assert positions[reordered[0]] == 1
-    assert positions[reordered[1]] == 2
-    assert positions[reordered[2]] == 3
+    assert positions[reordered[0]] == QUEUE_POSITION_GAP
+    assert positions[reordered[1]] == 2 * QUEUE_POSITION_GAP
+    assert positions[reordered[2]] == 3 * QUEUE_POSITION_GAP
 
 
 def test_reorder_queue_rejects_invalid_ids(tmp_path: Path) -> None:
@@ -82,6 +97,119 @@ def test_reorder_queue_rejects_invalid_ids(tmp_path: Path) -> None:
     assert reorder_queue(db_path, ["job1", "job3"]) is False
 
 
+def _queued_order(db_path: Path) -> list[str]:
+    return [job.id for job in list_jobs(db_path) if job.status == "queued"]
+
+
+def test_move_queued_job_updates_one_row(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    init_db(db_path)
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for offset, job_id in enumerate(["job1", "job2", "job3", "job4"]):
+        created_at = (base_time + timedelta(seconds=offset)).isoformat()
+        insert_job(db_path, _make_job(job_id, f"{job_id}.wav", created_at, uploads_dir))
+    connection = db_module._connect(db_path)
+    changes_before = connection.total_changes
+
+    assert (
+        move_queued_job(db_path, "job4", before="job2")
+        == (QUEUE_POSITION_GAP + 2 * QUEUE_POSITION_GAP) // 2
+    )
+    # The moved row plus its "moved" event.
+    assert connection.total_changes - changes_before == 2
+    assert _queued_order(db_path) == ["job1", "job4", "job2", "job3"]
+
+    assert move_queued_job(db_path, "job1", after="job3") == 4 * QUEUE_POSITION_GAP
+    assert _queued_order(db_path) == ["job4", "job2", "job3", "job1"]
+
+    assert move_queued_job(db_path, "job3") == QUEUE_POSITION_GAP // 2
+    assert _queued_order(db_path) == ["job3", "job4", "job2", "job1"]
+    assert move_queued_job(db_path, "missing", before="job1") is None
+
+
+def test_move_queued_job_rebalances_when_neighbours_touch(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    init_db(db_path)
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for offset, job_id in enumerate(["job1", "job2", "job3"]):
+        created_at = (base_time + timedelta(seconds=offset)).isoformat()
+        insert_job(db_path, _make_job(job_id, f"{job_id}.wav", created_at, uploads_dir))
+    with sqlite3.connect(db_path) as connection:
+        connection.executemany(
+            "UPDATE jobs SET queue_position = ? WHERE id = ?",
+            [(1, "job1"), (2, "job2"), (3, "job3")],
+        )
+
+    move_queued_job(db_path, "job3", after="job1")
+
+    assert _queued_order(db_path) == ["job1", "job3", "job2"]
+    positions = sorted(job.queue_position or 0 for job in list_jobs(db_path))
+    assert positions[0] == QUEUE_POSITION_GAP
+    assert positions[2] == 2 * QUEUE_POSITION_GAP
+
+
+def test_claim_next_job_reads_the_queue_in_index_order(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+
+    plan = " ".join(
+        str(row[3])
+        for row in db_module._connect(db_path).execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT id
+            FROM jobs
+            WHERE status = 'queued'
+            ORDER BY
+                priority ASC,
+                queue_position IS NULL,
+                queue_position ASC,
+                created_at ASC
+            LIMIT 1
+            """
+        )
+    )
+
+    assert "idx_jobs_status_priority_queue_position" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_move_endpoint_validates_jobs(tmp_path: Path) -> None:
+    app.state.base_dir = tmp_path
+    app.state.uploads_dir = tmp_path / "uploads"
+    app.state.results_dir = tmp_path / "results"
+    app.state.db_path = tmp_path / "jobs.db"
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+    db_path = Path(app.state.db_path)
+    init_db(db_path)
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc).isoformat()
+    for job_id in ("job1", "job2"):
+        insert_job(
+            db_path,
+            _make_job(job_id, f"{job_id}.wav", created_at, tmp_path / "uploads"),
+        )
+
+    with TestClient(app) as client:
+        moved = client.post("/api/jobs/job2/move", data={"before": "job1"})
+        moved_json = client.post("/api/jobs/job1/move", json={"before": "job2"})
+        not_string = client.post("/api/jobs/job1/move", json={"after": 1})
+        both = client.post("/api/jobs/job2/move", data={"before": "a", "after": "b"})
+        missing = client.post("/api/jobs/nope/move")
+        bad_anchor = client.post("/api/jobs/job1/move", data={"after": "nope"})
+
+    assert moved.json()["ok"] is True
+    assert moved_json.json()["ok"] is True
+    assert _queued_order(db_path) == ["job1", "job2"]
+    assert not_string.status_code == 422
+    assert both.status_code == 422
+    assert missing.status_code == 404
+    assert bad_anchor.status_code == 409
+
+
 def test_cancel_running_job_sets_status(tmp_path: Path) -> None:
     db_path = tmp_path / "jobs.db"
     init_db(db_path)
@@ -195,3 +323,40 @@ def test_worker_cancel_request_marks_job_cancelled(tmp_path: Path) -> None:
     assert updated.status == "cancelled"
     assert updated.completed_at is not None
     assert not Path(job.upload_path).exists()
+
+
+def test_status_counters_track_job_lifecycle(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    init_db(db_path)
+    created_at = "2024-01-01T00:00:00+00:00"
+    for job_id in ("job1", "job2", "job3", "job4"):
+        insert_job(db_path, _make_job(job_id, f"{job_id}.wav", created_at, uploads_dir))
+
+    def assert_counts_match_rows() -> None:
+        rows = db_module._connect(db_path).execute(
+            "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+        )
+        assert count_jobs_by_status(db_path) == {row[0]: row[1] for row in rows}
+
+    first = claim_next_job(db_path)
+    assert first is not None
+    assert count_jobs_by_status(db_path) == {"queued": 3, "reserved": 1}
+    mark_job_running(db_path, first.id)
+    mark_job_done(db_path, first.id)
+    second = claim_next_job(db_path)
+    assert second is not None
+    mark_job_running(db_path, second.id)
+    assert cancel_running_job(db_path, second.id) is True
+    third = claim_next_job(db_path)
+    assert third is not None
+    mark_job_running(db_path, third.id)
+    assert recover_running_jobs(db_path) == 1
+    assert delete_queued_job(db_path, "job4") is True
+    assert_counts_match_rows()
+    assert count_history_jobs(db_path) == 3
+    assert count_history_jobs(db_path, status="failed") == 1
+
+    assert delete_history_jobs(db_path, [first.id, second.id]) == 2
+    assert count_jobs_by_status(db_path) == {"failed": 1}
+    assert_counts_match_rows()
@@ -123,6 +123,22 @@ def test_create_app_lifespan_runs_startup_tasks(tmp_path: Path, monkeypatch) ->
         "ResultRetentionService",
         _DummyResultRetentionService,
     )
+
+    class _DummyWebhookDeliveryService:
+        def __init__(self, db_path):  # type: ignore[no-untyped-def]
+            _record("webhooks_init", Path(db_path))
+
+        def start(self) -> None:
+            _record("webhooks_start")
+
+        def stop(self) -> None:
+            _record("webhooks_stop")
+
+    monkeypatch.setattr(
+        app_module,
+        "WebhookDeliveryService",
+        _DummyWebhookDeliveryService,
+    )
     monkeypatch.setattr(
         app_module,
         "build_settings_snapshot",
@@ -172,6 +188,8 @@ def test_create_app_lifespan_runs_startup_tasks(tmp_path: Path, monkeypatch) ->
     assert "start_worker" in call_names
     assert "result_retention_start" in call_names
     assert "result_retention_stop" in call_names
+    assert "webhooks_start" in call_names
+    assert "webhooks_stop" in call_names
     assert "build_settings_snapshot" in call_names
     assert thread_started["started"] is True
     assert thread_created.get("name") == "mlx-ui-update-check"
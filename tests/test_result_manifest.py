@@ -0,0 +1,123 @@
+from datetime import datetime, timezone
+import hashlib
+from pathlib import Path
+import shutil
+
+from fastapi.testclient import TestClient
+
+from mlx_ui.app import app
+from mlx_ui.db import (
+    JobRecord,
+    clear_job_results,
+    init_db,
+    insert_job,
+    list_job_results,
+    mark_job_done,
+    mark_job_running,
+)
+from mlx_ui.result_manifest import backfill_result_manifests, build_result_manifest
+
+
+def _configure_app(tmp_path: Path) -> None:
+    app.state.base_dir = tmp_path
+    app.state.uploads_dir = tmp_path / "uploads"
+    app.state.results_dir = tmp_path / "results"
+    app.state.db_path = tmp_path / "jobs.db"
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+
+
+def _insert(db_path: Path, job_id: str, status: str) -> None:
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    insert_job(
+        db_path,
+        JobRecord(
+            id=job_id,
+            filename=f"{job_id}.wav",
+            status=status,
+            created_at=timestamp,
+            completed_at=timestamp if status != "reserved" else None,
+            upload_path=f"/tmp/{job_id}.wav",
+            language="auto",
+        ),
+    )
+
+
+def _write_results(results_dir: Path, job_id: str, transcript: str) -> None:
+    job_dir = results_dir / job_id
+    job_dir.mkdir(parents=True, exist_ok=True)
+    (job_dir / "call.txt").write_text(transcript, encoding="utf-8")
+    (job_dir / "call.srt").write_text("1\n00:00:00,000 --> 00:00:01,000\nhi\n")
+
+
+def test_manifest_records_sizes_checksums_and_preview(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    results_dir = tmp_path / "results"
+    init_db(db_path)
+    _insert(db_path, "job-1", "reserved")
+    transcript = "x" * 2500
+    _write_results(results_dir, "job-1", transcript)
+
+    mark_job_running(db_path, "job-1")
+    mark_job_done(
+        db_path,
+        "job-1",
+        results=build_result_manifest(results_dir, "job-1"),
+    )
+
+    manifest = list_job_results(db_path, ["job-1", "job-missing"])
+    assert list(manifest) == ["job-1"]
+    srt, txt = manifest["job-1"]
+    assert (srt.name, srt.format, srt.preview) == ("call.srt", "srt", None)
+    assert (txt.name, txt.format, txt.size_bytes) == ("call.txt", "txt", 2500)
+    assert txt.sha256 == hashlib.sha256(transcript.encode()).hexdigest()
+    assert txt.preview == "x" * 2000
+    assert txt.preview_truncated is True
+
+    assert clear_job_results(db_path, ["job-1"]) == 1
+    assert list_job_results(db_path, ["job-1"]) == {"job-1": []}
+
+
+def test_backfill_records_legacy_jobs_once(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    results_dir = tmp_path / "results"
+    init_db(db_path)
+    _insert(db_path, "job-1", "done")
+    _insert(db_path, "job-2", "done")
+    _insert(db_path, "job-3", "cancelled")
+    _write_results(results_dir, "job-1", "hello")
+
+    assert list_job_results(db_path, ["job-1", "job-2"]) == {}
+    assert backfill_result_manifests(db_path, results_dir, batch_size=1) == 2
+    assert backfill_result_manifests(db_path, results_dir) == 0
+
+    manifest = list_job_results(db_path, ["job-1", "job-2", "job-3"])
+    assert [result.name for result in manifest["job-1"]] == ["call.srt", "call.txt"]
+    assert manifest["job-2"] == []
+    assert "job-3" not in manifest
+
+
+def test_history_and_preview_read_the_manifest(tmp_path: Path) -> None:
+    _configure_app(tmp_path)
+    db_path = Path(app.state.db_path)
+    results_dir = Path(app.state.results_dir)
+    init_db(db_path)
+    _insert(db_path, "job-1", "done")
+    _write_results(results_dir, "job-1", "Quarterly numbers look fine.")
+
+    with TestClient(app) as client:
+        # Once recorded, listing results no longer depends on the directory.
+        shutil.rmtree(results_dir / "job-1")
+        history = client.get("/api/browser/history")
+        state = client.get("/api/state")
+        preview = client.get("/api/jobs/job-1/preview?chars=50")
+
+    assert history.json()["items"][0]["results"] == ["call.srt", "call.txt"]
+    assert state.json()["results_by_job"]["job-1"] == ["call.srt", "call.txt"]
+    assert preview.json() == {
+        "job_id": "job-1",
+        "filename": "call.txt",
+        "snippet": "Quarterly numbers look fine.",
+        "truncated": False,
+    }
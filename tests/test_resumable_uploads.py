@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+import hashlib
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from mlx_ui.app import app
+from mlx_ui.db import list_jobs
+from mlx_ui.resumable_uploads import (
+    RESUMABLE_MIN_CHUNK_SIZE,
+    create_partial_upload,
+    partial_uploads_dir,
+    purge_expired_partial_uploads,
+)
+
+CHUNK = RESUMABLE_MIN_CHUNK_SIZE
+
+
+def _configure_app(tmp_path: Path) -> None:
+    app.state.base_dir = tmp_path
+    app.state.uploads_dir = tmp_path / "uploads"
+    app.state.results_dir = tmp_path / "results"
+    app.state.db_path = tmp_path / "jobs.db"
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+
+
+def test_chunks_resume_out_of_order_and_finalise_into_a_job(tmp_path: Path) -> None:
+    _configure_app(tmp_path)
+    content = bytes(range(256)) * (CHUNK * 3 // 256) + b"tail"
+
+    with TestClient(app) as client:
+        created = client.post(
+            "/api/uploads",
+            json={
+                "filename": "talks/lecture.mp4",
+                "size": len(content),
+                "chunk_size": CHUNK,
+            },
+        ).json()
+        url = f"/api/uploads/{created['upload_id']}"
+        last = client.put(f"{url}?offset={3 * CHUNK}", content=content[3 * CHUNK :])
+        second = client.put(f"{url}?offset={CHUNK}", content=content[CHUNK : 2 * CHUNK])
+        short = client.put(f"{url}?offset=0", content=content[:10])
+        unaligned = client.put(f"{url}?offset=7", content=content[7 : CHUNK + 7])
+        early = client.post(f"{url}/complete")
+        status = client.get(url).json()
+        for offset in status["missing_chunks"]:
+            client.put(
+                f"{url}?offset={offset * CHUNK}",
+                content=content[offset * CHUNK : (offset + 1) * CHUNK],
+            )
+        completed = client.post(f"{url}/complete", json={"language": "auto"})
+        gone = client.get(url)
+
+    assert created["offset"] == 0
+    assert created["missing_chunks"] == [0, 1, 2, 3]
+    assert last.status_code == 200
+    assert second.json()["missing_chunks"] == [0, 2]
+    assert short.status_code == 409
+    assert unaligned.status_code == 409
+    assert early.status_code == 409
+    assert status["offset"] == 0
+    assert status["missing_chunks"] == [0, 2]
+    assert completed.status_code == 200
+    assert gone.status_code == 404
+
+    payload = completed.json()
+    assert payload["upload_sha256"] == hashlib.sha256(content).hexdigest()
+    [job] = list_jobs(Path(app.state.db_path))
+    assert (job.id, job.filename) == (payload["job_id"], "talks/lecture.mp4")
+    assert Path(job.upload_path).read_bytes() == content
+    assert Path(job.upload_path) == tmp_path / "uploads" / job.id / "lecture.mp4"
+    assert list(partial_uploads_dir(tmp_path / "uploads").iterdir()) == []
+
+
+def test_abandoned_partial_uploads_expire(tmp_path: Path) -> None:
+    uploads_dir = tmp_path / "uploads"
+    upload = create_partial_upload(
+        uploads_dir, filename="a.wav", size=10, chunk_size=CHUNK
+    )
+    later = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    assert purge_expired_partial_uploads(uploads_dir, now=later) == 0
+    assert (
+        purge_expired_partial_uploads(uploads_dir, max_age_seconds=60, now=later) == 1
+    )
+    assert not (partial_uploads_dir(uploads_dir) / upload.id).exists()
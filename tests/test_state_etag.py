@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from mlx_ui.app import app
+from mlx_ui.db import JobRecord, insert_job
+import mlx_ui.routers.jobs_api as jobs_api
+
+
+def _configure_app(tmp_path: Path) -> None:
+    app.state.base_dir = tmp_path
+    app.state.uploads_dir = tmp_path / "uploads"
+    app.state.results_dir = tmp_path / "results"
+    app.state.db_path = tmp_path / "jobs.db"
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+
+
+def _insert_queued(db_path: Path, job_id: str) -> None:
+    insert_job(
+        db_path,
+        JobRecord(
+            id=job_id,
+            filename=f"{job_id}.wav",
+            status="queued",
+            created_at="2026-07-21T12:00:00+00:00",
+            upload_path=f"/tmp/{job_id}.wav",
+            language="auto",
+        ),
+    )
+
+
+def test_state_endpoints_answer_304_until_a_job_changes(tmp_path: Path) -> None:
+    _configure_app(tmp_path)
+
+    with TestClient(app) as client:
+        paths = ("/api/state", "/api/machine/state", "/api/browser/state")
+        for index, path in enumerate(paths):
+            first = client.get(path)
+            etag = first.headers["ETag"]
+            unchanged = client.get(path, headers={"If-None-Match": etag})
+            weak = client.get(path, headers={"If-None-Match": f"W/{etag}"})
+
+            assert first.status_code == 200
+            assert len(first.json()["queue"]) == index
+            assert (unchanged.status_code, unchanged.content) == (304, b"")
+            assert unchanged.headers["ETag"] == etag
+            assert weak.status_code == 304
+
+            _insert_queued(Path(app.state.db_path), f"job-{index}")
+            changed = client.get(path, headers={"If-None-Match": etag})
+
+            assert changed.status_code == 200
+            assert changed.headers["ETag"] != etag
+            assert len(changed.json()["queue"]) == index + 1
+
+
+def test_unchanged_state_is_served_without_touching_the_db(
+    tmp_path: Path, monkeypatch
+) -> None:
+    _configure_app(tmp_path)
+
+    with TestClient(app) as client:
+        etag = client.get("/api/machine/state").headers["ETag"]
+        body = client.get("/api/machine/state").content
+
+        def fail(*args, **kwargs):
+            raise AssertionError("state was rebuilt")
+
+        monkeypatch.setattr(jobs_api, "list_active_jobs", fail)
+        revalidated = client.get("/api/machine/state", headers={"If-None-Match": etag})
+        cached = client.get("/api/machine/state")
+
+    assert revalidated.status_code == 304
+    assert (cached.status_code, cached.content) == (200, body)
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from mlx_ui.db import (
+    JobRecord,
+    init_db,
+    insert_job,
+    list_active_job_summaries,
+    list_active_jobs,
+    list_recent_history_jobs,
+    list_recent_history_summaries,
+    mark_job_running,
+)
+from mlx_ui.job_ui import build_job_ui, serialize_job
+
+
+def _insert(db_path: Path, job_id: str, status: str, **fields: object) -> None:
+    insert_job(
+        db_path,
+        JobRecord(
+            id=job_id,
+            filename=f"{job_id}.wav",
+            status=status,
+            created_at=f"2026-07-21T10:00:0{len(job_id) % 10}+00:00",
+            completed_at=(
+                "2026-07-21T11:00:00+00:00" if status in {"done", "failed"} else None
+            ),
+            upload_path=f"/private/uploads/{job_id}.wav",
+            language="fr",
+            source_path=f"/private/inbox/{job_id}.wav",
+            source_relpath=f"inbox/{job_id}.wav",
+            **fields,
+        ),
+    )
+
+
+def test_summaries_match_full_records_without_local_paths(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    _insert(db_path, "running", "reserved", requested_engine="whisper_mlx")
+    mark_job_running(db_path, "running")
+    _insert(db_path, "queued", "queued", client="agent", client_job_id="a-1")
+    _insert(
+        db_path,
+        "done",
+        "done",
+        requested_engine="parakeet_tdt_v3",
+        effective_engine="parakeet_tdt_v3",
+        effective_implementation_id="parakeet_mlx",
+    )
+
+    full_jobs = list_active_jobs(db_path) + list_recent_history_jobs(db_path, limit=10)
+    summaries = list_active_job_summaries(db_path) + list_recent_history_summaries(
+        db_path, limit=10
+    )
+
+    assert [job.id for job in summaries] == ["running", "queued", "done"]
+    assert summaries[0].status == "running"
+    for full, summary in zip(full_jobs, summaries):
+        expected = serialize_job(full)
+        del expected["upload_path"], expected["source_path"]
+        assert serialize_job(summary) == expected
+    assert not hasattr(summaries[0], "__dict__")
+
+
+def test_job_ui_is_shared_between_jobs_with_the_same_metadata(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    _insert(db_path, "job-1", "queued", requested_engine="whisper_mlx")
+    _insert(db_path, "job-2", "queued", requested_engine="whisper_mlx")
+    _insert(db_path, "job-3", "queued", requested_engine="whisper_cpu")
+
+    first, second, third = list_active_job_summaries(db_path)
+
+    assert build_job_ui(first) is build_job_ui(second)
+    assert build_job_ui(first) is not build_job_ui(third)
+    assert build_job_ui(first)["language"]["label"] == "French"
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from mlx_ui.app import app
+from mlx_ui.db import (
+    JobRecord,
+    delete_history_job,
+    find_transcript_snippets,
+    init_db,
+    insert_job,
+    list_history_page,
+    mark_job_done,
+    mark_job_running,
+)
+from mlx_ui.result_retention import purge_expired_results
+from mlx_ui.transcript_search import backfill_transcript_index, format_snippet_html
+
+
+def _configure_app(tmp_path: Path) -> None:
+    app.state.base_dir = tmp_path
+    app.state.uploads_dir = tmp_path / "uploads"
+    app.state.results_dir = tmp_path / "results"
+    app.state.db_path = tmp_path / "jobs.db"
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+
+
+def _insert(db_path: Path, job_id: str, filename: str, status: str) -> None:
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    insert_job(
+        db_path,
+        JobRecord(
+            id=job_id,
+            filename=filename,
+            status=status,
+            created_at=timestamp,
+            completed_at=timestamp if status != "reserved" else None,
+            upload_path=f"/tmp/{filename}",
+            language="auto",
+        ),
+    )
+
+
+def _search(db_path: Path, query: str) -> list[str]:
+    jobs, _total = list_history_page(db_path, limit=50, offset=0, query=query)
+    return sorted(job.id for job in jobs)
+
+
+def test_done_transcripts_are_searchable_and_cleaned_up(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+    _insert(db_path, "job-1", "standup.wav", "reserved")
+    _insert(db_path, "job-2", "budget.wav", "reserved")
+    for job_id, transcript in (
+        ("job-1", "We agreed to ship the caching layer on Friday."),
+        ("job-2", "The quarterly budget review moved to Tuesday."),
+    ):
+        mark_job_running(db_path, job_id)
+        mark_job_done(db_path, job_id, transcript=transcript)
+
+    assert _search(db_path, "caching") == ["job-1"]
+    assert _search(db_path, "quart") == ["job-2"]
+    assert _search(db_path, "budget") == ["job-2"]
+    assert _search(db_path, "standup") == ["job-1"]
+    assert _search(db_path, "holiday") == []
+    snippets = find_transcript_snippets(db_path, ["job-1", "job-2"], "caching")
+    assert list(snippets) == ["job-1"]
+    assert "<mark>caching</mark>" in format_snippet_html(snippets["job-1"])
+
+    assert delete_history_job(db_path, "job-1") is True
+    assert _search(db_path, "caching") == []
+
+    results_dir = tmp_path / "results"
+    (results_dir / "job-2").mkdir(parents=True)
+    summary = purge_expired_results(
+        db_path,
+        results_dir,
+        retention_days=1,
+        now=datetime.now(timezone.utc) + timedelta(days=2),
+    )
+    assert summary.deleted == 1
+    assert _search(db_path, "quarterly") == []
+
+
+def test_backfill_indexes_existing_results_once(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    results_dir = tmp_path / "results"
+    init_db(db_path)
+    _insert(db_path, "job-1", "interview.wav", "done")
+    _insert(db_path, "job-2", "lost.wav", "done")
+    _insert(db_path, "job-3", "broken.wav", "failed")
+    (results_dir / "job-1").mkdir(parents=True)
+    (results_dir / "job-1" / "interview.txt").write_text(
+        "Tell me about the migration plan.", encoding="utf-8"
+    )
+
+    assert backfill_transcript_index(db_path, results_dir, batch_size=1) == 2
+    assert backfill_transcript_index(db_path, results_dir) == 0
+    assert _search(db_path, "migration") == ["job-1"]
+
+
+def test_browser_history_query_returns_transcript_snippets(tmp_path: Path) -> None:
+    _configure_app(tmp_path)
+    db_path = Path(app.state.db_path)
+    init_db(db_path)
+    _insert(db_path, "job-1", "call.wav", "done")
+    _insert(db_path, "job-2", "notes <draft>.wav", "done")
+    results_dir = Path(app.state.results_dir)
+    (results_dir / "job-1").mkdir(parents=True)
+    (results_dir / "job-1" / "call.txt").write_text(
+        "Customer asked <again> about refunds for the annual plan.",
+        encoding="utf-8",
+    )
+
+    with TestClient(app) as client:
+        response = client.get("/api/browser/history?query=refund")
+        filename_response = client.get("/api/browser/history?query=draft")
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["id"] for item in items] == ["job-1"]
+    snippet = items[0]["transcript_snippet_html"]
+    assert "<mark>refunds</mark>" in snippet
+    assert "&lt;again&gt;" in snippet
+    filename_items = filename_response.json()["items"]
+    assert [item["id"] for item in filename_items] == ["job-2"]
+    assert "transcript_snippet_html" not in filename_items[0]
@@ -0,0 +1,155 @@
+import asyncio
+import hashlib
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from mlx_ui.app import app
+from mlx_ui.db import list_jobs
+from mlx_ui.upload_stream import receive_upload_form
+
+BOUNDARY = "stream-boundary"
+
+
+def _configure_app(tmp_path: Path) -> None:
+    app.state.base_dir = tmp_path
+    app.state.uploads_dir = tmp_path / "uploads"
+    app.state.results_dir = tmp_path / "results"
+    app.state.db_path = tmp_path / "jobs.db"
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+
+
+def _multipart(parts: list[tuple[str, str | None, bytes]]) -> bytes:
+    body = b""
+    for name, filename, content in parts:
+        disposition = f'form-data; name="{name}"'
+        if filename is not None:
+            disposition += f'; filename="{filename}"'
+        body += (
+            f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n\r\n".encode()
+            + content
+            + b"\r\n"
+        )
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+def _streamed_request(
+    body: bytes, chunk_size: int, sent: list[bytes] | None = None
+) -> Request:
+    chunks = [
+        body[index : index + chunk_size] for index in range(0, len(body), chunk_size)
+    ]
+
+    async def receive() -> dict[str, object]:
+        chunk = chunks.pop(0)
+        if sent is not None:
+            sent.append(chunk)
+        return {"type": "http.request", "body": chunk, "more_body": bool(chunks)}
+
+    content_type = f"multipart/form-data; boundary={BOUNDARY}".encode()
+    return Request(
+        {
+            "type": "http",
+            "method": "POST",
+            "headers": [(b"content-type", content_type)],
+        },
+        receive,
+    )
+
+
+def test_multipart_files_stream_to_job_dirs_with_hashes(tmp_path: Path) -> None:
+    first = b"a" * 70_000
+    second = bytes(range(256)) * 300
+    body = _multipart(
+        [
+            ("client", None, b"agent"),
+            ("files", "nested/one.wav", first),
+            ("files", "two.wav", second),
+            ("files", "", b""),
+            ("client_job_id", None, b"c-1"),
+        ]
+    )
+
+    form = asyncio.run(
+        receive_upload_form(_streamed_request(body, 1000), tmp_path / "uploads")
+    )
+
+    assert form.get("client") == "agent"
+    assert form.getlist("client_job_id") == ["c-1"]
+    one, two = form.files_for("files")
+    assert one.display_name == "nested/one.wav"
+    assert one.path == tmp_path / "uploads" / one.job_id / "one.wav"
+    assert one.path.read_bytes() == first
+    assert (one.size_bytes, one.sha256) == (
+        len(first),
+        hashlib.sha256(first).hexdigest(),
+    )
+    assert two.path.read_bytes() == second
+    assert two.sha256 == hashlib.sha256(second).hexdigest()
+
+
+def test_skip_files_stops_reading_before_the_first_file(tmp_path: Path) -> None:
+    body = _multipart(
+        [
+            ("client", None, b"agent"),
+            ("client_job_id", None, b"c-1"),
+            ("file", "call.wav", b"a" * 70_000),
+        ]
+    )
+    sent: list[bytes] = []
+    request = _streamed_request(body, 1000, sent)
+    seen: list[list[tuple[str, str]]] = []
+
+    def skip_files(form) -> bool:
+        seen.append(list(form.fields))
+        return True
+
+    form = asyncio.run(
+        receive_upload_form(request, tmp_path / "uploads", skip_files=skip_files)
+    )
+
+    assert seen == [[("client", "agent"), ("client_job_id", "c-1")]]
+    assert form.files_skipped is True
+    assert form.files == []
+    assert len(b"".join(sent)) < 10_000
+    assert list((tmp_path / "uploads").glob("*/*")) == []
+
+
+def test_upload_endpoints_record_hash_and_discard_rejected_files(
+    tmp_path: Path,
+) -> None:
+    _configure_app(tmp_path)
+    uploads_dir = tmp_path / "uploads"
+
+    with TestClient(app) as client:
+        created = client.post(
+            "/api/jobs",
+            data={"client": "agent", "client_job_id": "call-1"},
+            files={"file": ("call.wav", b"audio", "audio/wav")},
+        )
+        duplicate = client.post(
+            "/api/jobs",
+            data={"client": "agent", "client_job_id": "call-1"},
+            files={"file": ("call.wav", b"audio", "audio/wav")},
+        )
+        rejected = client.post(
+            "/api/jobs/batch",
+            data={"client": "agent", "client_job_id": ["a", "a"]},
+            files=[("files", ("a.wav", b"1", "audio/wav"))] * 2,
+        )
+        malformed = client.post(
+            "/api/jobs",
+            content=b"not multipart",
+            headers={"Content-Type": "text/plain"},
+        )
+
+    assert created.status_code == 200
+    assert duplicate.json()["created"] is False
+    assert rejected.status_code == 422
+    assert malformed.status_code == 400
+    [job] = list_jobs(Path(app.state.db_path))
+    assert job.upload_sha256 == hashlib.sha256(b"audio").hexdigest()
+    assert [path.parent.name for path in uploads_dir.glob("*/*")] == [job.id]
@@ -0,0 +1,173 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import threading
+
+from fastapi.testclient import TestClient
+
+from mlx_ui.app import app
+from mlx_ui.db import (
+    WEBHOOK_DELIVERY_DELIVERED,
+    WEBHOOK_DELIVERY_FAILED,
+    WEBHOOK_DELIVERY_PENDING,
+    JobRecord,
+    ResultFileRecord,
+    claim_next_job,
+    init_db,
+    insert_job,
+    list_webhook_deliveries,
+    mark_job_done,
+    mark_job_failed,
+    mark_job_running,
+)
+from mlx_ui.webhooks import WebhookDeliveryService, sign_webhook
+
+NOW = datetime(2026, 7, 21, 12, 0, tzinfo=timezone.utc)
+
+
+def _configure_app(tmp_path: Path) -> None:
+    app.state.base_dir = tmp_path
+    app.state.uploads_dir = tmp_path / "uploads"
+    app.state.results_dir = tmp_path / "results"
+    app.state.db_path = tmp_path / "jobs.db"
+    app.state.worker_enabled = False
+    app.state.update_check_enabled = False
+    app.state.live_service = None
+
+
+@contextmanager
+def _receiver(status: int = 204) -> Iterator[tuple[str, list[dict[str, object]]]]:
+    received: list[dict[str, object]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append({"headers": dict(self.headers), "body": body})
+            self.send_response(status)
+            self.end_headers()
+
+        def log_message(self, format, *args):  # type: ignore[no-untyped-def]
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/hooks/jobs", received
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _insert_running(db_path: Path, job_id: str, callback_url: str) -> None:
+    insert_job(
+        db_path,
+        JobRecord(
+            id=job_id,
+            filename=f"{job_id}.wav",
+            status="reserved",
+            created_at=NOW.isoformat(timespec="seconds"),
+            upload_path=f"/tmp/{job_id}.wav",
+            language="auto",
+            callback_url=callback_url,
+        ),
+    )
+    mark_job_running(db_path, job_id)
+
+
+def test_finished_machine_job_posts_a_signed_callback(tmp_path: Path) -> None:
+    _configure_app(tmp_path)
+    db_path = Path(app.state.db_path)
+
+    with _receiver() as (url, received):
+        with TestClient(app) as client:
+            rejected = client.post(
+                "/api/jobs",
+                data={
+                    "client": "agent",
+                    "client_job_id": "call-0",
+                    "callback_url": "ftp://example.test/hook",
+                },
+                files={"file": ("call.wav", b"audio", "audio/wav")},
+            )
+            created = client.post(
+                "/api/jobs",
+                data={
+                    "client": "agent",
+                    "client_job_id": "call-1",
+                    "callback_url": url,
+                },
+                files={"file": ("call.wav", b"audio", "audio/wav")},
+            )
+            job_id = created.json()["job_id"]
+            assert claim_next_job(db_path).id == job_id
+            mark_job_running(db_path, job_id)
+            mark_job_done(
+                db_path,
+                job_id,
+                results=[ResultFileRecord("call.txt", "txt", 5, "abc")],
+            )
+
+        service = WebhookDeliveryService(db_path, secret="s3cret")
+
+        assert service.run_once() == 1
+        assert service.run_once() == 0
+
+    assert rejected.status_code == 422
+    [request] = received
+    headers = request["headers"]
+    body = request["body"]
+    payload = json.loads(body)
+    assert payload["event"] == "job.finished"
+    assert payload["job"]["id"] == job_id
+    assert payload["job"]["status"] == "done"
+    assert payload["job"]["client_job_id"] == "call-1"
+    assert payload["results"] == [
+        {"name": "call.txt", "format": "txt", "size_bytes": 5, "sha256": "abc"}
+    ]
+    assert headers["X-Webhook-Signature"] == sign_webhook(
+        "s3cret", headers["X-Webhook-Timestamp"], body
+    )
+    [delivery] = list_webhook_deliveries(db_path, job_id)
+    assert (delivery.status, delivery.attempts) == (WEBHOOK_DELIVERY_DELIVERED, 1)
+
+
+def test_failed_callbacks_back_off_and_give_up(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    init_db(db_path)
+
+    with _receiver(status=503) as (url, received):
+        for index in range(3):
+            _insert_running(db_path, f"job-{index}", url)
+            mark_job_failed(db_path, f"job-{index}", error_message="boom")
+        service = WebhookDeliveryService(
+            db_path,
+            secret="s3cret",
+            max_concurrency=2,
+            max_attempts=2,
+        )
+        now = datetime.now(timezone.utc)
+
+        assert service.run_once(now) == 2
+        assert service.run_once(now) == 1
+        assert service.run_once(now) == 0
+        first = list_webhook_deliveries(db_path, "job-0")[0]
+        assert (first.status, first.attempts) == (WEBHOOK_DELIVERY_PENDING, 1)
+        assert first.last_error == "HTTP 503"
+        retry_at = now + timedelta(seconds=5)
+        assert first.next_attempt_at == retry_at.isoformat(timespec="seconds")
+
+        assert service.run_once(retry_at) == 2
+        assert service.run_once(retry_at) == 1
+
+    assert len(received) == 6
+    assert {request["headers"]["X-Webhook-Attempt"] for request in received} == {
+        "1",
+        "2",
+    }
+    for index in range(3):
+        [delivery] = list_webhook_deliveries(db_path, f"job-{index}")
+        assert (delivery.status, delivery.attempts) == (WEBHOOK_DELIVERY_FAILED, 2)
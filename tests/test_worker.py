@@ -7,9 +7,19 @@ import time
 import mlx_ui.engine_registry as engine_registry
 import mlx_ui.transcriber as transcriber_module
 import mlx_ui.worker as worker_module
-from mlx_ui.db import JobRecord, claim_next_job, init_db, insert_job, list_jobs
+from mlx_ui.db import (
+    JobRecord,
+    claim_next_job,
+    delete_history_job,
+    init_db,
+    insert_job,
+    list_jobs,
+    mark_job_running,
+    recover_running_jobs,
+)
 from mlx_ui.engine_registry import EngineFactoryOptions
 from mlx_ui.engine_registry import FAKE_ENGINE
+from mlx_ui.job_ui import build_job_ui
 from mlx_ui.settings import ResolvedTranscriberSettings
 from mlx_ui.worker import Worker, start_worker, stop_worker
 
@@ -50,6 +60,7 @@ def _make_job(
     uploads_dir: Path,
     *,
     requested_engine: str | None = None,
+    transcription_mode: str = "standard",
 ) -> JobRecord:
     job_dir = uploads_dir / job_id
     job_dir.mkdir(parents=True, exist_ok=True)
@@ -63,6 +74,7 @@ def _make_job(
         upload_path=str(upload_path),
         language="en",
         requested_engine=requested_engine,
+        transcription_mode=transcription_mode,
     )
 
 
@@ -648,3 +660,283 @@ def test_claim_next_job_blocks_when_running_exists(tmp_path: Path) -> None:
     jobs = {job.id: job for job in list_jobs(db_path)}
     assert jobs["job-running"].status == "running"
     assert jobs["job-queued"].status == "queued"
+
+
+class LabelTranscriber:
+    engine_id = FAKE_ENGINE
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.seen: list[str] = []
+
+    def transcribe(self, job: JobRecord, results_dir: Path) -> Path:
+        self.seen.append(job.id)
+        job_dir = Path(results_dir) / job.id
+        job_dir.mkdir(parents=True, exist_ok=True)
+        result_path = job_dir / f"{Path(job.filename).stem}.txt"
+        result_path.write_text(f"{self.label} transcript\n", encoding="utf-8")
+        return result_path
+
+
+def test_worker_two_pass_publishes_draft_then_refines_when_idle(
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    results_dir = tmp_path / "results"
+    init_db(db_path)
+    uploads_dir.mkdir(parents=True, exist_ok=True)
+
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    two_pass_job = _make_job(
+        "job1",
+        "alpha.wav",
+        base_time.isoformat(timespec="seconds"),
+        uploads_dir,
+        transcription_mode="two_pass",
+    )
+    insert_job(db_path, two_pass_job)
+
+    final = LabelTranscriber("final")
+    draft = LabelTranscriber("draft")
+    worker = Worker(
+        db_path=db_path,
+        uploads_dir=uploads_dir,
+        results_dir=results_dir,
+        transcriber=final,
+        draft_transcriber=draft,
+    )
+
+    assert worker.run_once() is True
+    jobs = {job.id: job for job in list_jobs(db_path)}
+    assert jobs["job1"].status == "done"
+    assert jobs["job1"].transcript_pass == "draft"
+    refinement = next(job for job in jobs.values() if job.refines_job_id == "job1")
+    assert refinement.status == "queued"
+    assert refinement.priority == 1
+    assert refinement.upload_path == two_pass_job.upload_path
+    assert Path(two_pass_job.upload_path).is_file()
+    assert (results_dir / "job1" / "alpha.txt").read_text(
+        encoding="utf-8"
+    ) == "draft transcript\n"
+
+    normal_job = _make_job(
+        "job2",
+        "beta.wav",
+        (base_time + timedelta(seconds=5)).isoformat(timespec="seconds"),
+        uploads_dir,
+    )
+    insert_job(db_path, normal_job)
+
+    assert worker.run_once() is True
+    assert final.seen == ["job2"]
+
+    assert worker.run_once() is True
+    assert worker.run_once() is False
+    assert final.seen == ["job2", refinement.id]
+    assert draft.seen == ["job1"]
+
+    jobs = {job.id: job for job in list_jobs(db_path)}
+    assert set(jobs) == {"job1", "job2"}
+    assert jobs["job1"].transcript_pass == "final"
+    assert jobs["job2"].transcript_pass is None
+    assert (results_dir / "job1" / "alpha.txt").read_text(
+        encoding="utf-8"
+    ) == "final transcript\n"
+    assert not (results_dir / refinement.id).exists()
+    assert not Path(two_pass_job.upload_path).exists()
+
+
+def test_worker_keeps_draft_when_refinement_fails(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    results_dir = tmp_path / "results"
+    init_db(db_path)
+    uploads_dir.mkdir(parents=True, exist_ok=True)
+
+    job = _make_job(
+        "job1",
+        "alpha.wav",
+        "2024-01-01T00:00:00+00:00",
+        uploads_dir,
+        transcription_mode="two_pass",
+    )
+    insert_job(db_path, job)
+
+    class FailingTranscriber:
+        engine_id = FAKE_ENGINE
+
+        def transcribe(self, job: JobRecord, results_dir: Path) -> Path:
+            raise RuntimeError("model crashed")
+
+    worker = Worker(
+        db_path=db_path,
+        uploads_dir=uploads_dir,
+        results_dir=results_dir,
+        transcriber=FailingTranscriber(),
+        draft_transcriber=LabelTranscriber("draft"),
+    )
+
+    assert worker.run_once() is True
+    assert worker.run_once() is True
+    assert worker.run_once() is False
+
+    jobs = list_jobs(db_path)
+    assert [job.id for job in jobs] == ["job1"]
+    assert jobs[0].status == "done"
+    assert jobs[0].transcript_pass == "unrefined"
+    assert jobs[0].error_message == "Refinement failed: model crashed"
+    transcript_pass = build_job_ui(jobs[0])["transcript_pass"]
+    assert transcript_pass["label"] == "Draft"
+    assert "pending" not in transcript_pass["title"]
+    assert (results_dir / "job1" / "alpha.txt").read_text(
+        encoding="utf-8"
+    ) == "draft transcript\n"
+    assert not Path(job.upload_path).exists()
+
+
+def test_interrupted_refinement_is_requeued_and_deleted_with_its_draft(
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    init_db(db_path)
+    insert_job(
+        db_path,
+        _make_job(
+            "job1",
+            "alpha.wav",
+            "2024-01-01T00:00:00+00:00",
+            uploads_dir,
+            transcription_mode="two_pass",
+        ),
+    )
+    worker = Worker(
+        db_path=db_path,
+        uploads_dir=uploads_dir,
+        results_dir=tmp_path / "results",
+        transcriber=LabelTranscriber("final"),
+        draft_transcriber=LabelTranscriber("draft"),
+    )
+    assert worker.run_once() is True
+
+    refinement = claim_next_job(db_path)
+    assert refinement is not None and refinement.refines_job_id == "job1"
+    assert mark_job_running(db_path, refinement.id) is True
+    assert recover_running_jobs(db_path) == 1
+
+    jobs = {job.id: job for job in list_jobs(db_path)}
+    assert jobs["job1"].status == "done"
+    assert jobs["job1"].transcript_pass == "draft"
+    assert jobs[refinement.id].status == "queued"
+    assert jobs[refinement.id].error_message is None
+
+    claim_next_job(db_path)
+    mark_job_running(db_path, refinement.id)
+    assert delete_history_job(db_path, "job1") is True
+    assert list_jobs(db_path) == []
+
+
+def test_claim_next_job_keeps_remote_lane_separate(tmp_path: Path) -> None:
+    db_path = tmp_path / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    init_db(db_path)
+    uploads_dir.mkdir(parents=True, exist_ok=True)
+
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for index, (job_id, engine) in enumerate(
+        [("remote1", "cohere"), ("remote2", "cohere"), ("local1", None)]
+    ):
+        insert_job(
+            db_path,
+            _make_job(
+                job_id,
+                f"{job_id}.txt",
+                (base_time + timedelta(seconds=index)).isoformat(timespec="seconds"),
+                uploads_dir,
+                requested_engine=engine,
+            ),
+        )
+
+    remote_ids = ("cohere",)
+    first = claim_next_job(db_path, engine_ids=remote_ids, max_running=2)
+    second = claim_next_job(db_path, engine_ids=remote_ids, max_running=2)
+    local = claim_next_job(db_path, exclude_engine_ids=remote_ids)
+
+    assert first is not None and first.id == "remote1"
+    assert second is not None and second.id == "remote2"
+    assert local is not None and local.id == "local1"
+    assert claim_next_job(db_path, exclude_engine_ids=remote_ids) is None
+
+
+def test_worker_runs_remote_jobs_alongside_local_job(tmp_path: Path) -> None:
+    class LaneTranscriber:
+        engine_id = FAKE_ENGINE
+
+        def __init__(self) -> None:
+            self.local_done = threading.Event()
+            self.remote_overlapped = False
+
+        def transcribe(self, job: JobRecord, results_dir: Path) -> Path:
+            if job.requested_engine == "cohere":
+                self.remote_overlapped = self.local_done.wait(timeout=2.0)
+            else:
+                self.local_done.set()
+            job_dir = Path(results_dir) / job.id
+            job_dir.mkdir(parents=True, exist_ok=True)
+            result_path = job_dir / f"{Path(job.filename).stem}.txt"
+            result_path.write_text(job.id, encoding="utf-8")
+            return result_path
+
+    db_path = tmp_path / "jobs.db"
+    uploads_dir = tmp_path / "uploads"
+    results_dir = tmp_path / "results"
+    init_db(db_path)
+    uploads_dir.mkdir(parents=True, exist_ok=True)
+
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    insert_job(
+        db_path,
+        _make_job(
+            "remote",
+            "remote.txt",
+            base_time.isoformat(timespec="seconds"),
+            uploads_dir,
+            requested_engine="cohere",
+        ),
+    )
+    insert_job(
+        db_path,
+        _make_job(
+            "local",
+            "local.txt",
+            (base_time + timedelta(seconds=1)).isoformat(timespec="seconds"),
+            uploads_dir,
+        ),
+    )
+
+    transcriber = LaneTranscriber()
+    worker = Worker(
+        db_path=db_path,
+        uploads_dir=uploads_dir,
+        results_dir=results_dir,
+        transcriber=transcriber,
+        poll_interval=0.01,
+        base_dir=tmp_path,
+        env={},
+        remote_concurrency=2,
+        remote_requests_per_minute=600,
+    )
+    worker.start()
+    try:
+        deadline = time.monotonic() + 3.0
+        while time.monotonic() < deadline:
+            statuses = {job.id: job.status for job in list_jobs(db_path)}
+            if statuses == {"remote": "done", "local": "done"}:
+                break
+            time.sleep(0.02)
+    finally:
+        worker.stop(timeout=2.0)
+
+    assert statuses == {"remote": "done", "local": "done"}
+    assert transcriber.remote_overlapped is True